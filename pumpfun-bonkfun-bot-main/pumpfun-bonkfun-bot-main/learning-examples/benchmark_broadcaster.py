@@ -0,0 +1,213 @@
+"""
+Benchmark the multi-endpoint transaction broadcaster against local stand-in RPCs.
+
+Each stand-in endpoint answers sendTransaction after an injected latency,
+rejects a share of requests, and forwards only a share of what it accepts to
+the (simulated) leader. A transaction lands if any endpoint that accepted it
+forwarded it. The script sends the same workload through:
+
+1. The first endpoint only (what SolanaClient does without a broadcaster)
+2. Every endpoint on each send (fanout 0)
+3. The best-scored endpoints only (--fanout), adapting as scores change
+
+and prints acceptance latency, landing rate and how often each endpoint was
+used, followed by the broadcaster's final scores.
+
+Usage:
+    uv run learning-examples/benchmark_broadcaster.py --sends 200 --fanout 2
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import os
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+import base58
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.broadcaster import TransactionBroadcaster  # noqa: E402
+from core.rpc_batcher import RpcError  # noqa: E402
+
+
+@dataclass
+class StandInProfile:
+    name: str
+    latency_ms: float
+    jitter_ms: float
+    reject_rate: float
+    forward_rate: float
+
+
+PROFILES = [
+    StandInProfile("slow-primary", 120, 30, 0.0, 0.95),
+    StandInProfile("fast-reliable", 20, 5, 0.0, 0.95),
+    StandInProfile("fast-lossy", 12, 3, 0.0, 0.4),
+    StandInProfile("flaky", 40, 10, 0.3, 0.9),
+]
+
+
+class StandInRpc:
+    """sendTransaction endpoint with injected latency, rejects and drops."""
+
+    def __init__(self, profile: StandInProfile, rng: random.Random):
+        self.profile = profile
+        self.rng = rng
+        self.forwarded: set[str] = set()
+        self.url = ""
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/"
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        profile = self.profile
+        delay = self.rng.gauss(profile.latency_ms, profile.jitter_ms) / 1000
+        await asyncio.sleep(max(0.0, delay))
+
+        if self.rng.random() < profile.reject_rate:
+            return web.json_response(
+                {
+                    "jsonrpc": "2.0",
+                    "id": body["id"],
+                    "error": {"code": -32005, "message": "Node is behind"},
+                }
+            )
+
+        signature = signature_of(body["params"][0])
+        if self.rng.random() < profile.forward_rate:
+            self.forwarded.add(signature)
+        return web.json_response(
+            {"jsonrpc": "2.0", "id": body["id"], "result": signature}
+        )
+
+
+def signature_of(encoded_tx: str) -> str:
+    return base58.b58encode(hashlib.sha512(encoded_tx.encode()).digest()).decode()
+
+
+def send_request(rng: random.Random) -> dict:
+    encoded_tx = base64.b64encode(rng.randbytes(200)).decode()
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "sendTransaction",
+        "params": [encoded_tx, {"encoding": "base64", "skipPreflight": True}],
+    }
+
+
+def percentiles(samples: list[float]) -> str:
+    if len(samples) < 2:
+        return "n/a"
+    ms = sorted(s * 1000 for s in samples)
+    cuts = statistics.quantiles(ms, n=100, method="inclusive")
+    return f"p50={cuts[49]:.1f}ms p90={cuts[89]:.1f}ms p99={cuts[98]:.1f}ms"
+
+
+async def run_mode(
+    label: str,
+    stand_ins: list[StandInRpc],
+    endpoints: list[str],
+    fanout: int,
+    sends: int,
+    seed: int,
+) -> TransactionBroadcaster:
+    # Every mode sends the same transactions
+    rng = random.Random(seed)
+    for stand_in in stand_ins:
+        stand_in.forwarded.clear()
+    broadcaster = TransactionBroadcaster(endpoints, fanout=fanout)
+    latencies: list[float] = []
+    landed = failed = 0
+    uses = dict.fromkeys(endpoints, 0)
+
+    for _ in range(sends):
+        before = {url: stats.sends for url, stats in broadcaster.stats.items()}
+        started = time.perf_counter()
+        try:
+            signature = await broadcaster.send(send_request(rng))
+        except RpcError:
+            failed += 1
+            continue
+        latencies.append(time.perf_counter() - started)
+
+        # Let late responses arrive before scoring the outcome
+        await asyncio.gather(*broadcaster._inflight, return_exceptions=True)
+        for url, stats in broadcaster.stats.items():
+            uses[url] += stats.sends - before[url]
+        lands = any(
+            signature in s.forwarded for s in stand_ins if s.url in endpoints
+        )
+        broadcaster.record_outcome(signature, lands)
+        landed += lands
+
+    print(f"{label}:")
+    print(f"  acceptance latency: {percentiles(latencies)}")
+    print(f"  landed {landed}/{sends} ({landed / sends:.0%}), all rejected {failed}")
+    names = {s.url: s.profile.name for s in stand_ins}
+    print(
+        "  endpoint use: "
+        + ", ".join(f"{names[url]} {count}" for url, count in uses.items())
+    )
+    await broadcaster.close()
+    return broadcaster
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    stand_ins = [StandInRpc(profile, rng) for profile in PROFILES]
+    for stand_in in stand_ins:
+        await stand_in.start()
+    urls = [stand_in.url for stand_in in stand_ins]
+
+    try:
+        await run_mode(
+            "Single endpoint", stand_ins, urls[:1], 0, args.sends, args.seed
+        )
+        await run_mode("Fan out to all", stand_ins, urls, 0, args.sends, args.seed)
+        adaptive = await run_mode(
+            f"Adaptive fanout {args.fanout}",
+            stand_ins,
+            urls,
+            args.fanout,
+            args.sends,
+            args.seed,
+        )
+        names = {s.url: s.profile.name for s in stand_ins}
+        print("Final scores (adaptive):")
+        for line in adaptive.summary().splitlines():
+            url = line.split(": ", 1)[0]
+            print(f"  {line.replace(url, names[url], 1)}")
+    finally:
+        for stand_in in stand_ins:
+            await stand_in.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sends", type=int, default=200)
+    parser.add_argument("--fanout", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""
+Benchmark transaction confirmation against a local stand-in RPC node.
+
+The stand-in serves getSignatureStatuses and getLatestBlockhash over HTTP and
+signatureSubscribe over WebSocket. Blocks are produced every --slot-ms, so a
+blockhash expires 150 slots after it was fetched. Each of --positions
+concurrent transactions lands after a random delay, or never (--expire-rate).
+The same workload is confirmed three ways:
+
+1. One polling loop per signature, once a second (the previous
+   SolanaClient.confirm_transaction)
+2. The client's ConfirmationTracker: one batched status poll for all pending
+   signatures
+3. The tracker with signatureSubscribe push notifications over a shared
+   WebSocket, polls kept as fallback
+
+and prints how long after landing each confirmation was noticed, how long
+expired transactions were waited on, and the RPC traffic of each mode.
+
+Usage:
+    uv run learning-examples/benchmark_confirmations.py --positions 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+import base58
+from aiohttp import WSMsgType, web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.client import SolanaClient  # noqa: E402
+from core.ws_multiplexer import WebSocketMultiplexer  # noqa: E402
+
+
+class StandInNode:
+    """HTTP and WebSocket RPC answering from a simulated chain."""
+
+    def __init__(self, slot_time: float):
+        self.slot_time = slot_time
+        self.started = time.monotonic()
+        self.land_at: dict[str, float | None] = {}
+        self.http_requests = 0
+        self.status_calls = 0
+        self.status_signatures = 0
+        self.http_url = ""
+        self.ws_url = ""
+        self._runner: web.AppRunner | None = None
+        self._timers: set[asyncio.TimerHandle] = set()
+
+    def reset(self) -> None:
+        self.land_at.clear()
+        self.http_requests = self.status_calls = self.status_signatures = 0
+
+    @property
+    def height(self) -> int:
+        return int((time.monotonic() - self.started) / self.slot_time)
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/", self.handle_http)
+        app.router.add_get("/ws", self.handle_ws)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.http_url = f"http://127.0.0.1:{port}/"
+        self.ws_url = f"ws://127.0.0.1:{port}/ws"
+
+    async def stop(self) -> None:
+        for timer in self._timers:
+            timer.cancel()
+        await self._runner.cleanup()
+
+    def landed(self, signature: str) -> bool:
+        land_at = self.land_at.get(signature)
+        return land_at is not None and time.monotonic() >= land_at
+
+    async def handle_http(self, request: web.Request) -> web.Response:
+        self.http_requests += 1
+        payload = await request.json()
+        if isinstance(payload, list):
+            return web.json_response([self.respond(call) for call in payload])
+        return web.json_response(self.respond(payload))
+
+    def respond(self, call: dict) -> dict:
+        method, params = call["method"], call.get("params", [])
+        context = {"slot": self.height}
+        if method == "getLatestBlockhash":
+            result = {
+                "context": context,
+                "value": {
+                    "blockhash": base58.b58encode(
+                        self.height.to_bytes(32, "little")
+                    ).decode(),
+                    "lastValidBlockHeight": self.height + 150,
+                },
+            }
+        elif method == "getSignatureStatuses":
+            self.status_calls += 1
+            self.status_signatures += len(params[0])
+            result = {
+                "context": context,
+                "value": [
+                    {
+                        "slot": self.height,
+                        "confirmations": 0,
+                        "err": None,
+                        "confirmationStatus": "confirmed",
+                    }
+                    if self.landed(signature)
+                    else None
+                    for signature in params[0]
+                ],
+            }
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": call["id"],
+                "error": {"code": -32601, "message": "Method not found"},
+            }
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    async def handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        loop = asyncio.get_running_loop()
+        subscription_ids = iter(range(1, 1_000_000))
+        timers: dict[int, asyncio.TimerHandle] = {}
+
+        def notify(subscription_id: int) -> None:
+            timers.pop(subscription_id, None)
+            message = {
+                "jsonrpc": "2.0",
+                "method": "signatureNotification",
+                "params": {
+                    "result": {
+                        "context": {"slot": self.height},
+                        "value": {"err": None},
+                    },
+                    "subscription": subscription_id,
+                },
+            }
+            asyncio.ensure_future(ws.send_str(json.dumps(message)))
+
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            call = json.loads(msg.data)
+            if call["method"] == "signatureSubscribe":
+                subscription_id = next(subscription_ids)
+                await ws.send_str(
+                    json.dumps(
+                        {"jsonrpc": "2.0", "id": call["id"], "result": subscription_id}
+                    )
+                )
+                land_at = self.land_at.get(call["params"][0])
+                if land_at is not None:
+                    delay = max(0.0, land_at - time.monotonic())
+                    timer = loop.call_later(delay, notify, subscription_id)
+                    timers[subscription_id] = timer
+                    self._timers.add(timer)
+            elif call["method"] == "signatureUnsubscribe":
+                timer = timers.pop(call["params"][0], None)
+                if timer:
+                    timer.cancel()
+                await ws.send_str(
+                    json.dumps({"jsonrpc": "2.0", "id": call["id"], "result": True})
+                )
+        return ws
+
+
+@dataclass
+class Position:
+    signature: str
+    send_delay: float
+    land_delay: float | None  # None: never lands
+
+
+async def legacy_confirm(
+    client: SolanaClient,
+    signature: str,
+    last_valid_block_height: int,
+    sleep_seconds: float = 1.0,
+    timeout: float = 90.0,
+) -> bool:
+    """The per-signature polling loop confirm_transaction used to run."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        expired = client.blockhash_service.is_expired(last_valid_block_height)
+        status = (await client.get_signature_statuses([signature]))[0]
+        if status is not None:
+            if status.get("confirmationStatus") in ("confirmed", "finalized"):
+                return True
+        elif expired:
+            return False
+        await asyncio.sleep(sleep_seconds)
+    return False
+
+
+def percentiles(samples: list[float]) -> str:
+    if len(samples) < 2:
+        return "n/a"
+    ms = sorted(s * 1000 for s in samples)
+    cuts = statistics.quantiles(ms, n=100, method="inclusive")
+    return f"p50={cuts[49]:.0f}ms p90={cuts[89]:.0f}ms max={ms[-1]:.0f}ms"
+
+
+def workload(args: argparse.Namespace) -> list[Position]:
+    rng = random.Random(args.seed)
+    positions = []
+    for _ in range(args.positions):
+        lands = rng.random() >= args.expire_rate
+        positions.append(
+            Position(
+                signature=base58.b58encode(rng.randbytes(64)).decode(),
+                send_delay=rng.uniform(0, args.spread),
+                land_delay=max(0.05, rng.gauss(args.land_ms, args.land_jitter_ms))
+                / 1000
+                if lands
+                else None,
+            )
+        )
+    return positions
+
+
+async def run_mode(
+    label: str, mode: str, node: StandInNode, positions: list[Position]
+) -> None:
+    node.reset()
+    client = SolanaClient(node.http_url)
+    client.blockhash_service.poll_interval = 0.1
+    await client.blockhash_service.refresh()
+    multiplexer = None
+    if mode == "push":
+        multiplexer = WebSocketMultiplexer(node.ws_url)
+        await client.confirmations.follow_signatures(multiplexer)
+
+    noticed: list[float] = []
+    expiry_waits: list[float] = []
+    missed = 0
+
+    async def confirm(position: Position) -> None:
+        nonlocal missed
+        await asyncio.sleep(position.send_delay)
+        sent_at = time.monotonic()
+        last_valid_block_height = client.blockhash_service.get().last_valid_block_height
+        land_at = sent_at + position.land_delay if position.land_delay else None
+        node.land_at[position.signature] = land_at
+
+        if mode == "legacy":
+            confirmed = await legacy_confirm(
+                client, position.signature, last_valid_block_height
+            )
+        else:
+            confirmed = await client.confirm_transaction(
+                position.signature, last_valid_block_height=last_valid_block_height
+            )
+        finished = time.monotonic()
+        if land_at is None:
+            expiry_waits.append(finished - sent_at)
+        elif confirmed:
+            noticed.append(finished - land_at)
+        else:
+            missed += 1
+
+    await asyncio.gather(*(confirm(position) for position in positions))
+
+    print(f"{label}:")
+    print(f"  landed -> noticed: {percentiles(noticed)} (missed {missed})")
+    print(f"  sent -> gave up on expired: {percentiles(expiry_waits)}")
+    per_call = node.status_signatures / max(1, node.status_calls)
+    print(
+        f"  HTTP requests {node.http_requests}, getSignatureStatuses calls "
+        f"{node.status_calls} ({per_call:.1f} signatures per call)"
+    )
+    if mode != "legacy":
+        tracker = client.confirmations
+        print(
+            f"  confirmed by push {tracker.confirmed_by_push}, "
+            f"by poll {tracker.confirmed_by_poll}, expired {tracker.expired}"
+        )
+
+    if multiplexer:
+        await multiplexer.close()
+    await client.close()
+
+
+async def run(args: argparse.Namespace) -> None:
+    node = StandInNode(args.slot_ms / 1000)
+    await node.start()
+    positions = workload(args)
+    try:
+        await run_mode("Per-signature polling (1 s)", "legacy", node, positions)
+        await run_mode("Batched polling", "poll", node, positions)
+        await run_mode("signatureSubscribe + batched polling", "push", node, positions)
+    finally:
+        await node.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--positions", type=int, default=20)
+    parser.add_argument("--spread", type=float, default=2.0, help="Send window (s)")
+    parser.add_argument("--land-ms", type=float, default=600.0)
+    parser.add_argument("--land-jitter-ms", type=float, default=200.0)
+    parser.add_argument("--expire-rate", type=float, default=0.2)
+    parser.add_argument("--slot-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if not args.verbose:
+        # Expired transactions are logged as errors by design
+        logging.disable(logging.ERROR)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
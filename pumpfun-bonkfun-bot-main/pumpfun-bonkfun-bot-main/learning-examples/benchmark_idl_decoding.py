@@ -0,0 +1,150 @@
+"""
+Benchmark compiled IDL decoders against the recursive IDL interpreter.
+
+Uses the raw JSON fixtures in this directory:
+- raw_bondingCurve_from_getAccountInfo.json (BondingCurve account data)
+- raw_create_tx_from_getTransaction.json / raw_buy_tx_from_getTransaction.json
+  ("Program data:" events from transaction logs)
+- pump.fun create/buy instruction data from the same getTransaction fixtures
+
+The bonding curve fixture predates the creator field, so it is also extended
+with a zero creator pubkey to benchmark the current account layout. LaunchLab
+PoolState has no fixture; a synthetic zero-filled account of the right size is
+used instead. Each sample is decoded by both paths and checked for equality.
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+
+import base58
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.idl_parser import IDLParser  # noqa: E402
+
+HERE = os.path.dirname(__file__)
+IDL_DIR = os.path.join(HERE, "..", "idl")
+PUMP_PROGRAM = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+ITERATIONS = 5_000
+
+
+def load_json(name: str) -> dict:
+    with open(os.path.join(HERE, name)) as f:
+        return json.load(f)
+
+
+def program_data_from_logs(logs: list[str]) -> list[bytes]:
+    return [
+        base64.b64decode(log.split("Program data: ")[1])
+        for log in logs
+        if "Program data: " in log
+    ]
+
+
+def pump_instruction_data(tx_json: dict) -> list[bytes]:
+    instructions = tx_json["result"]["transaction"]["message"]["instructions"]
+    return [
+        base58.b58decode(ix["data"])
+        for ix in instructions
+        if ix.get("programId") == PUMP_PROGRAM and "data" in ix
+    ]
+
+
+def bench(label: str, decode, samples: list, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for sample in samples:
+            decode(sample)
+    elapsed = time.perf_counter() - start
+    per_call_us = elapsed / (iterations * len(samples)) * 1e6
+    print(f"  {label:<12} {per_call_us:8.2f} µs/decode")
+    return per_call_us
+
+
+def compare(title: str, interpreted, compiled, samples: list) -> None:
+    for sample in samples:
+        if interpreted(sample) != compiled(sample):
+            raise AssertionError(f"{title}: compiled output differs from interpreter")
+
+    print(f"{title} ({len(samples)} samples)")
+    slow = bench("interpreter", interpreted, samples, ITERATIONS)
+    fast = bench("compiled", compiled, samples, ITERATIONS)
+    print(f"  speedup      {slow / fast:8.2f}x\n")
+
+
+def main() -> None:
+    pump_interp = IDLParser(os.path.join(IDL_DIR, "pump_fun_idl.json"))
+    pump_compiled = IDLParser(os.path.join(IDL_DIR, "pump_fun_idl.json"))
+    pump_compiled.compile_decoders()
+
+    bonk_interp = IDLParser(os.path.join(IDL_DIR, "raydium_launchlab_idl.json"))
+    bonk_compiled = IDLParser(os.path.join(IDL_DIR, "raydium_launchlab_idl.json"))
+    bonk_compiled.compile_decoders()
+
+    # BondingCurve account data
+    curve = load_json("raw_bondingCurve_from_getAccountInfo.json")
+    legacy_curve = base64.b64decode(curve["result"]["value"]["data"][0])
+    current_curve = legacy_curve + bytes(32)
+    compare(
+        "BondingCurve account",
+        lambda d: pump_interp.decode_account_data(d, "BondingCurve"),
+        lambda d: pump_compiled.decode_account_data(d, "BondingCurve"),
+        [legacy_curve, current_curve],
+    )
+
+    # Events and instructions from getTransaction fixtures
+    events = []
+    instructions = []
+    for name in (
+        "raw_create_tx_from_getTransaction.json",
+        "raw_buy_tx_from_getTransaction.json",
+    ):
+        tx_json = load_json(name)
+        events += program_data_from_logs(tx_json["result"]["meta"]["logMessages"])
+        instructions += pump_instruction_data(tx_json)
+    compare(
+        "pump.fun events (fixture layout)",
+        pump_interp.decode_event_data,
+        pump_compiled.decode_event_data,
+        events,
+    )
+
+    # Same events padded to the current IDL layout so the fast path applies
+    padded = []
+    for data in events:
+        decoder = pump_compiled.get_type_decoder(
+            pump_compiled.events[data[:8]]["name"]
+        )
+        padded.append(data + bytes(max(0, decoder.min_size + 8 - len(data))))
+    compare(
+        "pump.fun events (current layout)",
+        pump_interp.decode_event_data,
+        pump_compiled.decode_event_data,
+        padded,
+    )
+
+    # Create and buy instructions
+    keys = [bytes(32)] * 16
+    accounts = list(range(16))
+    compare(
+        "pump.fun instructions",
+        lambda d: pump_interp.decode_instruction(d, keys, accounts),
+        lambda d: pump_compiled.decode_instruction(d, keys, accounts),
+        instructions,
+    )
+
+    # LaunchLab PoolState (synthetic)
+    pool_size = 8 + bonk_compiled.get_type_decoder("PoolState").min_size
+    compare(
+        "LaunchLab PoolState (synthetic)",
+        lambda d: bonk_interp.decode_account_data(d, "PoolState"),
+        lambda d: bonk_compiled.decode_account_data(d, "PoolState"),
+        [bytes(pool_size)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Benchmark JSON decoding of listener frames: stdlib, orjson and partial decoding.
+
+Frames come from a TrafficRecorder recording (--recording) or are synthesized
+from the fixtures in this directory, with blocks padded by non-create
+transactions to the size of real blockSubscribe notifications. For each
+WebSocket source the script times:
+
+1. Full decoding with json.loads and (if installed) orjson.loads
+2. For blocks, partial decoding that slices out only the transactions around
+   the listener's prefilter markers, against a full decode followed by the
+   same prefilter over every transaction
+3. The listener's process_raw_message with each JSON backend, checking that
+   every backend detects the same mints
+
+Usage:
+    uv run learning-examples/benchmark_json_decoding.py --tokens 100 --noise 50
+    uv run learning-examples/benchmark_json_decoding.py --recording traffic.jsonl.gz
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import base58
+from solders.instruction import AccountMeta, Instruction
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from interfaces.core import Platform  # noqa: E402
+from monitoring.frame_decoder import decode_block_frame  # noqa: E402
+from monitoring.traffic_recorder import read_recording  # noqa: E402
+from monitoring.universal_block_listener import UniversalBlockListener  # noqa: E402
+from monitoring.universal_logs_listener import UniversalLogsListener  # noqa: E402
+from monitoring.universal_pumpportal_listener import (  # noqa: E402
+    UniversalPumpPortalListener,
+)
+from replay_benchmark import (  # noqa: E402
+    PUMP_PROGRAM,
+    FixtureTrafficBuilder,
+    anchor_discriminator,
+)
+from utils import json_backend  # noqa: E402
+
+SOURCES = ("logs", "blocks", "pumpportal")
+BUY = anchor_discriminator("global", "buy")
+
+
+def synthesize(tokens: int, noise: int, seed: int) -> dict[str, list[str]]:
+    builder = FixtureTrafficBuilder(seed)
+    frames: dict[str, list[str]] = {source: [] for source in SOURCES}
+    for _, source, raw in builder.build(tokens, 0.1, list(SOURCES), 1):
+        frames[source].append(raw)
+
+    # Buy transactions make up the bulk of a real pump.fun block
+    buy = Instruction(
+        PUMP_PROGRAM,
+        BUY + builder.rng.randbytes(16),
+        [AccountMeta(key, False, True) for key in builder.static_accounts[:12]],
+    )
+    padding = "".join(
+        json.dumps(builder._block_transaction(buy)) + ", " for _ in range(noise)
+    )
+    marker = '"transactions": ['
+    frames["blocks"] = [
+        raw.replace(marker, marker + padding, 1) for raw in frames["blocks"]
+    ]
+
+    # Logs of non-create transactions
+    for _ in range(tokens * 5):
+        signature = base58.b58encode(builder.rng.randbytes(64)).decode()
+        frames["logs"].append(
+            builder._logs_message(
+                signature, [f"Program {PUMP_PROGRAM} invoke [1]", "Program log: Instruction: Buy"]
+            )
+        )
+    return frames
+
+
+def load_recording(path: str) -> dict[str, list[str]]:
+    frames: dict[str, list[str]] = {source: [] for source in SOURCES}
+    for _, source, raw in read_recording(path):
+        if source in frames and isinstance(raw, str):
+            frames[source].append(raw)
+    return frames
+
+
+def timed(decode, frames: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for frame in frames:
+            decode(frame)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def full_prefiltered(raw: str, prefilter) -> list[str]:
+    transactions = json_backend.loads(raw)["params"]["result"]["value"]["block"][
+        "transactions"
+    ]
+    return [
+        tx["transaction"][0]
+        for tx in transactions
+        if prefilter.matches_base64(tx["transaction"][0])
+    ]
+
+
+async def detect(listener, frames: list[str]) -> tuple[list[list[str]], float]:
+    started = time.perf_counter()
+    mints = [
+        [str(t.mint) for t in await listener.process_raw_message(frame)]
+        for frame in frames
+    ]
+    return mints, time.perf_counter() - started
+
+
+async def run(args: argparse.Namespace) -> int:
+    frames = (
+        load_recording(args.recording)
+        if args.recording
+        else synthesize(args.tokens, args.noise, args.seed)
+    )
+    backends = ["stdlib"] + (["orjson"] if json_backend.orjson else [])
+    if not json_backend.orjson:
+        print("orjson is not installed; only the stdlib backend is measured")
+
+    listeners = {
+        "logs": lambda: UniversalLogsListener("ws://bench", [Platform.PUMP_FUN]),
+        "blocks": lambda: UniversalBlockListener("ws://bench", [Platform.PUMP_FUN]),
+        "pumpportal": lambda: UniversalPumpPortalListener(
+            "ws://bench", [Platform.PUMP_FUN]
+        ),
+    }
+
+    ok = True
+    for source in SOURCES:
+        batch = frames[source]
+        if not batch:
+            continue
+        size = sum(len(frame) for frame in batch)
+        print(f"\n{source}: {len(batch)} frames, {size / len(batch) / 1024:.1f} KiB avg")
+
+        for backend in backends:
+            json_backend.set_backend(backend)
+            elapsed = timed(json_backend.loads, batch, args.repeat)
+            print(f"  full decode ({backend}): {elapsed / len(batch) * 1e6:9.1f} us/frame")
+
+        if source == "blocks":
+            prefilter = listeners[source]().prefilter
+            for backend in backends:
+                json_backend.set_backend(backend)
+                elapsed = timed(
+                    lambda raw: full_prefiltered(raw, prefilter), batch, args.repeat
+                )
+                print(
+                    f"  full decode + prefilter ({backend}): "
+                    f"{elapsed / len(batch) * 1e6:6.1f} us/frame"
+                )
+            for backend in backends:
+                json_backend.set_backend(backend)
+                elapsed = timed(
+                    lambda raw: decode_block_frame(raw, prefilter.base64_markers),
+                    batch,
+                    args.repeat,
+                )
+                print(
+                    f"  partial decode ({backend}): {elapsed / len(batch) * 1e6:6.1f} us/frame"
+                )
+
+        results = {}
+        for backend in backends:
+            json_backend.set_backend(backend)
+            mints, elapsed = await detect(listeners[source](), batch)
+            results[backend] = mints
+            print(
+                f"  process_raw_message ({backend}): "
+                f"{elapsed / len(batch) * 1e6:6.1f} us/frame, "
+                f"{sum(map(len, mints))} tokens"
+            )
+        if any(mints != results["stdlib"] for mints in results.values()):
+            print("  RESULTS DIFFER between backends")
+            ok = False
+
+    json_backend.set_backend("auto")
+    return 0 if ok else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--recording", help="TrafficRecorder file to decode")
+    parser.add_argument("--tokens", type=int, default=100)
+    parser.add_argument("--noise", type=int, default=50, help="Non-create txs per block")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Benchmark precompiled trade templates against building transactions per trade.
+
+For each platform and side, the script compiles a trade template the way the
+trader does when a token is detected, then:
+
+1. Checks that signing the template yields byte-identical transactions to
+   building the instructions and compiling a message, over --checks random
+   amount, fee and blockhash combinations
+2. Times both paths from trade amounts to a signed, base64-encoded transaction
+
+Platforms whose builders do not support templates are reported as built per
+trade.
+
+Usage:
+    uv run learning-examples/benchmark_tx_templates.py --iterations 2000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.blockhash_service import RecentBlockhash  # noqa: E402
+from core.client import SolanaClient  # noqa: E402
+from interfaces.core import Platform, TokenInfo  # noqa: E402
+from platforms import get_platform_implementations  # noqa: E402
+from trading.trade_templates import TradeTemplateCache  # noqa: E402
+
+
+class StaticBlockhash:
+    """Stands in for the blockhash service with a settable blockhash."""
+
+    def __init__(self):
+        self.blockhash = Hash.default()
+
+    def get(self) -> RecentBlockhash:
+        return RecentBlockhash(self.blockhash, 1_000, 1, time.monotonic())
+
+
+class OfflineClient(SolanaClient):
+    """SolanaClient that signs transactions without any network access."""
+
+    def __init__(self):
+        # Skip SolanaClient.__init__ to avoid starting background tasks
+        self.rpc_endpoint = "http://offline"
+        self._client = None
+        self._last_valid_heights = OrderedDict()
+        self.blockhash_service = StaticBlockhash()
+
+
+class BenchWallet:
+    def __init__(self):
+        self.keypair = Keypair()
+        self.pubkey = self.keypair.pubkey()
+
+
+def token_for(platform: Platform) -> TokenInfo:
+    return TokenInfo(
+        name="Bench",
+        symbol="BENCH",
+        uri="",
+        mint=Pubkey.new_unique(),
+        platform=platform,
+        bonding_curve=Pubkey.new_unique(),
+        associated_bonding_curve=Pubkey.new_unique(),
+        pool_state=Pubkey.new_unique(),
+        base_vault=Pubkey.new_unique(),
+        quote_vault=Pubkey.new_unique(),
+        user=Pubkey.new_unique(),
+        creator=Pubkey.new_unique(),
+        creator_vault=Pubkey.new_unique(),
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    client = OfflineClient()
+    wallet = BenchWallet()
+    cache = TradeTemplateCache(client, wallet)
+
+    for platform in (Platform.PUMP_FUN, Platform.LETS_BONK):
+        implementations = get_platform_implementations(platform, client)
+        builder = implementations.instruction_builder
+        address_provider = implementations.address_provider
+        token_info = token_for(platform)
+
+        for side in ("buy", "sell"):
+            label = f"{platform.value} {side}"
+            started = time.perf_counter()
+            prepared = await cache.prepare(token_info, side)
+            compile_ms = (time.perf_counter() - started) * 1000
+            if prepared is None:
+                print(f"{label}: built per trade (no template)")
+                continue
+
+            build = (
+                builder.build_buy_instruction
+                if side == "buy"
+                else builder.build_sell_instruction
+            )
+
+            async def per_trade(amount_in: int, minimum_amount_out: int, fee, limit):
+                instructions = await build(
+                    token_info,
+                    wallet.pubkey,
+                    amount_in,
+                    minimum_amount_out,
+                    address_provider,
+                )
+                # Priority fee accounts are derived per trade too; templates keep them
+                (
+                    builder.get_required_accounts_for_buy
+                    if side == "buy"
+                    else builder.get_required_accounts_for_sell
+                )(token_info, wallet.pubkey, address_provider)
+                return client._sign_transaction(
+                    instructions, wallet.keypair, fee, limit
+                )
+
+            def templated(amount_in: int, minimum_amount_out: int, fee, limit):
+                transaction = prepared.template.bind(
+                    amount_in=amount_in, minimum_amount_out=minimum_amount_out
+                )
+                return client._sign_transaction(
+                    transaction, wallet.keypair, fee, limit
+                )
+
+            for _ in range(args.checks):
+                values = (
+                    rng.getrandbits(64),
+                    rng.getrandbits(64),
+                    rng.getrandbits(40),
+                    rng.getrandbits(32),
+                )
+                client.blockhash_service.blockhash = Hash(rng.randbytes(32))
+                expected = await per_trade(*values)
+                if templated(*values) != expected:
+                    raise SystemExit(f"{label}: template output differs from builder")
+
+            values = (10**9, 10**12, 200_000, 100_000)
+            started = time.perf_counter()
+            for _ in range(args.iterations):
+                await per_trade(*values)
+            built_us = (time.perf_counter() - started) / args.iterations * 1e6
+
+            started = time.perf_counter()
+            for _ in range(args.iterations):
+                templated(*values)
+            template_us = (time.perf_counter() - started) / args.iterations * 1e6
+
+            print(
+                f"{label}: identical over {args.checks} checks | per trade "
+                f"{built_us:.0f} us -> template {template_us:.0f} us "
+                f"({built_us / template_us:.1f}x) | compiled in {compile_ms:.1f} ms"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--checks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
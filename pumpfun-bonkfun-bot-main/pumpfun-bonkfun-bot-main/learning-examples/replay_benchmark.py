@@ -0,0 +1,610 @@
+"""
+Deterministic end-to-end benchmark: replay listener traffic into UniversalTrader.
+
+Recorded traffic (``record_traffic`` in a bot config) or a synthetic recording
+seeded from the fixtures in this directory is fed back through the real
+listener parsers and UniversalTrader. RPC goes to SimulatedSolanaClient, which
+answers every call locally after a configurable latency, so no SOL is spent
+and no node is needed.
+
+Synthetic recordings reuse:
+- raw_create_tx_from_getTransaction.json: token metadata, creator, log layout
+- raw_buy_tx_from_getTransaction.json: non-create log traffic
+- raw_create_tx_from_blockSubscribe.json: non-create block traffic
+- raw_bondingCurve_from_getAccountInfo.json: bonding curve served by the node
+
+Each fixture token is re-issued with a fresh mint and current-layout event and
+instruction data, so the current IDL decodes it.
+
+Reports detection -> decision -> send -> landed latency percentiles and
+replay msg/s. --drop-rate loses sends before they reach the leader, to compare
+a single send (--rebroadcast-interval 0) with resending until landed.
+
+Usage:
+    uv run learning-examples/replay_benchmark.py --speed 0 --tokens 200
+    uv run learning-examples/replay_benchmark.py --recording recordings/bot.jsonl.gz --speed 2
+    uv run learning-examples/replay_benchmark.py --speed 0 --drop-rate 0.5 --rebroadcast-interval 0.3
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import random
+import statistics
+import struct
+import sys
+import time
+
+import base58
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction import Transaction, VersionedTransaction
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.client import SolanaClient  # noqa: E402
+from core.pda_cache import pda_cache  # noqa: E402
+from geyser.generated import geyser_pb2  # noqa: E402
+from interfaces.core import Platform  # noqa: E402
+from monitoring.listener_factory import ListenerFactory  # noqa: E402
+from monitoring.replay_listener import ReplayListener  # noqa: E402
+from monitoring.traffic_recorder import read_recording, write_recording  # noqa: E402
+from monitoring.universal_multi_listener import UniversalMultiSourceListener  # noqa: E402
+from platforms.pumpfun.address_provider import (  # noqa: E402
+    PumpFunAddresses,
+    PumpFunAddressProvider,
+)
+from trading.universal_trader import UniversalTrader  # noqa: E402
+
+HERE = os.path.dirname(__file__)
+PUMP_PROGRAM = PumpFunAddresses.PROGRAM
+SOURCES = ["geyser", "logs", "pumpportal", "blocks"]
+
+# Typical delivery delay of each source relative to the create transaction (seconds)
+SOURCE_DELAYS = {"geyser": 0.0, "logs": 0.015, "pumpportal": 0.04, "blocks": 0.4}
+
+
+def load_json(*path: str) -> dict:
+    with open(os.path.join(HERE, *path)) as f:
+        return json.load(f)
+
+
+def anchor_discriminator(namespace: str, name: str) -> bytes:
+    return hashlib.sha256(f"{namespace}:{name}".encode()).digest()[:8]
+
+
+def borsh_string(value: str) -> bytes:
+    encoded = value.encode()
+    return struct.pack("<I", len(encoded)) + encoded
+
+
+def read_borsh_strings(data: bytes, count: int) -> list[str]:
+    values, offset = [], 0
+    for _ in range(count):
+        (length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        values.append(data[offset : offset + length].decode())
+        offset += length
+    return values
+
+
+class FixtureTrafficBuilder:
+    """Builds a synthetic multi-source recording from the repository fixtures."""
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+        self.address_provider = PumpFunAddressProvider()
+
+        create_tx = load_json("raw_create_tx_from_getTransaction.json")["result"]
+        buy_tx = load_json("raw_buy_tx_from_getTransaction.json")["result"]
+        self.block_tx = load_json(
+            "blockSubscribe-transactions", "raw_create_tx_from_blockSubscribe.json"
+        )
+        curve = load_json("raw_bondingCurve_from_getAccountInfo.json")
+        self.curve_data = base64.b64decode(curve["result"]["value"]["data"][0])
+        self.slot = create_tx["slot"]
+
+        create_ix = next(
+            ix
+            for ix in create_tx["transaction"]["message"]["instructions"]
+            if ix.get("programId") == str(PUMP_PROGRAM)
+        )
+        ix_data = base58.b58decode(create_ix["data"])
+        self.name, self.symbol, self.uri = read_borsh_strings(ix_data[8:], 3)
+        self.user = Pubkey.from_string(create_ix["accounts"][7])
+        self.static_accounts = [Pubkey.from_string(a) for a in create_ix["accounts"]]
+
+        self.create_logs = create_tx["meta"]["logMessages"]
+        self.buy_logs = buy_tx["meta"]["logMessages"]
+
+        # Virtual reserves from the bonding curve fixture
+        self.virtual_token_reserves, self.virtual_sol_reserves = struct.unpack_from(
+            "<QQ", self.curve_data, 8
+        )
+
+    def _signature(self) -> str:
+        return str(Signature(self.rng.randbytes(64)))
+
+    def _create_event(self, index: int, mint: Pubkey, bonding_curve: Pubkey) -> bytes:
+        return (
+            anchor_discriminator("event", "CreateEvent")
+            + borsh_string(f"{self.name} {index}")
+            + borsh_string(self.symbol)
+            + borsh_string(self.uri)
+            + bytes(mint)
+            + bytes(bonding_curve)
+            + bytes(self.user)
+            + bytes(self.user)
+            + struct.pack(
+                "<qQQQQ",
+                int(time.time()),
+                self.virtual_token_reserves,
+                self.virtual_sol_reserves,
+                self.virtual_token_reserves,
+                1_000_000_000_000_000,
+            )
+        )
+
+    def _create_instruction(
+        self, index: int, mint: Pubkey, bonding_curve: Pubkey, associated: Pubkey
+    ) -> Instruction:
+        data = (
+            anchor_discriminator("global", "create")
+            + borsh_string(f"{self.name} {index}")
+            + borsh_string(self.symbol)
+            + borsh_string(self.uri)
+            + bytes(self.user)
+        )
+        accounts = list(self.static_accounts)
+        accounts[0], accounts[2], accounts[3] = mint, bonding_curve, associated
+        metas = [
+            AccountMeta(key, is_signer=key in (mint, self.user), is_writable=True)
+            for key in accounts
+        ]
+        return Instruction(PUMP_PROGRAM, data, metas)
+
+    def _logs_message(self, signature: str, logs: list[str]) -> str:
+        return json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "logsNotification",
+                "params": {
+                    "result": {
+                        "context": {"slot": self.slot},
+                        "value": {"signature": signature, "err": None, "logs": logs},
+                    },
+                    "subscription": 1,
+                },
+            }
+        )
+
+    def _block_message(self, transactions: list[dict]) -> str:
+        return json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "blockNotification",
+                "params": {
+                    "result": {
+                        "context": {"slot": self.slot},
+                        "value": {
+                            "slot": self.slot,
+                            "block": {"transactions": transactions},
+                        },
+                    },
+                    "subscription": 1,
+                },
+            }
+        )
+
+    def _geyser_message(self, signature: str, instruction: Instruction) -> bytes:
+        message = Message([instruction], self.user)
+        update = geyser_pb2.SubscribeUpdate()
+        update.filters.append(f"platform_filter_{PUMP_PROGRAM}")
+        info = update.transaction.transaction
+        info.signature = base58.b58decode(signature)
+        tx_message = info.transaction.message
+        tx_message.account_keys.extend(bytes(key) for key in message.account_keys)
+        for compiled in message.instructions:
+            ix = tx_message.instructions.add()
+            ix.program_id_index = compiled.program_id_index
+            ix.accounts = bytes(compiled.accounts)
+            ix.data = bytes(compiled.data)
+        update.transaction.slot = self.slot
+        return update.SerializeToString()
+
+    def _block_transaction(self, instruction: Instruction) -> dict:
+        message = Message([instruction], self.user)
+        signatures = [
+            Signature(self.rng.randbytes(64))
+            for _ in range(message.header.num_required_signatures)
+        ]
+        transaction = VersionedTransaction.populate(message, signatures)
+        return {
+            "transaction": [base64.b64encode(bytes(transaction)).decode(), "base64"],
+            "meta": {"err": None},
+            "version": "legacy",
+        }
+
+    def build(
+        self, tokens: int, interval: float, sources: list[str], noise: int
+    ) -> list[tuple[float, str, str | bytes]]:
+        messages: list[tuple[float, str, str | bytes]] = []
+        for index in range(tokens):
+            created_at = index * interval
+            mint = Keypair.from_seed(self.rng.randbytes(32)).pubkey()
+            bonding_curve = self.address_provider.derive_pool_address(mint)
+            associated = self.address_provider.derive_associated_bonding_curve(
+                mint, bonding_curve
+            )
+            signature = self._signature()
+            instruction = self._create_instruction(index, mint, bonding_curve, associated)
+
+            def at(source: str) -> float:
+                jitter = self.rng.uniform(0, SOURCE_DELAYS[source] * 0.5 + 0.002)
+                return round(created_at + SOURCE_DELAYS[source] + jitter, 6)
+
+            if "geyser" in sources:
+                messages.append(
+                    (at("geyser"), "geyser", self._geyser_message(signature, instruction))
+                )
+            if "logs" in sources:
+                event = base64.b64encode(
+                    self._create_event(index, mint, bonding_curve)
+                ).decode()
+                logs = [
+                    f"Program data: {event}"
+                    if log.startswith("Program data: G3KpTd7r")
+                    else log
+                    for log in self.create_logs
+                ]
+                messages.append((at("logs"), "logs", self._logs_message(signature, logs)))
+            if "pumpportal" in sources:
+                messages.append(
+                    (
+                        at("pumpportal"),
+                        "pumpportal",
+                        json.dumps(
+                            {
+                                "signature": signature,
+                                "mint": str(mint),
+                                "traderPublicKey": str(self.user),
+                                "txType": "create",
+                                "bondingCurveKey": str(bonding_curve),
+                                "vTokensInBondingCurve": self.virtual_token_reserves / 1e6,
+                                "vSolInBondingCurve": self.virtual_sol_reserves / 1e9,
+                                "name": f"{self.name} {index}",
+                                "symbol": self.symbol,
+                                "uri": self.uri,
+                                "pool": "pump",
+                            }
+                        ),
+                    )
+                )
+            if "blocks" in sources:
+                transactions = [self.block_tx, self._block_transaction(instruction)]
+                messages.append((at("blocks"), "blocks", self._block_message(transactions)))
+
+            # Non-create traffic every listener has to parse and discard
+            for n in range(noise):
+                offset = round(created_at + interval * (n + 1) / (noise + 1), 6)
+                if "logs" in sources:
+                    messages.append(
+                        (offset, "logs", self._logs_message(self._signature(), self.buy_logs))
+                    )
+                if "blocks" in sources and n == 0:
+                    messages.append((offset, "blocks", self._block_message([self.block_tx])))
+
+        messages.sort(key=lambda message: message[0])
+        return messages
+
+
+class SimulatedSolanaClient(SolanaClient):
+    """SolanaClient whose JSON-RPC transport is answered locally after a delay.
+
+    Only ``_post_json`` is replaced, so batching, retries and confirmation
+    polling run exactly as they do against a real node. Each accepted send is
+    dropped before reaching the leader with probability ``drop_rate``; a
+    transaction lands on its first send that is not dropped. The chain
+    advances one slot (and block) every ``slot_time`` seconds, so blockhashes
+    expire after 150 of them.
+    """
+
+    def __init__(
+        self,
+        curve_data: bytes,
+        latency: float,
+        jitter: float,
+        seed: int,
+        drop_rate: float = 0.0,
+        slot_time: float = 0.4,
+    ):
+        self._curve_data = curve_data
+        self._latency = latency
+        self._jitter = jitter
+        self._rng = random.Random(seed)
+        self._genesis_slot = 300_000_000
+        self._started = time.monotonic()
+        self._slot_time = slot_time
+        self._slot = self._genesis_slot
+        self._drop_rate = drop_rate
+        self._tx_mints: dict[str, str] = {}
+        self.requests = 0
+        self.pending_mints: set[str] = set()
+        self.sent_at: dict[str, float] = {}
+        self.landed: set[str] = set()
+        self.landed_at: dict[str, float] = {}
+        super().__init__("http://simulated")
+
+    async def _post_json(self, payload):
+        self.requests += 1
+        await asyncio.sleep(max(0.0, self._rng.gauss(self._latency, self._jitter)))
+        if isinstance(payload, list):
+            return [self._respond(call) for call in payload]
+        return self._respond(payload)
+
+    def _respond(self, call: dict) -> dict:
+        method, params = call["method"], call.get("params", [])
+        elapsed = time.monotonic() - self._started
+        self._slot = self._genesis_slot + int(elapsed / self._slot_time)
+        context = {"slot": self._slot}
+
+        if method == "getHealth":
+            result = "ok"
+        elif method == "getAccountInfo":
+            # Fixture predates the creator field; pad it to the current layout
+            data = self._curve_data + bytes(32)
+            result = {
+                "context": context,
+                "value": {
+                    "data": [base64.b64encode(data).decode(), "base64"],
+                    "executable": False,
+                    "lamports": 73_551_852,
+                    "owner": str(PUMP_PROGRAM),
+                    "rentEpoch": 0,
+                    "space": len(data),
+                },
+            }
+        elif method == "getLatestBlockhash":
+            result = {
+                "context": context,
+                "value": {
+                    "blockhash": str(Hash.new_unique()),
+                    "lastValidBlockHeight": self._slot + 150,
+                },
+            }
+        elif method == "getRecentPrioritizationFees":
+            result = [{"slot": self._slot - i, "prioritizationFee": 0} for i in range(20)]
+        elif method == "getTokenAccountBalance":
+            result = {"context": context, "value": {"amount": "0", "decimals": 6}}
+        elif method == "getSignatureStatuses":
+            result = {
+                "context": context,
+                "value": [
+                    {"slot": self._slot, "confirmationStatus": "confirmed", "err": None}
+                    if signature in self.landed
+                    else None
+                    for signature in params[0]
+                ],
+            }
+        elif method == "sendTransaction":
+            return {"jsonrpc": "2.0", "id": call["id"], "result": self._send(params[0])}
+        else:
+            return {
+                "jsonrpc": "2.0",
+                "id": call["id"],
+                "error": {"code": -32601, "message": f"Method not found: {method}"},
+            }
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def _send(self, encoded_tx: str) -> str:
+        now = time.monotonic()
+        transaction = Transaction.from_bytes(base64.b64decode(encoded_tx))
+        signature = str(transaction.signatures[0])
+        for key in transaction.message.account_keys:
+            mint = str(key)
+            if mint in self.pending_mints:
+                self.pending_mints.discard(mint)
+                self.sent_at.setdefault(mint, now)
+                self._tx_mints[signature] = mint
+
+        if signature not in self.landed and self._rng.random() >= self._drop_rate:
+            self.landed.add(signature)
+            if signature in self._tx_mints:
+                self.landed_at.setdefault(self._tx_mints[signature], now)
+        return signature
+
+
+def percentiles(samples: list[float]) -> str:
+    if not samples:
+        return "n/a"
+    ms = sorted(s * 1000 for s in samples)
+    if len(ms) == 1:
+        return f"p50={ms[0]:.1f}ms"
+    cuts = statistics.quantiles(ms, n=100, method="inclusive")
+    return (
+        f"p50={cuts[49]:.1f}ms p90={cuts[89]:.1f}ms p99={cuts[98]:.1f}ms "
+        f"max={ms[-1]:.1f}ms (n={len(ms)})"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    sources = args.sources.split(",")
+
+    if args.recording:
+        recording = args.recording
+        recorded_sources = sorted({source for _, source, _ in read_recording(recording)})
+        sources = [s for s in sources if s in recorded_sources] or recorded_sources
+        curve_data = FixtureTrafficBuilder(args.seed).curve_data
+    else:
+        builder = FixtureTrafficBuilder(args.seed)
+        recording = args.output
+        messages = builder.build(args.tokens, args.interval, sources, args.noise)
+        write_recording(recording, messages)
+        curve_data = builder.curve_data
+        print(f"Wrote {len(messages)} synthetic messages to {recording}")
+
+    # One replay listener per source, raced through the real first-wins listener
+    replays = {}
+    for source in sources:
+        parser_listener = ListenerFactory.create_listener(
+            listener_type=source,
+            wss_endpoint="ws://replay",
+            geyser_endpoint="replay:443",
+            geyser_api_token="replay",
+            platforms=[Platform.PUMP_FUN],
+        )
+        replays[source] = ReplayListener(recording, {source: parser_listener}, args.speed)
+    listener = (
+        UniversalMultiSourceListener(replays, stats_interval=0)
+        if len(replays) > 1
+        else next(iter(replays.values()))
+    )
+
+    client = SimulatedSolanaClient(
+        curve_data,
+        args.rpc_latency_ms / 1000,
+        args.rpc_jitter_ms / 1000,
+        args.seed,
+        drop_rate=args.drop_rate,
+        slot_time=args.slot_ms / 1000,
+    )
+    trader = UniversalTrader(
+        rpc_endpoint="http://simulated",
+        wss_endpoint="ws://replay",
+        private_key=base58.b58encode(bytes(Keypair())).decode(),
+        buy_amount=0.0001,
+        buy_slippage=0.3,
+        sell_slippage=0.3,
+        platform=Platform.PUMP_FUN,
+        exit_strategy="manual",
+        yolo_mode=True,
+        max_concurrent_positions=args.concurrency,
+        wait_time_after_creation=0,
+        wait_time_before_new_token=0,
+        max_token_age=3600,
+        max_retries=1,
+        rebroadcast_interval=args.rebroadcast_interval,
+        transaction_templates=args.templates,
+        token_listener=listener,
+        solana_client=client,
+    )
+
+    # Decision = buy path entered for a token
+    decided_at: dict[str, float] = {}
+    execute = trader.buyer.execute
+
+    async def timed_execute(token_info):
+        mint = str(token_info.mint)
+        decided_at.setdefault(mint, time.monotonic())
+        client.pending_mints.add(mint)
+        return await execute(token_info)
+
+    trader.buyer.execute = timed_execute
+
+    # Stop the trader once the recording is exhausted and the queue has drained
+    listen = listener.listen_for_tokens
+
+    async def listen_then_drain(callback, match_string=None, creator_address=None):
+        await listen(callback, match_string, creator_address)
+        await trader.token_queue.join()
+        while trader.position_engine and trader.position_engine.active_positions:
+            await asyncio.sleep(0.01)
+
+    listener.listen_for_tokens = listen_then_drain
+
+    started = time.monotonic()
+    await trader.start()
+    wall = time.monotonic() - started
+    await client.close()
+
+    detected_at: dict[str, float] = {}
+    for replay in replays.values():
+        for mint, at in replay.detected_at.items():
+            detected_at[mint] = min(at, detected_at.get(mint, at))
+    messages = sum(replay.messages_replayed for replay in replays.values())
+    replay_time = max(replay.elapsed for replay in replays.values())
+
+    decide = [decided_at[m] - detected_at[m] for m in decided_at if m in detected_at]
+    send = [client.sent_at[m] - decided_at[m] for m in client.sent_at if m in decided_at]
+    total = [client.sent_at[m] - detected_at[m] for m in client.sent_at if m in detected_at]
+    land = [client.landed_at[m] - decided_at[m] for m in client.landed_at if m in decided_at]
+
+    print("\n=== Replay benchmark ===")
+    print(f"Sources: {', '.join(sources)} | speed: {f'{args.speed}x' if args.speed else 'max'} | "
+          f"RPC latency: {args.rpc_latency_ms}±{args.rpc_jitter_ms} ms | "
+          f"concurrency: {args.concurrency}")
+    print(f"Messages replayed: {messages} in {replay_time:.2f}s "
+          f"({messages / replay_time if replay_time else 0:.0f} msg/s)")
+    print(f"Tokens detected: {len(detected_at)}, bought: {len(client.sent_at)}, "
+          f"RPC requests: {client.requests}, wall time: {wall:.2f}s")
+    print(f"detection -> decision: {percentiles(decide)}")
+    print(f"decision  -> send:     {percentiles(send)}")
+    print(f"detection -> send:     {percentiles(total)}")
+    print(f"decision  -> landed:   {percentiles(land)} | "
+          f"landed {len(client.landed_at)}/{len(client.sent_at)} "
+          f"(drop rate {args.drop_rate:.0%}, rebroadcast every "
+          f"{f'{args.rebroadcast_interval * 1000:.0f} ms' if args.rebroadcast_interval else 'never'})")
+    if trader.trade_templates:
+        templates = trader.trade_templates
+        print(f"Trade templates: {templates.compiled} compiled, "
+              f"{templates.hits} trades precompiled, {templates.misses} built per trade")
+    pda = pda_cache.get_stats()
+    print(f"PDA cache: {pda['hit_rate']:.1%} hit rate ({pda['hits']} hits, "
+          f"{pda['misses']} misses), ~{pda['time_saved_ms']:.1f} ms of derivation saved")
+    if isinstance(listener, UniversalMultiSourceListener):
+        for name, stats in listener.get_stats()["sources"].items():
+            print(f"  {name}: won {stats['wins']}, avg lead {stats['avg_lead_ms']:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--recording", help="Replay this recording instead of fixtures")
+    parser.add_argument(
+        "--output",
+        default=os.path.join("recordings", "fixture_replay.jsonl.gz"),
+        help="Where to write the synthetic recording",
+    )
+    parser.add_argument("--sources", default=",".join(SOURCES))
+    parser.add_argument("--speed", type=float, default=1.0, help="0 for max speed")
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.2, help="Seconds between creates")
+    parser.add_argument("--noise", type=int, default=5, help="Non-create messages per create")
+    parser.add_argument("--rpc-latency-ms", type=float, default=40.0)
+    parser.add_argument("--rpc-jitter-ms", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent positions")
+    parser.add_argument(
+        "--drop-rate", type=float, default=0.0, help="Share of sends lost before the leader"
+    )
+    parser.add_argument(
+        "--rebroadcast-interval",
+        type=float,
+        default=0.0,
+        help="Resend each transaction this often until it lands (0 = send once)",
+    )
+    parser.add_argument(
+        "--templates", action="store_true", help="Precompile trade transactions"
+    )
+    parser.add_argument(
+        "--slot-ms", type=float, default=400.0, help="Simulated slot time (ms)"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
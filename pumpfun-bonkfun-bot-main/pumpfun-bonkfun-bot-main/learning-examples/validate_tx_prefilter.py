@@ -0,0 +1,153 @@
+"""
+Check the raw-bytes transaction prefilter against the full decode path.
+
+1. Fuzz: random payloads with the program ID and create discriminator planted
+   at every alignment must match exactly when both are present, in raw bytes
+   and in base64 form.
+2. Equivalence: synthetic blockSubscribe and Geyser traffic (creations plus
+   non-create noise) is parsed with the prefilter on and off, and the
+   detected mints must be identical.
+
+Exits non-zero on any mismatch and prints the decode time saved.
+
+Usage:
+    uv run learning-examples/validate_tx_prefilter.py --tokens 200 --noise 20
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import random
+import sys
+import time
+
+import base58
+from solders.instruction import AccountMeta, Instruction
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from interfaces.core import Platform  # noqa: E402
+from monitoring.tx_prefilter import TransactionPrefilter  # noqa: E402
+from monitoring.universal_block_listener import UniversalBlockListener  # noqa: E402
+from monitoring.universal_geyser_listener import UniversalGeyserListener  # noqa: E402
+from replay_benchmark import (  # noqa: E402
+    PUMP_PROGRAM,
+    FixtureTrafficBuilder,
+    anchor_discriminator,
+)
+
+CREATE = anchor_discriminator("global", "create")
+BUY = anchor_discriminator("global", "buy")
+
+
+def fuzz(rounds: int, rng: random.Random) -> int:
+    prefilter = TransactionPrefilter([(PUMP_PROGRAM, [CREATE])])
+    failures = 0
+    for _ in range(rounds):
+        has_program = rng.random() < 0.5
+        has_create = rng.random() < 0.5
+        planted = [bytes(PUMP_PROGRAM)] * has_program + [CREATE] * has_create
+        rng.shuffle(planted)
+
+        # Random filler around the planted patterns shifts their alignment
+        payload = rng.randbytes(rng.randint(0, 600))
+        for pattern in planted:
+            payload += pattern + rng.randbytes(rng.randint(0, 600))
+
+        expected = has_program and has_create
+        if prefilter.matches_bytes(payload) != expected:
+            failures += 1
+        if prefilter.matches_base64(base64.b64encode(payload).decode()) != expected:
+            failures += 1
+    return failures
+
+
+def build_traffic(tokens: int, noise: int, seed: int) -> list[tuple[str, str | bytes]]:
+    builder = FixtureTrafficBuilder(seed)
+    messages = [
+        (source, raw)
+        for _, source, raw in builder.build(tokens, 0.1, ["blocks", "geyser"], 1)
+    ]
+
+    # Buy instructions from the pump.fun program: the bulk of real traffic
+    for _ in range(tokens * noise):
+        buy = Instruction(
+            PUMP_PROGRAM,
+            BUY + builder.rng.randbytes(16),
+            [AccountMeta(key, False, True) for key in builder.static_accounts[:12]],
+        )
+        signature = base58.b58encode(builder.rng.randbytes(64)).decode()
+        messages.append(("geyser", builder._geyser_message(signature, buy)))
+
+    blocks = [builder._block_transaction(buy) for _ in range(noise)]
+    for index, (source, raw) in enumerate(list(messages)):
+        if source == "blocks":
+            # Pad every block with non-create transactions
+            prefix = raw.index('"transactions": [') + len('"transactions": [')
+            padding = "".join(
+                f'{{"transaction": ["{tx["transaction"][0]}", "base64"]}}, '
+                for tx in blocks
+            )
+            messages[index] = (source, raw[:prefix] + padding + raw[prefix:])
+    return messages
+
+
+async def compare(listener, messages: list) -> tuple[bool, float, float]:
+    prefilter = listener.prefilter
+
+    listener.prefilter = None
+    started = time.perf_counter()
+    full = [[str(t.mint) for t in await listener.process_raw_message(raw)] for raw in messages]
+    full_time = time.perf_counter() - started
+
+    listener.prefilter = prefilter
+    started = time.perf_counter()
+    filtered = [
+        [str(t.mint) for t in await listener.process_raw_message(raw)] for raw in messages
+    ]
+    filtered_time = time.perf_counter() - started
+
+    return full == filtered, full_time, filtered_time
+
+
+async def run(args: argparse.Namespace) -> int:
+    rng = random.Random(args.seed)
+    failures = fuzz(args.fuzz, rng)
+    print(f"Fuzz: {args.fuzz} payloads, {failures} mismatches")
+
+    messages = build_traffic(args.tokens, args.noise, args.seed)
+    listeners = {
+        "blocks": UniversalBlockListener("ws://validate", [Platform.PUMP_FUN]),
+        "geyser": UniversalGeyserListener(
+            "validate:443", "token", "x-token", [Platform.PUMP_FUN]
+        ),
+    }
+
+    ok = failures == 0
+    for source, listener in listeners.items():
+        raw = [message for s, message in messages if s == source]
+        same, full_time, filtered_time = await compare(listener, raw)
+        ok = ok and same
+        print(
+            f"{source}: {len(raw)} messages, results {'identical' if same else 'DIFFER'}, "
+            f"full decode {full_time * 1000:.1f} ms, prefiltered {filtered_time * 1000:.1f} ms "
+            f"({full_time / filtered_time if filtered_time else 0:.1f}x), "
+            f"prefilter pass rate {listener.prefilter.pass_rate:.1%}"
+        )
+
+    return 0 if ok else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tokens", type=int, default=100)
+    parser.add_argument("--noise", type=int, default=20, help="Non-create txs per token")
+    parser.add_argument("--fuzz", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,10 @@ from config_loader import (
     print_config_summary,
     validate_platform_listener_combination,
 )
+from core.client import SolanaClient
+from core.priority_fee.fee_oracle import PriorityFeeOracle
+from interfaces.core import Platform
+from monitoring.listener_hub import ListenerHub
 from trading.universal_trader import UniversalTrader
 from utils.logger import setup_file_logging
 
@@ -69,76 +73,7 @@ async def start_bot(config_path: str):
 
     # Initialize universal trader with platform-specific configuration
     try:
-        trader = UniversalTrader(
-            # Connection settings
-            rpc_endpoint=cfg["rpc_endpoint"],
-            wss_endpoint=cfg["wss_endpoint"],
-            private_key=cfg["private_key"],
-            # Platform configuration - pass platform enum directly
-            platform=platform,
-            # Trade parameters
-            buy_amount=cfg["trade"]["buy_amount"],
-            buy_slippage=cfg["trade"]["buy_slippage"],
-            sell_slippage=cfg["trade"]["sell_slippage"],
-            # Extreme fast mode settings
-            extreme_fast_mode=cfg["trade"].get("extreme_fast_mode", False),
-            extreme_fast_token_amount=cfg["trade"].get("extreme_fast_token_amount", 30),
-            # Exit strategy configuration
-            exit_strategy=cfg["trade"].get("exit_strategy", "time_based"),
-            take_profit_percentage=cfg["trade"].get("take_profit_percentage"),
-            stop_loss_percentage=cfg["trade"].get("stop_loss_percentage"),
-            max_hold_time=cfg["trade"].get("max_hold_time"),
-            price_check_interval=cfg["trade"].get("price_check_interval", 10),
-            # Listener configuration
-            listener_type=cfg["filters"]["listener_type"],
-            # Geyser configuration (if applicable)
-            geyser_endpoint=cfg.get("geyser", {}).get("endpoint"),
-            geyser_api_token=cfg.get("geyser", {}).get("api_token"),
-            geyser_auth_type=cfg.get("geyser", {}).get("auth_type", "x-token"),
-            # PumpPortal configuration (if applicable)
-            pumpportal_url=cfg.get("pumpportal", {}).get(
-                "url", "wss://pumpportal.fun/api/data"
-            ),
-            # Priority fee configuration
-            enable_dynamic_priority_fee=cfg.get("priority_fees", {}).get(
-                "enable_dynamic", False
-            ),
-            enable_fixed_priority_fee=cfg.get("priority_fees", {}).get(
-                "enable_fixed", True
-            ),
-            fixed_priority_fee=cfg.get("priority_fees", {}).get("fixed_amount", 500000),
-            extra_priority_fee=cfg.get("priority_fees", {}).get(
-                "extra_percentage", 0.0
-            ),
-            hard_cap_prior_fee=cfg.get("priority_fees", {}).get("hard_cap", 500000),
-            # Retry and timeout settings
-            max_retries=cfg.get("retries", {}).get("max_attempts", 10),
-            wait_time_after_creation=cfg.get("retries", {}).get(
-                "wait_after_creation", 15
-            ),
-            wait_time_after_buy=cfg.get("retries", {}).get("wait_after_buy", 15),
-            wait_time_before_new_token=cfg.get("retries", {}).get(
-                "wait_before_new_token", 15
-            ),
-            max_token_age=cfg.get("filters", {}).get("max_token_age", 0.001),
-            token_wait_timeout=cfg.get("timing", {}).get("token_wait_timeout", 120),
-            # Cleanup settings
-            cleanup_mode=cfg.get("cleanup", {}).get("mode", "disabled"),
-            cleanup_force_close_with_burn=cfg.get("cleanup", {}).get(
-                "force_close_with_burn", False
-            ),
-            cleanup_with_priority_fee=cfg.get("cleanup", {}).get(
-                "with_priority_fee", False
-            ),
-            # Trading filters
-            match_string=cfg["filters"].get("match_string"),
-            bro_address=cfg["filters"].get("bro_address"),
-            marry_mode=cfg["filters"].get("marry_mode", False),
-            yolo_mode=cfg["filters"].get("yolo_mode", False),
-            # Compute unit configuration
-            compute_units=cfg.get("compute_units", {}),
-        )
-
+        trader = create_trader(cfg, platform)
         await trader.start()
 
     except Exception as e:
@@ -146,10 +81,235 @@ async def start_bot(config_path: str):
         raise
 
 
+def create_trader(cfg: dict, platform: Platform, **shared) -> UniversalTrader:
+    """Create a trader from a bot configuration.
+
+    Args:
+        cfg: Loaded bot configuration
+        platform: Platform the bot trades on
+        **shared: Shared components passed through to UniversalTrader
+            (token_listener, solana_client, fee_oracle)
+
+    Returns:
+        Configured trader
+    """
+    return UniversalTrader(
+        # Connection settings
+        rpc_endpoint=cfg["rpc_endpoint"],
+        wss_endpoint=cfg["wss_endpoint"],
+        private_key=cfg["private_key"],
+        # Platform configuration - pass platform enum directly
+        platform=platform,
+        # Trade parameters
+        buy_amount=cfg["trade"]["buy_amount"],
+        buy_slippage=cfg["trade"]["buy_slippage"],
+        sell_slippage=cfg["trade"]["sell_slippage"],
+        # Extreme fast mode settings
+        extreme_fast_mode=cfg["trade"].get("extreme_fast_mode", False),
+        extreme_fast_token_amount=cfg["trade"].get("extreme_fast_token_amount", 30),
+        transaction_templates=cfg["trade"].get("transaction_templates", False),
+        # Exit strategy configuration
+        exit_strategy=cfg["trade"].get("exit_strategy", "time_based"),
+        take_profit_percentage=cfg["trade"].get("take_profit_percentage"),
+        stop_loss_percentage=cfg["trade"].get("stop_loss_percentage"),
+        max_hold_time=cfg["trade"].get("max_hold_time"),
+        price_check_interval=cfg["trade"].get("price_check_interval", 10),
+        price_feed=cfg["trade"].get("price_feed", "poll"),
+        curve_state_max_age=cfg["trade"].get("curve_state_max_age", 0),
+        price_feed_max_age=cfg["trade"].get("price_feed_max_age"),
+        # Listener configuration
+        listener_type=cfg["filters"]["listener_type"],
+        listener_sources=cfg["filters"].get("listener_sources"),
+        backfill_gap_slots=cfg["filters"].get("backfill_gap_slots", 0),
+        shared_websocket=cfg["filters"].get("shared_websocket", False),
+        # Geyser configuration (if applicable)
+        geyser_endpoint=cfg.get("geyser", {}).get("endpoint"),
+        geyser_api_token=cfg.get("geyser", {}).get("api_token"),
+        geyser_auth_type=cfg.get("geyser", {}).get("auth_type", "x-token"),
+        # PumpPortal configuration (if applicable)
+        pumpportal_url=cfg.get("pumpportal", {}).get(
+            "url", "wss://pumpportal.fun/api/data"
+        ),
+        # Priority fee configuration
+        enable_dynamic_priority_fee=cfg.get("priority_fees", {}).get(
+            "enable_dynamic", False
+        ),
+        enable_fixed_priority_fee=cfg.get("priority_fees", {}).get(
+            "enable_fixed", True
+        ),
+        fixed_priority_fee=cfg.get("priority_fees", {}).get("fixed_amount", 500000),
+        extra_priority_fee=cfg.get("priority_fees", {}).get(
+            "extra_percentage", 0.0
+        ),
+        hard_cap_prior_fee=cfg.get("priority_fees", {}).get("hard_cap", 500000),
+        dynamic_fee_percentile=cfg.get("priority_fees", {}).get("percentile", 70),
+        dynamic_fee_poll_interval=cfg.get("priority_fees", {}).get(
+            "poll_interval", 2.0
+        ),
+        dynamic_fee_max_staleness=cfg.get("priority_fees", {}).get(
+            "max_staleness", 10.0
+        ),
+        # Retry and timeout settings
+        max_retries=cfg.get("retries", {}).get("max_attempts", 10),
+        slot_driven_blockhash=cfg.get("retries", {}).get(
+            "slot_driven_blockhash", False
+        ),
+        signature_subscribe=cfg.get("retries", {}).get("signature_subscribe", False),
+        rebroadcast_interval=cfg.get("retries", {}).get("rebroadcast_interval", 0.0),
+        broadcast_endpoints=cfg.get("broadcast", {}).get("endpoints"),
+        broadcast_fanout=cfg.get("broadcast", {}).get("fanout", 0),
+        wait_time_after_creation=cfg.get("retries", {}).get(
+            "wait_after_creation", 15
+        ),
+        wait_time_after_buy=cfg.get("retries", {}).get("wait_after_buy", 15),
+        wait_time_before_new_token=cfg.get("retries", {}).get(
+            "wait_before_new_token", 15
+        ),
+        max_token_age=cfg.get("filters", {}).get("max_token_age", 0.001),
+        token_wait_timeout=cfg.get("timing", {}).get("token_wait_timeout", 120),
+        # Cleanup settings
+        cleanup_mode=cfg.get("cleanup", {}).get("mode", "disabled"),
+        cleanup_force_close_with_burn=cfg.get("cleanup", {}).get(
+            "force_close_with_burn", False
+        ),
+        cleanup_with_priority_fee=cfg.get("cleanup", {}).get(
+            "with_priority_fee", False
+        ),
+        # Trading filters
+        match_string=cfg["filters"].get("match_string"),
+        bro_address=cfg["filters"].get("bro_address"),
+        marry_mode=cfg["filters"].get("marry_mode", False),
+        yolo_mode=cfg["filters"].get("yolo_mode", False),
+        # Concurrency settings (yolo mode)
+        max_concurrent_positions=cfg.get("concurrency", {}).get(
+            "max_positions", 1
+        ),
+        max_sol_at_risk=cfg.get("concurrency", {}).get("max_sol_at_risk"),
+        stage_concurrency=cfg.get("concurrency", {}).get("stage_limits"),
+        # Compute unit configuration
+        compute_units=cfg.get("compute_units", {}),
+        # Trade journal
+        journal_config=cfg.get("journal", {}),
+        bot_name=cfg.get("name"),
+        # Raw listener traffic capture for replay benchmarks
+        record_traffic_path=cfg.get("record_traffic"),
+        **shared,
+    )
+
+
 def run_bot_process(config_path):
     asyncio.run(start_bot(config_path))
 
 
+class SharedServices:
+    """Connections and background services shared by bots in one event loop."""
+
+    def __init__(self):
+        """Initialize empty shared services. Must be created inside the event loop."""
+        self.listener_hub = ListenerHub()
+        self._clients: dict[str, SolanaClient] = {}
+        self._fee_oracles: dict[tuple, PriorityFeeOracle] = {}
+
+    def get_client(self, rpc_endpoint: str) -> SolanaClient:
+        """Get the client (and its blockhash updater) for an RPC endpoint."""
+        if rpc_endpoint not in self._clients:
+            self._clients[rpc_endpoint] = SolanaClient(rpc_endpoint)
+        return self._clients[rpc_endpoint]
+
+    def get_fee_oracle(self, cfg: dict) -> PriorityFeeOracle | None:
+        """Get the fee oracle matching a bot's dynamic fee settings, if enabled."""
+        fees = cfg.get("priority_fees", {})
+        if not fees.get("enable_dynamic", False):
+            return None
+
+        key = (
+            cfg["rpc_endpoint"],
+            fees.get("percentile", 70),
+            fees.get("poll_interval", 2.0),
+            fees.get("max_staleness", 10.0),
+        )
+        if key not in self._fee_oracles:
+            self._fee_oracles[key] = PriorityFeeOracle(
+                self.get_client(cfg["rpc_endpoint"]),
+                percentile=key[1],
+                poll_interval=key[2],
+                max_staleness=key[3],
+            )
+        return self._fee_oracles[key]
+
+    def trader_components(self, cfg: dict, platform: Platform) -> dict:
+        """Get the shared components to inject into a bot's trader."""
+        return {
+            "token_listener": self.listener_hub.subscribe(
+                listener_type=cfg["filters"]["listener_type"],
+                platform=platform,
+                wss_endpoint=cfg["wss_endpoint"],
+                geyser_endpoint=cfg.get("geyser", {}).get("endpoint"),
+                geyser_api_token=cfg.get("geyser", {}).get("api_token"),
+                geyser_auth_type=cfg.get("geyser", {}).get("auth_type", "x-token"),
+                pumpportal_url=cfg.get("pumpportal", {}).get(
+                    "url", "wss://pumpportal.fun/api/data"
+                ),
+                listener_sources=cfg["filters"].get("listener_sources"),
+                shared_websocket=cfg["filters"].get("shared_websocket", False),
+            ),
+            "solana_client": self.get_client(cfg["rpc_endpoint"]),
+            "fee_oracle": self.get_fee_oracle(cfg),
+        }
+
+    async def start(self) -> None:
+        """Start shared background services once every bot has registered."""
+        for oracle in self._fee_oracles.values():
+            await oracle.start()
+        logging.info(
+            f"Shared services: {self.listener_hub.subscription_count} listener "
+            f"subscription(s), {len(self._clients)} RPC client(s), "
+            f"{len(self._fee_oracles)} fee oracle(s)"
+        )
+
+    async def close(self) -> None:
+        """Stop shared listeners and services and close clients."""
+        await self.listener_hub.close()
+        for oracle in self._fee_oracles.values():
+            await oracle.stop()
+        for client in self._clients.values():
+            await client.close()
+
+
+async def start_shared_bots(configs: list[tuple[dict, Platform]]):
+    """Run several bots in one event loop on shared connections.
+
+    Bots with the same listener type, endpoint and platform share one
+    subscription; bots on the same RPC endpoint share one client and
+    blockhash updater.
+
+    Args:
+        configs: Loaded bot configurations with their platforms
+    """
+    setup_logging("shared")
+    services = SharedServices()
+    traders: dict[str, UniversalTrader] = {}
+    try:
+        for cfg, platform in configs:
+            print_config_summary(cfg)
+            try:
+                traders[cfg["name"]] = create_trader(
+                    cfg, platform, **services.trader_components(cfg, platform)
+                )
+            except Exception as e:
+                logging.exception(f"Failed to initialize bot '{cfg['name']}': {e}")
+
+        await services.start()
+        results = await asyncio.gather(
+            *(trader.start() for trader in traders.values()), return_exceptions=True
+        )
+        for name, result in zip(traders, results, strict=True):
+            if isinstance(result, Exception):
+                logging.error(f"Bot '{name}' failed: {result!r}")
+    finally:
+        await services.close()
+
+
 def run_all_bots():
     """Run all bots defined in YAML files in the 'bots' directory."""
     bot_dir = Path("bots")
@@ -165,6 +325,7 @@ def run_all_bots():
     logging.info(f"Found {len(bot_files)} bot configuration files")
 
     processes = []
+    shared_bots: list[tuple[dict, Platform]] = []
     skipped_bots = 0
 
     for file in bot_files:
@@ -225,7 +386,7 @@ def run_all_bots():
                 logging.info(
                     f"Starting bot '{bot_name}' ({platform.value}) in main process"
                 )
-                asyncio.run(start_bot(str(file)))
+                shared_bots.append((cfg, platform))
 
         except Exception as e:
             logging.exception(f"Failed to start bot from {file}: {e}")
@@ -235,6 +396,10 @@ def run_all_bots():
         f"Started {len(bot_files) - skipped_bots} bots, skipped {skipped_bots} disabled/invalid bots"
     )
 
+    # In-process bots share one event loop and their connections
+    if shared_bots:
+        asyncio.run(start_shared_bots(shared_bots))
+
     # Wait for all processes to complete
     for p in processes:
         p.join()
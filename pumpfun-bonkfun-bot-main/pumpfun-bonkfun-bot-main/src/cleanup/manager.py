@@ -40,7 +40,6 @@ class AccountCleanupManager:
         Skips if account doesn't exist or is already empty/closed.
         """
         ata = self.wallet.get_associated_token_address(mint)
-        solana_client = await self.client.get_client()
 
         priority_fee = (
             await self.priority_fee_manager.calculate_priority_fee([ata])
@@ -52,8 +51,9 @@ class AccountCleanupManager:
         await asyncio.sleep(15)
 
         try:
-            info = await solana_client.get_account_info(ata, encoding="base64")
-            if not info.value:
+            try:
+                await self.client.get_account_info(ata)
+            except ValueError:
                 logger.info(f"ATA {ata} does not exist or already closed.")
                 return
 
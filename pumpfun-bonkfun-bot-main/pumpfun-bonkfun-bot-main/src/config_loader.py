@@ -55,6 +55,62 @@ CONFIG_VALIDATION_RULES = [
         float("inf"),
         "priority_fees.hard_cap must be a non-negative integer",
     ),
+    (
+        "priority_fees.percentile",
+        int,
+        1,
+        99,
+        "priority_fees.percentile must be between 1 and 99",
+    ),
+    (
+        "priority_fees.poll_interval",
+        (int, float),
+        0.1,
+        60,
+        "priority_fees.poll_interval must be between 0.1 and 60 seconds",
+    ),
+    (
+        "priority_fees.max_staleness",
+        (int, float),
+        0.1,
+        float("inf"),
+        "priority_fees.max_staleness must be a positive number",
+    ),
+    (
+        "trade.curve_state_max_age",
+        (int, float),
+        0,
+        60,
+        "trade.curve_state_max_age must be between 0 and 60 seconds",
+    ),
+    (
+        "trade.price_feed_max_age",
+        (int, float),
+        0.1,
+        600,
+        "trade.price_feed_max_age must be between 0.1 and 600 seconds",
+    ),
+    (
+        "filters.backfill_gap_slots",
+        int,
+        0,
+        10_000,
+        "filters.backfill_gap_slots must be between 0 and 10000",
+    ),
+    (
+        "journal.max_file_size_mb",
+        (int, float),
+        0,
+        float("inf"),
+        "journal.max_file_size_mb must be a non-negative number",
+    ),
+    (
+        "journal.rotate_interval",
+        (int, float),
+        0,
+        float("inf"),
+        "journal.rotate_interval must be a non-negative number",
+    ),
     (
         "retries.max_attempts",
         int,
@@ -62,6 +118,20 @@ CONFIG_VALIDATION_RULES = [
         100,
         "retries.max_attempts must be between 0 and 100",
     ),
+    (
+        "retries.rebroadcast_interval",
+        (int, float),
+        0,
+        5,
+        "retries.rebroadcast_interval must be between 0 and 5 seconds",
+    ),
+    (
+        "broadcast.fanout",
+        int,
+        0,
+        100,
+        "broadcast.fanout must be between 0 and 100",
+    ),
     (
         "filters.max_token_age",
         (int, float),
@@ -69,20 +139,36 @@ CONFIG_VALIDATION_RULES = [
         float("inf"),
         "filters.max_token_age must be a non-negative number",
     ),
+    (
+        "concurrency.max_positions",
+        int,
+        1,
+        100,
+        "concurrency.max_positions must be between 1 and 100",
+    ),
+    (
+        "concurrency.max_sol_at_risk",
+        (int, float),
+        0,
+        float("inf"),
+        "concurrency.max_sol_at_risk must be a non-negative number",
+    ),
 ]
 
 # Valid values for enum-like fields
 VALID_VALUES = {
-    "filters.listener_type": ["logs", "blocks", "geyser", "pumpportal"],
+    "filters.listener_type": ["logs", "blocks", "geyser", "pumpportal", "multi"],
     "cleanup.mode": ["disabled", "on_fail", "after_sell", "post_session"],
     "trade.exit_strategy": ["time_based", "tp_sl", "manual"],
+    "trade.price_feed": ["poll", "account_subscribe", "geyser", "pumpportal"],
+    "journal.fsync": ["never", "rotate", "batch"],
     "platform": ["pump_fun", "lets_bonk"],
 }
 
 # Platform-specific listener compatibility
 PLATFORM_LISTENER_COMPATIBILITY = {
-    Platform.PUMP_FUN: ["logs", "blocks", "geyser", "pumpportal"],
-    Platform.LETS_BONK: ["blocks", "geyser", "pumpportal"],
+    Platform.PUMP_FUN: ["logs", "blocks", "geyser", "pumpportal", "multi"],
+    Platform.LETS_BONK: ["logs", "blocks", "geyser", "pumpportal", "multi"],
 }
 
 
@@ -127,6 +213,8 @@ def resolve_env_vars(config: dict) -> None:
         for k, v in d.items():
             if isinstance(v, dict):
                 resolve_all(v)
+            elif isinstance(v, list):
+                d[k] = [resolve_env(item) for item in v]
             else:
                 d[k] = resolve_env(v)
 
@@ -225,6 +313,19 @@ def validate_platform_config(config: dict, platform: Platform) -> None:
                 f"Listener type '{listener_type}' is not compatible with platform '{platform.value}'. "
                 f"Compatible listeners: {compatible_listeners}"
             )
+
+        if listener_type == "multi":
+            sources = config["filters"].get("listener_sources") or []
+            if len(sources) < 2:
+                raise ValueError(
+                    "filters.listener_sources must list at least two listeners for 'multi'"
+                )
+            for source in sources:
+                if source == "multi" or source not in compatible_listeners:
+                    raise ValueError(
+                        f"Listener source '{source}' is not compatible with platform '{platform.value}'. "
+                        f"Compatible listeners: {[name for name in compatible_listeners if name != 'multi']}"
+                    )
     except ValueError as e:
         if "Missing required config key" not in str(e):
             raise
@@ -330,7 +431,10 @@ def print_config_summary(config: dict) -> None:
     fees = config.get("priority_fees", {})
     print("Priority fees:")
     if fees.get("enable_dynamic"):
-        print("  - Dynamic fees enabled")
+        print(
+            f"  - Dynamic fees enabled (p{fees.get('percentile', 70)}, "
+            f"sampled every {fees.get('poll_interval', 2.0)}s)"
+        )
     elif fees.get("enable_fixed"):
         print(
             f"  - Fixed fee: {fees.get('fixed_amount', 'not configured')} microlamports"
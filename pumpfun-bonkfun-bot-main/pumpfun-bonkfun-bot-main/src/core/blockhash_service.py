@@ -0,0 +1,226 @@
+"""
+Recent blockhashes with the block height after which they expire.
+
+Blockhashes are refreshed on every slot notification when a slot stream is
+attached (``slotSubscribe`` over the endpoint's shared WebSocket, or any
+caller of ``on_slot``), and on a fixed timer otherwise. Each hash is kept
+with its ``lastValidBlockHeight``, so senders sign with the freshest hash and
+confirmation loops know when a transaction can no longer land.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from solders.hash import Hash
+
+from utils import json_backend
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from core.client import SolanaClient
+    from core.ws_multiplexer import MuxSubscription, WebSocketMultiplexer
+
+logger = get_logger(__name__)
+
+# A blockhash stays valid for this many blocks after the block that produced it
+MAX_PROCESSING_AGE = 150
+
+
+@dataclass(frozen=True, slots=True)
+class RecentBlockhash:
+    """A blockhash and the last block height at which it is accepted."""
+
+    blockhash: Hash
+    last_valid_block_height: int
+    slot: int
+    fetched_at: float
+
+
+class BlockhashService:
+    """Keeps a ring of recent blockhashes fresh in the background."""
+
+    def __init__(
+        self,
+        client: "SolanaClient",
+        poll_interval: float = 5.0,
+        ring_size: int = 16,
+    ):
+        """Initialize the blockhash service.
+
+        Args:
+            client: Solana client used to fetch blockhashes
+            poll_interval: Seconds between refreshes without slot notifications
+                (also the fallback when the slot stream stalls)
+            ring_size: Number of recent blockhashes kept
+        """
+        self.client = client
+        self.poll_interval = poll_interval
+        self._ring: deque[RecentBlockhash] = deque(maxlen=ring_size)
+        self._slot_event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._slot_task: asyncio.Task | None = None
+        self._slot_multiplexer: WebSocketMultiplexer | None = None
+        self._slot_subscription: MuxSubscription | None = None
+
+        # Newest slot reported by the slot stream
+        self.latest_slot: int | None = None
+        # Instrumentation
+        self.refreshes = 0
+        self.failures = 0
+
+    def start(self) -> None:
+        """Start the background refresh task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the refresh task and the slot stream."""
+        for task in (self._task, self._slot_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._slot_task = None
+
+        if self._slot_subscription is not None:
+            await self._slot_multiplexer.unsubscribe(self._slot_subscription)
+            self._slot_subscription = None
+
+    async def follow_slots(self, multiplexer: "WebSocketMultiplexer") -> None:
+        """Refresh on every ``slotSubscribe`` notification of an endpoint.
+
+        Calling it again while a slot stream is attached has no effect, so bots
+        sharing a client can each request it.
+
+        Args:
+            multiplexer: Shared connection of the endpoint to subscribe on
+        """
+        if self._slot_subscription is not None:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+        self._slot_multiplexer = multiplexer
+        self._slot_subscription = await multiplexer.subscribe(
+            "slotSubscribe", [], queue
+        )
+        self._slot_task = asyncio.create_task(self._consume_slots(queue))
+        logger.info(
+            f"Refreshing blockhashes on slots from {multiplexer.wss_endpoint}"
+        )
+
+    def on_slot(self, slot: int) -> None:
+        """Request a refresh for a new slot.
+
+        Refreshes never overlap; slots arriving during a fetch are coalesced
+        into the next one.
+
+        Args:
+            slot: Slot reported by a slot stream
+        """
+        if self.latest_slot is None or slot > self.latest_slot:
+            self.latest_slot = slot
+            self._slot_event.set()
+
+    def get(self) -> RecentBlockhash:
+        """Get the freshest blockhash.
+
+        Returns:
+            Newest blockhash and its expiry
+
+        Raises:
+            RuntimeError: If no blockhash has been fetched yet
+        """
+        if not self._ring:
+            raise RuntimeError("No cached blockhash available yet")
+        return self._ring[-1]
+
+    def age(self) -> float | None:
+        """Seconds since the freshest blockhash was fetched."""
+        if not self._ring:
+            return None
+        return time.monotonic() - self._ring[-1].fetched_at
+
+    def last_valid_block_height(self, blockhash: Hash) -> int | None:
+        """Look up the expiry of a blockhash still in the ring.
+
+        Args:
+            blockhash: Blockhash a transaction was signed with
+
+        Returns:
+            Last valid block height, or None if the hash is not tracked
+        """
+        for entry in reversed(self._ring):
+            if entry.blockhash == blockhash:
+                return entry.last_valid_block_height
+        return None
+
+    @property
+    def block_height(self) -> int | None:
+        """Block height when the freshest blockhash was fetched.
+
+        A lower bound of the current height, so an expiry check based on it
+        never gives up on a transaction that can still land.
+        """
+        if not self._ring:
+            return None
+        return self._ring[-1].last_valid_block_height - MAX_PROCESSING_AGE
+
+    def is_expired(self, last_valid_block_height: int) -> bool:
+        """Check whether a transaction's blockhash can no longer be processed.
+
+        Args:
+            last_valid_block_height: Expiry of the transaction's blockhash
+
+        Returns:
+            True once the chain has moved past the expiry height
+        """
+        height = self.block_height
+        return height is not None and height > last_valid_block_height
+
+    async def refresh(self) -> RecentBlockhash | None:
+        """Fetch the latest blockhash into the ring.
+
+        Returns:
+            Fetched blockhash, or None if the request failed
+        """
+        try:
+            entry = await self.client.get_latest_blockhash_info()
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"Blockhash fetch failed: {e!s}")
+            return None
+
+        self.refreshes += 1
+        if not self._ring or self._ring[-1].blockhash != entry.blockhash:
+            self._ring.append(entry)
+        return entry
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            # asyncio.timeout rather than wait_for, which can swallow a
+            # cancellation that coincides with the event being set
+            try:
+                async with asyncio.timeout(self.poll_interval):
+                    await self._slot_event.wait()
+            except TimeoutError:
+                pass
+            self._slot_event.clear()
+
+    async def _consume_slots(self, queue: asyncio.Queue) -> None:
+        while True:
+            _, message = await queue.get()
+            if message is None:
+                # Resubscribed after a reconnect
+                continue
+            try:
+                slot = json_backend.loads(message)["params"]["result"]["slot"]
+            except (ValueError, KeyError, TypeError):
+                logger.debug(f"Unexpected slot notification: {message[:200]}")
+                continue
+            self.on_slot(slot)
@@ -0,0 +1,260 @@
+"""
+Parallel transaction submission to several RPC endpoints.
+
+The same signed transaction is sent to the best-scored endpoints at once and
+the send resolves on the first acceptance. Sends still in flight keep running
+in the background so every endpoint's acceptance latency is measured, and
+confirmation outcomes are credited to the endpoints that accepted the
+transaction. Endpoints are ranked by acceptance latency weighted by landing
+rate, and one endpoint outside the selection is added periodically so a
+demoted endpoint can recover.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+
+from core.rpc_batcher import RpcError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Weight of the newest sample in the latency moving average
+LATENCY_ALPHA = 0.3
+# Score added per consecutive failure, in seconds of latency
+FAILURE_PENALTY = 1.0
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Submission statistics of one RPC endpoint."""
+
+    url: str
+    sends: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    errors: int = 0
+    consecutive_failures: int = 0
+    latency: float | None = None  # Moving average of acceptance latency (s)
+    landed: int = 0
+    expired: int = 0
+    last_used: float = 0.0
+
+    @property
+    def landing_rate(self) -> float:
+        """Share of accepted transactions that landed (smoothed for few samples)."""
+        return (self.landed + 1) / (self.landed + self.expired + 2)
+
+    @property
+    def score(self) -> float:
+        """Expected seconds to a landed transaction; lower is better.
+
+        Untried endpoints score 0 so each is measured at least once.
+        """
+        if self.latency is None:
+            return FAILURE_PENALTY * self.consecutive_failures
+        return (
+            self.latency / self.landing_rate
+            + FAILURE_PENALTY * self.consecutive_failures
+        )
+
+    def record_latency(self, seconds: float) -> None:
+        """Fold an acceptance latency into the moving average."""
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += LATENCY_ALPHA * (seconds - self.latency)
+
+
+class TransactionBroadcaster:
+    """Sends each transaction to several endpoints, first acceptance wins."""
+
+    def __init__(
+        self,
+        endpoints: list[str],
+        fanout: int = 0,
+        explore_every: int = 5,
+        send_timeout: float = 5.0,
+    ):
+        """Initialize the broadcaster.
+
+        Args:
+            endpoints: RPC endpoint URLs accepting sendTransaction
+            fanout: Number of best-scored endpoints per send (0 = all)
+            explore_every: Every this many sends, also use the least recently
+                used endpoint outside the selection (0 disables)
+            send_timeout: Seconds to wait for one endpoint's response
+
+        Raises:
+            ValueError: If no endpoint is given
+        """
+        if not endpoints:
+            raise ValueError("At least one broadcast endpoint is required")
+
+        self.stats = {url: EndpointStats(url) for url in dict.fromkeys(endpoints)}
+        self.fanout = fanout
+        self.explore_every = explore_every
+        self.send_timeout = send_timeout
+
+        self._session: aiohttp.ClientSession | None = None
+        self._sends = 0
+        # Responses still arriving after a send resolved
+        self._inflight: set[asyncio.Task] = set()
+        # Signature -> endpoints that accepted it, until its outcome is known
+        self._accepted_by: OrderedDict[str, list[EndpointStats]] = OrderedDict()
+
+    def select(self) -> list[EndpointStats]:
+        """Pick the endpoints for the next send.
+
+        Returns:
+            Endpoints ordered by score
+        """
+        ranked = sorted(self.stats.values(), key=lambda stats: stats.score)
+        if not self.fanout or self.fanout >= len(ranked):
+            return ranked
+
+        selected = ranked[: self.fanout]
+        self._sends += 1
+        if self.explore_every and self._sends % self.explore_every == 0:
+            selected.append(
+                min(ranked[self.fanout :], key=lambda stats: stats.last_used)
+            )
+        return selected
+
+    async def send(self, body: dict[str, Any]) -> str:
+        """Submit a sendTransaction request to the selected endpoints.
+
+        Args:
+            body: JSON-RPC sendTransaction request
+
+        Returns:
+            Transaction signature from the first endpoint that accepted it
+
+        Raises:
+            RpcError: If every endpoint rejected the transaction
+            aiohttp.ClientError: If no endpoint could be reached
+        """
+        selected = self.select()
+        pending = {
+            asyncio.create_task(self._send_one(stats, body)) for stats in selected
+        }
+        accepted_by: list[EndpointStats] = []
+        signature: str | None = None
+        error: BaseException | None = None
+
+        try:
+            while pending and signature is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    stats, result = task.result()
+                    accepted_by.append(stats)
+                    signature = signature or result
+        except asyncio.CancelledError:
+            for task in pending:
+                task.cancel()
+            raise
+
+        if signature is None:
+            raise error
+        self._track_acceptances(signature, accepted_by, pending)
+        return signature
+
+    def record_outcome(self, signature: str, landed: bool) -> None:
+        """Credit a confirmation outcome to the endpoints that accepted it.
+
+        Which endpoint delivered a landed transaction is unknown, so every
+        endpoint that accepted it shares the outcome; landing rates separate
+        endpoints best with a small fanout.
+
+        Args:
+            signature: Transaction signature
+            landed: Whether the transaction was confirmed
+        """
+        for stats in self._accepted_by.pop(signature, ()):
+            if landed:
+                stats.landed += 1
+            else:
+                stats.expired += 1
+
+    def summary(self) -> str:
+        """One line per endpoint with its scores, best first."""
+        lines = []
+        for stats in sorted(self.stats.values(), key=lambda stats: stats.score):
+            latency = f"{stats.latency * 1000:.1f}ms" if stats.latency else "n/a"
+            lines.append(
+                f"{stats.url}: score {stats.score:.3f}, latency {latency}, "
+                f"accepted {stats.accepted}/{stats.sends}, "
+                f"landed {stats.landed}, expired {stats.expired}"
+            )
+        return "\n".join(lines)
+
+    async def close(self) -> None:
+        """Wait for in-flight responses and close the HTTP session."""
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(self.send_timeout),
+            )
+        return self._session
+
+    async def _send_one(
+        self, stats: EndpointStats, body: dict[str, Any]
+    ) -> tuple[EndpointStats, str]:
+        stats.sends += 1
+        stats.last_used = time.monotonic()
+        started = time.perf_counter()
+        try:
+            async with self._get_session().post(stats.url, json=body) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            stats.errors += 1
+            stats.consecutive_failures += 1
+            logger.debug(f"Broadcast to {stats.url} failed: {e!s}")
+            raise
+
+        if "error" in data:
+            stats.rejected += 1
+            stats.consecutive_failures += 1
+            raise RpcError("sendTransaction", data["error"])
+
+        stats.accepted += 1
+        stats.consecutive_failures = 0
+        stats.record_latency(time.perf_counter() - started)
+        return stats, data["result"]
+
+    def _track_acceptances(
+        self,
+        signature: str,
+        accepted_by: list[EndpointStats],
+        pending: set[asyncio.Task],
+    ) -> None:
+        """Remember who accepted a signature, including late responses."""
+        self._accepted_by[signature] = accepted_by
+        if len(self._accepted_by) > 1_000:
+            self._accepted_by.popitem(last=False)
+
+        def on_done(task: asyncio.Task) -> None:
+            self._inflight.discard(task)
+            if not task.cancelled() and task.exception() is None:
+                accepted_by.append(task.result()[0])
+
+        for task in pending:
+            self._inflight.add(task)
+            task.add_done_callback(on_done)
@@ -3,13 +3,15 @@ Solana client abstraction for blockchain operations.
 """
 
 import asyncio
+import base64
 import json
+import time
+from collections import OrderedDict
 from typing import Any
 
 import aiohttp
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Processed
-from solana.rpc.types import TxOpts
+from solders.account import Account
 from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
 from solders.hash import Hash
 from solders.instruction import Instruction
@@ -18,50 +20,71 @@ from solders.message import Message
 from solders.pubkey import Pubkey
 from solders.transaction import Transaction
 
+from core.blockhash_service import BlockhashService, RecentBlockhash
+from core.broadcaster import TransactionBroadcaster
+from core.confirmation import ConfirmationTracker, TransactionOutcome
+from core.rpc_batcher import RpcBatcher, RpcError
+from core.tx_template import BoundTemplate
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Compute unit limit when only a priority fee is given
+DEFAULT_COMPUTE_UNIT_LIMIT = 85_000
+
 
 class SolanaClient:
     """Abstraction for Solana RPC client operations."""
 
-    def __init__(self, rpc_endpoint: str):
+    def __init__(
+        self,
+        rpc_endpoint: str,
+        batch_window: float = 0.002,
+        max_batch_size: int = 50,
+        max_connections: int = 100,
+    ):
         """Initialize Solana client with RPC endpoint.
 
         Args:
             rpc_endpoint: URL of the Solana RPC endpoint
+            batch_window: Seconds to coalesce concurrent reads into one batch
+            max_batch_size: Maximum number of calls per JSON-RPC batch
+            max_connections: Maximum pooled keep-alive connections
         """
         self.rpc_endpoint = rpc_endpoint
         self._client = None
-        self._cached_blockhash: Hash | None = None
-        self._blockhash_lock = asyncio.Lock()
-        self._blockhash_updater_task = asyncio.create_task(
-            self.start_blockhash_updater()
+        self._session: aiohttp.ClientSession | None = None
+        self._max_connections = max_connections
+        self._batcher = RpcBatcher(
+            self._post_json, batch_window=batch_window, max_batch_size=max_batch_size
         )
+        self.blockhash_service = BlockhashService(self)
+        self.blockhash_service.start()
+        # Expiry of the blockhash each sent transaction was signed with
+        self._last_valid_heights: OrderedDict[str, int] = OrderedDict()
+        # One batched status stream for every transaction awaiting confirmation
+        self.confirmations = ConfirmationTracker(self)
+        # Fans sends out to several endpoints when attached
+        self.broadcaster: TransactionBroadcaster | None = None
+
+    def attach_broadcaster(self, broadcaster: TransactionBroadcaster) -> None:
+        """Send transactions through several endpoints instead of rpc_endpoint.
 
-    async def start_blockhash_updater(self, interval: float = 5.0):
-        """Start background task to update recent blockhash."""
-        while True:
-            try:
-                blockhash = await self.get_latest_blockhash()
-                async with self._blockhash_lock:
-                    self._cached_blockhash = blockhash
-            except Exception as e:
-                logger.warning(f"Blockhash fetch failed: {e!s}")
-            finally:
-                await asyncio.sleep(interval)
+        Args:
+            broadcaster: Broadcaster submitting to its scored endpoints
+        """
+        self.broadcaster = broadcaster
 
     async def get_cached_blockhash(self) -> Hash:
         """Return the most recently cached blockhash."""
-        async with self._blockhash_lock:
-            if self._cached_blockhash is None:
-                raise RuntimeError("No cached blockhash available yet")
-            return self._cached_blockhash
+        return self.blockhash_service.get().blockhash
 
     async def get_client(self) -> AsyncClient:
         """Get or create the AsyncClient instance.
 
+        Kept for callers that need the full solana-py API. Hot paths in this
+        class go through the pooled session and the request batcher instead.
+
         Returns:
             AsyncClient instance
         """
@@ -71,47 +94,112 @@ class SolanaClient:
 
     async def close(self):
         """Close the client connection and stop the blockhash updater."""
-        if self._blockhash_updater_task:
-            self._blockhash_updater_task.cancel()
-            try:
-                await self._blockhash_updater_task
-            except asyncio.CancelledError:
-                pass
+        blockhash_service = getattr(self, "blockhash_service", None)
+        if blockhash_service:
+            await blockhash_service.stop()
+
+        confirmations = getattr(self, "confirmations", None)
+        if confirmations:
+            await confirmations.close()
 
         if self._client:
             await self._client.close()
             self._client = None
 
+        broadcaster = getattr(self, "broadcaster", None)
+        if broadcaster:
+            await broadcaster.close()
+
+        batcher = getattr(self, "_batcher", None)
+        if batcher:
+            await batcher.close()
+
+        session = getattr(self, "_session", None)
+        if session and not session.closed:
+            await session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared keep-alive HTTP session.
+
+        Returns:
+            Pooled aiohttp session reused for every RPC request
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(10),  # 10-second timeout
+            )
+        return self._session
+
+    async def _post_json(self, payload: Any) -> Any:
+        """POST a JSON-RPC payload over the pooled session.
+
+        Args:
+            payload: JSON-RPC request object or batch array
+
+        Returns:
+            Decoded JSON response
+        """
+        session = self._get_session()
+        async with session.post(self.rpc_endpoint, json=payload) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def _rpc_call(self, method: str, params: list[Any] | None = None) -> Any:
+        """Execute a batched JSON-RPC call.
+
+        Args:
+            method: JSON-RPC method name
+            params: Optional method parameters
+
+        Returns:
+            The ``result`` field of the response
+        """
+        return await self._batcher.call(method, params)
+
     async def get_health(self) -> str | None:
-        body = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "getHealth",
-        }
-        result = await self.post_rpc(body)
-        if result and "result" in result:
-            return result["result"]
-        return None
+        try:
+            return await self._rpc_call("getHealth")
+        except (RpcError, aiohttp.ClientError, asyncio.TimeoutError):
+            logger.exception("RPC request failed")
+            return None
 
-    async def get_account_info(self, pubkey: Pubkey) -> dict[str, Any]:
+    async def get_account_info(
+        self, pubkey: Pubkey, commitment: str = "finalized"
+    ) -> Account:
         """Get account info from the blockchain.
 
         Args:
             pubkey: Public key of the account
+            commitment: Commitment level (accounts created in the last few
+                slots are only visible at "processed" or "confirmed")
 
         Returns:
-            Account info response
+            Account with its lamports, decoded data and owner
 
         Raises:
             ValueError: If account doesn't exist or has no data
         """
-        client = await self.get_client()
-        response = await client.get_account_info(
-            pubkey, encoding="base64"
-        )  # base64 encoding for account data by default
-        if not response.value:
+        result = await self._rpc_call(
+            "getAccountInfo",
+            [str(pubkey), {"encoding": "base64", "commitment": commitment}],
+        )
+        value = result.get("value") if result else None
+        if not value:
             raise ValueError(f"Account {pubkey} not found")
-        return response.value
+        return Account(
+            lamports=value["lamports"],
+            data=base64.b64decode(value["data"][0]),
+            owner=Pubkey.from_string(value["owner"]),
+            executable=value["executable"],
+            rent_epoch=value.get("rentEpoch", 0),
+        )
 
     async def get_token_account_balance(self, token_account: Pubkey) -> int:
         """Get token balance for an account.
@@ -122,10 +210,13 @@ class SolanaClient:
         Returns:
             Token balance as integer
         """
-        client = await self.get_client()
-        response = await client.get_token_account_balance(token_account)
-        if response.value:
-            return int(response.value.amount)
+        result = await self._rpc_call(
+            "getTokenAccountBalance",
+            [str(token_account), {"commitment": "finalized"}],
+        )
+        value = result.get("value") if result else None
+        if value:
+            return int(value["amount"])
         return 0
 
     async def get_latest_blockhash(self) -> Hash:
@@ -134,13 +225,110 @@ class SolanaClient:
         Returns:
             Recent blockhash as string
         """
-        client = await self.get_client()
-        response = await client.get_latest_blockhash(commitment="processed")
-        return response.value.blockhash
+        result = await self._rpc_call(
+            "getLatestBlockhash", [{"commitment": "processed"}]
+        )
+        return Hash.from_string(result["value"]["blockhash"])
+
+    async def get_signature_statuses(
+        self, signatures: list[str]
+    ) -> list[dict[str, Any] | None]:
+        """Get the processing status of several transactions in one request.
+
+        Args:
+            signatures: Transaction signatures (at most 256)
+
+        Returns:
+            Status per signature, None for signatures the node has not seen
+        """
+        result = await self._rpc_call("getSignatureStatuses", [signatures])
+        return result["value"]
+
+    async def get_latest_blockhash_info(self) -> RecentBlockhash:
+        """Get the latest blockhash with the block height it expires after.
+
+        Returns:
+            Blockhash, last valid block height and context slot
+        """
+        result = await self._rpc_call(
+            "getLatestBlockhash", [{"commitment": "processed"}]
+        )
+        return RecentBlockhash(
+            blockhash=Hash.from_string(result["value"]["blockhash"]),
+            last_valid_block_height=result["value"]["lastValidBlockHeight"],
+            slot=result["context"]["slot"],
+            fetched_at=time.monotonic(),
+        )
+
+    async def get_recent_prioritization_fees(
+        self, accounts: list[Pubkey] | None = None
+    ) -> list[dict[str, Any]]:
+        """Get recent prioritization fees observed by the node.
+
+        Args:
+            accounts: Optional writable accounts to scope the fee sample
+
+        Returns:
+            List of ``{"slot", "prioritizationFee"}`` entries
+        """
+        params = [[str(account) for account in accounts]] if accounts else []
+        return await self._rpc_call("getRecentPrioritizationFees", params) or []
+
+    async def get_slot(self, commitment: str = "confirmed") -> int:
+        """Get the current slot.
+
+        Args:
+            commitment: Commitment level of the slot
+
+        Returns:
+            Current slot
+        """
+        return await self._rpc_call("getSlot", [{"commitment": commitment}])
+
+    async def get_blocks(self, start_slot: int, end_slot: int) -> list[int]:
+        """Get the confirmed slots that produced a block in a range.
+
+        Args:
+            start_slot: First slot (inclusive)
+            end_slot: Last slot (inclusive)
+
+        Returns:
+            Slots with a block, skipped slots omitted
+        """
+        return (
+            await self._rpc_call(
+                "getBlocks", [start_slot, end_slot, {"commitment": "confirmed"}]
+            )
+            or []
+        )
+
+    async def get_block(self, slot: int) -> dict[str, Any] | None:
+        """Get a confirmed block with base64-encoded transactions.
+
+        Args:
+            slot: Block slot
+
+        Returns:
+            Block in the same shape as ``blockNotification`` blocks, or None
+            if the slot has no block
+        """
+        return await self._rpc_call(
+            "getBlock",
+            [
+                slot,
+                {
+                    "commitment": "confirmed",
+                    "encoding": "base64",
+                    "transactionDetails": "full",
+                    "rewards": False,
+                    "maxSupportedTransactionVersion": 0,
+                },
+            ],
+        )
 
     async def build_and_send_transaction(
         self,
-        instructions: list[Instruction],
+        instructions: list[Instruction] | BoundTemplate,
         signer_keypair: Keypair,
         skip_preflight: bool = True,
         max_retries: int = 3,
@@ -151,7 +339,8 @@ class SolanaClient:
         Send a transaction with optional priority fee and compute unit limit.
 
         Args:
-            instructions: List of instructions to include in the transaction.
+            instructions: List of instructions to include in the transaction,
+                or a precompiled transaction template.
             signer_keypair: Keypair to sign the transaction.
             skip_preflight: Whether to skip preflight checks.
             max_retries: Maximum number of retry attempts.
@@ -161,37 +350,16 @@ class SolanaClient:
         Returns:
             Transaction signature.
         """
-        client = await self.get_client()
-
         logger.info(
             f"Priority fee in microlamports: {priority_fee if priority_fee else 0}"
         )
-
-        # Add compute budget instructions if applicable
-        if priority_fee is not None or compute_unit_limit is not None:
-            fee_instructions = []
-
-            # Set compute unit limit (use provided value or default to 85,000)
-            cu_limit = compute_unit_limit if compute_unit_limit is not None else 85_000
-            fee_instructions.append(set_compute_unit_limit(cu_limit))
-
-            # Set priority fee if provided
-            if priority_fee is not None:
-                fee_instructions.append(set_compute_unit_price(priority_fee))
-
-            instructions = fee_instructions + instructions
-
-        recent_blockhash = await self.get_cached_blockhash()
-        message = Message(instructions, signer_keypair.pubkey())
-        transaction = Transaction([signer_keypair], message, recent_blockhash)
+        encoded_tx, _, _ = self._sign_transaction(
+            instructions, signer_keypair, priority_fee, compute_unit_limit
+        )
 
         for attempt in range(max_retries):
             try:
-                tx_opts = TxOpts(
-                    skip_preflight=skip_preflight, preflight_commitment=Processed
-                )
-                response = await client.send_transaction(transaction, tx_opts)
-                return response.value
+                return await self._send_raw_transaction(encoded_tx, skip_preflight)
 
             except Exception as e:
                 if attempt == max_retries - 1:
@@ -206,28 +374,309 @@ class SolanaClient:
                 )
                 await asyncio.sleep(wait_time)
 
+    async def send_until_landed(
+        self,
+        instructions: list[Instruction] | BoundTemplate,
+        signer_keypair: Keypair,
+        skip_preflight: bool = True,
+        max_attempts: int = 1,
+        priority_fee: int | None = None,
+        compute_unit_limit: int | None = None,
+        rebroadcast_interval: float = 0.3,
+        commitment: str = "confirmed",
+        timeout: float = 90.0,
+    ) -> TransactionOutcome:
+        """Sign once and resend the same transaction until it lands or expires.
+
+        Send failures (timeouts, rate limits, a node behind) are covered by
+        the next resend, and a duplicate-signature response means the
+        transaction is already being processed. Only a program error signs
+        the instructions again, with a fresh blockhash.
+
+        Args:
+            instructions: List of instructions to include in the transaction,
+                or a precompiled transaction template
+            signer_keypair: Keypair to sign the transaction
+            skip_preflight: Whether to skip preflight checks
+            max_attempts: Maximum number of signed transactions (rebuilds + 1)
+            priority_fee: Optional priority fee in microlamports
+            compute_unit_limit: Optional compute unit limit
+            rebroadcast_interval: Seconds between resends and status polls
+            commitment: Confirmation commitment level
+            timeout: Maximum seconds to wait for one transaction
+
+        Returns:
+            Outcome of the last signed transaction
+        """
+        logger.info(
+            f"Priority fee in microlamports: {priority_fee if priority_fee else 0}"
+        )
+        for attempt in range(max(1, max_attempts)):
+            encoded_tx, signature, last_valid_block_height = self._sign_transaction(
+                instructions, signer_keypair, priority_fee, compute_unit_limit
+            )
+            outcome = await self._rebroadcast(
+                encoded_tx,
+                signature,
+                last_valid_block_height,
+                skip_preflight,
+                rebroadcast_interval,
+                commitment,
+                timeout,
+            )
+            if outcome.landed or outcome.error is None:
+                return outcome
+            if attempt < max_attempts - 1:
+                logger.warning(
+                    f"Transaction {signature} failed with {outcome.error}, rebuilding"
+                )
+        return outcome
+
+    async def _rebroadcast(
+        self,
+        encoded_tx: str,
+        signature: str,
+        last_valid_block_height: int,
+        skip_preflight: bool,
+        interval: float,
+        commitment: str,
+        timeout: float,
+    ) -> TransactionOutcome:
+        """Resend a signed transaction on a fixed cadence until it is confirmed.
+
+        Args:
+            encoded_tx: Base64-encoded serialized transaction
+            signature: Transaction signature
+            last_valid_block_height: Expiry of the transaction's blockhash
+            skip_preflight: Whether to skip preflight checks
+            interval: Seconds between resends
+            commitment: Confirmation commitment level
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Whether the transaction landed, and its program error if it failed
+        """
+        sends: set[asyncio.Task] = set()
+        program_errors: list[Any] = []
+        resend = True
+        sent = 0
+
+        def on_sent(task: asyncio.Task) -> None:
+            nonlocal resend
+            sends.discard(task)
+            if task.cancelled() or task.exception() is None:
+                return
+            error = task.exception()
+            text = str(error)
+            if "AlreadyProcessed" in text or "already been processed" in text:
+                # Duplicate signature: the transaction is in, stop resending
+                resend = False
+            elif isinstance(error, RpcError) and "InstructionError" in text:
+                program_errors.append(error.error)
+            else:
+                logger.debug(f"Resend of {signature} failed: {text}")
+
+        pending = await self.confirmations.track(
+            signature, commitment, last_valid_block_height
+        )
+        deadline = time.monotonic() + timeout
+        outcome: TransactionOutcome | None = None
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                # Once seen by the cluster, resending cannot help anymore
+                if (
+                    resend
+                    and not pending.seen
+                    and not self.blockhash_service.is_expired(last_valid_block_height)
+                ):
+                    task = asyncio.create_task(
+                        self._send_raw_transaction(encoded_tx, skip_preflight)
+                    )
+                    sends.add(task)
+                    task.add_done_callback(on_sent)
+                    sent += 1
+
+                await asyncio.wait({pending.future}, timeout=min(interval, remaining))
+                if pending.future.done():
+                    outcome = pending.future.result()
+                    break
+                if program_errors:
+                    outcome = TransactionOutcome(signature, False, program_errors[0])
+                    break
+        finally:
+            for task in list(sends):
+                task.cancel()
+            await self.confirmations.discard(pending)
+
+        if outcome is None:
+            logger.error(
+                f"Transaction {signature} not confirmed after {timeout:.0f} seconds"
+            )
+            outcome = TransactionOutcome(signature, False)
+        elif outcome.landed:
+            logger.info(f"Transaction {signature} landed after {sent} sends")
+        elif outcome.error is None:
+            logger.error(f"Transaction {signature} not landed after {sent} sends")
+        self._record_outcome(signature, outcome.landed)
+        return outcome
+
+    def _sign_transaction(
+        self,
+        instructions: list[Instruction] | BoundTemplate,
+        signer_keypair: Keypair,
+        priority_fee: int | None,
+        compute_unit_limit: int | None,
+    ) -> tuple[str, str, int]:
+        """Sign instructions with the freshest blockhash.
+
+        A bound template is patched and signed without compiling a message;
+        its compute budget instructions are always present, with a price of
+        0 when no priority fee is given.
+
+        Args:
+            instructions: List of instructions to include in the transaction,
+                or a precompiled transaction template
+            signer_keypair: Keypair to sign the transaction
+            priority_fee: Optional priority fee in microlamports
+            compute_unit_limit: Optional compute unit limit (85,000 if only a
+                priority fee is given)
+
+        Returns:
+            Base64-encoded transaction, its signature and the last block
+            height at which it can land
+        """
+        cu_limit = (
+            compute_unit_limit
+            if compute_unit_limit is not None
+            else DEFAULT_COMPUTE_UNIT_LIMIT
+        )
+        recent = self.blockhash_service.get()
+
+        if isinstance(instructions, BoundTemplate):
+            raw_tx, tx_signature = instructions.sign(
+                signer_keypair, recent.blockhash, cu_limit, priority_fee or 0
+            )
+            encoded_tx = base64.b64encode(raw_tx).decode("ascii")
+            signature = str(tx_signature)
+            self._remember_expiry(signature, recent.last_valid_block_height)
+            return encoded_tx, signature, recent.last_valid_block_height
+
+        # Add compute budget instructions if applicable
+        if priority_fee is not None or compute_unit_limit is not None:
+            fee_instructions = [set_compute_unit_limit(cu_limit)]
+
+            # Set priority fee if provided
+            if priority_fee is not None:
+                fee_instructions.append(set_compute_unit_price(priority_fee))
+
+            instructions = fee_instructions + instructions
+
+        message = Message(instructions, signer_keypair.pubkey())
+        transaction = Transaction([signer_keypair], message, recent.blockhash)
+        encoded_tx = base64.b64encode(bytes(transaction)).decode("ascii")
+        signature = str(transaction.signatures[0])
+        self._remember_expiry(signature, recent.last_valid_block_height)
+        return encoded_tx, signature, recent.last_valid_block_height
+
+    def _remember_expiry(self, signature: str, last_valid_block_height: int) -> None:
+        """Record when a sent transaction's blockhash expires.
+
+        Args:
+            signature: Transaction signature
+            last_valid_block_height: Expiry of the transaction's blockhash
+        """
+        self._last_valid_heights[signature] = last_valid_block_height
+        if len(self._last_valid_heights) > 1_000:
+            self._last_valid_heights.popitem(last=False)
+
+    async def _send_raw_transaction(
+        self, encoded_tx: str, skip_preflight: bool = True
+    ) -> str:
+        """Submit a signed, base64-encoded transaction.
+
+        Sends are latency critical, so they bypass the batch window but still
+        reuse the pooled keep-alive connection. With a broadcaster attached the
+        request goes to its selected endpoints in parallel instead.
+
+        Args:
+            encoded_tx: Base64-encoded serialized transaction
+            skip_preflight: Whether to skip preflight checks
+
+        Returns:
+            Transaction signature
+        """
+        body = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "sendTransaction",
+            "params": [
+                encoded_tx,
+                {
+                    "encoding": "base64",
+                    "skipPreflight": skip_preflight,
+                    "preflightCommitment": "processed",
+                },
+            ],
+        }
+        if self.broadcaster:
+            return await self.broadcaster.send(body)
+
+        response = await self._post_json(body)
+        if "error" in response:
+            raise RpcError("sendTransaction", response["error"])
+        return response["result"]
+
     async def confirm_transaction(
-        self, signature: str, commitment: str = "confirmed"
+        self,
+        signature: str,
+        commitment: str = "confirmed",
+        timeout: float = 90.0,
+        last_valid_block_height: int | None = None,
     ) -> bool:
         """Wait for transaction confirmation.
 
+        The signature is added to the client's confirmation tracker, which
+        polls the status of every pending transaction in one batched request
+        and, when attached to a WebSocket endpoint, receives confirmations
+        through ``signatureSubscribe``. Waiting stops early once the
+        transaction's blockhash has expired without the transaction being seen.
+
         Args:
             signature: Transaction signature
             commitment: Confirmation commitment level
+            timeout: Maximum seconds to wait for confirmation
+            last_valid_block_height: Expiry of the transaction's blockhash
+                (known for transactions sent through this client)
 
         Returns:
-            Whether transaction was confirmed
+            Whether transaction was confirmed without an error
         """
-        client = await self.get_client()
+        signature = str(signature)
+        if last_valid_block_height is None:
+            last_valid_block_height = self._last_valid_heights.get(signature)
         try:
-            await client.confirm_transaction(
-                signature, commitment=commitment, sleep_seconds=1
+            outcome = await self.confirmations.wait(
+                signature, commitment, last_valid_block_height, timeout
             )
-            return True
         except Exception:
             logger.exception(f"Failed to confirm transaction {signature}")
             return False
 
+        if outcome.error is not None:
+            logger.error(f"Transaction {signature} failed: {outcome.error}")
+        self._record_outcome(signature, outcome.landed)
+        return outcome.landed
+
+    def _record_outcome(self, signature: str, landed: bool) -> None:
+        """Score the broadcast endpoints that accepted a transaction.
+
+        Args:
+            signature: Transaction signature
+            landed: Whether the transaction was confirmed
+        """
+        if self.broadcaster:
+            self.broadcaster.record_outcome(signature, landed)
+
     async def post_rpc(self, body: dict[str, Any]) -> dict[str, Any] | None:
         """
         Send a raw RPC request to the Solana node.
@@ -239,14 +688,7 @@ class SolanaClient:
             Optional[Dict[str, Any]]: Parsed JSON response, or None if the request fails.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.rpc_endpoint,
-                    json=body,
-                    timeout=aiohttp.ClientTimeout(10),  # 10-second timeout
-                ) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            return await self._post_json(body)
         except aiohttp.ClientError:
             logger.exception("RPC request failed")
             return None
@@ -0,0 +1,322 @@
+"""
+Shared confirmation tracking for sent transactions.
+
+Every signature waiting for confirmation is registered with one tracker per
+client. A single background task polls ``getSignatureStatuses`` for all of
+them in one batched request per interval, and when a WebSocket endpoint is
+attached each signature is also watched with ``signatureSubscribe`` over the
+endpoint's shared connection, so confirmations are usually pushed before the
+next poll. Waits are correlated with the blockhash expiry of the
+transaction: once its blockhash can no longer be processed and the cluster
+has not seen it, the wait fails immediately instead of running into the
+timeout.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from utils import json_backend
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from core.client import SolanaClient
+    from core.ws_multiplexer import MuxSubscription, WebSocketMultiplexer
+
+logger = get_logger(__name__)
+
+# Ordering of commitment levels reported by getSignatureStatuses
+COMMITMENT_RANK = {"processed": 0, "confirmed": 1, "finalized": 2}
+# Most signatures getSignatureStatuses accepts per request
+MAX_SIGNATURES_PER_REQUEST = 256
+
+
+@dataclass(frozen=True)
+class TransactionOutcome:
+    """Result of sending a transaction until it lands or expires."""
+
+    signature: str
+    landed: bool
+    error: Any = None  # Program error of a transaction that failed on chain
+
+
+@dataclass(eq=False)
+class PendingSignature:
+    """A signature registered with the tracker."""
+
+    signature: str
+    commitment: str
+    last_valid_block_height: int | None
+    future: asyncio.Future
+    seen: bool = False  # Reported by the cluster below the target commitment
+    subscription: "MuxSubscription | None" = field(default=None, repr=False)
+    watchers: int = 1
+
+    @property
+    def target_rank(self) -> int:
+        """Rank of the commitment the signature is waited for at."""
+        return COMMITMENT_RANK.get(self.commitment, COMMITMENT_RANK["confirmed"])
+
+
+class ConfirmationTracker:
+    """Confirms all pending signatures of a client with one status stream."""
+
+    def __init__(self, client: "SolanaClient", poll_interval: float = 0.4):
+        """Initialize the tracker.
+
+        Args:
+            client: Solana client used for status polls and expiry checks
+            poll_interval: Seconds between batched status polls (a newly
+                tracked signature triggers a poll right away)
+        """
+        self.client = client
+        self.poll_interval = poll_interval
+        self._pending: dict[str, PendingSignature] = {}
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._multiplexer: WebSocketMultiplexer | None = None
+        self._queue: asyncio.Queue | None = None
+        self._notification_task: asyncio.Task | None = None
+
+        # Instrumentation
+        self.polls = 0
+        self.poll_failures = 0
+        self.confirmed_by_poll = 0
+        self.confirmed_by_push = 0
+        self.expired = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of signatures waiting for confirmation."""
+        return len(self._pending)
+
+    async def follow_signatures(self, multiplexer: "WebSocketMultiplexer") -> None:
+        """Also watch signatures with ``signatureSubscribe`` on an endpoint.
+
+        Calling it again while an endpoint is attached has no effect, so bots
+        sharing a client can each request it. Batched polling continues as
+        the fallback for notifications lost to a reconnect.
+
+        Args:
+            multiplexer: Shared connection of the endpoint to subscribe on
+        """
+        if self._multiplexer is not None:
+            return
+
+        self._multiplexer = multiplexer
+        self._queue = asyncio.Queue(maxsize=1000)
+        self._notification_task = asyncio.create_task(self._consume_notifications())
+        for entry in list(self._pending.values()):
+            await self._subscribe(entry)
+        logger.info(
+            f"Confirming transactions via signatureSubscribe on "
+            f"{multiplexer.wss_endpoint}"
+        )
+
+    async def track(
+        self,
+        signature: str,
+        commitment: str = "confirmed",
+        last_valid_block_height: int | None = None,
+    ) -> PendingSignature:
+        """Register a signature; its future resolves with the outcome.
+
+        Tracking an already pending signature returns the same entry, and
+        every ``track`` must be paired with a ``discard``.
+
+        Args:
+            signature: Transaction signature
+            commitment: Commitment level to wait for
+            last_valid_block_height: Expiry of the transaction's blockhash
+                (None to wait until the caller gives up)
+
+        Returns:
+            Pending entry whose future resolves to a TransactionOutcome
+        """
+        entry = self._pending.get(signature)
+        if entry is not None:
+            entry.watchers += 1
+            return entry
+
+        entry = PendingSignature(
+            signature,
+            commitment,
+            last_valid_block_height,
+            asyncio.get_running_loop().create_future(),
+        )
+        self._pending[signature] = entry
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        if self._multiplexer is not None:
+            await self._subscribe(entry)
+        return entry
+
+    async def discard(self, entry: PendingSignature) -> None:
+        """Stop tracking a signature once its last watcher is done with it.
+
+        Args:
+            entry: Entry returned by ``track``
+        """
+        entry.watchers -= 1
+        if entry.watchers > 0:
+            return
+        if self._pending.get(entry.signature) is entry:
+            del self._pending[entry.signature]
+        if entry.subscription is not None:
+            subscription, entry.subscription = entry.subscription, None
+            await self._multiplexer.unsubscribe(subscription)
+
+    async def wait(
+        self,
+        signature: str,
+        commitment: str = "confirmed",
+        last_valid_block_height: int | None = None,
+        timeout: float = 90.0,
+    ) -> TransactionOutcome:
+        """Wait for a signature to reach a commitment level.
+
+        Args:
+            signature: Transaction signature
+            commitment: Commitment level to wait for
+            last_valid_block_height: Expiry of the transaction's blockhash
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Whether the transaction landed, and its error if it failed
+        """
+        entry = await self.track(signature, commitment, last_valid_block_height)
+        try:
+            async with asyncio.timeout(timeout):
+                # Shielded: other watchers share the future
+                return await asyncio.shield(entry.future)
+        except TimeoutError:
+            logger.error(
+                f"Transaction {signature} not confirmed after {timeout:.0f} seconds"
+            )
+            return TransactionOutcome(signature, False)
+        finally:
+            await self.discard(entry)
+
+    async def poll(self) -> None:
+        """Fetch the status of every pending signature in batched requests."""
+        entries = [entry for entry in self._pending.values() if not entry.future.done()]
+        if not entries:
+            return
+        chunks = [
+            entries[i : i + MAX_SIGNATURES_PER_REQUEST]
+            for i in range(0, len(entries), MAX_SIGNATURES_PER_REQUEST)
+        ]
+        await asyncio.gather(*(self._poll_chunk(chunk) for chunk in chunks))
+
+    async def close(self) -> None:
+        """Stop polling and resolve every pending signature as not landed."""
+        for task in (self._task, self._notification_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._notification_task = None
+
+        for entry in list(self._pending.values()):
+            self._resolve(entry, TransactionOutcome(entry.signature, False))
+            if entry.subscription is not None:
+                await self._multiplexer.unsubscribe(entry.subscription)
+                entry.subscription = None
+        self._pending.clear()
+
+    async def _run(self) -> None:
+        while self._pending:
+            self._wakeup.clear()
+            await self.poll()
+            try:
+                async with asyncio.timeout(self.poll_interval):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                pass
+
+    async def _poll_chunk(self, entries: list[PendingSignature]) -> None:
+        # Checked before the poll: once expired, a miss is final
+        blockhash_service = self.client.blockhash_service
+        expired = [
+            entry.last_valid_block_height is not None
+            and blockhash_service.is_expired(entry.last_valid_block_height)
+            for entry in entries
+        ]
+        try:
+            statuses = await self.client.get_signature_statuses(
+                [entry.signature for entry in entries]
+            )
+        except Exception as e:
+            self.poll_failures += 1
+            logger.warning(f"Signature status poll failed: {e!s}")
+            return
+        self.polls += 1
+
+        for entry, status, is_expired in zip(entries, statuses, expired, strict=True):
+            if entry.future.done():
+                continue
+            if status is None:
+                if is_expired:
+                    self.expired += 1
+                    logger.error(
+                        f"Transaction {entry.signature} expired: blockhash no "
+                        f"longer valid after block height "
+                        f"{entry.last_valid_block_height}"
+                    )
+                    self._resolve(entry, TransactionOutcome(entry.signature, False))
+                continue
+
+            if status.get("err"):
+                self._resolve(
+                    entry, TransactionOutcome(entry.signature, False, status["err"])
+                )
+                continue
+            reached = status.get("confirmationStatus") or "processed"
+            if COMMITMENT_RANK.get(reached, 0) >= entry.target_rank:
+                self.confirmed_by_poll += 1
+                self._resolve(entry, TransactionOutcome(entry.signature, True))
+            else:
+                entry.seen = True
+
+    async def _subscribe(self, entry: PendingSignature) -> None:
+        entry.subscription = await self._multiplexer.subscribe(
+            "signatureSubscribe",
+            [entry.signature, {"commitment": entry.commitment}],
+            self._queue,
+            key=entry,
+        )
+
+    async def _consume_notifications(self) -> None:
+        while True:
+            subscription, message = await self._queue.get()
+            if message is None:
+                # Resubscribed after a reconnect; polls cover the gap
+                continue
+            try:
+                value = json_backend.loads(message)["params"]["result"]["value"]
+            except (ValueError, KeyError, TypeError):
+                logger.debug(f"Unexpected signature notification: {message[:200]}")
+                continue
+            if not isinstance(value, dict):
+                continue
+
+            entry: PendingSignature = subscription.key
+            # The server cancels a signature subscription after notifying it
+            if entry.subscription is subscription:
+                entry.subscription = None
+            await self._multiplexer.unsubscribe(subscription, notify_server=False)
+
+            if entry.future.done():
+                continue
+            error = value.get("err")
+            if error is None:
+                self.confirmed_by_push += 1
+            self._resolve(entry, TransactionOutcome(entry.signature, not error, error))
+
+    @staticmethod
+    def _resolve(entry: PendingSignature, outcome: TransactionOutcome) -> None:
+        if not entry.future.done():
+            entry.future.set_result(outcome)
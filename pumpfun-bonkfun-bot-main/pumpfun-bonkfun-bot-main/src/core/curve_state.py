@@ -0,0 +1,150 @@
+"""
+Local store of bonding curve / pool state kept up to date by pushed updates.
+
+Price feeds write the latest decoded state for each tracked pool here, and
+position monitors wait on the store instead of polling the RPC node. Token
+listeners can also stream the post-trade reserves of every trade event they
+see into the store, which curve managers then read instead of the RPC node
+while the state is fresh.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from solders.pubkey import Pubkey
+
+
+@dataclass
+class CurveState:
+    """Snapshot of a bonding curve or pool at a point in time."""
+
+    pool_address: Pubkey
+    price: float
+    source: str
+    slot: int | None = None
+    state: dict[str, Any] = field(default_factory=dict)
+    updated_at: float = field(default_factory=monotonic)
+    version: int = 0
+
+    @property
+    def age(self) -> float:
+        """Seconds since this snapshot was received."""
+        return monotonic() - self.updated_at
+
+
+class CurveStateStore:
+    """Per-pool latest curve state with change notification."""
+
+    def __init__(self, max_pools: int | None = None):
+        """Initialize an empty store.
+
+        Args:
+            max_pools: Most pools kept; the least recently updated are
+                evicted first (None keeps every pool)
+        """
+        self.max_pools = max_pools
+        self._states: dict[Pubkey, CurveState] = {}
+        self._changed: dict[Pubkey, asyncio.Event] = {}
+
+    def get(self, pool_address: Pubkey) -> CurveState | None:
+        """Get the latest known state for a pool.
+
+        Args:
+            pool_address: Address of the pool/curve
+
+        Returns:
+            Latest state, or None if nothing has been received yet
+        """
+        return self._states.get(pool_address)
+
+    def update(
+        self,
+        pool_address: Pubkey,
+        price: float,
+        source: str,
+        slot: int | None = None,
+        state: dict[str, Any] | None = None,
+    ) -> CurveState | None:
+        """Record a new state and wake anyone waiting on the pool.
+
+        Updates older than the stored slot are ignored so that out-of-order
+        deliveries from different feeds cannot move the price backwards.
+
+        Args:
+            pool_address: Address of the pool/curve
+            price: Token price in SOL
+            source: Name of the feed that produced the update
+            slot: Slot the update was observed at, if known
+            state: Decoded pool state fields
+
+        Returns:
+            The stored state, or None if the update was stale
+        """
+        previous = self._states.get(pool_address)
+        if (
+            previous is not None
+            and slot is not None
+            and previous.slot is not None
+            and slot < previous.slot
+        ):
+            return None
+
+        current = CurveState(
+            pool_address=pool_address,
+            price=price,
+            source=source,
+            slot=slot,
+            state=state or {},
+            version=previous.version + 1 if previous else 1,
+        )
+        # Re-insert so the dict stays ordered from least to most recently updated
+        self._states.pop(pool_address, None)
+        self._states[pool_address] = current
+        if self.max_pools is not None and len(self._states) > self.max_pools:
+            del self._states[next(iter(self._states))]
+
+        event = self._changed.pop(pool_address, None)
+        if event is not None:
+            event.set()
+        return current
+
+    async def wait_for_update(
+        self, pool_address: Pubkey, after_version: int, timeout: float
+    ) -> CurveState | None:
+        """Wait until the pool has a state newer than ``after_version``.
+
+        Args:
+            pool_address: Address of the pool/curve
+            after_version: Version the caller has already seen
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Newer state, or None if no update arrived before the timeout
+        """
+        current = self._states.get(pool_address)
+        if current is not None and current.version > after_version:
+            return current
+
+        event = self._changed.setdefault(pool_address, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        current = self._states.get(pool_address)
+        if current is not None and current.version > after_version:
+            return current
+        return None
+
+    def discard(self, pool_address: Pubkey) -> None:
+        """Forget a pool's state and release its waiters.
+
+        Args:
+            pool_address: Address of the pool/curve
+        """
+        self._states.pop(pool_address, None)
+        event = self._changed.pop(pool_address, None)
+        if event is not None:
+            event.set()
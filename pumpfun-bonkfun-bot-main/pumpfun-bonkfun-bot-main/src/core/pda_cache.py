@@ -0,0 +1,148 @@
+"""
+Memoized program-derived address (PDA) and associated token account derivation.
+
+``Pubkey.find_program_address`` searches bump seeds by repeated SHA-256 hashing,
+and every derivation for a given seed set always returns the same address. The
+cache keeps constant addresses (no per-mint/per-user seeds) pinned for the life
+of the process and per-mint/per-user derivations in a bounded LRU.
+"""
+
+import time
+from collections import OrderedDict
+
+from solders.pubkey import Pubkey
+
+from core.pubkeys import SystemAddresses
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PdaCache:
+    """Caches ``find_program_address`` results keyed by seeds and program."""
+
+    def __init__(self, max_size: int = 4096):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of per-mint/per-user derivations kept
+        """
+        self.max_size = max_size
+        self._pinned: dict[tuple, tuple[Pubkey, int]] = {}
+        self._lru: OrderedDict[tuple, tuple[Pubkey, int]] = OrderedDict()
+
+        # Instrumentation
+        self.hits = 0
+        self.misses = 0
+        self.derive_time = 0.0  # Seconds spent deriving on misses
+
+    def find_program_address(
+        self, seeds: list[bytes], program_id: Pubkey
+    ) -> tuple[Pubkey, int]:
+        """Find a program address, deriving it only on the first request.
+
+        Args:
+            seeds: PDA seeds
+            program_id: Program owning the address
+
+        Returns:
+            Tuple of (address, bump)
+        """
+        key = (bytes(program_id), *seeds)
+
+        result = self._pinned.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        result = self._lru.get(key)
+        if result is not None:
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return result
+
+        result = self._derive(seeds, program_id)
+        self._lru[key] = result
+        if len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+        return result
+
+    def precompute(self, seeds: list[bytes], program_id: Pubkey) -> Pubkey:
+        """Derive a constant address once and keep it for the life of the process.
+
+        Args:
+            seeds: PDA seeds without any per-mint or per-user component
+            program_id: Program owning the address
+
+        Returns:
+            Derived address
+        """
+        key = (bytes(program_id), *seeds)
+        result = self._pinned.get(key)
+        if result is not None:
+            self.hits += 1
+            return result[0]
+
+        result = self._derive(seeds, program_id)
+        self._pinned[key] = result
+        return result[0]
+
+    def get_associated_token_address(
+        self,
+        owner: Pubkey,
+        mint: Pubkey,
+        token_program_id: Pubkey = SystemAddresses.TOKEN_PROGRAM,
+    ) -> Pubkey:
+        """Derive an associated token account address.
+
+        Args:
+            owner: Token account owner
+            mint: Token mint
+            token_program_id: Token program owning the mint
+
+        Returns:
+            Associated token account address
+        """
+        address, _ = self.find_program_address(
+            [bytes(owner), bytes(token_program_id), bytes(mint)],
+            SystemAddresses.ASSOCIATED_TOKEN_PROGRAM,
+        )
+        return address
+
+    def _derive(self, seeds: list[bytes], program_id: Pubkey) -> tuple[Pubkey, int]:
+        start = time.perf_counter()
+        result = Pubkey.find_program_address(seeds, program_id)
+        self.derive_time += time.perf_counter() - start
+        self.misses += 1
+        return result
+
+    def get_stats(self) -> dict:
+        """Get hit rate and estimated derivation time saved.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        lookups = self.hits + self.misses
+        avg_derive = self.derive_time / self.misses if self.misses else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "pinned": len(self._pinned),
+            "cached": len(self._lru),
+            "avg_derive_us": avg_derive * 1e6,
+            "time_saved_ms": self.hits * avg_derive * 1000,
+        }
+
+    def log_stats(self) -> None:
+        """Log hit rate and estimated derivation time saved."""
+        stats = self.get_stats()
+        logger.info(
+            f"PDA cache: {stats['hits']} hits / {stats['misses']} misses "
+            f"({stats['hit_rate']:.1%} hit rate), avg derivation {stats['avg_derive_us']:.0f} µs, "
+            f"~{stats['time_saved_ms']:.1f} ms saved"
+        )
+
+
+# Shared by every platform so wallet ATAs and common PDAs are derived once
+pda_cache = PdaCache()
@@ -0,0 +1,199 @@
+"""
+Background priority fee oracle.
+
+Samples ``getRecentPrioritizationFees`` on a timer, globally and for each
+tracked account set, and keeps rolling per-slot windows so fee estimates can
+be answered from memory on the trade path.
+"""
+
+import asyncio
+import statistics
+from dataclasses import dataclass
+from time import monotonic
+
+from solders.pubkey import Pubkey
+
+from core.client import SolanaClient
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+GLOBAL_KEY = "global"
+
+
+@dataclass
+class FeeEstimate:
+    """Percentile estimate for one account set."""
+
+    fee: int  # Max of the recent and full-window percentiles, in microlamports
+    recent_fee: int  # Percentile over the most recent slots
+    window_fee: int  # Percentile over the whole slot window
+    slot: int  # Newest slot in the window
+    samples: int  # Slots in the window
+    updated_at: float  # monotonic() time of the sample
+
+    @property
+    def age(self) -> float:
+        """Seconds since this estimate was sampled."""
+        return monotonic() - self.updated_at
+
+
+class PriorityFeeOracle:
+    """Keeps rolling priority fee percentiles fresh in the background."""
+
+    def __init__(
+        self,
+        client: SolanaClient,
+        percentile: int = 70,
+        poll_interval: float = 2.0,
+        max_staleness: float = 10.0,
+        window_slots: int = 150,
+        recent_slots: int = 20,
+    ):
+        """Initialize the fee oracle.
+
+        Args:
+            client: Solana RPC client
+            percentile: Fee percentile to pay (1-99)
+            poll_interval: Seconds between samples
+            max_staleness: Seconds after which an estimate is no longer used
+            window_slots: Slots kept in the rolling window
+            recent_slots: Most recent slots used for the short-range percentile
+        """
+        self.client = client
+        self.percentile = percentile
+        self.poll_interval = poll_interval
+        self.max_staleness = max_staleness
+        self.window_slots = window_slots
+        self.recent_slots = min(recent_slots, window_slots)
+
+        self._account_sets: dict[str, list[Pubkey]] = {GLOBAL_KEY: []}
+        self._windows: dict[str, dict[int, int]] = {}
+        self._estimates: dict[str, FeeEstimate] = {}
+        self._task: asyncio.Task | None = None
+
+    def track(self, name: str, accounts: list[Pubkey]) -> None:
+        """Sample fees for transactions write-locking an account set.
+
+        Args:
+            name: Account set name (e.g. "program", "fee_recipient")
+            accounts: Accounts in the set
+        """
+        self._account_sets[name] = list(accounts)
+
+    async def start(self) -> None:
+        """Take a first sample and start the background sampler."""
+        if self._task:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Priority fee oracle started: p{self.percentile} over "
+            f"{self.window_slots} slots, sets: {', '.join(self._account_sets)}"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background sampler."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self.refresh()
+
+    async def refresh(self) -> None:
+        """Sample every tracked account set once."""
+        names = list(self._account_sets)
+        results = await asyncio.gather(
+            *(
+                self.client.get_recent_prioritization_fees(
+                    self._account_sets[name] or None
+                )
+                for name in names
+            ),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Priority fee sample for '{name}' failed: {result}")
+                continue
+            self._update(name, result)
+
+    def _update(self, name: str, samples: list[dict]) -> None:
+        if not samples:
+            return
+
+        window = self._windows.setdefault(name, {})
+        for sample in samples:
+            window[sample["slot"]] = sample["prioritizationFee"]
+
+        newest = max(window)
+        for slot in [s for s in window if s <= newest - self.window_slots]:
+            del window[slot]
+
+        slots = sorted(window)
+        window_fee = self._percentile([window[s] for s in slots])
+        recent_fee = self._percentile([window[s] for s in slots[-self.recent_slots :]])
+        self._estimates[name] = FeeEstimate(
+            fee=max(window_fee, recent_fee),
+            recent_fee=recent_fee,
+            window_fee=window_fee,
+            slot=newest,
+            samples=len(slots),
+            updated_at=monotonic(),
+        )
+
+    def _percentile(self, fees: list[int]) -> int:
+        if len(fees) < 2:
+            return fees[0] if fees else 0
+        return int(statistics.quantiles(fees, n=100)[self.percentile - 1])
+
+    def get_fee(self, accounts: list[Pubkey] | None = None) -> int | None:
+        """Get the current fee estimate without any network round-trip.
+
+        Account sets that are fully contained in ``accounts`` are considered
+        and the highest fresh estimate among them wins; the global estimate
+        is used when no tracked set applies.
+
+        Args:
+            accounts: Accounts the transaction will touch
+
+        Returns:
+            Fee in microlamports, or None if no fresh estimate exists
+        """
+        fees = []
+        if accounts:
+            touched = set(accounts)
+            for name, tracked in self._account_sets.items():
+                if not tracked or not touched.issuperset(tracked):
+                    continue
+                estimate = self._fresh(name)
+                if estimate:
+                    fees.append(estimate.fee)
+
+        if not fees:
+            estimate = self._fresh(GLOBAL_KEY)
+            if estimate:
+                fees.append(estimate.fee)
+
+        return max(fees) if fees else None
+
+    def _fresh(self, name: str) -> FeeEstimate | None:
+        estimate = self._estimates.get(name)
+        if estimate is None or estimate.age > self.max_staleness:
+            return None
+        return estimate
+
+    def get_estimates(self) -> dict[str, FeeEstimate]:
+        """Get the latest estimate for each account set, fresh or not.
+
+        Returns:
+            Dictionary mapping account set names to estimates
+        """
+        return dict(self._estimates)
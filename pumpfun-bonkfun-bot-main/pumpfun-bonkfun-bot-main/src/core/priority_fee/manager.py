@@ -1,7 +1,7 @@
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
-from core.priority_fee.dynamic_fee import DynamicPriorityFee
+from core.priority_fee.fee_oracle import PriorityFeeOracle
 from core.priority_fee.fixed_fee import FixedPriorityFee
 from utils.logger import get_logger
 
@@ -19,6 +19,10 @@ class PriorityFeeManager:
         fixed_fee: int,
         extra_fee: float,
         hard_cap: int,
+        percentile: int = 70,
+        poll_interval: float = 2.0,
+        max_staleness: float = 10.0,
+        fee_oracle: PriorityFeeOracle | None = None,
     ):
         """
         Initialize the priority fee manager.
@@ -30,6 +34,12 @@ class PriorityFeeManager:
             fixed_fee: Fixed priority fee in microlamports.
             extra_fee: Percentage increase to apply to the base fee.
             hard_cap: Maximum allowed priority fee in microlamports.
+            percentile: Fee percentile paid when dynamic fees are enabled.
+            poll_interval: Seconds between background fee samples.
+            max_staleness: Seconds after which a dynamic estimate is ignored
+                in favour of the fixed fee.
+            fee_oracle: Shared oracle to read dynamic fees from. Its owner
+                starts and stops it; otherwise a private oracle is created.
         """
         self.client = client
         self.enable_dynamic_fee = enable_dynamic_fee
@@ -39,9 +49,41 @@ class PriorityFeeManager:
         self.hard_cap = hard_cap
 
         # Initialize plugins
-        self.dynamic_fee_plugin = DynamicPriorityFee(client)
+        self._owns_fee_oracle = fee_oracle is None
+        if not enable_dynamic_fee:
+            self.fee_oracle = None
+        elif fee_oracle:
+            self.fee_oracle = fee_oracle
+        else:
+            self.fee_oracle = PriorityFeeOracle(
+                client,
+                percentile=percentile,
+                poll_interval=poll_interval,
+                max_staleness=max_staleness,
+            )
         self.fixed_fee_plugin = FixedPriorityFee(fixed_fee)
 
+    def track_accounts(self, name: str, accounts: list[Pubkey]) -> None:
+        """
+        Sample dynamic fees for an account set in the background.
+
+        Args:
+            name: Account set name.
+            accounts: Accounts in the set.
+        """
+        if self.fee_oracle:
+            self.fee_oracle.track(name, accounts)
+
+    async def start(self) -> None:
+        """Start background fee sampling if dynamic fees are enabled."""
+        if self.fee_oracle and self._owns_fee_oracle:
+            await self.fee_oracle.start()
+
+    async def stop(self) -> None:
+        """Stop background fee sampling."""
+        if self.fee_oracle and self._owns_fee_oracle:
+            await self.fee_oracle.stop()
+
     async def calculate_priority_fee(
         self, accounts: list[Pubkey] | None = None
     ) -> int | None:
@@ -78,11 +120,13 @@ class PriorityFeeManager:
         Returns:
             Optional[int]: Base fee in microlamports, or None if no fee should be applied.
         """
-        # Prefer dynamic fee if both are enabled
-        if self.enable_dynamic_fee:
-            dynamic_fee = await self.dynamic_fee_plugin.get_priority_fee(accounts)
+        # Prefer dynamic fee if both are enabled. Estimates come from memory;
+        # a missing or stale estimate falls through to the fixed fee.
+        if self.fee_oracle:
+            dynamic_fee = self.fee_oracle.get_fee(accounts)
             if dynamic_fee is not None:
                 return dynamic_fee
+            logger.warning("No fresh dynamic priority fee estimate available")
 
         # Fall back to fixed fee if enabled
         if self.enable_fixed_fee:
@@ -0,0 +1,177 @@
+"""
+JSON-RPC request batching for Solana RPC calls.
+
+Concurrent callers (price checks, balance lookups, fee sampling, confirmation
+polling) frequently issue small independent reads within a few milliseconds of
+each other. The batcher coalesces those calls into a single JSON-RPC array
+request so they share one HTTP round-trip on the pooled connection.
+"""
+
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RpcError(Exception):
+    """Raised when the RPC node returns an error object for a request."""
+
+    def __init__(self, method: str, error: Any):
+        """Initialize RPC error.
+
+        Args:
+            method: JSON-RPC method that failed
+            error: Error object returned by the node
+        """
+        self.method = method
+        self.error = error
+        super().__init__(f"RPC error for {method}: {error}")
+
+
+class RpcBatcher:
+    """Coalesces concurrent JSON-RPC calls into batched array requests."""
+
+    def __init__(
+        self,
+        post: Callable[[Any], Awaitable[Any]],
+        batch_window: float = 0.002,
+        max_batch_size: int = 50,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            post: Coroutine that POSTs a JSON payload (object or array) and
+                returns the decoded JSON response
+            batch_window: Seconds to wait for more calls before flushing
+            max_batch_size: Maximum number of calls sent in one request
+        """
+        self._post = post
+        self.batch_window = batch_window
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._ids = itertools.count(1)
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+        self.requests_sent = 0
+        self.calls_sent = 0
+
+    async def call(self, method: str, params: list[Any] | None = None) -> Any:
+        """Queue a JSON-RPC call and wait for its result.
+
+        Args:
+            method: JSON-RPC method name
+            params: Optional method parameters
+
+        Returns:
+            The ``result`` field of the JSON-RPC response
+
+        Raises:
+            RpcError: If the node returned an error for this call
+        """
+        loop = asyncio.get_running_loop()
+        request: dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+        }
+        if params is not None:
+            request["params"] = params
+
+        future = loop.create_future()
+        self._pending.append((request, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.batch_window > 0:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send all pending calls as one request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        """Send a batch and resolve each caller's future.
+
+        Args:
+            batch: Pending (request, future) pairs
+        """
+        requests = [request for request, _ in batch]
+        futures = {request["id"]: future for request, future in batch}
+
+        # Single calls go out as a plain object for providers without batch support
+        payload: Any = requests[0] if len(requests) == 1 else requests
+        self.requests_sent += 1
+        self.calls_sent += len(requests)
+
+        try:
+            response = await self._post(payload)
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        responses = response if isinstance(response, list) else [response]
+        methods = {request["id"]: request["method"] for request in requests}
+
+        for item in responses:
+            if not isinstance(item, dict):
+                continue
+            future = futures.pop(item.get("id"), None)
+            if future is None or future.done():
+                continue
+            if "error" in item:
+                future.set_exception(RpcError(methods[item["id"]], item["error"]))
+            else:
+                future.set_result(item.get("result"))
+
+        # Batch-level errors come back as a single object without a matching id
+        for request_id, future in futures.items():
+            if not future.done():
+                error = (
+                    response.get("error", "missing response")
+                    if isinstance(response, dict)
+                    else "missing response"
+                )
+                future.set_exception(RpcError(methods[request_id], error))
+
+    async def close(self) -> None:
+        """Flush outstanding calls and wait for in-flight requests."""
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, float]:
+        """Get batching statistics.
+
+        Returns:
+            Dictionary with request and call counters
+        """
+        return {
+            "requests_sent": self.requests_sent,
+            "calls_sent": self.calls_sent,
+            "avg_batch_size": (
+                self.calls_sent / self.requests_sent if self.requests_sent else 0.0
+            ),
+        }
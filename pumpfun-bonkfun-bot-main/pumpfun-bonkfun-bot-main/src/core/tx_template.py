@@ -0,0 +1,255 @@
+"""
+Precompiled transaction messages patched in place before signing.
+
+A template is compiled once from the instructions of a transaction built with
+sentinel values for its variable fields (trade amounts and the compute
+budget). The byte offsets of those values and of the recent blockhash in the
+serialized message are recorded, so producing a transaction for new values
+is a few byte writes into a copy of the message and one signature.
+
+Compiling verifies the template by building the transaction again with other
+values and comparing it with the patched message. Builders whose output
+depends on the values in any other way (derived lamports, per-call seeds) are
+rejected with TemplateError, and their transactions are built per call.
+"""
+
+import secrets
+import struct
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+
+# Fields every template carries, patched by the client when signing
+COMPUTE_UNIT_LIMIT = "compute_unit_limit"
+COMPUTE_UNIT_PRICE = "compute_unit_price"
+_COMPUTE_BUDGET_FIELDS = {COMPUTE_UNIT_LIMIT: "<I", COMPUTE_UNIT_PRICE: "<Q"}
+
+# Legacy message header: required signatures, readonly signed, readonly unsigned
+_HEADER_SIZE = 3
+
+
+class TemplateError(ValueError):
+    """Raised when a transaction cannot be expressed as a template."""
+
+
+def _decode_compact_u16(data: bytes, offset: int) -> tuple[int, int]:
+    """Decode a compact-u16 length prefix; returns (value, encoded size)."""
+    value = 0
+    for size in range(3):
+        byte = data[offset + size]
+        value |= (byte & 0x7F) << (7 * size)
+        if not byte & 0x80:
+            return value, size + 1
+    raise TemplateError("Malformed compact-u16 in message")
+
+
+def _sentinels(formats: dict[str, str]) -> dict[str, int]:
+    """Random values with the top bit set, unlikely to occur in a message."""
+    values = {}
+    for name, fmt in formats.items():
+        bits = struct.calcsize(fmt) * 8
+        values[name] = secrets.randbits(bits - 1) | (1 << (bits - 1))
+    return values
+
+
+def _find_all(data: bytes, pattern: bytes) -> tuple[int, ...]:
+    offsets = []
+    position = data.find(pattern)
+    while position != -1:
+        offsets.append(position)
+        position = data.find(pattern, position + 1)
+    return tuple(offsets)
+
+
+class TransactionTemplate:
+    """A compiled single-signer message with patchable fields."""
+
+    def __init__(
+        self,
+        message: bytes,
+        fields: dict[str, tuple[str, tuple[int, ...]]],
+    ):
+        """Initialize the template.
+
+        Args:
+            message: Serialized legacy message
+            fields: Field name -> (struct format, byte offsets in the message)
+
+        Raises:
+            TemplateError: If the message needs more than one signature
+        """
+        if message[0] != 1:
+            raise TemplateError(
+                f"Templates support one signer, message requires {message[0]}"
+            )
+        account_count, size = _decode_compact_u16(message, _HEADER_SIZE)
+        self._message = bytes(message)
+        self._blockhash_offset = _HEADER_SIZE + size + 32 * account_count
+        self._fields = fields
+
+    @property
+    def field_names(self) -> frozenset[str]:
+        """Names of the values a transaction is rendered with."""
+        return frozenset(self._fields)
+
+    @classmethod
+    async def compile(
+        cls,
+        payer: Pubkey,
+        build: Callable[..., Awaitable[list[Instruction]]],
+        fields: dict[str, str],
+    ) -> "TransactionTemplate":
+        """Compile and verify a template from an instruction builder.
+
+        Compute budget instructions (limit and price) are prepended to the
+        built instructions, so every template has the ``compute_unit_limit``
+        and ``compute_unit_price`` fields.
+
+        Args:
+            payer: Fee payer and only signer
+            build: Coroutine function called with one keyword argument per
+                field, returning the transaction's instructions
+            fields: Field name -> struct format of its encoding (e.g. "<Q")
+
+        Returns:
+            Verified template
+
+        Raises:
+            TemplateError: If a field value cannot be located in the message,
+                or the message depends on the values beyond their encoding
+        """
+        formats = {**_COMPUTE_BUDGET_FIELDS, **fields}
+        first = _sentinels(formats)
+        message = await cls._compile_message(payer, build, first, Hash.default())
+
+        offsets = {}
+        for name, fmt in formats.items():
+            found = _find_all(message, struct.pack(fmt, first[name]))
+            if not found:
+                raise TemplateError(f"Field {name} not found in the message")
+            offsets[name] = (fmt, found)
+        template = cls(message, offsets)
+
+        second = _sentinels(formats)
+        blockhash = Hash(secrets.token_bytes(32))
+        expected = await cls._compile_message(payer, build, second, blockhash)
+        if template.render(blockhash, **second) != expected:
+            raise TemplateError("Message depends on values beyond the template fields")
+        return template
+
+    def render(self, blockhash: Hash, **values: int) -> bytes:
+        """Patch a blockhash and field values into the message.
+
+        Args:
+            blockhash: Recent blockhash to sign with
+            **values: One value per template field
+
+        Returns:
+            Serialized message
+
+        Raises:
+            TemplateError: If the values do not match the template fields
+        """
+        if values.keys() != self._fields.keys():
+            raise TemplateError(
+                f"Expected values for {sorted(self._fields)}, got {sorted(values)}"
+            )
+        message = bytearray(self._message)
+        offset = self._blockhash_offset
+        message[offset : offset + 32] = bytes(blockhash)
+        for name, value in values.items():
+            fmt, offsets = self._fields[name]
+            encoded = struct.pack(fmt, value)
+            for offset in offsets:
+                message[offset : offset + len(encoded)] = encoded
+        return bytes(message)
+
+    def sign(
+        self, keypair: Keypair, blockhash: Hash, **values: int
+    ) -> tuple[bytes, Signature]:
+        """Render and sign a transaction.
+
+        Args:
+            keypair: Fee payer's keypair
+            blockhash: Recent blockhash to sign with
+            **values: One value per template field
+
+        Returns:
+            Serialized transaction and its signature
+        """
+        message = self.render(blockhash, **values)
+        signature = keypair.sign_message(message)
+        # One signature: compact-u16 count, signature, message
+        return b"\x01" + bytes(signature) + message, signature
+
+    def bind(self, **values: int) -> "BoundTemplate":
+        """Fix the trade values, leaving compute budget and blockhash to the signer.
+
+        Args:
+            **values: Values of every field except the compute budget ones
+
+        Returns:
+            Template ready to be signed by SolanaClient
+        """
+        return BoundTemplate(self, values)
+
+    @staticmethod
+    async def _compile_message(
+        payer: Pubkey,
+        build: Callable[..., Awaitable[list[Instruction]]],
+        values: dict[str, Any],
+        blockhash: Hash,
+    ) -> bytes:
+        trade_values = {
+            name: value
+            for name, value in values.items()
+            if name not in _COMPUTE_BUDGET_FIELDS
+        }
+        instructions = [
+            set_compute_unit_limit(values[COMPUTE_UNIT_LIMIT]),
+            set_compute_unit_price(values[COMPUTE_UNIT_PRICE]),
+            *await build(**trade_values),
+        ]
+        return bytes(Message.new_with_blockhash(instructions, payer, blockhash))
+
+
+@dataclass(frozen=True)
+class BoundTemplate:
+    """A template with its trade values, awaiting compute budget and blockhash."""
+
+    template: TransactionTemplate
+    values: dict[str, int]
+
+    def sign(
+        self,
+        keypair: Keypair,
+        blockhash: Hash,
+        compute_unit_limit: int,
+        compute_unit_price: int,
+    ) -> tuple[bytes, Signature]:
+        """Render and sign the transaction.
+
+        Args:
+            keypair: Fee payer's keypair
+            blockhash: Recent blockhash to sign with
+            compute_unit_limit: Compute unit limit
+            compute_unit_price: Priority fee in microlamports per compute unit
+
+        Returns:
+            Serialized transaction and its signature
+        """
+        return self.template.sign(
+            keypair,
+            blockhash,
+            compute_unit_limit=compute_unit_limit,
+            compute_unit_price=compute_unit_price,
+            **self.values,
+        )
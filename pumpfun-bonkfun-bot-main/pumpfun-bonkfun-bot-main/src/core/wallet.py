@@ -5,7 +5,8 @@ Wallet management for Solana transactions.
 import base58
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
+
+from core.pda_cache import pda_cache
 
 
 class Wallet:
@@ -39,7 +40,7 @@ class Wallet:
         Returns:
             Associated token account address
         """
-        return get_associated_token_address(self.pubkey, mint)
+        return pda_cache.get_associated_token_address(self.pubkey, mint)
 
     @staticmethod
     def _load_keypair(private_key: str) -> Keypair:
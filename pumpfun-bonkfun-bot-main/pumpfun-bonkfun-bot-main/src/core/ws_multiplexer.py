@@ -0,0 +1,326 @@
+"""
+One shared Solana WebSocket connection per endpoint.
+
+Listeners and price feeds that talk to the same ``wss_endpoint`` register
+their ``*Subscribe`` requests with the endpoint's multiplexer instead of
+opening their own socket. Notifications are routed by subscription id to
+the queue of the consumer that made the request, and every subscription is
+sent again after a reconnect (servers assign new ids per connection). The
+connection is opened on the first subscription and closed once no
+subscription has been registered for ``idle_timeout`` seconds, so short-lived
+subscriptions (one per transaction signature) reuse a warm connection.
+"""
+
+import asyncio
+import itertools
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+import websockets
+
+from utils import json_backend
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SUBSCRIPTION_KEY = '"subscription"'
+_SUBSCRIPTION_ID = re.compile(r"\s*:\s*(\d+)")
+
+
+@dataclass(eq=False)
+class MuxSubscription:
+    """A ``*Subscribe`` request served over a shared connection.
+
+    The consumer's queue receives ``(subscription, raw_frame)`` tuples, and
+    ``(subscription, None)`` once the subscription has been sent again after
+    a reconnect, so the consumer can recover what it missed.
+    """
+
+    method: str
+    params: list[Any]
+    queue: asyncio.Queue
+    key: Any = None  # Consumer tag, e.g. the pool the subscription is for
+    server_id: int | None = field(default=None, init=False)
+    dropped: int = field(default=0, init=False)
+
+    @property
+    def unsubscribe_method(self) -> str:
+        """RPC method that cancels this subscription."""
+        return self.method.replace("Subscribe", "Unsubscribe")
+
+
+class WebSocketMultiplexer:
+    """Serves many subscriptions over one WebSocket connection."""
+
+    def __init__(
+        self,
+        wss_endpoint: str,
+        ping_interval: float = 20,
+        reconnect_delay: float = 5,
+        idle_timeout: float = 30,
+    ):
+        """Initialize the multiplexer.
+
+        Args:
+            wss_endpoint: Solana WebSocket endpoint URL
+            ping_interval: Seconds between keepalive pings
+            reconnect_delay: Seconds to wait before reconnecting
+            idle_timeout: Seconds to keep the connection open after the last
+                subscription is removed (0 closes it immediately)
+        """
+        self.wss_endpoint = wss_endpoint
+        self.ping_interval = ping_interval
+        self.reconnect_delay = reconnect_delay
+        self.idle_timeout = idle_timeout
+
+        self._subscriptions: list[MuxSubscription] = []
+        self._by_server_id: dict[int, MuxSubscription] = {}
+        self._pending: dict[int, MuxSubscription] = {}
+        self._request_ids = itertools.count(1)
+        self._websocket = None
+        self._task: asyncio.Task | None = None
+        self._idle_task: asyncio.Task | None = None
+
+        # Instrumentation
+        self.connects = 0
+        self.notifications = 0
+        self.unrouted = 0
+
+    @property
+    def subscription_count(self) -> int:
+        """Number of registered subscriptions."""
+        return len(self._subscriptions)
+
+    async def subscribe(
+        self,
+        method: str,
+        params: list[Any],
+        queue: asyncio.Queue,
+        key: Any = None,
+    ) -> MuxSubscription:
+        """Register a subscription, connecting if needed.
+
+        Args:
+            method: Subscribe method (e.g. "logsSubscribe")
+            params: Request params
+            queue: Consumer queue receiving ``(subscription, raw_frame)``
+            key: Consumer tag stored on the subscription
+
+        Returns:
+            The subscription, confirmed asynchronously by the server
+        """
+        subscription = MuxSubscription(method, params, queue, key)
+        self._subscriptions.append(subscription)
+        if self._idle_task is not None:
+            self._idle_task.cancel()
+            self._idle_task = None
+        if self._websocket is not None:
+            await self._send_subscribe(subscription)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    async def unsubscribe(
+        self, subscription: MuxSubscription, notify_server: bool = True
+    ) -> None:
+        """Cancel a subscription; the connection closes after the last one.
+
+        Args:
+            subscription: Subscription returned by ``subscribe``
+            notify_server: Send the unsubscribe request (False for
+                subscriptions the server already ended, e.g. a signature
+                subscription after its notification)
+        """
+        if subscription not in self._subscriptions:
+            return
+        self._subscriptions.remove(subscription)
+
+        if subscription.server_id is not None:
+            self._by_server_id.pop(subscription.server_id, None)
+            if notify_server:
+                await self._send_unsubscribe(
+                    subscription.unsubscribe_method, subscription.server_id
+                )
+
+        if not self._subscriptions:
+            if self.idle_timeout <= 0:
+                await self._disconnect()
+            elif self._idle_task is None:
+                self._idle_task = asyncio.create_task(self._disconnect_when_idle())
+
+    async def close(self) -> None:
+        """Cancel every subscription and close the connection."""
+        for subscription in list(self._subscriptions):
+            await self.unsubscribe(subscription)
+        if self._idle_task is not None:
+            self._idle_task.cancel()
+            self._idle_task = None
+        await self._disconnect()
+
+    async def _disconnect(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._subscriptions:
+            # Subscribed again while the connection was closing
+            self._task = asyncio.create_task(self._run())
+
+    async def _disconnect_when_idle(self) -> None:
+        await asyncio.sleep(self.idle_timeout)
+        self._idle_task = None
+        if not self._subscriptions:
+            await self._disconnect()
+
+    async def _run(self) -> None:
+        while self._subscriptions:
+            try:
+                # Block notifications can exceed the default 1 MiB frame limit,
+                # and an oversized frame would drop every consumer's stream
+                async with websockets.connect(
+                    self.wss_endpoint, ping_interval=self.ping_interval, max_size=None
+                ) as websocket:
+                    self._websocket = websocket
+                    self._pending.clear()
+                    self._by_server_id.clear()
+                    reconnected = self.connects > 0
+                    self.connects += 1
+                    logger.info(
+                        f"Shared WebSocket connected to {self.wss_endpoint} "
+                        f"({len(self._subscriptions)} subscriptions)"
+                    )
+
+                    for subscription in list(self._subscriptions):
+                        subscription.server_id = None
+                        await self._send_subscribe(subscription)
+                        if reconnected:
+                            self._put(subscription, None)
+
+                    async for message in websocket:
+                        self._route(message)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(f"Shared WebSocket error on {self.wss_endpoint}")
+            finally:
+                self._websocket = None
+
+            if self._subscriptions:
+                logger.info(
+                    f"Reconnecting shared WebSocket in "
+                    f"{self.reconnect_delay} seconds..."
+                )
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def _send_subscribe(self, subscription: MuxSubscription) -> None:
+        request_id = next(self._request_ids)
+        self._pending[request_id] = subscription
+        try:
+            await self._websocket.send(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "method": subscription.method,
+                        "params": subscription.params,
+                    }
+                )
+            )
+        except websockets.exceptions.ConnectionClosed:
+            # Sent again by the reconnect
+            self._pending.pop(request_id, None)
+
+    async def _send_unsubscribe(self, method: str, server_id: int) -> None:
+        if self._websocket is None:
+            return
+        try:
+            await self._websocket.send(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": next(self._request_ids),
+                        "method": method,
+                        "params": [server_id],
+                    }
+                )
+            )
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    def _route(self, message: str | bytes) -> None:
+        if isinstance(message, bytes):
+            message = message.decode()
+
+        # The subscription id follows the result in every notification, and a
+        # quoted key cannot occur unescaped inside a JSON string, so the last
+        # match is the id without decoding a possibly multi-megabyte frame
+        position = message.rfind(_SUBSCRIPTION_KEY)
+        if position != -1:
+            match = _SUBSCRIPTION_ID.match(message, position + len(_SUBSCRIPTION_KEY))
+            if match:
+                self.notifications += 1
+                subscription = self._by_server_id.get(int(match.group(1)))
+                if subscription is None:
+                    self.unrouted += 1
+                else:
+                    self._put(subscription, message)
+                return
+
+        try:
+            data = json_backend.loads(message)
+        except ValueError:
+            logger.warning(f"Undecodable frame on shared WebSocket: {message[:200]}")
+            return
+
+        subscription = self._pending.pop(data.get("id"), None)
+        if subscription is None:
+            return
+        if "error" in data:
+            logger.error(
+                f"{subscription.method} failed on shared WebSocket: {data['error']}"
+            )
+            return
+
+        server_id = data.get("result")
+        if subscription not in self._subscriptions:
+            # Cancelled while the request was in flight
+            asyncio.create_task(
+                self._send_unsubscribe(subscription.unsubscribe_method, server_id)
+            )
+            return
+        subscription.server_id = server_id
+        self._by_server_id[server_id] = subscription
+        logger.debug(f"{subscription.method} confirmed with ID: {server_id}")
+
+    def _put(self, subscription: MuxSubscription, message: str | None) -> None:
+        queue = subscription.queue
+        if queue.full():
+            # A slow consumer loses its oldest frames, never another consumer's
+            queue.get_nowait()
+            subscription.dropped += 1
+        queue.put_nowait((subscription, message))
+
+
+_multiplexers: dict[str, WebSocketMultiplexer] = {}
+
+
+def get_multiplexer(wss_endpoint: str) -> WebSocketMultiplexer:
+    """Get the shared multiplexer of an endpoint, creating it on first use.
+
+    Args:
+        wss_endpoint: Solana WebSocket endpoint URL
+
+    Returns:
+        Multiplexer owning the endpoint's connection
+    """
+    multiplexer = _multiplexers.get(wss_endpoint)
+    if multiplexer is None:
+        multiplexer = WebSocketMultiplexer(wss_endpoint)
+        _multiplexers[wss_endpoint] = multiplexer
+    return multiplexer
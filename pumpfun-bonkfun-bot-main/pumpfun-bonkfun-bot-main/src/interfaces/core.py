@@ -8,11 +8,15 @@ must implement to enable unified trading operations across different protocols.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from solders.instruction import Instruction
 from solders.pubkey import Pubkey
 
+if TYPE_CHECKING:
+    from core.client import SolanaClient
+    from core.curve_state import CurveStateStore
+
 
 class Platform(Enum):
     """Supported trading platforms."""
@@ -49,6 +53,16 @@ class TokenInfo:
     additional_data: dict[str, Any] | None = None
 
 
+@dataclass
+class CurveUpdate:
+    """Post-trade state of a pool/curve decoded from a trade event."""
+
+    pool_address: Pubkey
+    price: float  # Token price in SOL
+    state: dict[str, Any]  # Reserve fields named as in CurveManager.decode_pool_state
+    mint: Pubkey | None = None
+
+
 class AddressProvider(ABC):
     """Abstract interface for platform-specific address management."""
 
@@ -113,6 +127,33 @@ class AddressProvider(ABC):
         """
         pass
 
+    def precompute_constant_addresses(self) -> None:
+        """Derive the platform's constant PDAs ahead of the first trade.
+
+        Called when the platform's implementations are created. Platforms
+        without constant PDAs keep this default no-op.
+        """
+
+    def precompute_user_addresses(self, user: Pubkey) -> None:
+        """Derive wallet-specific addresses ahead of the first trade.
+
+        Platforms without wallet-specific PDAs keep this default no-op.
+
+        Args:
+            user: Trading wallet address
+        """
+
+    def get_priority_fee_accounts(self) -> dict[str, list[Pubkey]]:
+        """Get account sets whose recent priority fees are worth sampling.
+
+        Each set is sampled in the background by the priority fee oracle and
+        applies to any trade touching all of its accounts.
+
+        Returns:
+            Dictionary mapping account set names to accounts
+        """
+        return {"program": [self.program_id]}
+
 
 class InstructionBuilder(ABC):
     """Abstract interface for building platform-specific trading instructions."""
@@ -225,10 +266,56 @@ class InstructionBuilder(ABC):
         """
         pass
 
+    @property
+    def supports_templates(self) -> bool:
+        """Whether trade instructions depend only on the token, user and amounts.
+
+        Such builders can have their transactions precompiled into templates
+        (see core.tx_template). Builders with per-call state, such as
+        time-derived account seeds, keep the default and build per trade.
+        """
+        return False
+
 
 class CurveManager(ABC):
     """Abstract interface for platform-specific price calculations and pool state management."""
 
+    # Pushed curve state served instead of RPC reads, see attach_state_store
+    state_store: "CurveStateStore | None" = None
+    max_state_age: float = 0.0
+
+    def attach_state_store(self, store: "CurveStateStore", max_age: float) -> None:
+        """Serve pool state from a store fed by pushed updates.
+
+        Args:
+            store: Store of pushed curve state
+            max_age: Seconds a stored state is used before falling back to RPC
+        """
+        self.state_store = store
+        self.max_state_age = max_age
+
+    def _fresh_state(
+        self, pool_address: Pubkey, required: tuple[str, ...]
+    ) -> dict[str, Any] | None:
+        """Get the stored state of a pool if it is fresh and complete.
+
+        Args:
+            pool_address: Address of the pool/curve
+            required: Fields the caller needs (feeds that only push a price
+                do not carry reserves)
+
+        Returns:
+            Stored state, or None if the caller should read the account
+        """
+        if self.state_store is None:
+            return None
+        current = self.state_store.get(pool_address)
+        if current is None or current.age > self.max_state_age:
+            return None
+        if any(key not in current.state for key in required):
+            return None
+        return current.state
+
     @property
     @abstractmethod
     def platform(self) -> Platform:
@@ -301,6 +388,21 @@ class CurveManager(ABC):
         """
         pass
 
+    @abstractmethod
+    def decode_pool_state(self, data: bytes) -> dict[str, Any]:
+        """Decode raw pool/curve account data without an RPC call.
+
+        Used by price feeds that receive account data pushed over a
+        subscription.
+
+        Args:
+            data: Raw account data including the discriminator
+
+        Returns:
+            Dictionary containing pool state data, including ``price_per_token``
+        """
+        pass
+
 
 class EventParser(ABC):
     """Abstract interface for parsing platform-specific token creation events."""
@@ -326,6 +428,75 @@ class EventParser(ABC):
         """
         pass
 
+    def parse_unresolved_creation_from_logs(
+        self, logs: list[str], signature: str
+    ) -> dict[str, Any] | None:
+        """Decode a creation event whose TokenInfo needs account lookups.
+
+        Platforms whose creation logs hold every TokenInfo field return None;
+        others return the decoded event for ``resolve_token_creation``.
+
+        Args:
+            logs: List of log strings from transaction
+            signature: Transaction signature
+
+        Returns:
+            Decoded creation event, or None
+        """
+        return None
+
+    async def resolve_token_creation(
+        self,
+        event: dict[str, Any],
+        signature: str,
+        client: "SolanaClient | None",
+        detected_at: float | None = None,
+    ) -> TokenInfo | None:
+        """Build a TokenInfo from an unresolved creation event.
+
+        Args:
+            event: Event returned by ``parse_unresolved_creation_from_logs``
+            signature: Transaction signature
+            client: RPC client for account lookups (None if unavailable)
+            detected_at: Monotonic time the event was received (now if None)
+
+        Returns:
+            TokenInfo, or None if the created accounts could not be resolved
+        """
+        return None
+
+    async def resolve_token_creation_from_logs(
+        self, logs: list[str], signature: str, client: "SolanaClient | None"
+    ) -> TokenInfo | None:
+        """Parse token creation from logs, fetching fields the logs do not carry.
+
+        Args:
+            logs: List of log strings from transaction
+            signature: Transaction signature
+            client: RPC client for account lookups (None if unavailable)
+
+        Returns:
+            TokenInfo if token creation found, None otherwise
+        """
+        token_info = self.parse_token_creation_from_logs(logs, signature)
+        if token_info is not None:
+            return token_info
+        event = self.parse_unresolved_creation_from_logs(logs, signature)
+        if event is None:
+            return None
+        return await self.resolve_token_creation(event, signature, client)
+
+    def parse_curve_updates_from_logs(self, logs: list[str]) -> list[CurveUpdate]:
+        """Decode the post-trade curve state of every trade in the logs.
+
+        Args:
+            logs: List of log strings from transaction
+
+        Returns:
+            Updates in log order (empty if the platform emits no trade events)
+        """
+        return []
+
     @abstractmethod
     def parse_token_creation_from_instruction(
         self, instruction_data: bytes, accounts: list[int], account_keys: list[bytes]
@@ -2,15 +2,32 @@
 Base class for WebSocket token listeners - now platform-agnostic.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
-from interfaces.core import Platform, TokenInfo
+from interfaces.core import CurveUpdate, Platform, TokenInfo
+from monitoring.source_filter import SourceFilter
+from monitoring.traffic_recorder import TrafficRecorder
+from utils.dedup import BoundedDedupSet
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from core.client import SolanaClient
+    from core.curve_state import CurveStateStore
+    from core.ws_multiplexer import WebSocketMultiplexer
+    from monitoring.gap_backfill import GapBackfiller
+
+logger = get_logger(__name__)
 
 
 class BaseTokenListener(ABC):
     """Base abstract class for token listeners - now platform-agnostic."""
 
+    # Name used to tag recorded traffic and to pick a parser during replay
+    source_name: str = ""
+
     def __init__(self, platform: Platform | None = None):
         """Initialize the listener with optional platform specification.
 
@@ -18,6 +35,202 @@ class BaseTokenListener(ABC):
             platform: Platform to monitor (if None, monitor all platforms)
         """
         self.platform = platform
+        self.recorder: TrafficRecorder | None = None
+        # Creator filter of the running subscription, pushed down where the source allows
+        self.source_filter = SourceFilter()
+
+        # Resume state: the newest slot processed and the mints already delivered
+        self.last_slot: int | None = None
+        self.gap_backfiller: GapBackfiller | None = None
+        self._delivered = BoundedDedupSet(10_000)
+        self._backfill_tasks: set[asyncio.Task] = set()
+
+        # RPC client for parsers whose source lacks fields (LetsBonk logs)
+        self.rpc_client: SolanaClient | None = None
+        # Store receiving the post-trade curve state of streamed trade events
+        self.curve_state_store: CurveStateStore | None = None
+
+    def attach_recorder(self, recorder: TrafficRecorder) -> None:
+        """Record every raw message this listener receives.
+
+        Args:
+            recorder: Recorder receiving raw messages
+        """
+        self.recorder = recorder
+
+    def _compile_source_filter(self, creator_address: str | None) -> SourceFilter:
+        """Compile the creator filter for the next subscription.
+
+        Args:
+            creator_address: Optional creator address to filter by
+
+        Returns:
+            Compiled filter, also stored as ``source_filter``
+        """
+        self.source_filter = SourceFilter(creator_address)
+        if self.source_filter.can_push_down:
+            logger.info(f"Filtering at the source for creator {creator_address}")
+        return self.source_filter
+
+    def attach_gap_backfiller(self, backfiller: "GapBackfiller") -> None:
+        """Recover creations missed while reconnecting.
+
+        Args:
+            backfiller: Backfiller fetching the blocks after ``last_slot``
+        """
+        self.gap_backfiller = backfiller
+
+    def attach_rpc_client(self, client: "SolanaClient") -> None:
+        """Let parsers read accounts a detection source does not carry.
+
+        Args:
+            client: Solana RPC client
+        """
+        self.rpc_client = client
+
+    def attach_curve_state_store(self, store: "CurveStateStore") -> None:
+        """Stream the curve state after every trade the source carries.
+
+        Args:
+            store: Store receiving post-trade curve state
+        """
+        self.curve_state_store = store
+
+    def _apply_curve_updates(
+        self, updates: list[CurveUpdate], slot: int | None
+    ) -> None:
+        """Write decoded trade events to the attached store.
+
+        Args:
+            updates: Post-trade curve states in transaction order
+            slot: Slot of the transaction, if known
+        """
+        for update in updates:
+            self.curve_state_store.update(
+                update.pool_address,
+                update.price,
+                self.source_name,
+                slot=slot,
+                state=update.state,
+            )
+
+    def _note_slot(self, slot: int | None) -> None:
+        """Advance the resume point to a processed slot."""
+        if slot is not None and (self.last_slot is None or slot > self.last_slot):
+            self.last_slot = slot
+
+    def _first_delivery(self, token_info: TokenInfo) -> bool:
+        """Check that a token has not been delivered yet, live or backfilled.
+
+        Args:
+            token_info: Detected token
+
+        Returns:
+            True if the token should be delivered
+        """
+        return self._delivered.add(str(token_info.mint))
+
+    def _start_backfill(
+        self,
+        deliver: Callable[[TokenInfo], Awaitable[None]],
+        platforms: list[Platform],
+    ) -> None:
+        """Backfill the gap since ``last_slot`` alongside the live stream.
+
+        Called right after (re)subscribing; the first connection has no gap.
+        A backfill keeps running if the new connection drops again.
+
+        Args:
+            deliver: Handler for each recovered token (deduplicates and filters)
+            platforms: Platforms whose creations are recovered
+        """
+        if self.gap_backfiller is None or self.last_slot is None:
+            return
+
+        async def run(last_slot: int) -> None:
+            try:
+                tokens = await self.gap_backfiller.backfill(last_slot, platforms)
+            except Exception:
+                logger.exception(f"Backfill after slot {last_slot} failed")
+                return
+            for token_info in tokens:
+                await deliver(token_info)
+
+        task = asyncio.create_task(run(self.last_slot))
+        self._backfill_tasks.add(task)
+        task.add_done_callback(self._backfill_tasks.discard)
+
+    async def _listen_multiplexed(
+        self,
+        multiplexer: "WebSocketMultiplexer",
+        requests: list[tuple[str, list[Any]]],
+        deliver: Callable[[TokenInfo], Awaitable[None]],
+        platforms: list[Platform],
+    ) -> None:
+        """Receive this listener's subscriptions over a shared connection.
+
+        Args:
+            multiplexer: Multiplexer owning the endpoint's connection
+            requests: (method, params) of every subscription
+            deliver: Handler for each detected token (deduplicates and filters)
+            platforms: Platforms recovered by the backfill after a reconnect
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+        subscriptions = [
+            await multiplexer.subscribe(method, params, queue)
+            for method, params in requests
+        ]
+        logger.info(
+            f"Receiving {len(subscriptions)} {self.source_name} subscriptions "
+            f"over the shared connection to {multiplexer.wss_endpoint}"
+        )
+
+        try:
+            while True:
+                subscription, raw = await queue.get()
+                if raw is None:
+                    # Every subscription is resent together, so one backfill
+                    # covers the reconnect
+                    if subscription is subscriptions[0]:
+                        self._start_backfill(deliver, platforms)
+                    continue
+
+                if self.recorder:
+                    self.recorder.record(self.source_name, raw)
+                try:
+                    tokens = await self._parse_live_message(raw, deliver)
+                except Exception:
+                    logger.exception("Error processing WebSocket message")
+                    continue
+                for token_info in tokens:
+                    await deliver(token_info)
+        finally:
+            for subscription in subscriptions:
+                await multiplexer.unsubscribe(subscription)
+
+    async def _parse_live_message(
+        self, raw: Any, deliver: Callable[[TokenInfo], Awaitable[None]]
+    ) -> list[TokenInfo]:
+        """Parse a message received by the live receive loop.
+
+        Listeners whose tokens need RPC lookups override this to resolve them
+        off the receive loop and hand them to ``deliver`` when ready.
+
+        Args:
+            raw: Raw message as received from the source
+            deliver: Handler for tokens resolved later (deduplicates and filters)
+
+        Returns:
+            Tokens ready to be delivered now
+        """
+        return await self.process_raw_message(raw)
+
+    async def _stop_backfills(self) -> None:
+        """Cancel backfills still running when the listener stops."""
+        tasks = list(self._backfill_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     @abstractmethod
     async def listen_for_tokens(
@@ -36,6 +249,19 @@ class BaseTokenListener(ABC):
         """
         pass
 
+    @abstractmethod
+    async def process_raw_message(self, raw: Any) -> list[TokenInfo]:
+        """Parse one raw message exactly as received from the source.
+
+        Used both by the live receive loop and by replay.
+
+        Args:
+            raw: Raw message (text frame for WebSocket sources, bytes for gRPC)
+
+        Returns:
+            Every token creation in the message (a block can carry several)
+        """
+
     def should_process_token(self, token_info: TokenInfo) -> bool:
         """Check if a token should be processed based on platform filter.
 
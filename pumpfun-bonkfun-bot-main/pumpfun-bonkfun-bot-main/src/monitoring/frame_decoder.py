@@ -0,0 +1,128 @@
+"""
+Partial decoding of blockNotification frames.
+
+Listener parsers only use the slot and the base64 transaction blobs of a
+block. Block frames with full transactions are megabytes of JSON, so their
+blobs are sliced straight out of the frame text instead of building the
+whole object tree. This is safe because a JSON string cannot contain an
+unescaped quote, so the ``"transaction":["`` key pattern can only match a
+real transaction entry.
+
+Slicing only beats orjson when prefilter markers narrow it down to the
+transactions around a creation; without markers, frames are left to a full
+decode when orjson is the JSON backend. Logs frames are mostly log lines
+the parsers need, so they are always decoded in full.
+
+Frames that are not notifications (subscription acks, errors) return None
+and are left to a full decode.
+"""
+
+import re
+from dataclasses import dataclass
+
+from utils import json_backend
+
+_BLOCK_METHOD = re.compile(r'"method"\s*:\s*"blockNotification"')
+_SLOT = re.compile(r'"slot"\s*:\s*(\d+)')
+_TRANSACTION_KEY = '"transaction"'
+_WHITESPACE = " \t\r\n"
+
+
+@dataclass(slots=True)
+class BlockFrame:
+    """Fields of a ``blockNotification`` used by the event parsers."""
+
+    slot: int | None
+    transactions: list[str]  # Base64-encoded transactions, in block order
+
+
+def decode_block_frame(
+    raw: str, markers: tuple[str, ...] | None = None
+) -> BlockFrame | None:
+    """Slice the slot and base64 transactions out of a block notification.
+
+    Args:
+        raw: WebSocket text frame
+        markers: Base64 substrings a wanted transaction must contain (e.g.
+            creation discriminators at every alignment). When given, only
+            the transactions around a marker are sliced out, so the rest of
+            the block is never touched at Python speed.
+
+    Returns:
+        Decoded fields, or None if the frame is not a block notification
+        with base64 transactions, or if a full decode is faster (the caller
+        then decodes it in full)
+    """
+    # Scanning every blob at Python speed loses to orjson's full decode
+    if markers is None and json_backend.get_backend() == "orjson":
+        return None
+
+    # The method key precedes the block in every notification
+    if not _BLOCK_METHOD.search(raw, 0, 200):
+        return None
+
+    if markers is None:
+        transactions = _encoded_transactions(raw)
+        if not transactions:
+            return None
+    elif _TRANSACTION_KEY in raw:
+        transactions = _marked_transactions(raw, markers)
+    else:
+        return None
+
+    slot = _SLOT.search(raw)
+    return BlockFrame(
+        slot=int(slot.group(1)) if slot else None,
+        transactions=transactions,
+    )
+
+
+def _encoded_transaction_at(raw: str, pos: int) -> tuple[str, int] | None:
+    """Read the base64 string of the ``"transaction"`` key at ``pos``."""
+    pos += len(_TRANSACTION_KEY)
+    for expected in ":[\"":
+        while raw[pos] in _WHITESPACE:
+            pos += 1
+        if raw[pos] != expected:
+            return None
+        pos += 1
+    end = raw.find('"', pos)
+    if end == -1:
+        return None
+    return raw[pos:end], pos
+
+
+def _encoded_transactions(raw: str) -> list[str]:
+    # str.find runs at memchr speed; a regex over the base64 runs is slower
+    # than decoding the whole frame
+    transactions = []
+    pos = raw.find(_TRANSACTION_KEY)
+    while pos != -1:
+        found = _encoded_transaction_at(raw, pos)
+        if found:
+            transactions.append(found[0])
+            pos = found[1] + len(found[0])
+        else:
+            pos += len(_TRANSACTION_KEY)
+        pos = raw.find(_TRANSACTION_KEY, pos)
+    return transactions
+
+
+def _marked_transactions(raw: str, markers: tuple[str, ...]) -> list[str]:
+    hits = set()
+    for marker in markers:
+        pos = raw.find(marker)
+        while pos != -1:
+            hits.add(pos)
+            pos = raw.find(marker, pos + 1)
+
+    transactions: dict[int, str] = {}
+    for hit in sorted(hits):
+        key = raw.rfind(_TRANSACTION_KEY, 0, hit)
+        if key == -1 or key in transactions:
+            continue
+        found = _encoded_transaction_at(raw, key)
+        # Hits in metadata (e.g. log lines) fall outside the transaction blob
+        if found and found[1] <= hit < found[1] + len(found[0]):
+            transactions[key] = found[0]
+    return list(transactions.values())
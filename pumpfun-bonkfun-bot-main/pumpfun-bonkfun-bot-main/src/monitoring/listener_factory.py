@@ -21,17 +21,22 @@ class ListenerFactory:
         geyser_auth_type: str = "x-token",
         pumpportal_url: str = "wss://pumpportal.fun/api/data",
         platforms: list[Platform] | None = None,
+        listener_sources: list[str] | None = None,
+        shared_websocket: bool = False,
     ) -> BaseTokenListener:
         """Create a token listener based on the specified type.
 
         Args:
-            listener_type: Type of listener ('logs', 'blocks', 'geyser', or 'pumpportal')
+            listener_type: Type of listener ('logs', 'blocks', 'geyser', 'pumpportal' or 'multi')
             wss_endpoint: WebSocket endpoint URL (for logs/blocks listeners)
             geyser_endpoint: Geyser gRPC endpoint URL (for geyser listener)
             geyser_api_token: Geyser API token (for geyser listener)
             geyser_auth_type: Geyser authentication type
             pumpportal_url: PumpPortal WebSocket URL (for pumpportal listener)
             platforms: List of platforms to monitor (if None, monitor all)
+            listener_sources: Listener types raced by the 'multi' listener
+            shared_websocket: Subscribe logs/blocks listeners through the
+                endpoint's shared connection instead of their own
 
         Returns:
             Configured token listener
@@ -41,7 +46,38 @@ class ListenerFactory:
         """
         listener_type = listener_type.lower()
 
-        if listener_type == "geyser":
+        if listener_type == "multi":
+            if not listener_sources or len(listener_sources) < 2:
+                raise ValueError(
+                    "At least two listener sources are required for multi listener"
+                )
+
+            from monitoring.universal_multi_listener import (
+                UniversalMultiSourceListener,
+            )
+
+            sources = {}
+            for source in dict.fromkeys(s.lower() for s in listener_sources):
+                if source == "multi":
+                    raise ValueError("Multi listener sources cannot include 'multi'")
+                sources[source] = ListenerFactory.create_listener(
+                    listener_type=source,
+                    wss_endpoint=wss_endpoint,
+                    geyser_endpoint=geyser_endpoint,
+                    geyser_api_token=geyser_api_token,
+                    geyser_auth_type=geyser_auth_type,
+                    pumpportal_url=pumpportal_url,
+                    platforms=platforms,
+                    shared_websocket=shared_websocket,
+                )
+
+            listener = UniversalMultiSourceListener(sources)
+            logger.info(
+                f"Created Universal Multi-source listener racing: {list(sources)}"
+            )
+            return listener
+
+        elif listener_type == "geyser":
             if not geyser_endpoint or not geyser_api_token:
                 raise ValueError(
                     "Geyser endpoint and API token are required for geyser listener"
@@ -67,6 +103,9 @@ class ListenerFactory:
             listener = UniversalLogsListener(
                 wss_endpoint=wss_endpoint,
                 platforms=platforms,
+                multiplexer=ListenerFactory._multiplexer(
+                    wss_endpoint, shared_websocket
+                ),
             )
             logger.info("Created Universal Logs listener for token monitoring")
             return listener
@@ -80,6 +119,9 @@ class ListenerFactory:
             listener = UniversalBlockListener(
                 wss_endpoint=wss_endpoint,
                 platforms=platforms,
+                multiplexer=ListenerFactory._multiplexer(
+                    wss_endpoint, shared_websocket
+                ),
             )
             logger.info("Created Universal Block listener for token monitoring")
             return listener
@@ -124,9 +166,19 @@ class ListenerFactory:
         else:
             raise ValueError(
                 f"Invalid listener type '{listener_type}'. "
-                f"Must be one of: 'logs', 'blocks', 'geyser', 'pumpportal'"
+                f"Must be one of: 'logs', 'blocks', 'geyser', 'pumpportal', 'multi'"
             )
 
+    @staticmethod
+    def _multiplexer(wss_endpoint: str, shared_websocket: bool):
+        """Get the endpoint's shared connection if sharing is enabled."""
+        if not shared_websocket:
+            return None
+
+        from core.ws_multiplexer import get_multiplexer
+
+        return get_multiplexer(wss_endpoint)
+
     @staticmethod
     def get_supported_listener_types() -> list[str]:
         """Get list of supported listener types.
@@ -134,7 +186,7 @@ class ListenerFactory:
         Returns:
             List of supported listener type strings
         """
-        return ["logs", "blocks", "geyser", "pumpportal"]
+        return ["logs", "blocks", "geyser", "pumpportal", "multi"]
 
     @staticmethod
     def get_platform_compatible_listeners(platform: Platform) -> list[str]:
@@ -147,11 +199,11 @@ class ListenerFactory:
             List of compatible listener types
         """
         if platform == Platform.PUMP_FUN:
-            return ["logs", "blocks", "geyser", "pumpportal"]
+            return ["logs", "blocks", "geyser", "pumpportal", "multi"]
         elif platform == Platform.LETS_BONK:
-            return ["blocks", "geyser", "pumpportal"]  # Added pumpportal support
+            return ["logs", "blocks", "geyser", "pumpportal", "multi"]
         else:
-            return ["blocks", "geyser"]  # Default universal listeners
+            return ["blocks", "geyser", "multi"]  # Default universal listeners
 
     @staticmethod
     def get_pumpportal_supported_platforms() -> list[Platform]:
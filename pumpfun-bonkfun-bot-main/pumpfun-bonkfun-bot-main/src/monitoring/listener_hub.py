@@ -0,0 +1,239 @@
+"""
+Shares one token subscription between several bots running in the same event loop.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from core.client import SolanaClient
+from core.curve_state import CurveStateStore
+from interfaces.core import Platform, TokenInfo
+from monitoring.base_listener import BaseTokenListener
+from monitoring.gap_backfill import GapBackfiller
+from monitoring.listener_factory import ListenerFactory
+from monitoring.traffic_recorder import TrafficRecorder
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Subscriber:
+    callback: Callable[[TokenInfo], Awaitable[None]]
+    match_string: str | None
+    creator_address: str | None
+
+    def matches(self, token_info: TokenInfo) -> bool:
+        if self.match_string and not (
+            self.match_string.lower() in token_info.name.lower()
+            or self.match_string.lower() in token_info.symbol.lower()
+        ):
+            return False
+
+        return not (
+            self.creator_address
+            and self.creator_address
+            not in (str(token_info.user), str(token_info.creator))
+        )
+
+
+class _SharedSource:
+    """One upstream listener and the subscribers it fans out to."""
+
+    def __init__(self, key: tuple, listener: BaseTokenListener):
+        self.key = key
+        self.listener = listener
+        self.subscribers: list[_Subscriber] = []
+        self.task: asyncio.Task | None = None
+
+    def ensure_running(self) -> asyncio.Task:
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+        return self.task
+
+    async def _run(self) -> None:
+        logger.info(
+            f"Shared {self.key[0]} subscription started for "
+            f"{len(self.subscribers)} bot(s)"
+        )
+        # Filters are applied per subscriber, so the upstream listener runs unfiltered
+        await self.listener.listen_for_tokens(self._dispatch)
+
+    async def _dispatch(self, token_info: TokenInfo) -> None:
+        for subscriber in list(self.subscribers):
+            if not subscriber.matches(token_info):
+                continue
+            try:
+                await subscriber.callback(token_info)
+            except Exception:
+                logger.exception(f"Subscriber failed to handle {token_info.symbol}")
+
+
+class SharedListenerSubscription(BaseTokenListener):
+    """A bot's view of a shared subscription; behaves like its own listener."""
+
+    def __init__(self, source: _SharedSource, platform: Platform | None = None):
+        """Initialize the subscription.
+
+        Args:
+            source: Shared upstream source
+            platform: Platform the subscribing bot trades
+        """
+        super().__init__(platform)
+        self._source = source
+        self.source_name = source.listener.source_name
+
+    def attach_recorder(self, recorder: TrafficRecorder) -> None:
+        """Record the raw traffic of the shared upstream listener.
+
+        Args:
+            recorder: Recorder receiving raw messages
+        """
+        super().attach_recorder(recorder)
+        self._source.listener.attach_recorder(recorder)
+
+    def attach_gap_backfiller(self, backfiller: GapBackfiller) -> None:
+        """Backfill reconnect gaps of the shared upstream listener.
+
+        Args:
+            backfiller: Backfiller fetching the blocks after ``last_slot``
+        """
+        super().attach_gap_backfiller(backfiller)
+        self._source.listener.attach_gap_backfiller(backfiller)
+
+    def attach_rpc_client(self, client: SolanaClient) -> None:
+        """Attach the RPC client to the shared upstream listener.
+
+        Args:
+            client: Solana RPC client
+        """
+        super().attach_rpc_client(client)
+        self._source.listener.attach_rpc_client(client)
+
+    def attach_curve_state_store(self, store: CurveStateStore) -> None:
+        """Stream trade events of the shared upstream listener into a store.
+
+        Args:
+            store: Store receiving post-trade curve state
+        """
+        super().attach_curve_state_store(store)
+        self._source.listener.attach_curve_state_store(store)
+
+    async def listen_for_tokens(
+        self,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None = None,
+        creator_address: str | None = None,
+    ) -> None:
+        """Receive tokens from the shared subscription until it stops.
+
+        Args:
+            token_callback: Callback function for new tokens
+            match_string: Optional string to match in token name/symbol
+            creator_address: Optional creator address to filter by
+        """
+        subscriber = _Subscriber(token_callback, match_string, creator_address)
+        self._source.subscribers.append(subscriber)
+        try:
+            # Shielded so that one bot stopping does not cancel the others' feed
+            await asyncio.shield(self._source.ensure_running())
+        finally:
+            self._source.subscribers.remove(subscriber)
+
+    async def process_raw_message(self, raw: Any) -> list[TokenInfo]:
+        """Parse one raw message with the shared upstream listener's parser.
+
+        Args:
+            raw: Raw message as received by the upstream listener
+
+        Returns:
+            Every token creation in the message
+        """
+        return await self._source.listener.process_raw_message(raw)
+
+
+class ListenerHub:
+    """Creates at most one upstream listener per (type, endpoint, platform)."""
+
+    def __init__(self):
+        """Initialize an empty hub."""
+        self._sources: dict[tuple, _SharedSource] = {}
+
+    def subscribe(
+        self,
+        listener_type: str,
+        platform: Platform,
+        wss_endpoint: str | None = None,
+        geyser_endpoint: str | None = None,
+        geyser_api_token: str | None = None,
+        geyser_auth_type: str = "x-token",
+        pumpportal_url: str = "wss://pumpportal.fun/api/data",
+        listener_sources: list[str] | None = None,
+        shared_websocket: bool = False,
+    ) -> SharedListenerSubscription:
+        """Get a subscription, creating the upstream listener on first use.
+
+        Args:
+            listener_type: Type of listener (see ListenerFactory)
+            platform: Platform to monitor
+            wss_endpoint: WebSocket endpoint URL
+            geyser_endpoint: Geyser gRPC endpoint URL
+            geyser_api_token: Geyser API token
+            geyser_auth_type: Geyser authentication type
+            pumpportal_url: PumpPortal WebSocket URL
+            listener_sources: Listener types raced by the 'multi' listener
+            shared_websocket: Subscribe through the endpoint's shared connection
+
+        Returns:
+            Subscription to pass to UniversalTrader as its token listener
+        """
+        listener_type = listener_type.lower()
+        endpoint = {
+            "geyser": geyser_endpoint,
+            "pumpportal": pumpportal_url,
+        }.get(listener_type, wss_endpoint)
+        if listener_type == "multi":
+            endpoint = (wss_endpoint, geyser_endpoint, pumpportal_url)
+        key = (
+            listener_type,
+            endpoint,
+            platform,
+            tuple(sorted(listener_sources or ())),
+            shared_websocket,
+        )
+
+        source = self._sources.get(key)
+        if source is None:
+            listener = ListenerFactory.create_listener(
+                listener_type=listener_type,
+                wss_endpoint=wss_endpoint,
+                geyser_endpoint=geyser_endpoint,
+                geyser_api_token=geyser_api_token,
+                geyser_auth_type=geyser_auth_type,
+                pumpportal_url=pumpportal_url,
+                platforms=[platform],
+                listener_sources=listener_sources,
+                shared_websocket=shared_websocket,
+            )
+            source = _SharedSource(key, listener)
+            self._sources[key] = source
+        else:
+            logger.info(
+                f"Reusing {listener_type} subscription for {platform.value}"
+            )
+
+        return SharedListenerSubscription(source, platform)
+
+    @property
+    def subscription_count(self) -> int:
+        """Number of distinct upstream subscriptions."""
+        return len(self._sources)
+
+    async def close(self) -> None:
+        """Stop every upstream listener."""
+        tasks = [s.task for s in self._sources.values() if s.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,89 @@
+"""
+Push-based price feeds for open positions.
+
+A price feed keeps the curve state of every tracked pool up to date in a
+shared CurveStateStore from pushed updates, so position monitors can react as
+soon as the on-chain state changes instead of polling the RPC node.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+
+from solders.pubkey import Pubkey
+
+from core.curve_state import CurveStateStore
+from interfaces.core import TokenInfo
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PriceFeed(ABC):
+    """Base class for pushed price feed backends."""
+
+    name = "base"
+
+    def __init__(self, store: CurveStateStore):
+        """Initialize the price feed.
+
+        Args:
+            store: Shared store receiving decoded curve state
+        """
+        self.store = store
+        self.tracked: dict[Pubkey, TokenInfo] = {}
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the background connection task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Started {self.name} price feed")
+
+    async def stop(self) -> None:
+        """Stop the background connection task."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.tracked.clear()
+
+    async def track(self, token_info: TokenInfo, pool_address: Pubkey) -> None:
+        """Start receiving updates for a pool.
+
+        Args:
+            token_info: Token held in the pool
+            pool_address: Address of the pool/curve
+        """
+        if pool_address in self.tracked:
+            return
+        self.tracked[pool_address] = token_info
+        await self._on_track(pool_address)
+
+    async def untrack(self, pool_address: Pubkey) -> None:
+        """Stop receiving updates for a pool.
+
+        Args:
+            pool_address: Address of the pool/curve
+        """
+        if self.tracked.pop(pool_address, None) is None:
+            return
+        await self._on_untrack(pool_address)
+        self.store.discard(pool_address)
+
+    @abstractmethod
+    async def _run(self) -> None:
+        """Maintain the upstream connection and apply updates to the store."""
+        pass
+
+    @abstractmethod
+    async def _on_track(self, pool_address: Pubkey) -> None:
+        """Subscribe to a newly tracked pool on the live connection."""
+        pass
+
+    @abstractmethod
+    async def _on_untrack(self, pool_address: Pubkey) -> None:
+        """Unsubscribe from a pool on the live connection."""
+        pass
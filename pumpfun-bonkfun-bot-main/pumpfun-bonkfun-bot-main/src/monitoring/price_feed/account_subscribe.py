@@ -0,0 +1,94 @@
+"""
+Price feed backed by Solana WebSocket ``accountSubscribe`` notifications.
+"""
+
+import asyncio
+import base64
+
+from solders.pubkey import Pubkey
+
+from core.curve_state import CurveStateStore
+from core.ws_multiplexer import MuxSubscription, get_multiplexer
+from interfaces.core import CurveManager
+from monitoring.price_feed import PriceFeed
+from utils import json_backend
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AccountSubscribePriceFeed(PriceFeed):
+    """Streams curve account changes over the endpoint's shared WebSocket."""
+
+    name = "account_subscribe"
+
+    def __init__(
+        self,
+        wss_endpoint: str,
+        curve_manager: CurveManager,
+        store: CurveStateStore,
+    ):
+        """Initialize the accountSubscribe price feed.
+
+        Args:
+            wss_endpoint: Solana WebSocket endpoint URL
+            curve_manager: Platform curve manager used to decode account data
+            store: Shared store receiving decoded curve state
+        """
+        super().__init__(store)
+        self.wss_endpoint = wss_endpoint
+        self.curve_manager = curve_manager
+
+        # One subscription per pool on the endpoint's shared connection, so
+        # concurrent positions do not each hold a socket
+        self._multiplexer = get_multiplexer(wss_endpoint)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        self._pool_subscriptions: dict[Pubkey, MuxSubscription] = {}
+
+    async def stop(self) -> None:
+        """Stop the feed and cancel its subscriptions."""
+        for subscription in list(self._pool_subscriptions.values()):
+            await self._multiplexer.unsubscribe(subscription)
+        self._pool_subscriptions.clear()
+        await super().stop()
+
+    async def _run(self) -> None:
+        while True:
+            subscription, message = await self._queue.get()
+            if message is None:
+                # Resubscribed after a reconnect; the next notification
+                # carries the current state
+                continue
+            self._handle_notification(subscription.key, message)
+
+    async def _on_track(self, pool_address: Pubkey) -> None:
+        self._pool_subscriptions[pool_address] = await self._multiplexer.subscribe(
+            "accountSubscribe",
+            [str(pool_address), {"encoding": "base64", "commitment": "processed"}],
+            self._queue,
+            key=pool_address,
+        )
+        logger.debug(f"Subscribed price feed to {pool_address}")
+
+    async def _on_untrack(self, pool_address: Pubkey) -> None:
+        subscription = self._pool_subscriptions.pop(pool_address, None)
+        if subscription is not None:
+            await self._multiplexer.unsubscribe(subscription)
+
+    def _handle_notification(self, pool_address: Pubkey, message: str) -> None:
+        if pool_address not in self.tracked:
+            return
+
+        try:
+            result = json_backend.loads(message)["params"]["result"]
+            account_data = base64.b64decode(result["value"]["data"][0])
+            state = self.curve_manager.decode_pool_state(account_data)
+            self.store.update(
+                pool_address,
+                state["price_per_token"],
+                self.name,
+                slot=result.get("context", {}).get("slot"),
+                state=state,
+            )
+        except Exception:
+            logger.exception(f"Failed to decode account update for {pool_address}")
@@ -0,0 +1,92 @@
+"""
+Factory for creating push-based price feeds.
+"""
+
+from core.curve_state import CurveStateStore
+from interfaces.core import CurveManager
+from monitoring.price_feed import PriceFeed
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PRICE_FEED_TYPES = ["poll", "account_subscribe", "geyser", "pumpportal"]
+
+
+class PriceFeedFactory:
+    """Factory for creating price feeds based on configuration."""
+
+    @staticmethod
+    def create_price_feed(
+        feed_type: str,
+        store: CurveStateStore,
+        curve_manager: CurveManager,
+        wss_endpoint: str | None = None,
+        geyser_endpoint: str | None = None,
+        geyser_api_token: str | None = None,
+        geyser_auth_type: str = "x-token",
+        pumpportal_url: str = "wss://pumpportal.fun/api/data",
+    ) -> PriceFeed | None:
+        """Create a price feed based on the specified type.
+
+        Args:
+            feed_type: Feed type ('poll', 'account_subscribe', 'geyser' or 'pumpportal')
+            store: Shared store receiving curve state
+            curve_manager: Platform curve manager used to decode account data
+            wss_endpoint: Solana WebSocket endpoint (for account_subscribe)
+            geyser_endpoint: Geyser gRPC endpoint (for geyser)
+            geyser_api_token: Geyser API token (for geyser)
+            geyser_auth_type: Geyser authentication type
+            pumpportal_url: PumpPortal WebSocket URL (for pumpportal)
+
+        Returns:
+            Configured price feed, or None for RPC polling
+
+        Raises:
+            ValueError: If feed type is invalid or required parameters are missing
+        """
+        feed_type = feed_type.lower()
+
+        if feed_type == "poll":
+            return None
+
+        if feed_type == "account_subscribe":
+            if not wss_endpoint:
+                raise ValueError(
+                    "WebSocket endpoint is required for account_subscribe price feed"
+                )
+
+            from monitoring.price_feed.account_subscribe import (
+                AccountSubscribePriceFeed,
+            )
+
+            feed = AccountSubscribePriceFeed(wss_endpoint, curve_manager, store)
+
+        elif feed_type == "geyser":
+            if not geyser_endpoint or not geyser_api_token:
+                raise ValueError(
+                    "Geyser endpoint and API token are required for geyser price feed"
+                )
+
+            from monitoring.price_feed.geyser import GeyserPriceFeed
+
+            feed = GeyserPriceFeed(
+                geyser_endpoint,
+                geyser_api_token,
+                geyser_auth_type,
+                curve_manager,
+                store,
+            )
+
+        elif feed_type == "pumpportal":
+            from monitoring.price_feed.pumpportal import PumpPortalPriceFeed
+
+            feed = PumpPortalPriceFeed(store, pumpportal_url)
+
+        else:
+            raise ValueError(
+                f"Invalid price feed type: {feed_type}. "
+                f"Must be one of: {', '.join(PRICE_FEED_TYPES)}"
+            )
+
+        logger.info(f"Created {feed_type} price feed for position monitoring")
+        return feed
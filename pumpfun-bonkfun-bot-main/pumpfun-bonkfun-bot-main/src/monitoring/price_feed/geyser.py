@@ -0,0 +1,127 @@
+"""
+Price feed backed by Geyser gRPC account updates.
+"""
+
+import asyncio
+
+import grpc
+from solders.pubkey import Pubkey
+
+from core.curve_state import CurveStateStore
+from geyser.generated import geyser_pb2, geyser_pb2_grpc
+from interfaces.core import CurveManager
+from monitoring.price_feed import PriceFeed
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GeyserPriceFeed(PriceFeed):
+    """Streams curve account changes from a Geyser account subscription."""
+
+    name = "geyser"
+
+    def __init__(
+        self,
+        geyser_endpoint: str,
+        geyser_api_token: str,
+        geyser_auth_type: str,
+        curve_manager: CurveManager,
+        store: CurveStateStore,
+    ):
+        """Initialize the Geyser price feed.
+
+        Args:
+            geyser_endpoint: Geyser gRPC endpoint
+            geyser_api_token: Geyser API token
+            geyser_auth_type: Authentication type ("x-token" or "basic")
+            curve_manager: Platform curve manager used to decode account data
+            store: Shared store receiving decoded curve state
+        """
+        super().__init__(store)
+        self.geyser_endpoint = geyser_endpoint
+        self.geyser_api_token = geyser_api_token
+        self.auth_type = (geyser_auth_type or "x-token").lower()
+        self.curve_manager = curve_manager
+
+        # Subscription requests are streamed so the account list can change
+        # without reconnecting
+        self._requests: asyncio.Queue | None = None
+
+    def _create_geyser_connection(self):
+        """Establish a secure connection to the Geyser endpoint."""
+        if self.auth_type == "x-token":
+            auth = grpc.metadata_call_credentials(
+                lambda _, callback: callback(
+                    (("x-token", self.geyser_api_token),), None
+                )
+            )
+        else:
+            auth = grpc.metadata_call_credentials(
+                lambda _, callback: callback(
+                    (("authorization", f"Basic {self.geyser_api_token}"),), None
+                )
+            )
+        creds = grpc.composite_channel_credentials(grpc.ssl_channel_credentials(), auth)
+        channel = grpc.aio.secure_channel(self.geyser_endpoint, creds)
+        return geyser_pb2_grpc.GeyserStub(channel), channel
+
+    def _create_subscription_request(self) -> geyser_pb2.SubscribeRequest:
+        request = geyser_pb2.SubscribeRequest()
+        request.accounts["price_feed"].account.extend(
+            str(pool_address) for pool_address in self.tracked
+        )
+        request.commitment = geyser_pb2.CommitmentLevel.PROCESSED
+        return request
+
+    async def _request_stream(self):
+        while True:
+            yield await self._requests.get()
+
+    async def _run(self) -> None:
+        while True:
+            stub, channel = self._create_geyser_connection()
+            self._requests = asyncio.Queue()
+            await self._requests.put(self._create_subscription_request())
+            try:
+                logger.info(f"Price feed connected to Geyser: {self.geyser_endpoint}")
+                async for update in stub.Subscribe(self._request_stream()):
+                    if update.HasField("account"):
+                        self._handle_account_update(update.account)
+
+            except asyncio.CancelledError:
+                raise
+            except grpc.aio.AioRpcError as e:
+                logger.exception(f"Price feed gRPC error: {e.details()}")
+            except Exception:
+                logger.exception("Price feed Geyser error")
+            finally:
+                self._requests = None
+                await channel.close()
+
+            logger.info("Reconnecting price feed in 5 seconds...")
+            await asyncio.sleep(5)
+
+    async def _on_track(self, pool_address: Pubkey) -> None:
+        if self._requests is not None:
+            await self._requests.put(self._create_subscription_request())
+
+    async def _on_untrack(self, pool_address: Pubkey) -> None:
+        if self._requests is not None:
+            await self._requests.put(self._create_subscription_request())
+
+    def _handle_account_update(self, update) -> None:
+        try:
+            pool_address = Pubkey.from_bytes(update.account.pubkey)
+            if pool_address not in self.tracked:
+                return
+            state = self.curve_manager.decode_pool_state(update.account.data)
+            self.store.update(
+                pool_address,
+                state["price_per_token"],
+                self.name,
+                slot=update.slot,
+                state=state,
+            )
+        except Exception:
+            logger.exception("Failed to decode Geyser account update")
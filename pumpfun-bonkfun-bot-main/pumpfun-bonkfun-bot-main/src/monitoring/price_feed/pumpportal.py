@@ -0,0 +1,110 @@
+"""
+Price feed backed by the PumpPortal token-trade stream.
+"""
+
+import asyncio
+import json
+
+import websockets
+from solders.pubkey import Pubkey
+
+from core.curve_state import CurveStateStore
+from monitoring.price_feed import PriceFeed
+from utils import json_backend
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PumpPortalPriceFeed(PriceFeed):
+    """Derives curve prices from PumpPortal ``subscribeTokenTrade`` messages."""
+
+    name = "pumpportal"
+
+    def __init__(
+        self,
+        store: CurveStateStore,
+        pumpportal_url: str = "wss://pumpportal.fun/api/data",
+    ):
+        """Initialize the PumpPortal price feed.
+
+        Args:
+            store: Shared store receiving curve state
+            pumpportal_url: PumpPortal WebSocket URL
+        """
+        super().__init__(store)
+        self.pumpportal_url = pumpportal_url
+        self.ping_interval = 20  # seconds
+
+        self._websocket = None
+        self._mint_to_pool: dict[str, Pubkey] = {}
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with websockets.connect(
+                    self.pumpportal_url, ping_interval=self.ping_interval
+                ) as websocket:
+                    self._websocket = websocket
+                    if self._mint_to_pool:
+                        await self._send("subscribeTokenTrade", list(self._mint_to_pool))
+
+                    async for message in websocket:
+                        self._handle_message(message)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Price feed PumpPortal error")
+            finally:
+                self._websocket = None
+
+            logger.info("Reconnecting price feed in 5 seconds...")
+            await asyncio.sleep(5)
+
+    async def _send(self, method: str, mints: list[str]) -> None:
+        try:
+            await self._websocket.send(json.dumps({"method": method, "keys": mints}))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def _on_track(self, pool_address: Pubkey) -> None:
+        mint = str(self.tracked[pool_address].mint)
+        self._mint_to_pool[mint] = pool_address
+        if self._websocket is not None:
+            await self._send("subscribeTokenTrade", [mint])
+
+    async def _on_untrack(self, pool_address: Pubkey) -> None:
+        mints = [m for m, pool in self._mint_to_pool.items() if pool == pool_address]
+        for mint in mints:
+            del self._mint_to_pool[mint]
+        if mints and self._websocket is not None:
+            await self._send("unsubscribeTokenTrade", mints)
+
+    def _handle_message(self, message: str) -> None:
+        try:
+            data = json_backend.loads(message)
+        except json.JSONDecodeError:
+            logger.exception("Failed to decode PumpPortal trade message")
+            return
+
+        pool_address = self._mint_to_pool.get(data.get("mint", ""))
+        if pool_address is None:
+            return
+
+        virtual_sol = data.get("vSolInBondingCurve")
+        virtual_tokens = data.get("vTokensInBondingCurve")
+        if not virtual_sol or not virtual_tokens:
+            return
+
+        # PumpPortal reports reserves in decimal SOL and decimal tokens
+        self.store.update(
+            pool_address,
+            virtual_sol / virtual_tokens,
+            self.name,
+            state={
+                "sol_reserves_decimal": virtual_sol,
+                "token_reserves_decimal": virtual_tokens,
+                "signature": data.get("signature"),
+            },
+        )
@@ -0,0 +1,131 @@
+"""
+Listener that replays recorded traffic through the real listener parsers.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+from interfaces.core import TokenInfo
+from monitoring.base_listener import BaseTokenListener
+from monitoring.traffic_recorder import read_recording
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReplayListener(BaseTokenListener):
+    """Feeds a recording back at 1x, Nx or maximum speed."""
+
+    source_name = "replay"
+
+    def __init__(
+        self,
+        recording_path: str,
+        listeners: dict[str, BaseTokenListener],
+        speed: float = 1.0,
+    ):
+        """Initialize the replay listener.
+
+        Args:
+            recording_path: Recording written by TrafficRecorder
+            listeners: Listeners whose parsers handle each recorded source,
+                keyed by source name
+            speed: Replay speed multiplier (0 replays as fast as possible)
+        """
+        super().__init__()
+        self.recording_path = recording_path
+        self.listeners = listeners
+        self.speed = speed
+
+        # Replay statistics
+        self.messages_replayed = 0
+        self.tokens_detected = 0
+        self.elapsed = 0.0
+        self.detected_at: dict[str, float] = {}
+
+    @property
+    def messages_per_second(self) -> float:
+        """Replay throughput, in messages per second."""
+        if not self.elapsed:
+            return 0.0
+        return self.messages_replayed / self.elapsed
+
+    async def listen_for_tokens(
+        self,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None = None,
+        creator_address: str | None = None,
+    ) -> None:
+        """Replay the recording and return once it is exhausted.
+
+        Args:
+            token_callback: Callback function for new tokens
+            match_string: Optional string to match in token name/symbol
+            creator_address: Optional creator address to filter by
+        """
+        logger.info(
+            f"Replaying {self.recording_path} at "
+            f"{f'{self.speed}x' if self.speed > 0 else 'max'} speed"
+        )
+        start = monotonic()
+
+        for offset, source, raw in read_recording(self.recording_path):
+            if source not in self.listeners:
+                continue
+
+            if self.speed > 0:
+                delay = start + offset / self.speed - monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            self.messages_replayed += 1
+            try:
+                tokens = await self.process_raw_message((source, raw))
+            except Exception:
+                logger.exception(f"Failed to replay {source} message")
+                continue
+
+            for token_info in tokens:
+                if match_string and not (
+                    match_string.lower() in token_info.name.lower()
+                    or match_string.lower() in token_info.symbol.lower()
+                ):
+                    continue
+
+                if creator_address and creator_address not in (
+                    str(token_info.user),
+                    str(token_info.creator),
+                ):
+                    continue
+
+                self.tokens_detected += 1
+                self.detected_at.setdefault(str(token_info.mint), monotonic())
+                await token_callback(token_info)
+
+            # Let the consumer run between messages, as a live socket would
+            if self.speed <= 0:
+                await asyncio.sleep(0)
+
+        self.elapsed = monotonic() - start
+        logger.info(
+            f"Replay finished: {self.messages_replayed} messages, "
+            f"{self.tokens_detected} tokens in {self.elapsed:.2f}s "
+            f"({self.messages_per_second:.0f} msg/s)"
+        )
+
+    async def process_raw_message(self, raw: Any) -> list[TokenInfo]:
+        """Parse one recorded message with the parser of its source.
+
+        Args:
+            raw: (source name, raw message) pair as stored by TrafficRecorder
+
+        Returns:
+            Every token creation in the message, none for unknown sources
+        """
+        source, message = raw
+        listener = self.listeners.get(source)
+        if listener is None:
+            return []
+        return await listener.process_raw_message(message)
@@ -0,0 +1,56 @@
+"""
+Token filters compiled for evaluation at the source.
+
+A creator filter can be pushed into the subscription itself: Geyser
+transaction filters can require the creator's account, and WebSocket
+subscriptions can mention the creator instead of the platform program, so
+the node only sends the creator's transactions. Sources without such a
+filter (PumpPortal) check for the creator's address in the raw message
+before decoding. Name/symbol matching is case-insensitive on decoded
+strings, so it still runs after parsing.
+"""
+
+from dataclasses import dataclass, field
+
+from solders.pubkey import Pubkey
+
+
+@dataclass(frozen=True)
+class SourceFilter:
+    """Creator filter of a ``listen_for_tokens`` call, compiled once per subscription."""
+
+    creator_address: str | None = None
+    creator: Pubkey | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        if self.creator_address:
+            # Fail before subscribing rather than on a rejected subscription
+            object.__setattr__(self, "creator", Pubkey.from_string(self.creator_address))
+
+    @property
+    def can_push_down(self) -> bool:
+        """Whether the subscription itself can be narrowed."""
+        return self.creator is not None
+
+    def geyser_account_required(self) -> list[str]:
+        """Accounts every streamed transaction must reference."""
+        return [self.creator_address] if self.creator else []
+
+    def websocket_mentions(self, program_ids: list[str]) -> list[str]:
+        """Accounts to subscribe to, one ``mentions`` subscription each.
+
+        ``logsSubscribe`` and ``blockSubscribe`` accept a single account, so
+        the creator replaces the program IDs; the parsers still only accept
+        creations from the monitored programs.
+
+        Args:
+            program_ids: Program IDs subscribed to without a creator filter
+
+        Returns:
+            Accounts to mention
+        """
+        return [self.creator_address] if self.creator else program_ids
+
+    def matches_raw_text(self, raw: str) -> bool:
+        """Check that a JSON message can come from the creator (base58 address)."""
+        return self.creator is None or self.creator_address in raw
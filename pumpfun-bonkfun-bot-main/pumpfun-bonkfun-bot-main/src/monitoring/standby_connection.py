@@ -0,0 +1,96 @@
+"""
+Spare connection kept open while a listener streams, for near-instant failover.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class StandbyConnection(Generic[T]):
+    """Pre-opens the next connection so a reconnect skips DNS, TCP and TLS setup."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[T]],
+        is_open: Callable[[T], bool],
+        close: Callable[[T], Awaitable[None]],
+    ):
+        """Initialize the standby slot.
+
+        Args:
+            connect: Callable returning an awaitable that opens a connection
+            is_open: Checks that a connection is still usable
+            close: Coroutine function closing a connection
+        """
+        self._connect = connect
+        self._is_open = is_open
+        self._close = close
+        self._task: asyncio.Task | None = None
+
+    def prepare(self) -> None:
+        """Start opening a spare connection in the background if none exists."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._connect())
+
+    @property
+    def ready(self) -> bool:
+        """Whether a spare connection has finished opening."""
+        task = self._task
+        return (
+            task is not None
+            and task.done()
+            and not task.cancelled()
+            and task.exception() is None
+        )
+
+    async def take(self) -> T | None:
+        """Take the spare connection, if it opened and is still usable.
+
+        Returns:
+            Open connection, or None if the caller must connect itself
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return None
+        try:
+            connection = await task
+        except Exception as e:
+            logger.debug(f"Standby connection failed: {e}")
+            return None
+
+        if self._is_open(connection):
+            return connection
+        await self._close(connection)
+        return None
+
+    async def connect(self) -> T:
+        """Get a connection, preferring the spare one.
+
+        Returns:
+            Open connection
+        """
+        connection = await self.take()
+        if connection is not None:
+            logger.info("Failing over to standby connection")
+            return connection
+        return await self._connect()
+
+    async def close(self) -> None:
+        """Close the spare connection."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        try:
+            connection = await task
+        except (asyncio.CancelledError, Exception):
+            return
+        await self._close(connection)
@@ -0,0 +1,171 @@
+"""
+Capture and read back raw listener traffic for deterministic replay.
+
+Recordings are JSON lines (gzip-compressed when the path ends in ``.gz``).
+The first line is a header; every other line is
+``[offset_seconds, source, kind, payload]`` where ``kind`` is ``"t"`` for
+text frames (stored as-is) and ``"b"`` for binary frames (stored as base64).
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+RECORDING_VERSION = 1
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TrafficRecorder:
+    """Buffers raw listener messages in memory and writes them in the background."""
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        """Initialize the recorder.
+
+        Args:
+            path: Output file (``.jsonl`` or ``.jsonl.gz``)
+            flush_interval: Seconds between background writes
+        """
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.messages_recorded = 0
+
+        self._buffer: list[list] = []
+        self._start = time.monotonic()
+        self._file: IO[str] | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        # Serializes writes: a thread left running by one flush must finish
+        # before the next flush or the file close touches the file
+        self._write_lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """Open the output file and start the background writer."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = _open(self.path, "w")
+        header = {"version": RECORDING_VERSION, "started_at": time.time()}
+        self._file.write(json.dumps(header) + "\n")
+        self._start = time.monotonic()
+        self._stopping = False
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"Recording listener traffic to {self.path}")
+
+    def record(self, source: str, raw: str | bytes) -> None:
+        """Record one raw message. Cheap enough to call on the receive path.
+
+        Args:
+            source: Listener source name
+            raw: Raw message as received
+        """
+        offset = round(time.monotonic() - self._start, 6)
+        if isinstance(raw, bytes):
+            self._buffer.append([offset, source, "b", raw])
+        else:
+            self._buffer.append([offset, source, "t", raw])
+        self.messages_recorded += 1
+
+    async def _flush_loop(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write buffered messages to disk off the event loop."""
+        async with self._write_lock:
+            if not self._buffer or self._file is None:
+                return
+            batch, self._buffer = self._buffer, []
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception:
+                # Logged and dropped so the writer task keeps running
+                logger.exception(f"Failed to record {len(batch)} listener messages")
+
+    def _write(self, batch: list[list]) -> None:
+        lines = []
+        for offset, source, kind, payload in batch:
+            if kind == "b":
+                payload = base64.b64encode(payload).decode("ascii")
+            lines.append(json.dumps([offset, source, kind, payload]))
+        self._file.write("\n".join(lines) + "\n")
+
+    async def close(self) -> None:
+        """Flush remaining messages and close the file."""
+        if self._flush_task:
+            # Not cancelled: a cancelled flush would leave its write thread
+            # running while the file is closed
+            self._stopping = True
+            self._wakeup.set()
+            await self._flush_task
+            self._flush_task = None
+
+        await self.flush()
+        async with self._write_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+                logger.info(
+                    f"Recorded {self.messages_recorded} listener messages "
+                    f"to {self.path}"
+                )
+
+
+def read_recording(path: str) -> Iterator[tuple[float, str, str | bytes]]:
+    """Read a recording written by TrafficRecorder.
+
+    Args:
+        path: Recording file
+
+    Yields:
+        Tuples of (offset_seconds, source, raw_message)
+    """
+    with _open(Path(path), "r") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != RECORDING_VERSION:
+            raise ValueError(
+                f"Unsupported recording version {header.get('version')} in {path}"
+            )
+        for line in f:
+            if not line.strip():
+                continue
+            offset, source, kind, payload = json.loads(line)
+            if kind == "b":
+                payload = base64.b64decode(payload)
+            yield offset, source, payload
+
+
+def write_recording(path: str, messages: list[tuple[float, str, str | bytes]]) -> None:
+    """Write a complete recording in one go (e.g. one built from fixtures).
+
+    Args:
+        path: Output file (``.jsonl`` or ``.jsonl.gz``)
+        messages: Tuples of (offset_seconds, source, raw_message)
+    """
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with _open(output, "w") as f:
+        f.write(json.dumps({"version": RECORDING_VERSION, "started_at": time.time()}) + "\n")
+        for offset, source, raw in messages:
+            if isinstance(raw, bytes):
+                entry = [offset, source, "b", base64.b64encode(raw).decode("ascii")]
+            else:
+                entry = [offset, source, "t", raw]
+            f.write(json.dumps(entry) + "\n")
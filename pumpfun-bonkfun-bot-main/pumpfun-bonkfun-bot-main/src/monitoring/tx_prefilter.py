@@ -0,0 +1,111 @@
+"""
+Raw-bytes prefilter for transactions that may create a token.
+
+A token creation must contain both the platform's program ID (in the account
+keys) and its creation instruction discriminator (at the start of the
+instruction data). Searching for those byte strings is far cheaper than
+deserializing a transaction, so full decoding only runs on candidates.
+
+Base64 payloads are searched without decoding: a byte pattern at offset ``n``
+always encodes to the same characters for the part of it that does not share
+a base64 group with its neighbours, so three precomputed variants (one per
+``n % 3``) cover every alignment.
+"""
+
+import base64
+
+from solders.pubkey import Pubkey
+
+
+def base64_variants(pattern: bytes) -> tuple[str, ...]:
+    """Get the base64 substrings that ``pattern`` encodes to at each alignment.
+
+    Args:
+        pattern: Byte pattern to search for
+
+    Returns:
+        One substring per byte offset modulo 3
+    """
+    variants = []
+    for shift in range(3):
+        encoded = base64.b64encode(bytes(shift) + pattern).decode("ascii")
+        # Keep only characters whose 6 bits all come from the pattern
+        start = -(-8 * shift // 6)
+        end = 8 * (shift + len(pattern)) // 6
+        variants.append(encoded[start:end])
+    return tuple(variants)
+
+
+class TransactionPrefilter:
+    """Substring test run before transaction or protobuf decoding."""
+
+    def __init__(self, targets: list[tuple[Pubkey, list[bytes]]]):
+        """Initialize the prefilter.
+
+        Args:
+            targets: (program ID, creation instruction discriminators) per platform
+        """
+        self._raw = [
+            (bytes(program_id), tuple(discriminators))
+            for program_id, discriminators in targets
+        ]
+        self._encoded = [
+            (
+                base64_variants(bytes(program_id)),
+                tuple(v for d in discriminators for v in base64_variants(d)),
+            )
+            for program_id, discriminators in targets
+        ]
+
+        # Instrumentation
+        self.checked = 0
+        self.passed = 0
+
+    @property
+    def base64_markers(self) -> tuple[str, ...]:
+        """Base64 substrings of every creation discriminator at every alignment."""
+        return tuple(
+            dict.fromkeys(d for _, discriminators in self._encoded for d in discriminators)
+        )
+
+    def matches_bytes(self, raw: bytes) -> bool:
+        """Check raw bytes (e.g. a serialized transaction or Geyser update).
+
+        Args:
+            raw: Raw payload
+
+        Returns:
+            True if the payload may contain a token creation
+        """
+        self.checked += 1
+        # Discriminators are rarer than program IDs, so they are tested first
+        for program_id, discriminators in self._raw:
+            if any(d in raw for d in discriminators) and program_id in raw:
+                self.passed += 1
+                return True
+        return False
+
+    def matches_base64(self, encoded: str) -> bool:
+        """Check a base64-encoded payload without decoding it.
+
+        Args:
+            encoded: Base64 payload (e.g. a blockSubscribe transaction)
+
+        Returns:
+            True if the payload may contain a token creation
+        """
+        self.checked += 1
+        for program_ids, discriminators in self._encoded:
+            if any(d in encoded for d in discriminators) and any(
+                p in encoded for p in program_ids
+            ):
+                self.passed += 1
+                return True
+        return False
+
+    @property
+    def pass_rate(self) -> float:
+        """Fraction of checked payloads passed on to full decoding."""
+        if not self.checked:
+            return 0.0
+        return self.passed / self.checked
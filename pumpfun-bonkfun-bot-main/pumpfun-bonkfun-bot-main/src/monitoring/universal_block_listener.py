@@ -6,14 +6,21 @@ import asyncio
 import base64
 import json
 from collections.abc import Awaitable, Callable
+from typing import Any
 
 import websockets
 from solders.transaction import VersionedTransaction
+from websockets.protocol import State
 
 from core.client import SolanaClient
-from interfaces.core import Platform, TokenInfo
+from core.ws_multiplexer import WebSocketMultiplexer
+from interfaces.core import EventParser, Platform, TokenInfo
 from monitoring.base_listener import BaseTokenListener
+from monitoring.frame_decoder import decode_block_frame
+from monitoring.standby_connection import StandbyConnection
+from monitoring.tx_prefilter import TransactionPrefilter
 from platforms import get_platform_implementations, platform_factory
+from utils import json_backend
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,20 +29,30 @@ logger = get_logger(__name__)
 class UniversalBlockListener(BaseTokenListener):
     """Universal block listener that works with any platform."""
 
+    source_name = "blocks"
+
     def __init__(
         self,
         wss_endpoint: str,
         platforms: list[Platform] | None = None,
+        multiplexer: WebSocketMultiplexer | None = None,
     ) -> None:
         """Initialize universal block listener.
 
         Args:
             wss_endpoint: WebSocket endpoint URL
             platforms: List of platforms to monitor (if None, monitor all supported platforms)
+            multiplexer: Shared connection to subscribe through (own connection if None)
         """
         super().__init__()
         self.wss_endpoint = wss_endpoint
+        self.multiplexer = multiplexer
         self.ping_interval = 20  # seconds
+        self.standby = StandbyConnection(
+            self._open_websocket,
+            lambda ws: ws.state is State.OPEN,
+            lambda ws: ws.close(),
+        )
 
         # Get supported platforms
         if platforms is None:
@@ -49,6 +66,8 @@ class UniversalBlockListener(BaseTokenListener):
         self.platform_program_ids = []
         # Map program IDs to their parsers for faster lookup
         self.program_id_to_parser = {}
+        # Map raw 32-byte program IDs to (parser, creation discriminators)
+        self.program_dispatch: dict[bytes, tuple[EventParser, tuple[bytes, ...]]] = {}
 
         for platform in self.platforms:
             try:
@@ -58,9 +77,7 @@ class UniversalBlockListener(BaseTokenListener):
                         # Skip SolanaClient.__init__ to avoid starting blockhash updater
                         self.rpc_endpoint = "http://dummy"
                         self._client = None
-                        self._cached_blockhash = None
-                        self._blockhash_lock = None
-                        self._blockhash_updater_task = None
+                        self.blockhash_service = None
 
                 dummy_client = DummyClient()
 
@@ -70,6 +87,10 @@ class UniversalBlockListener(BaseTokenListener):
                 program_id_str = str(parser.get_program_id())
                 self.platform_program_ids.append(program_id_str)
                 self.program_id_to_parser[program_id_str] = (platform, parser)
+                self.program_dispatch[bytes(parser.get_program_id())] = (
+                    parser,
+                    tuple(parser.get_instruction_discriminators()),
+                )
 
                 logger.info(
                     f"Registered platform {platform.value} with program ID {parser.get_program_id()}"
@@ -78,6 +99,18 @@ class UniversalBlockListener(BaseTokenListener):
             except Exception as e:
                 logger.warning(f"Could not register platform {platform.value}: {e}")
 
+        # Skips decoding for transactions that cannot contain a creation
+        self.prefilter = TransactionPrefilter(
+            [
+                (parser.get_program_id(), list(discriminators))
+                for parser, discriminators in self.program_dispatch.values()
+            ]
+        )
+
+    async def _open_websocket(self) -> websockets.ClientConnection:
+        """Open a WebSocket connection to the endpoint."""
+        return await websockets.connect(self.wss_endpoint)
+
     async def listen_for_tokens(
         self,
         token_callback: Callable[[TokenInfo], Awaitable[None]],
@@ -94,52 +127,117 @@ class UniversalBlockListener(BaseTokenListener):
         if not self.platform_parsers:
             logger.error("No platform parsers available. Cannot listen for tokens.")
             return
+        self._compile_source_filter(creator_address)
+
+        async def deliver(token_info: TokenInfo) -> None:
+            await self._handle_token(
+                token_info, token_callback, match_string, creator_address
+            )
 
-        while True:
+        if self.multiplexer is not None:
             try:
-                async with websockets.connect(self.wss_endpoint) as websocket:
-                    await self._subscribe_to_programs(websocket)
-                    ping_task = asyncio.create_task(self._ping_loop(websocket))
-
-                    try:
-                        while True:
-                            token_info = await self._wait_for_token_creation(websocket)
-                            if not token_info:
-                                continue
-
-                            logger.info(
-                                f"New token detected: {token_info.name} ({token_info.symbol}) on {token_info.platform.value}"
-                            )
-
-                            # Apply filters
-                            if match_string and not (
-                                match_string.lower() in token_info.name.lower()
-                                or match_string.lower() in token_info.symbol.lower()
-                            ):
-                                logger.info(
-                                    f"Token does not match filter '{match_string}'. Skipping..."
-                                )
-                                continue
-
-                            if (
-                                creator_address
-                                and str(token_info.user) != creator_address
-                            ):
-                                logger.info(
-                                    f"Token not created by {creator_address}. Skipping..."
-                                )
-                                continue
-
-                            await token_callback(token_info)
-
-                    except websockets.exceptions.ConnectionClosed:
-                        logger.warning("WebSocket connection closed. Reconnecting...")
-                        ping_task.cancel()
+                await self._listen_multiplexed(
+                    self.multiplexer,
+                    self._subscription_requests(),
+                    deliver,
+                    self.platforms,
+                )
+            finally:
+                await self._stop_backfills()
+            return
 
-            except Exception:
-                logger.exception("WebSocket connection error")
-                logger.info("Reconnecting in 5 seconds...")
-                await asyncio.sleep(5)
+        try:
+            while True:
+                try:
+                    websocket = await self.standby.connect()
+                    async with websocket:
+                        await self._subscribe_to_programs(websocket)
+                        ping_task = asyncio.create_task(self._ping_loop(websocket))
+                        self._start_backfill(deliver, self.platforms)
+                        self.standby.prepare()
+
+                        try:
+                            while True:
+                                for token_info in await self._wait_for_token_creation(
+                                    websocket
+                                ):
+                                    await deliver(token_info)
+
+                        except websockets.exceptions.ConnectionClosed:
+                            logger.warning("WebSocket connection closed. Reconnecting...")
+                            ping_task.cancel()
+
+                except Exception:
+                    logger.exception("WebSocket connection error")
+                    logger.info("Reconnecting in 5 seconds...")
+                    await asyncio.sleep(5)
+        finally:
+            await self._stop_backfills()
+            await self.standby.close()
+
+    async def _handle_token(
+        self,
+        token_info: TokenInfo,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None,
+        creator_address: str | None,
+    ) -> None:
+        """Deduplicate and filter a detected token and forward it.
+
+        Args:
+            token_info: Detected token (live or backfilled)
+            token_callback: Callback function for new tokens
+            match_string: Optional string to match in token name/symbol
+            creator_address: Optional creator address to filter by
+        """
+        if not self._first_delivery(token_info):
+            return
+
+        logger.info(
+            f"New token detected: {token_info.name} ({token_info.symbol}) on {token_info.platform.value}"
+        )
+
+        # Apply filters
+        if match_string and not (
+            match_string.lower() in token_info.name.lower()
+            or match_string.lower() in token_info.symbol.lower()
+        ):
+            logger.info(f"Token does not match filter '{match_string}'. Skipping...")
+            return
+
+        if creator_address and str(token_info.user) != creator_address:
+            logger.info(f"Token not created by {creator_address}. Skipping...")
+            return
+
+        await token_callback(token_info)
+
+    def _subscription_requests(self) -> list[tuple[str, list[Any]]]:
+        """Build the blockSubscribe requests of the monitored program IDs.
+
+        With a creator filter only the creator's transactions are subscribed to.
+
+        Returns:
+            (method, params) of every subscription
+        """
+        # For block subscriptions, we can use mentionsAccountOrProgram to monitor multiple programs
+        # We'll create separate subscriptions for each program to be more specific
+        mentions = self.source_filter.websocket_mentions(self.platform_program_ids)
+        return [
+            (
+                "blockSubscribe",
+                [
+                    {"mentionsAccountOrProgram": program_id},
+                    {
+                        "commitment": "confirmed",
+                        "encoding": "base64",
+                        "showRewards": False,
+                        "transactionDetails": "full",
+                        "maxSupportedTransactionVersion": 0,
+                    },
+                ],
+            )
+            for program_id in mentions
+        ]
 
     async def _subscribe_to_programs(
         self, websocket: websockets.WebSocketServerProtocol
@@ -149,29 +247,15 @@ class UniversalBlockListener(BaseTokenListener):
         Args:
             websocket: Active WebSocket connection
         """
-        # For block subscriptions, we can use mentionsAccountOrProgram to monitor multiple programs
-        # We'll create separate subscriptions for each program to be more specific
-        for i, program_id in enumerate(self.platform_program_ids):
+        for i, (method, params) in enumerate(self._subscription_requests()):
             subscription_message = json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": i + 1,
-                    "method": "blockSubscribe",
-                    "params": [
-                        {"mentionsAccountOrProgram": program_id},
-                        {
-                            "commitment": "confirmed",
-                            "encoding": "base64",
-                            "showRewards": False,
-                            "transactionDetails": "full",
-                            "maxSupportedTransactionVersion": 0,
-                        },
-                    ],
-                }
+                {"jsonrpc": "2.0", "id": i + 1, "method": method, "params": params}
             )
 
             await websocket.send(subscription_message)
-            logger.info(f"Subscribed to blocks mentioning program: {program_id}")
+            logger.info(
+                f"Subscribed to blocks mentioning: {params[0]['mentionsAccountOrProgram']}"
+            )
 
     async def _ping_loop(self, websocket: websockets.WebSocketServerProtocol) -> None:
         """Keep connection alive with pings.
@@ -197,43 +281,20 @@ class UniversalBlockListener(BaseTokenListener):
 
     async def _wait_for_token_creation(
         self, websocket: websockets.WebSocketServerProtocol
-    ) -> TokenInfo | None:
-        """Wait for token creation event from any platform.
+    ) -> list[TokenInfo]:
+        """Wait for the next block and extract its token creations.
 
         Args:
             websocket: Active WebSocket connection
 
         Returns:
-            TokenInfo if a token creation is found, None otherwise
+            Every token creation found in the block (empty if none)
         """
         try:
             response = await asyncio.wait_for(websocket.recv(), timeout=30)
-            data = json.loads(response)
-
-            # Handle subscription errors
-            if "error" in data:
-                logger.error(f"Block subscription error: {data['error']}")
-                return None
-            elif "result" in data:
-                # Subscription confirmation - continue waiting for notifications
-                return None
-
-            if "method" not in data or data["method"] != "blockNotification":
-                return None
-
-            if "params" not in data or "result" not in data["params"]:
-                return None
-
-            block_data = data["params"]["result"]
-            if "value" not in block_data or "block" not in block_data["value"]:
-                return None
-
-            block = block_data["value"]["block"]
-            if "transactions" not in block:
-                return None
-
-            # Process all transactions in the block for token creations
-            return self._process_block_transactions(block["transactions"])
+            if self.recorder:
+                self.recorder.record(self.source_name, response)
+            return await self.process_raw_message(response)
 
         except TimeoutError:
             logger.debug("No data received for 30 seconds")
@@ -243,17 +304,67 @@ class UniversalBlockListener(BaseTokenListener):
         except Exception:
             logger.exception("Error processing WebSocket message")
 
-        return None
+        return []
+
+    async def process_raw_message(self, raw: str) -> list[TokenInfo]:
+        """Parse a blockNotification frame.
 
-    def _process_block_transactions(self, transactions: list) -> TokenInfo | None:
+        Args:
+            raw: WebSocket text frame
+
+        Returns:
+            Every token creation found in the block
+        """
+        # With the prefilter, only the base64 transactions around a creation
+        # discriminator are sliced out, without decoding the whole frame
+        frame = decode_block_frame(
+            raw, self.prefilter.base64_markers if self.prefilter else None
+        )
+        if frame is not None:
+            self._note_slot(frame.slot)
+            tokens: list[TokenInfo] = []
+            for encoded in frame.transactions:
+                tokens.extend(self._parse_encoded_transaction(encoded))
+            return tokens
+
+        data = json_backend.loads(raw)
+
+        # Handle subscription errors
+        if "error" in data:
+            logger.error(f"Block subscription error: {data['error']}")
+            return []
+        elif "result" in data:
+            # Subscription confirmation - continue waiting for notifications
+            return []
+
+        if "method" not in data or data["method"] != "blockNotification":
+            return []
+
+        if "params" not in data or "result" not in data["params"]:
+            return []
+
+        block_data = data["params"]["result"]
+        if "value" not in block_data or "block" not in block_data["value"]:
+            return []
+
+        self._note_slot(block_data["value"].get("slot"))
+        block = block_data["value"]["block"]
+        if not block or "transactions" not in block:
+            return []
+
+        # Process all transactions in the block for token creations
+        return self._process_block_transactions(block["transactions"])
+
+    def _process_block_transactions(self, transactions: list) -> list[TokenInfo]:
         """Process all transactions in a block looking for token creations.
 
         Args:
             transactions: List of transaction data from block
 
         Returns:
-            TokenInfo if a token creation is found, None otherwise
+            Every token creation found, in block order
         """
+        tokens: list[TokenInfo] = []
         for tx in transactions:
             if not isinstance(tx, dict) or "transaction" not in tx:
                 continue
@@ -262,63 +373,75 @@ class UniversalBlockListener(BaseTokenListener):
 
             # Handle base64 encoded transaction data
             if isinstance(tx_data, list) and len(tx_data) > 0:
-                token_info = self._parse_encoded_transaction(tx, tx_data[0])
-                if token_info:
-                    return token_info
+                tokens.extend(self._parse_encoded_transaction(tx_data[0]))
 
             # Handle already decoded transaction data (shouldn't happen in blockSubscribe)
             elif isinstance(tx_data, dict) and "message" in tx_data:
-                token_info = self._parse_decoded_transaction(tx, tx_data)
-                if token_info:
-                    return token_info
+                tokens.extend(self._parse_decoded_transaction(tx, tx_data))
 
-        return None
+        return tokens
 
-    def _parse_encoded_transaction(
-        self, tx: dict, encoded_data: str
-    ) -> TokenInfo | None:
+    def _parse_encoded_transaction(self, encoded_data: str) -> list[TokenInfo]:
         """Parse base64 encoded transaction data.
 
+        The transaction is decoded once; instructions are matched against the
+        monitored programs on raw 32-byte keys and creation discriminators
+        before any parser runs.
+
         Args:
-            tx: Transaction wrapper from block
             encoded_data: Base64 encoded transaction data
 
         Returns:
-            TokenInfo if token creation found, None otherwise
+            Token creations found in the transaction
         """
+        if self.prefilter and not self.prefilter.matches_base64(encoded_data):
+            return []
+
         try:
-            tx_bytes = base64.b64decode(encoded_data)
-            transaction = VersionedTransaction.from_bytes(tx_bytes)
+            message = VersionedTransaction.from_bytes(
+                base64.b64decode(encoded_data)
+            ).message
+        except Exception:
+            # Failed to decode transaction - skip it
+            return []
 
-            # Check if any of the instructions use our monitored programs
-            for instruction in transaction.message.instructions:
-                program_id = str(
-                    transaction.message.account_keys[instruction.program_id_index]
-                )
+        account_keys = message.account_keys
+        account_keys_bytes: list[bytes] | None = None
+        tokens: list[TokenInfo] = []
 
-                # Check if this program ID is one we're monitoring
-                if program_id in self.program_id_to_parser:
-                    platform, parser = self.program_id_to_parser[program_id]
-
-                    # Try to parse with the appropriate parser
-                    try:
-                        if hasattr(parser, "parse_token_creation_from_block"):
-                            token_info = parser.parse_token_creation_from_block(
-                                {"transactions": [tx]}
-                            )
-                            if token_info:
-                                return token_info
-                    except Exception:
-                        # Expected for non-creation transactions
-                        continue
+        for instruction in message.instructions:
+            if instruction.program_id_index >= len(account_keys):
+                continue
 
-        except Exception:
-            # Failed to decode transaction - skip it
-            pass
+            dispatch = self.program_dispatch.get(
+                bytes(account_keys[instruction.program_id_index])
+            )
+            if dispatch is None:
+                continue
+
+            parser, discriminators = dispatch
+            ix_data = bytes(instruction.data)
+            if not ix_data.startswith(discriminators):
+                continue
+
+            # Key bytes are only materialized for transactions that create tokens
+            if account_keys_bytes is None:
+                account_keys_bytes = [bytes(key) for key in account_keys]
+
+            try:
+                token_info = parser.parse_token_creation_from_instruction(
+                    ix_data, instruction.accounts, account_keys_bytes
+                )
+            except Exception as e:
+                logger.debug(f"Failed to parse creation instruction: {e}")
+                continue
+
+            if token_info:
+                tokens.append(token_info)
 
-        return None
+        return tokens
 
-    def _parse_decoded_transaction(self, tx: dict, tx_data: dict) -> TokenInfo | None:
+    def _parse_decoded_transaction(self, tx: dict, tx_data: dict) -> list[TokenInfo]:
         """Parse already decoded transaction data.
 
         Args:
@@ -326,35 +449,31 @@ class UniversalBlockListener(BaseTokenListener):
             tx_data: Decoded transaction data
 
         Returns:
-            TokenInfo if token creation found, None otherwise
+            Token creations found in the transaction
         """
         message = tx_data["message"]
         if "instructions" not in message or "accountKeys" not in message:
-            return None
-
-        for ix in message["instructions"]:
-            if "programIdIndex" not in ix:
+            return []
+
+        parsers = {
+            message["accountKeys"][ix["programIdIndex"]]
+            for ix in message["instructions"]
+            if "programIdIndex" in ix
+            and ix["programIdIndex"] < len(message["accountKeys"])
+        }
+        for program_id in parsers:
+            if program_id not in self.program_id_to_parser:
                 continue
 
-            program_idx = ix["programIdIndex"]
-            if program_idx >= len(message["accountKeys"]):
+            _, parser = self.program_id_to_parser[program_id]
+            try:
+                token_info = parser.parse_token_creation_from_block(
+                    {"transactions": [tx]}
+                )
+                if token_info:
+                    return [token_info]
+            except Exception:
+                # Expected for non-creation transactions
                 continue
 
-            program_id = message["accountKeys"][program_idx]
-
-            # Check if this program ID is one we're monitoring
-            if program_id in self.program_id_to_parser:
-                platform, parser = self.program_id_to_parser[program_id]
-
-                try:
-                    if hasattr(parser, "parse_token_creation_from_block"):
-                        token_info = parser.parse_token_creation_from_block(
-                            {"transactions": [tx]}
-                        )
-                        if token_info:
-                            return token_info
-                except Exception:
-                    # Expected for non-creation transactions
-                    continue
-
-        return None
+        return []
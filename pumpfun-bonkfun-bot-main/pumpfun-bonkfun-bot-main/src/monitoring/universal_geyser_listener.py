@@ -4,30 +4,159 @@ Universal Geyser listener that works with any platform through the interface sys
 
 import asyncio
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
 
 import grpc
 
 from geyser.generated import geyser_pb2, geyser_pb2_grpc
-from interfaces.core import Platform, TokenInfo
+from interfaces.core import EventParser, Platform, TokenInfo
 from monitoring.base_listener import BaseTokenListener
+from monitoring.standby_connection import StandbyConnection
+from monitoring.tx_prefilter import TransactionPrefilter
 from platforms import platform_factory
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DROP_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+# Protobuf field numbers of SubscribeUpdate.transaction and its slot
+_UPDATE_TRANSACTION_FIELD = 4
+_TRANSACTION_SLOT_FIELD = 2
+
+
+def _read_varint(raw: bytes, pos: int) -> tuple[int, int]:
+    """Read a protobuf varint, returning its value and the position after it."""
+    value = shift = 0
+    while True:
+        byte = raw[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _skip_field(raw: bytes, pos: int, wire_type: int) -> int:
+    """Get the position after a protobuf field value of the given wire type."""
+    if wire_type == 0:
+        return _read_varint(raw, pos)[1]
+    if wire_type == 1:
+        return pos + 8
+    if wire_type == 2:
+        length, pos = _read_varint(raw, pos)
+        return pos + length
+    if wire_type == 5:
+        return pos + 4
+    raise ValueError(f"Unsupported wire type {wire_type}")
+
+
+def _transaction_update_slot(raw: bytes) -> int | None:
+    """Read the slot of a serialized transaction SubscribeUpdate.
+
+    Walks the protobuf wire format without decoding the transaction, so the
+    slot is available for updates the prefilter rejects.
+
+    Args:
+        raw: Protobuf-encoded SubscribeUpdate
+
+    Returns:
+        Slot of the transaction, or None if the update has no transaction slot
+    """
+    try:
+        pos, end = 0, len(raw)
+        while pos < end:
+            key, pos = _read_varint(raw, pos)
+            if key >> 3 == _UPDATE_TRANSACTION_FIELD and key & 7 == 2:
+                length, pos = _read_varint(raw, pos)
+                end = pos + length
+                while pos < end:
+                    key, pos = _read_varint(raw, pos)
+                    if key >> 3 == _TRANSACTION_SLOT_FIELD and key & 7 == 0:
+                        return _read_varint(raw, pos)[0]
+                    pos = _skip_field(raw, pos, key & 7)
+                return None
+            pos = _skip_field(raw, pos, key & 7)
+    except (IndexError, ValueError):
+        pass
+    return None
+
+
+@dataclass
+class StageStats:
+    """Throughput, queue depth and latency of one pipeline stage."""
+
+    processed: int = 0
+    dropped: int = 0
+    max_queue_depth: int = 0  # Deepest backlog seen on the stage's input queue
+    latency_total: float = 0.0  # Seconds from stage input to output
+    latency_max: float = 0.0
+
+    def observe(self, latency: float) -> None:
+        """Record one processed item."""
+        self.processed += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    @property
+    def avg_latency(self) -> float:
+        """Average stage latency, in seconds."""
+        if not self.processed:
+            return 0.0
+        return self.latency_total / self.processed
+
 
 class UniversalGeyserListener(BaseTokenListener):
     """Universal Geyser listener that works with any platform."""
 
+    source_name = "geyser"
+
     def __init__(
         self,
         geyser_endpoint: str,
         geyser_api_token: str,
         geyser_auth_type: str,
         platforms: list[Platform] | None = None,
+        raw_queue_size: int = 10_000,
+        token_queue_size: int = 1_000,
+        drop_policy: str = "drop_oldest",
+        stats_interval: float = 300.0,
     ):
-        """Initialize universal Geyser listener."""
+        """Initialize universal Geyser listener.
+
+        Updates flow through three stages connected by bounded queues: the
+        reader drains the gRPC stream, the decoder extracts token creations
+        and the delivery stage filters them and awaits the callback. A slow
+        callback fills the token queue, which blocks the decoder; the raw
+        queue then absorbs the backlog and applies ``drop_policy`` when full,
+        so the gRPC stream itself is never left unread.
+
+        Args:
+            geyser_endpoint: Geyser gRPC endpoint
+            geyser_api_token: Geyser API token
+            geyser_auth_type: "x-token" or "basic"
+            platforms: Platforms to monitor (if None, all supported platforms)
+            raw_queue_size: Updates buffered between reader and decoder
+            token_queue_size: Tokens buffered between decoder and delivery
+            drop_policy: What the reader does when the raw queue is full:
+                "drop_oldest", "drop_newest" or "block" (stop reading)
+            stats_interval: Seconds between pipeline statistics log lines (0 to disable)
+        """
         super().__init__()
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Unsupported drop_policy={drop_policy!r}. Expected one of {DROP_POLICIES}"
+            )
+        self.raw_queue_size = raw_queue_size
+        self.token_queue_size = token_queue_size
+        self.drop_policy = drop_policy
+        self.stats_interval = stats_interval
+        self.stats = {
+            "reader": StageStats(),
+            "decoder": StageStats(),
+            "delivery": StageStats(),
+        }
         self.geyser_endpoint = geyser_endpoint
         self.geyser_api_token = geyser_api_token
 
@@ -47,6 +176,8 @@ class UniversalGeyserListener(BaseTokenListener):
         # Get event parsers for all platforms
         self.platform_parsers = {}
         self.platform_program_ids = set()
+        # Raw 32-byte program ID -> parser, matched directly against Geyser account keys
+        self.program_dispatch: dict[bytes, EventParser] = {}
 
         for platform in self.platforms:
             try:
@@ -59,9 +190,7 @@ class UniversalGeyserListener(BaseTokenListener):
                         # Skip SolanaClient.__init__ to avoid starting blockhash updater
                         self.rpc_endpoint = "http://dummy"
                         self._client = None
-                        self._cached_blockhash = None
-                        self._blockhash_lock = None
-                        self._blockhash_updater_task = None
+                        self.blockhash_service = None
 
                 dummy_client = DummyClient()
 
@@ -71,6 +200,7 @@ class UniversalGeyserListener(BaseTokenListener):
                 parser = implementations.event_parser
                 self.platform_parsers[platform] = parser
                 self.platform_program_ids.add(parser.get_program_id())
+                self.program_dispatch[bytes(parser.get_program_id())] = parser
 
                 logger.info(
                     f"Registered platform {platform.value} with program ID {parser.get_program_id()}"
@@ -79,6 +209,20 @@ class UniversalGeyserListener(BaseTokenListener):
             except Exception as e:
                 logger.warning(f"Could not register platform {platform.value}: {e}")
 
+        self.standby = StandbyConnection(
+            self._open_channel,
+            lambda channel: channel.get_state() == grpc.ChannelConnectivity.READY,
+            lambda channel: channel.close(),
+        )
+
+        # Skips protobuf decoding for updates that cannot contain a creation
+        self.prefilter = TransactionPrefilter(
+            [
+                (parser.get_program_id(), parser.get_instruction_discriminators())
+                for parser in self.platform_parsers.values()
+            ]
+        )
+
     async def _create_geyser_connection(self):
         """Establish a secure connection to the Geyser endpoint."""
 
@@ -99,15 +243,28 @@ class UniversalGeyserListener(BaseTokenListener):
 
         return geyser_pb2_grpc.GeyserStub(channel), channel
 
+    async def _open_channel(self) -> grpc.aio.Channel:
+        """Open a channel and wait until its transport is connected."""
+        _, channel = await self._create_geyser_connection()
+        try:
+            await asyncio.wait_for(channel.channel_ready(), timeout=10)
+        except BaseException:
+            await channel.close()
+            raise
+        return channel
+
     def _create_subscription_request(self):
         """Create a subscription request for all monitored platforms."""
 
         request = geyser_pb2.SubscribeRequest()
+        account_required = self.source_filter.geyser_account_required()
 
         # Add all platform program IDs to the filter
         for program_id in self.platform_program_ids:
             filter_name = f"platform_filter_{program_id}"
             request.transactions[filter_name].account_include.append(str(program_id))
+            # Only transactions that also reference the creator are streamed
+            request.transactions[filter_name].account_required.extend(account_required)
             request.transactions[filter_name].failed = False
 
         request.commitment = geyser_pb2.CommitmentLevel.PROCESSED
@@ -123,10 +280,51 @@ class UniversalGeyserListener(BaseTokenListener):
         if not self.platform_parsers:
             logger.error("No platform parsers available. Cannot listen for tokens.")
             return
+        self._compile_source_filter(creator_address)
+
+        raw_queue: asyncio.Queue[tuple[float, bytes]] = asyncio.Queue(
+            self.raw_queue_size
+        )
+        token_queue: asyncio.Queue[tuple[float, TokenInfo]] = asyncio.Queue(
+            self.token_queue_size
+        )
+        tasks = [
+            asyncio.create_task(self._decode_stage(raw_queue, token_queue)),
+            asyncio.create_task(
+                self._delivery_stage(
+                    token_queue, token_callback, match_string, creator_address
+                )
+            ),
+        ]
+        if self.stats_interval > 0:
+            tasks.append(asyncio.create_task(self._stats_loop()))
+
+        async def backfill(token_info: TokenInfo) -> None:
+            await token_queue.put((monotonic(), token_info))
 
+        try:
+            await self._read_stage(raw_queue, backfill)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._stop_backfills()
+            await self.standby.close()
+
+    async def _read_stage(
+        self,
+        raw_queue: asyncio.Queue,
+        backfill: Callable[[TokenInfo], Awaitable[None]],
+    ) -> None:
+        """Drain the gRPC stream into the raw queue, reconnecting on errors.
+
+        After a reconnect the slots missed since the last processed update
+        are backfilled over RPC; the Geyser proto in this tree has no
+        ``from_slot`` replay.
+        """
         while True:
             try:
-                stub, channel = await self._create_geyser_connection()
+                channel = await self.standby.connect()
                 request = self._create_subscription_request()
 
                 logger.info(f"Connected to Geyser endpoint: {self.geyser_endpoint}")
@@ -137,40 +335,29 @@ class UniversalGeyserListener(BaseTokenListener):
                     f"Monitoring program IDs: {[str(pid) for pid in self.platform_program_ids]}"
                 )
 
+                # Receive raw bytes so the prefilter runs before protobuf decoding
+                subscribe = channel.stream_stream(
+                    "/geyser.Geyser/Subscribe",
+                    request_serializer=geyser_pb2.SubscribeRequest.SerializeToString,
+                    response_deserializer=None,
+                )
+                call = subscribe(iter([request]))
+                self._start_backfill(backfill, self.platforms)
+                self.standby.prepare()
+
                 try:
-                    async for update in stub.Subscribe(iter([request])):
-                        token_info = await self._process_update(update)
-                        if not token_info:
-                            continue
-
-                        logger.info(
-                            f"New token detected: {token_info.name} ({token_info.symbol}) on {token_info.platform.value}"
-                        )
-
-                        # Apply filters
-                        if match_string and not (
-                            match_string.lower() in token_info.name.lower()
-                            or match_string.lower() in token_info.symbol.lower()
-                        ):
-                            logger.info(
-                                f"Token does not match filter '{match_string}'. Skipping..."
-                            )
-                            continue
-
-                        if creator_address and str(token_info.user) != creator_address:
-                            logger.info(
-                                f"Token not created by {creator_address}. Skipping..."
-                            )
-                            continue
-
-                        await token_callback(token_info)
+                    async for raw in call:
+                        if self.recorder:
+                            self.recorder.record(self.source_name, raw)
+                        await self._enqueue(raw_queue, (monotonic(), raw))
 
                 except Exception as e:
                     if isinstance(e, grpc.aio.AioRpcError):
                         logger.exception(f"gRPC error: {e.details()}")
                     else:
                         logger.exception("Geyser error occurred")
-                    await asyncio.sleep(5)
+                    if not self.standby.ready:
+                        await asyncio.sleep(5)
 
                 finally:
                     await channel.close()
@@ -180,39 +367,160 @@ class UniversalGeyserListener(BaseTokenListener):
                 logger.info("Reconnecting in 10 seconds...")
                 await asyncio.sleep(10)
 
-    async def _process_update(self, update) -> TokenInfo | None:
+    async def _enqueue(self, raw_queue: asyncio.Queue, item: tuple[float, bytes]) -> None:
+        """Put an update on the raw queue, applying the drop policy when full."""
+        stats = self.stats["reader"]
+        stats.processed += 1
+
+        if not raw_queue.full():
+            raw_queue.put_nowait(item)
+        elif self.drop_policy == "block":
+            await raw_queue.put(item)
+        elif self.drop_policy == "drop_newest":
+            stats.dropped += 1
+        else:
+            raw_queue.get_nowait()
+            raw_queue.put_nowait(item)
+            stats.dropped += 1
+
+    async def _decode_stage(
+        self, raw_queue: asyncio.Queue, token_queue: asyncio.Queue
+    ) -> None:
+        """Decode raw updates and pass token creations to the delivery stage."""
+        stats = self.stats["decoder"]
+        while True:
+            stats.max_queue_depth = max(stats.max_queue_depth, raw_queue.qsize())
+            received_at, raw = await raw_queue.get()
+            try:
+                tokens = await self.process_raw_message(raw)
+            except Exception:
+                logger.exception("Error decoding Geyser update")
+                continue
+
+            stats.observe(monotonic() - received_at)
+            for token_info in tokens:
+                # Blocking here is the backpressure that lets the raw queue absorb bursts
+                await token_queue.put((received_at, token_info))
+
+    async def _delivery_stage(
+        self,
+        token_queue: asyncio.Queue,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None,
+        creator_address: str | None,
+    ) -> None:
+        """Deduplicate and filter decoded tokens and hand them to the callback."""
+        stats = self.stats["delivery"]
+        while True:
+            stats.max_queue_depth = max(stats.max_queue_depth, token_queue.qsize())
+            received_at, token_info = await token_queue.get()
+            if not self._first_delivery(token_info):
+                continue
+
+            logger.info(
+                f"New token detected: {token_info.name} ({token_info.symbol}) on {token_info.platform.value}"
+            )
+
+            # Apply filters
+            if match_string and not (
+                match_string.lower() in token_info.name.lower()
+                or match_string.lower() in token_info.symbol.lower()
+            ):
+                logger.info(f"Token does not match filter '{match_string}'. Skipping...")
+                continue
+
+            if creator_address and str(token_info.user) != creator_address:
+                logger.info(f"Token not created by {creator_address}. Skipping...")
+                continue
+
+            # Latency from the update arriving to the callback being invoked
+            stats.observe(monotonic() - received_at)
+            try:
+                await token_callback(token_info)
+            except Exception:
+                logger.exception(f"Token callback failed for {token_info.symbol}")
+
+    async def _stats_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            self.log_stats()
+
+    def get_stats(self) -> dict:
+        """Get per-stage throughput, drops, queue depth and latency.
+
+        Returns:
+            Dictionary of statistics keyed by stage name
+        """
+        stats = {
+            name: {
+                "processed": s.processed,
+                "dropped": s.dropped,
+                "max_queue_depth": s.max_queue_depth,
+                "avg_latency_ms": s.avg_latency * 1000,
+                "max_latency_ms": s.latency_max * 1000,
+            }
+            for name, s in self.stats.items()
+        }
+        if self.prefilter:
+            stats["decoder"]["prefilter_pass_rate"] = self.prefilter.pass_rate
+        return stats
+
+    def log_stats(self) -> None:
+        """Log per-stage throughput, drops, queue depth and latency."""
+        for name, s in self.get_stats().items():
+            logger.info(
+                f"Geyser {name}: {s['processed']} processed, {s['dropped']} dropped, "
+                f"max queue depth {s['max_queue_depth']}, "
+                f"avg latency {s['avg_latency_ms']:.2f} ms, max {s['max_latency_ms']:.2f} ms"
+            )
+
+    async def process_raw_message(self, raw: bytes) -> list[TokenInfo]:
+        """Parse a serialized SubscribeUpdate.
+
+        Args:
+            raw: Protobuf-encoded SubscribeUpdate
+
+        Returns:
+            Token creations found in the update
+        """
+        if self.prefilter and not self.prefilter.matches_bytes(raw):
+            # Rejected updates still advance the resume point
+            self._note_slot(_transaction_update_slot(raw))
+            return []
+        return await self._process_update(geyser_pb2.SubscribeUpdate.FromString(raw))
+
+    async def _process_update(self, update) -> list[TokenInfo]:
         """Process a Geyser update and extract token creation info."""
         try:
             if not update.HasField("transaction"):
-                return None
+                return []
+            self._note_slot(update.transaction.slot)
 
             tx = update.transaction.transaction.transaction
             msg = getattr(tx, "message", None)
             if msg is None:
-                return None
-
-            from solders.pubkey import Pubkey
+                return []
 
+            account_keys = msg.account_keys
+            tokens = []
             for ix in msg.instructions:
                 # Check which platform this instruction belongs to
                 program_idx = ix.program_id_index
-                if program_idx >= len(msg.account_keys):
+                if program_idx >= len(account_keys):
                     continue
 
-                program_id = Pubkey.from_bytes(msg.account_keys[program_idx])
+                parser = self.program_dispatch.get(account_keys[program_idx])
+                if parser is None:
+                    continue
 
-                # Find the matching platform parser
-                for platform, parser in self.platform_parsers.items():
-                    if program_id == parser.get_program_id():
-                        # Use the platform's event parser
-                        token_info = parser.parse_token_creation_from_instruction(
-                            ix.data, ix.accounts, msg.account_keys
-                        )
-                        if token_info:
-                            return token_info
+                token_info = parser.parse_token_creation_from_instruction(
+                    ix.data, ix.accounts, account_keys
+                )
+                if token_info:
+                    tokens.append(token_info)
 
-            return None
+            return tokens
 
         except Exception:
             logger.exception("Error processing Geyser update")
-            return None
+            return []
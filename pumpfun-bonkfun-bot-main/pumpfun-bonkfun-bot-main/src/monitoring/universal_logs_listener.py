@@ -5,11 +5,18 @@ Universal logs listener that works with any platform through the interface syste
 import asyncio
 import json
 from collections.abc import Awaitable, Callable
+from functools import partial
+from time import monotonic
+from typing import Any
 
 import websockets
+from websockets.protocol import State
 
+from core.ws_multiplexer import WebSocketMultiplexer
 from interfaces.core import Platform, TokenInfo
 from monitoring.base_listener import BaseTokenListener
+from monitoring.standby_connection import StandbyConnection
+from utils import json_backend
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,20 +25,32 @@ logger = get_logger(__name__)
 class UniversalLogsListener(BaseTokenListener):
     """Universal logs listener that works with any platform."""
 
+    source_name = "logs"
+
     def __init__(
         self,
         wss_endpoint: str,
         platforms: list[Platform] | None = None,
+        multiplexer: WebSocketMultiplexer | None = None,
     ):
         """Initialize universal logs listener.
 
         Args:
             wss_endpoint: WebSocket endpoint URL
             platforms: List of platforms to monitor (if None, monitor all supported platforms)
+            multiplexer: Shared connection to subscribe through (own connection if None)
         """
         super().__init__()
         self.wss_endpoint = wss_endpoint
+        self.multiplexer = multiplexer
+        # Creations resolved over RPC (LetsBonk), kept off the receive loop
+        self._resolution_tasks: set[asyncio.Task] = set()
         self.ping_interval = 20  # seconds
+        self.standby = StandbyConnection(
+            self._open_websocket,
+            lambda ws: ws.state is State.OPEN,
+            lambda ws: ws.close(),
+        )
 
         # Import platform factory and get supported platforms
         from platforms import platform_factory
@@ -57,9 +76,7 @@ class UniversalLogsListener(BaseTokenListener):
                         # Skip SolanaClient.__init__ to avoid starting blockhash updater
                         self.rpc_endpoint = "http://dummy"
                         self._client = None
-                        self._cached_blockhash = None
-                        self._blockhash_lock = None
-                        self._blockhash_updater_task = None
+                        self.blockhash_service = None
 
                 dummy_client = DummyClient()
 
@@ -77,6 +94,10 @@ class UniversalLogsListener(BaseTokenListener):
             except Exception as e:
                 logger.warning(f"Could not register platform {platform.value}: {e}")
 
+    async def _open_websocket(self) -> websockets.ClientConnection:
+        """Open a WebSocket connection to the endpoint."""
+        return await websockets.connect(self.wss_endpoint)
+
     async def listen_for_tokens(
         self,
         token_callback: Callable[[TokenInfo], Awaitable[None]],
@@ -93,52 +114,105 @@ class UniversalLogsListener(BaseTokenListener):
         if not self.platform_parsers:
             logger.error("No platform parsers available. Cannot listen for tokens.")
             return
+        self._compile_source_filter(creator_address)
+
+        async def deliver(token_info: TokenInfo) -> None:
+            await self._handle_token(
+                token_info, token_callback, match_string, creator_address
+            )
 
-        while True:
+        if self.multiplexer is not None:
             try:
-                async with websockets.connect(self.wss_endpoint) as websocket:
-                    await self._subscribe_to_logs(websocket)
-                    ping_task = asyncio.create_task(self._ping_loop(websocket))
-
-                    try:
-                        while True:
-                            token_info = await self._wait_for_token_creation(websocket)
-                            if not token_info:
-                                continue
-
-                            logger.info(
-                                f"New token detected: {token_info.name} ({token_info.symbol}) on {token_info.platform.value}"
-                            )
-
-                            # Apply filters
-                            if match_string and not (
-                                match_string.lower() in token_info.name.lower()
-                                or match_string.lower() in token_info.symbol.lower()
-                            ):
-                                logger.info(
-                                    f"Token does not match filter '{match_string}'. Skipping..."
-                                )
-                                continue
-
-                            if (
-                                creator_address
-                                and str(token_info.user) != creator_address
-                            ):
-                                logger.info(
-                                    f"Token not created by {creator_address}. Skipping..."
-                                )
-                                continue
-
-                            await token_callback(token_info)
-
-                    except websockets.exceptions.ConnectionClosed:
-                        logger.warning("WebSocket connection closed. Reconnecting...")
-                        ping_task.cancel()
-
-            except Exception:
-                logger.exception("WebSocket connection error")
-                logger.info("Reconnecting in 5 seconds...")
-                await asyncio.sleep(5)
+                await self._listen_multiplexed(
+                    self.multiplexer,
+                    self._subscription_requests(),
+                    deliver,
+                    self.platforms,
+                )
+            finally:
+                await self._stop_backfills()
+                await self._stop_resolutions()
+            return
+
+        try:
+            while True:
+                try:
+                    websocket = await self.standby.connect()
+                    async with websocket:
+                        await self._subscribe_to_logs(websocket)
+                        ping_task = asyncio.create_task(self._ping_loop(websocket))
+                        self._start_backfill(deliver, self.platforms)
+                        self.standby.prepare()
+
+                        try:
+                            while True:
+                                for token_info in await self._wait_for_token_creation(
+                                    websocket, deliver
+                                ):
+                                    await deliver(token_info)
+
+                        except websockets.exceptions.ConnectionClosed:
+                            logger.warning("WebSocket connection closed. Reconnecting...")
+                            ping_task.cancel()
+
+                except Exception:
+                    logger.exception("WebSocket connection error")
+                    logger.info("Reconnecting in 5 seconds...")
+                    await asyncio.sleep(5)
+        finally:
+            await self._stop_backfills()
+            await self._stop_resolutions()
+            await self.standby.close()
+
+    async def _handle_token(
+        self,
+        token_info: TokenInfo,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None,
+        creator_address: str | None,
+    ) -> None:
+        """Deduplicate and filter a detected token and forward it.
+
+        Args:
+            token_info: Detected token (live or backfilled)
+            token_callback: Callback function for new tokens
+            match_string: Optional string to match in token name/symbol
+            creator_address: Optional creator address to filter by
+        """
+        if not self._first_delivery(token_info):
+            return
+
+        logger.info(
+            f"New token detected: {token_info.name} ({token_info.symbol}) on {token_info.platform.value}"
+        )
+
+        # Apply filters
+        if match_string and not (
+            match_string.lower() in token_info.name.lower()
+            or match_string.lower() in token_info.symbol.lower()
+        ):
+            logger.info(f"Token does not match filter '{match_string}'. Skipping...")
+            return
+
+        if creator_address and str(token_info.user) != creator_address:
+            logger.info(f"Token not created by {creator_address}. Skipping...")
+            return
+
+        await token_callback(token_info)
+
+    def _subscription_requests(self) -> list[tuple[str, list[Any]]]:
+        """Build the logsSubscribe requests of the monitored program IDs.
+
+        With a creator filter only the creator's transactions are subscribed to.
+
+        Returns:
+            (method, params) of every subscription
+        """
+        mentions = self.source_filter.websocket_mentions(self.platform_program_ids)
+        return [
+            ("logsSubscribe", [{"mentions": [program_id]}, {"commitment": "processed"}])
+            for program_id in mentions
+        ]
 
     async def _subscribe_to_logs(self, websocket) -> None:
         """Subscribe to logs mentioning any of the monitored program IDs.
@@ -147,25 +221,17 @@ class UniversalLogsListener(BaseTokenListener):
             websocket: Active WebSocket connection
         """
         # Subscribe to logs for all monitored platforms
-        for i, program_id in enumerate(self.platform_program_ids):
+        for i, (method, params) in enumerate(self._subscription_requests()):
             subscription_message = json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": i + 1,
-                    "method": "logsSubscribe",
-                    "params": [
-                        {"mentions": [program_id]},
-                        {"commitment": "processed"},
-                    ],
-                }
+                {"jsonrpc": "2.0", "id": i + 1, "method": method, "params": params}
             )
 
             await websocket.send(subscription_message)
-            logger.info(f"Subscribed to logs mentioning program: {program_id}")
+            logger.info(f"Subscribed to logs mentioning: {params[0]['mentions'][0]}")
 
             # Wait for subscription confirmation
             response = await websocket.recv()
-            response_data = json.loads(response)
+            response_data = json_backend.loads(response)
             if "result" in response_data:
                 logger.info(
                     f"Subscription confirmed with ID: {response_data['result']}"
@@ -190,26 +256,15 @@ class UniversalLogsListener(BaseTokenListener):
         except Exception:
             logger.exception("Ping error")
 
-    async def _wait_for_token_creation(self, websocket) -> TokenInfo | None:
+    async def _wait_for_token_creation(
+        self, websocket, deliver: Callable[[TokenInfo], Awaitable[None]]
+    ) -> list[TokenInfo]:
         """Wait for token creation events from any platform."""
         try:
             response = await asyncio.wait_for(websocket.recv(), timeout=30)
-            data = json.loads(response)
-
-            if "method" not in data or data["method"] != "logsNotification":
-                return None
-
-            log_data = data["params"]["result"]["value"]
-            logs = log_data.get("logs", [])
-            signature = log_data.get("signature", "unknown")
-
-            # Try each platform's event parser
-            for platform, parser in self.platform_parsers.items():
-                token_info = parser.parse_token_creation_from_logs(logs, signature)
-                if token_info:
-                    return token_info
-
-            return None
+            if self.recorder:
+                self.recorder.record(self.source_name, response)
+            return await self._parse_live_message(response, deliver)
 
         except TimeoutError:
             logger.debug("No data received for 30 seconds")
@@ -219,4 +274,115 @@ class UniversalLogsListener(BaseTokenListener):
         except Exception:
             logger.exception("Error processing WebSocket message")
 
-        return None
+        return []
+
+    async def process_raw_message(self, raw: str) -> list[TokenInfo]:
+        """Parse a logsNotification frame.
+
+        Creations that need account lookups are resolved before returning.
+
+        Args:
+            raw: WebSocket text frame
+
+        Returns:
+            Token creations found in the transaction's logs
+        """
+        tokens, unresolved = self._parse_frame(raw)
+        for resolve in unresolved:
+            token_info = await resolve()
+            if token_info:
+                tokens.append(token_info)
+        return tokens
+
+    async def _parse_live_message(
+        self, raw: str, deliver: Callable[[TokenInfo], Awaitable[None]]
+    ) -> list[TokenInfo]:
+        """Parse a live frame, resolving creations in their own tasks.
+
+        A LetsBonk creation reads its pool account over RPC with retries;
+        resolving it inline would hold every frame behind it.
+
+        Args:
+            raw: WebSocket text frame
+            deliver: Handler receiving the resolved tokens
+
+        Returns:
+            Token creations complete in the logs
+        """
+        tokens, unresolved = self._parse_frame(raw)
+        for resolve in unresolved:
+            task = asyncio.create_task(self._resolve_and_deliver(resolve, deliver))
+            self._resolution_tasks.add(task)
+            task.add_done_callback(self._resolution_tasks.discard)
+        return tokens
+
+    def _parse_frame(
+        self, raw: str
+    ) -> tuple[list[TokenInfo], list[Callable[[], Awaitable[TokenInfo | None]]]]:
+        """Decode a logsNotification frame without any RPC call.
+
+        Args:
+            raw: WebSocket text frame
+
+        Returns:
+            Complete token creations, and a resolver for each creation that
+            needs account lookups
+        """
+        # The log lines are most of the frame, so it is decoded in full
+        data = json_backend.loads(raw)
+        if data.get("method") != "logsNotification":
+            return [], []
+
+        result = data["params"]["result"]
+        slot = result.get("context", {}).get("slot")
+        self._note_slot(slot)
+        log_data = result["value"]
+        # Events in the logs of a failed transaction were rolled back
+        if log_data.get("err") is not None:
+            return [], []
+        logs = log_data.get("logs") or []
+        signature = log_data.get("signature", "unknown")
+
+        if self.curve_state_store is not None:
+            for parser in self.platform_parsers.values():
+                self._apply_curve_updates(
+                    parser.parse_curve_updates_from_logs(logs), slot
+                )
+
+        # Try each platform's event parser
+        for parser in self.platform_parsers.values():
+            token_info = parser.parse_token_creation_from_logs(logs, signature)
+            if token_info:
+                return [token_info], []
+            event = parser.parse_unresolved_creation_from_logs(logs, signature)
+            if event:
+                resolve = partial(
+                    parser.resolve_token_creation,
+                    event,
+                    signature,
+                    self.rpc_client,
+                    monotonic(),
+                )
+                return [], [resolve]
+
+        return [], []
+
+    async def _resolve_and_deliver(
+        self,
+        resolve: Callable[[], Awaitable[TokenInfo | None]],
+        deliver: Callable[[TokenInfo], Awaitable[None]],
+    ) -> None:
+        try:
+            token_info = await resolve()
+        except Exception:
+            logger.exception("Failed to resolve token creation")
+            return
+        if token_info:
+            await deliver(token_info)
+
+    async def _stop_resolutions(self) -> None:
+        """Cancel creations still being resolved when the listener stops."""
+        tasks = list(self._resolution_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,278 @@
+"""
+Composite listener that races several token sources and forwards the first sighting.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from core.client import SolanaClient
+from core.curve_state import CurveStateStore
+from interfaces.core import TokenInfo
+from monitoring.base_listener import BaseTokenListener
+from monitoring.gap_backfill import GapBackfiller
+from monitoring.traffic_recorder import TrafficRecorder
+from utils.dedup import BoundedDedupSet
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SourceStats:
+    """Delivery statistics for a single source."""
+
+    deliveries: int = 0  # Tokens delivered, including duplicates
+    wins: int = 0  # Tokens this source delivered first
+    repeats: int = 0  # Tokens this source delivered again after winning them
+    lead_time_total: float = 0.0  # Sum of leads over the next source, in seconds
+    lead_time_samples: int = 0
+    lead_time_max: float = 0.0
+    lag_time_total: float = 0.0  # Sum of delays behind the winner, in seconds
+
+    @property
+    def avg_lead_time(self) -> float:
+        """Average lead over the runner-up source, in seconds."""
+        if not self.lead_time_samples:
+            return 0.0
+        return self.lead_time_total / self.lead_time_samples
+
+    @property
+    def avg_lag_time(self) -> float:
+        """Average delay behind the winning source when late, in seconds."""
+        late = self.deliveries - self.wins - self.repeats
+        if not late:
+            return 0.0
+        return self.lag_time_total / late
+
+
+@dataclass
+class _FirstSighting:
+    source: str
+    seen_at: float
+    runner_up_seen: bool = False
+
+
+class UniversalMultiSourceListener(BaseTokenListener):
+    """Runs several listeners at once and forwards each token from the fastest one."""
+
+    def __init__(
+        self,
+        listeners: dict[str, BaseTokenListener],
+        dedup_size: int = 10_000,
+        stats_interval: float = 300.0,
+    ):
+        """Initialize the composite listener.
+
+        Args:
+            listeners: Child listeners keyed by source name (e.g. "geyser", "logs")
+            dedup_size: Number of recent mints remembered for duplicate suppression
+            stats_interval: Seconds between source statistics log lines (0 to disable)
+        """
+        super().__init__()
+        if not listeners:
+            raise ValueError("At least one source listener is required")
+
+        self.listeners = listeners
+        self.stats_interval = stats_interval
+        self._seen = BoundedDedupSet(dedup_size)
+        self.stats: dict[str, SourceStats] = {name: SourceStats() for name in listeners}
+        self.duplicates = 0
+
+    def attach_recorder(self, recorder: TrafficRecorder) -> None:
+        """Record the raw traffic of every source listener.
+
+        Args:
+            recorder: Recorder receiving raw messages
+        """
+        super().attach_recorder(recorder)
+        for listener in self.listeners.values():
+            listener.attach_recorder(recorder)
+
+    def attach_gap_backfiller(self, backfiller: GapBackfiller) -> None:
+        """Backfill reconnect gaps of every source listener.
+
+        Args:
+            backfiller: Backfiller fetching the blocks after ``last_slot``
+        """
+        super().attach_gap_backfiller(backfiller)
+        for listener in self.listeners.values():
+            listener.attach_gap_backfiller(backfiller)
+
+    def attach_rpc_client(self, client: SolanaClient) -> None:
+        """Attach the RPC client to every source listener.
+
+        Args:
+            client: Solana RPC client
+        """
+        super().attach_rpc_client(client)
+        for listener in self.listeners.values():
+            listener.attach_rpc_client(client)
+
+    def attach_curve_state_store(self, store: CurveStateStore) -> None:
+        """Stream trade events of every source listener into a store.
+
+        Args:
+            store: Store receiving post-trade curve state
+        """
+        super().attach_curve_state_store(store)
+        for listener in self.listeners.values():
+            listener.attach_curve_state_store(store)
+
+    async def listen_for_tokens(
+        self,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None = None,
+        creator_address: str | None = None,
+    ) -> None:
+        """Listen on all sources and forward each new token once.
+
+        Args:
+            token_callback: Callback function for new tokens
+            match_string: Optional string to match in token name/symbol
+            creator_address: Optional creator address to filter by
+        """
+        logger.info(f"Racing token sources: {', '.join(self.listeners)}")
+
+        tasks = [
+            asyncio.create_task(
+                self._run_source(name, listener, token_callback, match_string, creator_address)
+            )
+            for name, listener in self.listeners.items()
+        ]
+        if self.stats_interval > 0:
+            tasks.append(asyncio.create_task(self._stats_loop()))
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.log_stats()
+
+    async def _run_source(
+        self,
+        name: str,
+        listener: BaseTokenListener,
+        token_callback: Callable[[TokenInfo], Awaitable[None]],
+        match_string: str | None,
+        creator_address: str | None,
+    ) -> None:
+        async def on_token(token_info: TokenInfo) -> None:
+            if self._record_delivery(name, token_info):
+                await token_callback(token_info)
+
+        try:
+            await listener.listen_for_tokens(on_token, match_string, creator_address)
+            logger.warning(f"Token source '{name}' stopped")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(f"Token source '{name}' failed")
+
+    async def process_raw_message(self, raw: Any) -> list[TokenInfo]:
+        """Parse one message with the parser of the source that received it.
+
+        Args:
+            raw: (source name, raw message) pair as stored by TrafficRecorder
+
+        Returns:
+            Every token creation in the message, none for unknown sources
+        """
+        source, message = raw
+        listener = self.listeners.get(source)
+        if listener is None:
+            return []
+        return await listener.process_raw_message(message)
+
+    def _record_delivery(self, source: str, token_info: TokenInfo) -> bool:
+        """Record a delivery and decide whether it is the first sighting.
+
+        Args:
+            source: Name of the delivering source
+            token_info: Delivered token
+
+        Returns:
+            True if the token should be forwarded
+        """
+        now = monotonic()
+        key = str(token_info.mint)
+        stats = self.stats[source]
+        stats.deliveries += 1
+
+        if self._seen.add(key, _FirstSighting(source, now)):
+            stats.wins += 1
+            logger.debug(f"{source} delivered {token_info.symbol} first")
+            return True
+
+        self.duplicates += 1
+        first = self._seen.get(key)
+        if source == first.source:
+            # Repeat from the winner: neither a lag nor a lead over another source
+            stats.repeats += 1
+            logger.debug(f"{source} delivered {token_info.symbol} again")
+            return False
+
+        lag = now - first.seen_at
+        stats.lag_time_total += lag
+
+        # Lead time is measured against the runner-up only
+        if not first.runner_up_seen:
+            first.runner_up_seen = True
+            winner = self.stats[first.source]
+            winner.lead_time_total += lag
+            winner.lead_time_samples += 1
+            winner.lead_time_max = max(winner.lead_time_max, lag)
+
+        logger.debug(
+            f"{source} delivered {token_info.symbol} {lag * 1000:.1f} ms after {first.source}"
+        )
+        return False
+
+    async def _stats_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            self.log_stats()
+
+    def get_stats(self) -> dict:
+        """Get per-source win rates and lead times.
+
+        Returns:
+            Dictionary with unique token count, duplicates and per-source stats
+        """
+        unique = sum(s.wins for s in self.stats.values())
+        return {
+            "unique_tokens": unique,
+            "duplicates": self.duplicates,
+            "sources": {
+                name: {
+                    "deliveries": s.deliveries,
+                    "wins": s.wins,
+                    "win_rate": s.wins / unique if unique else 0.0,
+                    "avg_lead_ms": s.avg_lead_time * 1000,
+                    "max_lead_ms": s.lead_time_max * 1000,
+                    "avg_lag_ms": s.avg_lag_time * 1000,
+                }
+                for name, s in self.stats.items()
+            },
+        }
+
+    def log_stats(self) -> None:
+        """Log per-source win rates and lead times."""
+        stats = self.get_stats()
+        if not stats["unique_tokens"]:
+            return
+
+        logger.info(
+            f"Token sources: {stats['unique_tokens']} unique tokens, "
+            f"{stats['duplicates']} duplicates suppressed"
+        )
+        for name, s in stats["sources"].items():
+            logger.info(
+                f"  {name}: won {s['wins']}/{stats['unique_tokens']} ({s['win_rate']:.1%}), "
+                f"avg lead {s['avg_lead_ms']:.1f} ms, max lead {s['max_lead_ms']:.1f} ms, "
+                f"avg lag when late {s['avg_lag_ms']:.1f} ms"
+            )
@@ -10,6 +10,7 @@ import websockets
 
 from interfaces.core import Platform, TokenInfo
 from monitoring.base_listener import BaseTokenListener
+from utils import json_backend
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +19,8 @@ logger = get_logger(__name__)
 class UniversalPumpPortalListener(BaseTokenListener):
     """Universal PumpPortal listener that works with multiple platforms."""
 
+    source_name = "pumpportal"
+
     def __init__(
         self,
         pumpportal_url: str = "wss://pumpportal.fun/api/data",
@@ -75,6 +78,9 @@ class UniversalPumpPortalListener(BaseTokenListener):
             match_string: Optional string to match in token name/symbol
             creator_address: Optional creator address to filter by
         """
+        # PumpPortal streams every launch; the creator is checked on the raw frame
+        self._compile_source_filter(creator_address)
+
         while True:
             try:
                 async with websockets.connect(self.pumpportal_url) as websocket:
@@ -83,40 +89,39 @@ class UniversalPumpPortalListener(BaseTokenListener):
 
                     try:
                         while True:
-                            token_info = await self._wait_for_token_creation(websocket)
-                            if not token_info:
-                                continue
-
-                            logger.info(
-                                f"New token detected: {token_info.name} ({token_info.symbol}) on {token_info.platform.value}"
-                            )
-
-                            # Apply filters
-                            if match_string and not (
-                                match_string.lower() in token_info.name.lower()
-                                or match_string.lower() in token_info.symbol.lower()
+                            for token_info in await self._wait_for_token_creation(
+                                websocket
                             ):
                                 logger.info(
-                                    f"Token does not match filter '{match_string}'. Skipping..."
+                                    f"New token detected: {token_info.name} ({token_info.symbol}) on {token_info.platform.value}"
                                 )
-                                continue
 
-                            if creator_address:
-                                creator_str = (
-                                    str(token_info.creator)
-                                    if token_info.creator
-                                    else ""
-                                )
-                                user_str = (
-                                    str(token_info.user) if token_info.user else ""
-                                )
-                                if creator_address not in [creator_str, user_str]:
+                                # Apply filters
+                                if match_string and not (
+                                    match_string.lower() in token_info.name.lower()
+                                    or match_string.lower() in token_info.symbol.lower()
+                                ):
                                     logger.info(
-                                        f"Token not created by {creator_address}. Skipping..."
+                                        f"Token does not match filter '{match_string}'. Skipping..."
                                     )
                                     continue
 
-                            await token_callback(token_info)
+                                if creator_address:
+                                    creator_str = (
+                                        str(token_info.creator)
+                                        if token_info.creator
+                                        else ""
+                                    )
+                                    user_str = (
+                                        str(token_info.user) if token_info.user else ""
+                                    )
+                                    if creator_address not in [creator_str, user_str]:
+                                        logger.info(
+                                            f"Token not created by {creator_address}. Skipping..."
+                                        )
+                                        continue
+
+                                await token_callback(token_info)
 
                     except websockets.exceptions.ConnectionClosed:
                         logger.warning(
@@ -167,51 +172,20 @@ class UniversalPumpPortalListener(BaseTokenListener):
         except Exception:
             logger.exception("Ping error")
 
-    async def _wait_for_token_creation(self, websocket) -> TokenInfo | None:
+    async def _wait_for_token_creation(self, websocket) -> list[TokenInfo]:
         """Wait for token creation event from PumpPortal.
 
         Args:
             websocket: Active WebSocket connection
 
         Returns:
-            TokenInfo if a token creation is found, None otherwise
+            Token creations in the next message (empty if none)
         """
         try:
             response = await asyncio.wait_for(websocket.recv(), timeout=30)
-            data = json.loads(response)
-
-            # Handle different message formats from PumpPortal
-            token_data = None
-            if "method" in data and data["method"] == "newToken":
-                # Standard newToken method format
-                params = data.get("params", [])
-                if params and len(params) > 0:
-                    token_data = params[0]
-            elif "signature" in data and "mint" in data and "pool" in data:
-                # Direct token data format
-                token_data = data
-
-            if not token_data:
-                return None
-
-            # Get pool name to determine which processor to use
-            pool_name = token_data.get("pool", "").lower()
-            if pool_name not in self.pool_to_processors:
-                logger.debug(f"Ignoring token from unsupported pool: {pool_name}")
-                return None
-
-            # Try each processor that supports this pool
-            for processor in self.pool_to_processors[pool_name]:
-                if processor.can_process(token_data):
-                    token_info = processor.process_token_data(token_data)
-                    if token_info:
-                        logger.debug(
-                            f"Successfully processed token using {processor.platform.value} processor"
-                        )
-                        return token_info
-
-            logger.debug(f"No processor could handle token data from pool {pool_name}")
-            return None
+            if self.recorder:
+                self.recorder.record(self.source_name, response)
+            return await self.process_raw_message(response)
 
         except TimeoutError:
             logger.debug("No data received from PumpPortal for 30 seconds")
@@ -223,4 +197,52 @@ class UniversalPumpPortalListener(BaseTokenListener):
         except Exception:
             logger.exception("Error processing PumpPortal WebSocket message")
 
-        return None
+        return []
+
+    async def process_raw_message(self, raw: str) -> list[TokenInfo]:
+        """Parse a PumpPortal new token frame.
+
+        Args:
+            raw: WebSocket text frame
+
+        Returns:
+            Token creations found in the frame
+        """
+        # Launches by other creators are dropped before decoding
+        if not self.source_filter.matches_raw_text(raw):
+            return []
+
+        data = json_backend.loads(raw)
+
+        # Handle different message formats from PumpPortal
+        token_data = None
+        if "method" in data and data["method"] == "newToken":
+            # Standard newToken method format
+            params = data.get("params", [])
+            if params and len(params) > 0:
+                token_data = params[0]
+        elif "signature" in data and "mint" in data and "pool" in data:
+            # Direct token data format
+            token_data = data
+
+        if not token_data:
+            return []
+
+        # Get pool name to determine which processor to use
+        pool_name = token_data.get("pool", "").lower()
+        if pool_name not in self.pool_to_processors:
+            logger.debug(f"Ignoring token from unsupported pool: {pool_name}")
+            return []
+
+        # Try each processor that supports this pool
+        for processor in self.pool_to_processors[pool_name]:
+            if processor.can_process(token_data):
+                token_info = processor.process_token_data(token_data)
+                if token_info:
+                    logger.debug(
+                        f"Successfully processed token using {processor.platform.value} processor"
+                    )
+                    return [token_info]
+
+        logger.debug(f"No processor could handle token data from pool {pool_name}")
+        return []
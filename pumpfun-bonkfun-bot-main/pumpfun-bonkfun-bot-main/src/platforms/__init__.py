@@ -107,6 +107,8 @@ class PlatformRegistry:
 
         # Create instances - pass IDL parser to classes that need it
         address_provider = impl_classes["address_provider"]()
+        # Constant PDAs are derived once here instead of on the first trade
+        address_provider.precompute_constant_addresses()
 
         # For platforms with IDL support, pass the parser to relevant classes
         if idl_parser and platform in [Platform.LETS_BONK, Platform.PUMP_FUN]:
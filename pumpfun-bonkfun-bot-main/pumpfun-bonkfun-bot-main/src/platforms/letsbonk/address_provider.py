@@ -9,8 +9,8 @@ from dataclasses import dataclass
 from typing import Final
 
 from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
 
+from core.pda_cache import pda_cache
 from core.pubkeys import SystemAddresses
 from interfaces.core import AddressProvider, Platform, TokenInfo
 
@@ -81,7 +81,7 @@ class LetsBonkAddressProvider(AddressProvider):
         if quote_mint is None:
             quote_mint = SystemAddresses.SOL_MINT
 
-        pool_state, _ = Pubkey.find_program_address(
+        pool_state, _ = pda_cache.find_program_address(
             [b"pool", bytes(base_mint), bytes(quote_mint)], LetsBonkAddresses.PROGRAM
         )
         return pool_state
@@ -105,7 +105,7 @@ class LetsBonkAddressProvider(AddressProvider):
         pool_state = self.derive_pool_address(base_mint, quote_mint)
 
         # Then derive the base vault using pool_vault seed
-        base_vault, _ = Pubkey.find_program_address(
+        base_vault, _ = pda_cache.find_program_address(
             [b"pool_vault", bytes(pool_state), bytes(base_mint)],
             LetsBonkAddresses.PROGRAM,
         )
@@ -130,7 +130,7 @@ class LetsBonkAddressProvider(AddressProvider):
         pool_state = self.derive_pool_address(base_mint, quote_mint)
 
         # Then derive the quote vault using pool_vault seed
-        quote_vault, _ = Pubkey.find_program_address(
+        quote_vault, _ = pda_cache.find_program_address(
             [b"pool_vault", bytes(pool_state), bytes(quote_mint)],
             LetsBonkAddresses.PROGRAM,
         )
@@ -146,7 +146,7 @@ class LetsBonkAddressProvider(AddressProvider):
         Returns:
             User's associated token account address
         """
-        return get_associated_token_address(user, mint)
+        return pda_cache.get_associated_token_address(user, mint)
 
     def get_additional_accounts(self, token_info: TokenInfo) -> dict[str, Pubkey]:
         """Get LetsBonk-specific additional accounts needed for trading.
@@ -193,10 +193,7 @@ class LetsBonkAddressProvider(AddressProvider):
             Authority PDA address
         """
         AUTH_SEED = b"vault_auth_seed"
-        authority_pda, _ = Pubkey.find_program_address(
-            [AUTH_SEED], LetsBonkAddresses.PROGRAM
-        )
-        return authority_pda
+        return pda_cache.precompute([AUTH_SEED], LetsBonkAddresses.PROGRAM)
 
     def derive_event_authority_pda(self) -> Pubkey:
         """Derive the event authority PDA for Raydium LaunchLab.
@@ -207,10 +204,12 @@ class LetsBonkAddressProvider(AddressProvider):
             Event authority PDA address
         """
         EVENT_AUTHORITY_SEED = b"__event_authority"
-        event_authority_pda, _ = Pubkey.find_program_address(
-            [EVENT_AUTHORITY_SEED], LetsBonkAddresses.PROGRAM
-        )
-        return event_authority_pda
+        return pda_cache.precompute([EVENT_AUTHORITY_SEED], LetsBonkAddresses.PROGRAM)
+
+    def precompute_constant_addresses(self) -> None:
+        """Derive the LaunchLab authority and event authority PDAs."""
+        self.derive_authority_pda()
+        self.derive_event_authority_pda()
 
     def create_wsol_account_with_seed(self, payer: Pubkey, seed: str) -> Pubkey:
         """Create a WSOL account address using createAccountWithSeed pattern.
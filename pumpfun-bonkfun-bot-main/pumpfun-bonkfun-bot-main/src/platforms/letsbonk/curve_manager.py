@@ -18,6 +18,9 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fields of the decoded state used by the price and amount calculations
+RESERVE_FIELDS = ("virtual_base", "virtual_quote")
+
 
 class LetsBonkCurveManager(CurveManager):
     """LetsBonk (Raydium LaunchLab) implementation of CurveManager interface."""
@@ -49,6 +52,11 @@ class LetsBonkCurveManager(CurveManager):
         Returns:
             Dictionary containing pool state data
         """
+        # Pushed state (price feed, streamed trade events) while fresh
+        state = self._fresh_state(pool_address, RESERVE_FIELDS)
+        if state is not None:
+            return state
+
         try:
             account = await self.client.get_account_info(pool_address)
             if not account.data:
@@ -157,6 +165,17 @@ class LetsBonkCurveManager(CurveManager):
         pool_state = await self.get_pool_state(pool_address)
         return (pool_state["virtual_base"], pool_state["virtual_quote"])
 
+    def decode_pool_state(self, data: bytes) -> dict[str, Any]:
+        """Decode raw pool state account data pushed by a subscription.
+
+        Args:
+            data: Raw account data
+
+        Returns:
+            Dictionary with decoded pool state
+        """
+        return self._decode_pool_state_with_idl(data)
+
     def _decode_pool_state_with_idl(self, data: bytes) -> dict[str, Any]:
         """Decode pool state data using injected IDL parser.
 
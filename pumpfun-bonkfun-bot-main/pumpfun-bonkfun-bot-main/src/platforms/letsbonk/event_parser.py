@@ -5,21 +5,32 @@ This module parses LetsBonk-specific token creation events from various sources
 by implementing the EventParser interface with IDL-based parsing.
 """
 
+import asyncio
 import base64
 import struct
 from time import monotonic
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
 
-from interfaces.core import EventParser, Platform, TokenInfo
+from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+from interfaces.core import CurveUpdate, EventParser, Platform, TokenInfo
 from platforms.letsbonk.address_provider import LetsBonkAddressProvider
 from utils.idl_parser import IDLParser
 from utils.logger import get_logger
+from utils.program_logs import program_data_lines
+
+if TYPE_CHECKING:
+    from core.client import SolanaClient
 
 logger = get_logger(__name__)
 
+# The pool account is read right after its creation is streamed; RPC nodes
+# lagging behind the notifying node may not have the slot yet
+POOL_STATE_FETCH_ATTEMPTS = 3
+POOL_STATE_RETRY_DELAY = 0.2  # seconds
+
 
 class LetsBonkEventParser(EventParser):
     """LetsBonk implementation of EventParser interface with IDL-based parsing."""
@@ -40,6 +51,18 @@ class LetsBonkEventParser(EventParser):
             "<Q", self._initialize_discriminator_bytes
         )[0]
 
+        # The first 10 base64 characters encode the first 60 bits of the
+        # event, all inside the discriminator
+        event_discriminators = self._idl_parser.get_event_discriminators()
+        self._pool_create_log_prefix = (
+            "Program data: "
+            + base64.b64encode(event_discriminators["PoolCreateEvent"]).decode()[:10]
+        )
+        self._trade_log_prefix = (
+            "Program data: "
+            + base64.b64encode(event_discriminators["TradeEvent"]).decode()[:10]
+        )
+
         logger.info("LetsBonk event parser initialized with injected IDL parser")
 
     @property
@@ -52,15 +75,192 @@ class LetsBonkEventParser(EventParser):
     ) -> TokenInfo | None:
         """Parse token creation from LetsBonk transaction logs.
 
+        The PoolCreateEvent in the logs carries no base mint or vaults, so a
+        TokenInfo can only be built by ``resolve_token_creation``.
+
         Args:
             logs: List of log strings from transaction
             signature: Transaction signature
 
         Returns:
-            TokenInfo if token creation found, None otherwise
+            Always None
+        """
+        return None
+
+    def parse_pool_creation_from_logs(self, logs: list[str]) -> dict[str, Any] | None:
+        """Decode the PoolCreateEvent emitted by an ``initialize`` instruction.
+
+        Args:
+            logs: List of log strings from transaction
+
+        Returns:
+            Event fields (pool_state, creator, config, base_mint_param, ...),
+            or None if the logs contain no pool creation
+        """
+        for _, log in program_data_lines(logs, str(self.get_program_id())):
+            if not log.startswith(self._pool_create_log_prefix):
+                continue
+            event = self._idl_parser.find_event_in_logs([log], "PoolCreateEvent")
+            if event:
+                return event["fields"]
+        return None
+
+    def parse_curve_updates_from_logs(self, logs: list[str]) -> list[CurveUpdate]:
+        """Decode the pool reserves after every LaunchLab trade in the logs.
+
+        Args:
+            logs: List of log strings from transaction
+
+        Returns:
+            Updates in log order
         """
-        # LetsBonk doesn't emit specific logs for token creation like pump.fun
-        # Token creation is identified through instruction parsing
+        updates = []
+        # pump.fun emits a TradeEvent with the same discriminator
+        for _, log in program_data_lines(logs, str(self.get_program_id())):
+            if not log.startswith(self._trade_log_prefix):
+                continue
+            event = self._idl_parser.find_event_in_logs([log], "TradeEvent")
+            if not event:
+                continue
+
+            fields = event["fields"]
+            try:
+                pool_state = Pubkey.from_string(fields["pool_state"])
+                virtual_base = fields["virtual_base"]
+                virtual_quote = fields["virtual_quote"]
+            except (KeyError, ValueError):
+                continue
+            if virtual_base <= 0:
+                continue
+
+            # Same price as LetsBonkCurveManager.calculate_price
+            price = (
+                (virtual_quote / virtual_base)
+                * (10**TOKEN_DECIMALS)
+                / LAMPORTS_PER_SOL
+            )
+            updates.append(
+                CurveUpdate(
+                    pool_address=pool_state,
+                    price=price,
+                    state={
+                        "virtual_base": virtual_base,
+                        "virtual_quote": virtual_quote,
+                        "real_base": fields.get("real_base_after", 0),
+                        "real_quote": fields.get("real_quote_after", 0),
+                        "price_per_token": price,
+                    },
+                )
+            )
+        return updates
+
+    def parse_unresolved_creation_from_logs(
+        self, logs: list[str], signature: str
+    ) -> dict[str, Any] | None:
+        """Decode the PoolCreateEvent of a LetsBonk pool creation.
+
+        Args:
+            logs: List of log strings from transaction
+            signature: Transaction signature
+
+        Returns:
+            Event fields for ``resolve_token_creation``, or None
+        """
+        return self.parse_pool_creation_from_logs(logs)
+
+    async def resolve_token_creation(
+        self,
+        event: dict[str, Any],
+        signature: str,
+        client: "SolanaClient | None",
+        detected_at: float | None = None,
+    ) -> TokenInfo | None:
+        """Build a TokenInfo from a PoolCreateEvent and the created pool account.
+
+        Name, symbol, URI, creator and pool come from the event; the base
+        mint and vaults are read from the new PoolState account, which also
+        tells LetsBonk pools apart from other LaunchLab platforms.
+
+        Args:
+            event: Fields of the PoolCreateEvent
+            signature: Transaction signature
+            client: RPC client used to read the pool account
+            detected_at: Monotonic time the event was received (now if None)
+
+        Returns:
+            TokenInfo, or None if the pool is not a readable LetsBonk pool
+        """
+        # Detection time, before the account lookup
+        creation_timestamp = monotonic() if detected_at is None else detected_at
+        if client is None:
+            logger.warning(
+                f"Pool creation in {signature} needs an RPC client to resolve its mint"
+            )
+            return None
+
+        try:
+            pool_state = Pubkey.from_string(event["pool_state"])
+            creator = Pubkey.from_string(event["creator"])
+            base_mint_param = event["base_mint_param"]
+        except (KeyError, ValueError) as e:
+            logger.debug(f"Incomplete PoolCreateEvent in {signature}: {e}")
+            return None
+
+        pool = await self._fetch_pool_state(pool_state, client)
+        if pool is None:
+            return None
+
+        platform_config = self.address_provider.get_system_addresses()[
+            "platform_config"
+        ]
+        if pool.get("platform_config") != str(platform_config):
+            logger.debug(f"Pool {pool_state} belongs to another LaunchLab platform")
+            return None
+
+        return TokenInfo(
+            name=base_mint_param.get("name", ""),
+            symbol=base_mint_param.get("symbol", ""),
+            uri=base_mint_param.get("uri", ""),
+            mint=Pubkey.from_string(pool["base_mint"]),
+            platform=Platform.LETS_BONK,
+            pool_state=pool_state,
+            base_vault=Pubkey.from_string(pool["base_vault"]),
+            quote_vault=Pubkey.from_string(pool["quote_vault"]),
+            user=creator,
+            creator=creator,
+            creation_timestamp=creation_timestamp,
+        )
+
+    async def _fetch_pool_state(
+        self, pool_state: Pubkey, client: "SolanaClient"
+    ) -> dict[str, Any] | None:
+        """Read and decode a freshly created PoolState account.
+
+        Args:
+            pool_state: Address of the pool state
+            client: RPC client
+
+        Returns:
+            Decoded pool state, or None if it could not be read
+        """
+        for attempt in range(POOL_STATE_FETCH_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(POOL_STATE_RETRY_DELAY)
+            try:
+                account = await client.get_account_info(
+                    pool_state, commitment="processed"
+                )
+            except Exception as e:
+                logger.debug(f"Pool state {pool_state} not readable yet: {e}")
+                continue
+            return self._idl_parser.decode_account_data(
+                account.data, "PoolState", skip_discriminator=True
+            )
+
+        logger.warning(
+            f"Could not read pool state {pool_state} after "
+            f"{POOL_STATE_FETCH_ATTEMPTS} attempts"
+        )
         return None
 
     def parse_token_creation_from_instruction(
@@ -9,8 +9,8 @@ from dataclasses import dataclass
 from typing import Final
 
 from solders.pubkey import Pubkey
-from spl.token.instructions import get_associated_token_address
 
+from core.pda_cache import pda_cache
 from core.pubkeys import SystemAddresses
 from interfaces.core import AddressProvider, Platform, TokenInfo
 
@@ -46,11 +46,10 @@ class PumpFunAddresses:
         Returns:
             Pubkey of the derived global volume accumulator account
         """
-        derived_address, _ = Pubkey.find_program_address(
+        return pda_cache.precompute(
             [b"global_volume_accumulator"],
             PumpFunAddresses.PROGRAM,
         )
-        return derived_address
 
     @staticmethod
     def find_user_volume_accumulator(user: Pubkey) -> Pubkey:
@@ -63,7 +62,7 @@ class PumpFunAddresses:
         Returns:
             Pubkey of the derived user volume accumulator account
         """
-        derived_address, _ = Pubkey.find_program_address(
+        derived_address, _ = pda_cache.find_program_address(
             [b"user_volume_accumulator", bytes(user)],
             PumpFunAddresses.PROGRAM,
         )
@@ -77,11 +76,10 @@ class PumpFunAddresses:
         Returns:
             Pubkey of the derived fee config account
         """
-        derived_address, _ = Pubkey.find_program_address(
+        return pda_cache.precompute(
             [b"fee_config", bytes(PumpFunAddresses.PROGRAM)],
             PumpFunAddresses.FEE_PROGRAM,
         )
-        return derived_address
 
 
 class PumpFunAddressProvider(AddressProvider):
@@ -134,7 +132,7 @@ class PumpFunAddressProvider(AddressProvider):
         Returns:
             Bonding curve address
         """
-        bonding_curve, _ = Pubkey.find_program_address(
+        bonding_curve, _ = pda_cache.find_program_address(
             [b"bonding-curve", bytes(base_mint)], PumpFunAddresses.PROGRAM
         )
         return bonding_curve
@@ -149,7 +147,7 @@ class PumpFunAddressProvider(AddressProvider):
         Returns:
             User's associated token account address
         """
-        return get_associated_token_address(user, mint)
+        return pda_cache.get_associated_token_address(user, mint)
 
     def get_additional_accounts(self, token_info: TokenInfo) -> dict[str, Pubkey]:
         """Get pump.fun-specific additional accounts needed for trading.
@@ -198,7 +196,7 @@ class PumpFunAddressProvider(AddressProvider):
         Returns:
             Associated bonding curve address
         """
-        derived_address, _ = Pubkey.find_program_address(
+        derived_address, _ = pda_cache.find_program_address(
             [
                 bytes(bonding_curve),
                 bytes(SystemAddresses.TOKEN_PROGRAM),
@@ -217,7 +215,7 @@ class PumpFunAddressProvider(AddressProvider):
         Returns:
             Creator vault address
         """
-        creator_vault, _ = Pubkey.find_program_address(
+        creator_vault, _ = pda_cache.find_program_address(
             [b"creator-vault", bytes(creator)], PumpFunAddresses.PROGRAM
         )
         return creator_vault
@@ -249,6 +247,34 @@ class PumpFunAddressProvider(AddressProvider):
         """
         return PumpFunAddresses.find_fee_config()
 
+    def precompute_constant_addresses(self) -> None:
+        """Derive the global volume accumulator and fee config PDAs."""
+        PumpFunAddresses.find_global_volume_accumulator()
+        PumpFunAddresses.find_fee_config()
+
+    def precompute_user_addresses(self, user: Pubkey) -> None:
+        """Derive the trading wallet's pump.fun addresses ahead of the first buy.
+
+        Args:
+            user: Trading wallet address
+        """
+        self.derive_user_volume_accumulator(user)
+
+    def get_priority_fee_accounts(self) -> dict[str, list[Pubkey]]:
+        """Get pump.fun account sets whose recent priority fees are worth sampling.
+
+        The fee recipient and global volume accumulator are write-locked by
+        every buy, so they see the most contention.
+
+        Returns:
+            Dictionary mapping account set names to accounts
+        """
+        return {
+            "program": [PumpFunAddresses.PROGRAM],
+            "fee_recipient": [PumpFunAddresses.FEE],
+            "global_volume_accumulator": [self.derive_global_volume_accumulator()],
+        }
+
     def get_buy_instruction_accounts(
         self, token_info: TokenInfo, user: Pubkey
     ) -> dict[str, Pubkey]:
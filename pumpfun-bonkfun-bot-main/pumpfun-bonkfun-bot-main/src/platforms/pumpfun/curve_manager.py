@@ -17,6 +17,9 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Fields of the decoded state used by the price and amount calculations
+RESERVE_FIELDS = ("virtual_token_reserves", "virtual_sol_reserves")
+
 
 class PumpFunCurveManager(CurveManager):
     """Pump.Fun implementation of CurveManager interface using IDL-based decoding."""
@@ -47,6 +50,11 @@ class PumpFunCurveManager(CurveManager):
         Returns:
             Dictionary containing bonding curve state data
         """
+        # Pushed state (price feed, streamed trade events) while fresh
+        state = self._fresh_state(pool_address, RESERVE_FIELDS)
+        if state is not None:
+            return state
+
         try:
             account = await self.client.get_account_info(pool_address)
             if not account.data:
@@ -158,6 +166,17 @@ class PumpFunCurveManager(CurveManager):
             pool_state["virtual_sol_reserves"],
         )
 
+    def decode_pool_state(self, data: bytes) -> dict[str, Any]:
+        """Decode raw bonding curve account data pushed by a subscription.
+
+        Args:
+            data: Raw account data
+
+        Returns:
+            Dictionary with decoded bonding curve
+        """
+        return self._decode_curve_state_with_idl(data)
+
     def _decode_curve_state_with_idl(self, data: bytes) -> dict[str, Any]:
         """Decode bonding curve state data using injected IDL parser.
 
@@ -13,9 +13,16 @@ from typing import Any
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
 
-from core.pubkeys import SystemAddresses
-from interfaces.core import EventParser, Platform, TokenInfo
+from core.pda_cache import pda_cache
+from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS, SystemAddresses
+from interfaces.core import CurveUpdate, EventParser, Platform, TokenInfo
 from platforms.pumpfun.address_provider import PumpFunAddresses
+from platforms.pumpfun.log_scanner import (
+    CreateEvent,
+    PumpFunEvent,
+    PumpFunLogScanner,
+    TradeEvent,
+)
 from utils.idl_parser import IDLParser
 from utils.logger import get_logger
 
@@ -47,6 +54,10 @@ class PumpFunEventParser(EventParser):
             "<Q", self._create_instruction_discriminator_bytes
         )[0]
 
+        self._log_scanner = PumpFunLogScanner(
+            self._idl_parser, PumpFunAddresses.PROGRAM
+        )
+
         logger.info(
             "Pump.Fun event parser initialized with IDL-based event and instruction parsing"
         )
@@ -74,192 +85,76 @@ class PumpFunEventParser(EventParser):
         Returns:
             TokenInfo if token creation found, None otherwise
         """
-        # Check if this is a token creation transaction
-        if not any("Program log: Instruction: Create" in log for log in logs):
-            return None
-
-        # Skip swaps as the first condition may pass them
-        if any("Program log: Instruction: CreateTokenAccount" in log for log in logs):
-            return None
-
-        logger.info(f"🔍 Parsing token creation from logs for signature: {signature}")
-
-        # Look for event data in the logs (CreateEvent data!)
-        # We need to find the Program data that comes after "Instruction: Create"
-        try:
-            create_instruction_found = False
-            program_data_entries = []
-
-            # First, collect all Program data entries and note when Create instruction happens
-            for i, log in enumerate(logs):
-                if "Program log: Instruction: Create" in log:
-                    create_instruction_found = True
-                    logger.info(f"📝 Found Create instruction at log index {i}")
-                elif "Program data:" in log:
-                    # Extract base64 encoded event data
-                    encoded_data = log.split("Program data: ")[1].strip()
-                    program_data_entries.append((i, encoded_data, log))
-                    logger.info(
-                        f"📊 Found Program data at log index {i}, length: {len(encoded_data)}"
-                    )
-
-            if not create_instruction_found:
-                logger.info("❌ No Create instruction found in logs")
-                return None
-
-            if not program_data_entries:
-                logger.info("❌ No Program data entries found in logs")
-                return None
-
-            logger.info(
-                f"🔍 Found {len(program_data_entries)} Program data entries to check"
-            )
-
-            # Try each Program data entry
-            for entry_idx, (log_idx, encoded_data, full_log) in enumerate(
-                program_data_entries
-            ):
-                try:
-                    logger.info(
-                        f"🧪 Trying Program data entry {entry_idx + 1}/{len(program_data_entries)} (log index {log_idx})"
-                    )
-
-                    decoded_data = base64.b64decode(encoded_data)
-
-                    if len(decoded_data) < 8:
-                        logger.info(
-                            f"⚠️ Program data too short: {len(decoded_data)} bytes"
-                        )
-                        continue
-
-                    # Check discriminator from program data
-                    discriminator = decoded_data[:8]
-                    discriminator_int = struct.unpack("<Q", discriminator)[0]
-
-                    logger.info(
-                        f"🔍 Program data discriminator: {discriminator.hex()} (int: {discriminator_int})"
-                    )
-                    logger.info(
-                        f"🎯 Expected CreateEvent discriminator: {self._create_event_discriminator_bytes.hex()} (int: {self._create_event_discriminator})"
-                    )
-
-                    # Try to decode as CreateEvent using IDL parser
-                    decoded_event = self._idl_parser.decode_event_data(
-                        decoded_data, "CreateEvent"
-                    )
-
-                    if not decoded_event:
-                        logger.info("❌ IDL parser returned None for CreateEvent")
-                        continue
-
-                    if decoded_event.get("event_name") != "CreateEvent":
-                        logger.info(
-                            f"❌ Wrong event type: {decoded_event.get('event_name', 'None')}"
-                        )
-                        continue
-
-                    logger.info(
-                        f"✅ Successfully decoded event: {decoded_event.get('event_name', 'Unknown')}"
-                    )
-                    logger.info(
-                        f"🔍 Event fields: {list(decoded_event.get('fields', {}).keys())}"
-                    )
+        for event in self._log_scanner.scan(logs, (CreateEvent,)):
+            return self._token_info_from_create_event(event)
+        return None
 
-                    fields = decoded_event.get("fields", {})
-                    if not fields:
-                        logger.info("❌ No fields found in decoded event")
-                        continue
-
-                    # Validate required fields exist
-                    required_fields = [
-                        "mint",
-                        "bonding_curve",
-                        "user",
-                        "creator",
-                        "name",
-                        "symbol",
-                        "uri",
-                    ]
-                    missing_fields = [
-                        field for field in required_fields if field not in fields
-                    ]
-                    if missing_fields:
-                        logger.info(f"❌ Missing required fields: {missing_fields}")
-                        continue
+    def parse_events_from_logs(self, logs: list[str]) -> list[PumpFunEvent]:
+        """Decode every CreateEvent, TradeEvent and CompleteEvent in the logs.
 
-                    logger.info(
-                        f"🎯 Token found: {fields.get('symbol', 'Unknown')} ({fields.get('name', 'Unknown')})"
-                    )
-
-                    # Convert string representations to Pubkey objects
-                    # Note: IDL parser returns pubkeys as base58 strings
-                    try:
-                        mint = (
-                            Pubkey.from_string(fields["mint"])
-                            if isinstance(fields["mint"], str)
-                            else fields["mint"]
-                        )
-                        bonding_curve = (
-                            Pubkey.from_string(fields["bonding_curve"])
-                            if isinstance(fields["bonding_curve"], str)
-                            else fields["bonding_curve"]
-                        )
-                        user = (
-                            Pubkey.from_string(fields["user"])
-                            if isinstance(fields["user"], str)
-                            else fields["user"]
-                        )
-                        creator = (
-                            Pubkey.from_string(fields["creator"])
-                            if isinstance(fields["creator"], str)
-                            else fields["creator"]
-                        )
-
-                        logger.info(f"🔑 Mint: {mint}")
-                        logger.info(f"🔑 Bonding Curve: {bonding_curve}")
-                        logger.info(f"🔑 User: {user}")
-                        logger.info(f"🔑 Creator: {creator}")
+        Args:
+            logs: List of log strings from transaction
 
-                    except Exception as e:
-                        logger.info(f"❌ Failed to convert pubkey fields: {e}")
-                        continue
+        Returns:
+            Typed events in log order
+        """
+        return self._log_scanner.scan(logs)
 
-                    # Derive additional addresses
-                    associated_bonding_curve = self._derive_associated_bonding_curve(
-                        mint, bonding_curve
-                    )
-                    creator_vault = self._derive_creator_vault(creator)
-
-                    logger.info(
-                        f"✅ Successfully parsed CreateEvent for token: {fields.get('symbol', 'Unknown')}"
-                    )
-
-                    return TokenInfo(
-                        name=fields["name"],
-                        symbol=fields["symbol"],
-                        uri=fields["uri"],
-                        mint=mint,
-                        platform=Platform.PUMP_FUN,
-                        bonding_curve=bonding_curve,
-                        associated_bonding_curve=associated_bonding_curve,
-                        user=user,
-                        creator=creator,
-                        creator_vault=creator_vault,
-                        creation_timestamp=monotonic(),
-                    )
-
-                except Exception as e:
-                    logger.info(
-                        f"❌ Failed to decode Program data entry {entry_idx + 1}: {e}"
-                    )
-                    continue
+    def parse_curve_updates_from_logs(self, logs: list[str]) -> list[CurveUpdate]:
+        """Decode the bonding curve reserves after every trade in the logs.
 
-            logger.info("❌ No valid CreateEvent found in any Program data entries")
-            return None
+        Args:
+            logs: List of log strings from transaction
 
-        except Exception:
-            logger.exception("Failed to parse token creation from logs")
-            return None
+        Returns:
+            Updates in log order
+        """
+        updates = []
+        for event in self._log_scanner.scan(logs, (TradeEvent,)):
+            if event.virtual_token_reserves <= 0:
+                continue
+            bonding_curve, _ = pda_cache.find_program_address(
+                [b"bonding-curve", bytes(event.mint)], PumpFunAddresses.PROGRAM
+            )
+            price = (
+                event.virtual_sol_reserves
+                / event.virtual_token_reserves
+                * (10**TOKEN_DECIMALS)
+                / LAMPORTS_PER_SOL
+            )
+            updates.append(
+                CurveUpdate(
+                    pool_address=bonding_curve,
+                    price=price,
+                    state={
+                        "virtual_token_reserves": event.virtual_token_reserves,
+                        "virtual_sol_reserves": event.virtual_sol_reserves,
+                        "real_token_reserves": event.real_token_reserves,
+                        "real_sol_reserves": event.real_sol_reserves,
+                        "price_per_token": price,
+                    },
+                    mint=event.mint,
+                )
+            )
+        return updates
+
+    def _token_info_from_create_event(self, event: CreateEvent) -> TokenInfo:
+        """Build TokenInfo from a decoded CreateEvent, deriving the missing PDAs."""
+        return TokenInfo(
+            name=event.name,
+            symbol=event.symbol,
+            uri=event.uri,
+            mint=event.mint,
+            platform=Platform.PUMP_FUN,
+            bonding_curve=event.bonding_curve,
+            associated_bonding_curve=self._derive_associated_bonding_curve(
+                event.mint, event.bonding_curve
+            ),
+            user=event.user,
+            creator=event.creator,
+            creator_vault=self._derive_creator_vault(event.creator),
+            creation_timestamp=monotonic(),
+        )
 
     def parse_token_creation_from_instruction(
         self, instruction_data: bytes, accounts: list[int], account_keys: list[bytes]
@@ -537,7 +432,7 @@ class PumpFunEventParser(EventParser):
         Returns:
             Creator vault address
         """
-        derived_address, _ = Pubkey.find_program_address(
+        derived_address, _ = pda_cache.find_program_address(
             [b"creator-vault", bytes(creator)],
             PumpFunAddresses.PROGRAM,
         )
@@ -555,7 +450,7 @@ class PumpFunEventParser(EventParser):
         Returns:
             Associated bonding curve address
         """
-        derived_address, _ = Pubkey.find_program_address(
+        derived_address, _ = pda_cache.find_program_address(
             [
                 bytes(bonding_curve),
                 bytes(SystemAddresses.TOKEN_PROGRAM),
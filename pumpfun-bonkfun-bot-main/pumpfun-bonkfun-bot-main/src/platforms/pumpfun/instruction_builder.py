@@ -42,6 +42,11 @@ class PumpFunInstructionBuilder(InstructionBuilder):
         """Get the platform this builder serves."""
         return Platform.PUMP_FUN
 
+    @property
+    def supports_templates(self) -> bool:
+        """Buy and sell instructions only vary with the amounts."""
+        return True
+
     async def build_buy_instruction(
         self,
         token_info: TokenInfo,
@@ -0,0 +1,209 @@
+"""
+Single-pass scanner of pump.fun transaction logs.
+
+Each log line is classified once. ``Program data:`` payloads are dispatched
+by the base64 text of their 8-byte discriminator, so only CreateEvent,
+TradeEvent and CompleteEvent payloads are base64-decoded, each with the
+compiled IDL plan of its event. Other program data (events of other
+programs, unrelated pump.fun events) is skipped without decoding.
+"""
+
+import base64
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from solders.pubkey import Pubkey
+
+from utils.idl_parser import IDLParser
+from utils.logger import get_logger
+from utils.program_logs import PROGRAM_DATA_PREFIX, program_data_lines
+
+logger = get_logger(__name__)
+
+# 10 base64 characters encode the first 60 bits, all inside the discriminator
+DISCRIMINATOR_B64_CHARS = 10
+DISCRIMINATOR_SIZE = 8
+
+
+@dataclass(slots=True)
+class CreateEvent:
+    """Token creation on the bonding curve."""
+
+    name: str
+    symbol: str
+    uri: str
+    mint: Pubkey
+    bonding_curve: Pubkey
+    user: Pubkey
+    creator: Pubkey
+    timestamp: int
+    virtual_token_reserves: int
+    virtual_sol_reserves: int
+    real_token_reserves: int
+    token_total_supply: int
+
+
+@dataclass(slots=True)
+class TradeEvent:
+    """Buy or sell on the bonding curve, with the reserves after the trade."""
+
+    mint: Pubkey
+    user: Pubkey
+    creator: Pubkey | None
+    is_buy: bool
+    sol_amount: int
+    token_amount: int
+    timestamp: int
+    virtual_sol_reserves: int
+    virtual_token_reserves: int
+    real_sol_reserves: int
+    real_token_reserves: int
+    fee: int
+    creator_fee: int
+
+
+@dataclass(slots=True)
+class CompleteEvent:
+    """Bonding curve completion (the token is ready to migrate)."""
+
+    user: Pubkey
+    mint: Pubkey
+    bonding_curve: Pubkey
+    timestamp: int
+
+
+PumpFunEvent = CreateEvent | TradeEvent | CompleteEvent
+
+
+def _pubkey(value: Any) -> Pubkey:
+    return Pubkey.from_string(value) if isinstance(value, str) else value
+
+
+def _build_create(fields: dict[str, Any]) -> CreateEvent:
+    return CreateEvent(
+        name=fields["name"],
+        symbol=fields["symbol"],
+        uri=fields["uri"],
+        mint=_pubkey(fields["mint"]),
+        bonding_curve=_pubkey(fields["bonding_curve"]),
+        user=_pubkey(fields["user"]),
+        creator=_pubkey(fields["creator"]),
+        timestamp=fields.get("timestamp", 0),
+        virtual_token_reserves=fields.get("virtual_token_reserves", 0),
+        virtual_sol_reserves=fields.get("virtual_sol_reserves", 0),
+        real_token_reserves=fields.get("real_token_reserves", 0),
+        token_total_supply=fields.get("token_total_supply", 0),
+    )
+
+
+def _build_trade(fields: dict[str, Any]) -> TradeEvent:
+    creator = fields.get("creator")
+    return TradeEvent(
+        mint=_pubkey(fields["mint"]),
+        user=_pubkey(fields["user"]),
+        creator=_pubkey(creator) if creator else None,
+        is_buy=fields["is_buy"],
+        sol_amount=fields["sol_amount"],
+        token_amount=fields["token_amount"],
+        timestamp=fields.get("timestamp", 0),
+        virtual_sol_reserves=fields["virtual_sol_reserves"],
+        virtual_token_reserves=fields["virtual_token_reserves"],
+        real_sol_reserves=fields.get("real_sol_reserves", 0),
+        real_token_reserves=fields.get("real_token_reserves", 0),
+        fee=fields.get("fee", 0),
+        creator_fee=fields.get("creator_fee", 0),
+    )
+
+
+def _build_complete(fields: dict[str, Any]) -> CompleteEvent:
+    return CompleteEvent(
+        user=_pubkey(fields["user"]),
+        mint=_pubkey(fields["mint"]),
+        bonding_curve=_pubkey(fields["bonding_curve"]),
+        timestamp=fields.get("timestamp", 0),
+    )
+
+
+# IDL event name -> (event class, builder from decoded fields)
+_EVENTS = {
+    "CreateEvent": (CreateEvent, _build_create),
+    "TradeEvent": (TradeEvent, _build_trade),
+    "CompleteEvent": (CompleteEvent, _build_complete),
+}
+
+
+class PumpFunLogScanner:
+    """Extracts typed pump.fun events from transaction logs in one pass."""
+
+    def __init__(self, idl_parser: IDLParser, program_id: Pubkey):
+        """Initialize the scanner.
+
+        Args:
+            idl_parser: Pre-loaded IDL parser for pump.fun platform
+            program_id: pump.fun program, the only emitter whose data is decoded
+        """
+        self._idl_parser = idl_parser
+        self._program_id = str(program_id)
+        self._idl_parser.compile_decoders()
+
+        event_discriminators = idl_parser.get_event_discriminators()
+        # base64 discriminator prefix -> (event name, discriminator)
+        self._dispatch: dict[str, tuple[str, bytes]] = {}
+        for event_name in _EVENTS:
+            discriminator = event_discriminators[event_name]
+            prefix = base64.b64encode(discriminator).decode()[:DISCRIMINATOR_B64_CHARS]
+            self._dispatch[prefix] = (event_name, discriminator)
+
+    def scan(
+        self, logs: list[str], kinds: tuple[type, ...] | None = None
+    ) -> list[PumpFunEvent]:
+        """Decode the pump.fun events in a transaction's logs.
+
+        Args:
+            logs: List of log strings from transaction
+            kinds: Event classes to decode (all if None); payloads of other
+                events are not base64-decoded
+
+        Returns:
+            Events in log order
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        events: list[PumpFunEvent] = []
+        start = len(PROGRAM_DATA_PREFIX)
+        end = start + DISCRIMINATOR_B64_CHARS
+
+        for index, log in program_data_lines(logs, self._program_id):
+            entry = self._dispatch.get(log[start:end])
+            if entry is None:
+                continue
+            event_name, discriminator = entry
+            event_class, builder = _EVENTS[event_name]
+            if kinds is not None and event_class not in kinds:
+                continue
+
+            try:
+                data = base64.b64decode(log[start:].strip())
+            except ValueError:
+                continue
+            if data[:DISCRIMINATOR_SIZE] != discriminator:
+                continue
+
+            decoded = self._idl_parser.decode_event_data(data, event_name)
+            if not decoded:
+                if debug:
+                    logger.debug(f"Could not decode {event_name} at log index {index}")
+                continue
+
+            try:
+                event = builder(decoded["fields"])
+            except (KeyError, ValueError) as e:
+                if debug:
+                    logger.debug(f"Incomplete {event_name} at log index {index}: {e}")
+                continue
+
+            if debug:
+                logger.debug(f"Decoded {event_name} at log index {index}: {event}")
+            events.append(event)
+
+        return events
@@ -0,0 +1,215 @@
+"""
+Append-only trade journal written off the event loop.
+
+Records are compact JSON lines of the form
+``{"ts": <unix time>, "kind": "trade" | "token", "bot": <bot name>, ...}``
+(``bot`` is omitted when the journal has no bot name). Files are named
+``journal-<UTC timestamp>.jsonl`` and rotated by size and age, so a directory
+of journals can be streamed back in order with ``read_journal``.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FSYNC_POLICIES = ("never", "rotate", "batch")
+
+
+class TradeJournal:
+    """Buffers journal records in memory and writes them in background batches."""
+
+    def __init__(
+        self,
+        directory: str = "trades",
+        flush_interval: float = 1.0,
+        batch_size: int = 256,
+        max_file_size: int = 64 * 1024 * 1024,
+        rotate_interval: float = 86_400.0,
+        fsync: str = "rotate",
+        bot_name: str | None = None,
+    ):
+        """Initialize the journal.
+
+        Args:
+            directory: Directory holding journal files
+            flush_interval: Maximum seconds a record waits before being written
+            batch_size: Buffered records that trigger an early write
+            max_file_size: Bytes after which a new file is started (0 to disable)
+            rotate_interval: Seconds after which a new file is started (0 to disable)
+            fsync: When to fsync: "never", "rotate" (when a file is closed)
+                or "batch" (after every write)
+            bot_name: Name stored in every record, telling apart bots that
+                write to the same directory
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Invalid fsync policy '{fsync}', expected one of {FSYNC_POLICIES}"
+            )
+
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_file_size = max_file_size
+        self.rotate_interval = rotate_interval
+        self.fsync = fsync
+        self.bot_name = bot_name
+        self.records_written = 0
+
+        self._buffer: list[dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        # Serializes writes: a thread left running by one flush must finish
+        # before the next flush or the file close touches the file
+        self._write_lock = asyncio.Lock()
+        self._file: IO[str] | None = None
+        self._file_size = 0
+        self._file_opened_at = 0.0
+
+    def start(self) -> None:
+        """Start the background writer."""
+        if self._task:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Trade journal writing to {self.directory}/")
+
+    def record(self, kind: str, data: dict[str, Any]) -> None:
+        """Queue a record. Never blocks on disk.
+
+        Args:
+            kind: Record kind (e.g. "trade", "token")
+            data: Record fields
+        """
+        record = {"ts": round(time.time(), 3), "kind": kind}
+        if self.bot_name:
+            record["bot"] = self.bot_name
+        record.update(data)
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write buffered records to disk off the event loop."""
+        async with self._write_lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception:
+                # Logged and dropped so the writer task keeps running
+                logger.exception(f"Failed to write {len(batch)} journal records")
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        if self._should_rotate():
+            self._close_file()
+        if self._file is None:
+            self._open_file()
+
+        lines = []
+        for record in batch:
+            try:
+                lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+            except (TypeError, ValueError) as e:
+                logger.error(
+                    f"Dropping unserializable {record.get('kind')} record: {e}"
+                )
+        data = "".join(lines)
+        self._file.write(data)
+        self._file.flush()
+        self._file_size += len(data.encode("utf-8"))
+        self.records_written += len(lines)
+
+        if self.fsync == "batch":
+            os.fsync(self._file.fileno())
+
+    def _should_rotate(self) -> bool:
+        if self._file is None:
+            return False
+        if self.max_file_size and self._file_size >= self.max_file_size:
+            return True
+        return bool(
+            self.rotate_interval
+            and time.monotonic() - self._file_opened_at >= self.rotate_interval
+        )
+
+    def _open_file(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S-%f")
+        path = self.directory / f"journal-{stamp}.jsonl"
+        self._file = path.open("a", encoding="utf-8")
+        self._file_size = path.stat().st_size
+        self._file_opened_at = time.monotonic()
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        if self.fsync != "never":
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+    async def close(self) -> None:
+        """Stop the writer, write remaining records and close the current file."""
+        if self._task:
+            # Not cancelled: a cancelled flush would leave its write thread
+            # running while the file is closed
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+
+        await self.flush()
+        async with self._write_lock:
+            if self._file:
+                await asyncio.to_thread(self._close_file)
+                logger.info(
+                    f"Trade journal closed after {self.records_written} records"
+                )
+
+
+def read_journal(path: str, kind: str | None = None) -> Iterator[dict[str, Any]]:
+    """Stream records back from a journal file or directory of journal files.
+
+    Args:
+        path: Journal file, or directory whose journal files are read in order
+        kind: Only yield records of this kind
+
+    Yields:
+        Journal records
+    """
+    source = Path(path)
+    files = sorted(source.glob("journal-*.jsonl")) if source.is_dir() else [source]
+    for file_path in files:
+        with file_path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partial last line
+                    logger.warning(f"Skipping malformed journal line in {file_path}")
+                    continue
+                if kind is None or record.get("kind") == kind:
+                    yield record
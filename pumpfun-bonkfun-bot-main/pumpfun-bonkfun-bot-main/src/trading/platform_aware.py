@@ -3,20 +3,70 @@ Platform-aware trader implementations that use the interface system.
 Final cleanup removing all platform-specific hardcoding.
 """
 
+from solders.instruction import Instruction
 from solders.pubkey import Pubkey
 
 from core.client import SolanaClient
 from core.priority_fee.manager import PriorityFeeManager
 from core.pubkeys import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+from core.tx_template import BoundTemplate
 from core.wallet import Wallet
 from interfaces.core import AddressProvider, Platform, TokenInfo
 from platforms import get_platform_implementations
 from trading.base import Trader, TradeResult
+from trading.trade_templates import TradeTemplateCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+async def _send_and_confirm(
+    client: SolanaClient,
+    instructions: list[Instruction] | BoundTemplate,
+    wallet: Wallet,
+    max_retries: int,
+    rebroadcast_interval: float,
+    priority_fee: int | None,
+    compute_unit_limit: int | None,
+) -> tuple[str, bool]:
+    """Send a trade transaction and wait until it is confirmed.
+
+    Args:
+        client: Solana client
+        instructions: Trade instructions, or a precompiled trade template
+        wallet: Wallet signing the transaction
+        max_retries: Maximum send attempts (signed transactions when rebroadcasting)
+        rebroadcast_interval: Seconds between resends of the same signed
+            transaction until it lands (0 sends once with retry backoff)
+        priority_fee: Priority fee in microlamports
+        compute_unit_limit: Compute unit limit
+
+    Returns:
+        Signature of the last sent transaction and whether it was confirmed
+    """
+    if rebroadcast_interval:
+        outcome = await client.send_until_landed(
+            instructions,
+            wallet.keypair,
+            skip_preflight=True,
+            max_attempts=max_retries,
+            priority_fee=priority_fee,
+            compute_unit_limit=compute_unit_limit,
+            rebroadcast_interval=rebroadcast_interval,
+        )
+        return outcome.signature, outcome.landed
+
+    tx_signature = await client.build_and_send_transaction(
+        instructions,
+        wallet.keypair,
+        skip_preflight=True,
+        max_retries=max_retries,
+        priority_fee=priority_fee,
+        compute_unit_limit=compute_unit_limit,
+    )
+    return tx_signature, await client.confirm_transaction(tx_signature)
+
+
 class PlatformAwareBuyer(Trader):
     """Platform-aware token buyer that works with any supported platform."""
 
@@ -31,6 +81,8 @@ class PlatformAwareBuyer(Trader):
         extreme_fast_token_amount: int = 0,
         extreme_fast_mode: bool = False,
         compute_units: dict | None = None,
+        rebroadcast_interval: float = 0.0,
+        templates: TradeTemplateCache | None = None,
     ):
         """Initialize platform-aware token buyer."""
         self.client = client
@@ -42,6 +94,8 @@ class PlatformAwareBuyer(Trader):
         self.extreme_fast_mode = extreme_fast_mode
         self.extreme_fast_token_amount = extreme_fast_token_amount
         self.compute_units = compute_units or {}
+        self.rebroadcast_interval = rebroadcast_interval
+        self.templates = templates
 
     async def execute(self, token_info: TokenInfo) -> TradeResult:
         """Execute buy operation using platform-specific implementations."""
@@ -78,19 +132,28 @@ class PlatformAwareBuyer(Trader):
             # Calculate maximum SOL to spend with slippage
             max_amount_lamports = int(amount_lamports * (1 + self.slippage))
 
-            # Build buy instructions using platform-specific builder
-            instructions = await instruction_builder.build_buy_instruction(
-                token_info,
-                self.wallet.pubkey,
-                max_amount_lamports,  # amount_in (SOL)
-                minimum_token_amount_raw,  # minimum_amount_out (tokens)
-                address_provider,
-            )
+            prepared = self.templates.get(token_info, "buy") if self.templates else None
+            if prepared:
+                # Precompiled at detection: only the amounts are patched in
+                instructions = prepared.template.bind(
+                    amount_in=max_amount_lamports,
+                    minimum_amount_out=minimum_token_amount_raw,
+                )
+                priority_accounts = prepared.priority_accounts
+            else:
+                # Build buy instructions using platform-specific builder
+                instructions = await instruction_builder.build_buy_instruction(
+                    token_info,
+                    self.wallet.pubkey,
+                    max_amount_lamports,  # amount_in (SOL)
+                    minimum_token_amount_raw,  # minimum_amount_out (tokens)
+                    address_provider,
+                )
 
-            # Get accounts for priority fee calculation
-            priority_accounts = instruction_builder.get_required_accounts_for_buy(
-                token_info, self.wallet.pubkey, address_provider
-            )
+                # Get accounts for priority fee calculation
+                priority_accounts = instruction_builder.get_required_accounts_for_buy(
+                    token_info, self.wallet.pubkey, address_provider
+                )
 
             logger.info(
                 f"Buying {token_amount:.6f} tokens at {token_price_sol:.8f} SOL per token on {token_info.platform.value}"
@@ -100,11 +163,12 @@ class PlatformAwareBuyer(Trader):
             )
 
             # Send transaction
-            tx_signature = await self.client.build_and_send_transaction(
+            tx_signature, success = await _send_and_confirm(
+                self.client,
                 instructions,
-                self.wallet.keypair,
-                skip_preflight=True,
-                max_retries=self.max_retries,
+                self.wallet,
+                self.max_retries,
+                self.rebroadcast_interval,
                 priority_fee=await self.priority_fee_manager.calculate_priority_fee(
                     priority_accounts
                 ),
@@ -113,8 +177,6 @@ class PlatformAwareBuyer(Trader):
                 ),
             )
 
-            success = await self.client.confirm_transaction(tx_signature)
-
             if success:
                 logger.info(f"Buy transaction confirmed: {tx_signature}")
                 return TradeResult(
@@ -180,6 +242,8 @@ class PlatformAwareSeller(Trader):
         slippage: float = 0.25,
         max_retries: int = 5,
         compute_units: dict | None = None,
+        rebroadcast_interval: float = 0.0,
+        templates: TradeTemplateCache | None = None,
     ):
         """Initialize platform-aware token seller."""
         self.client = client
@@ -188,6 +252,8 @@ class PlatformAwareSeller(Trader):
         self.slippage = slippage
         self.max_retries = max_retries
         self.compute_units = compute_units or {}
+        self.rebroadcast_interval = rebroadcast_interval
+        self.templates = templates
 
     async def execute(self, token_info: TokenInfo) -> TradeResult:
         """Execute sell operation using platform-specific implementations."""
@@ -240,26 +306,37 @@ class PlatformAwareSeller(Trader):
                 f"Minimum SOL output (with {self.slippage * 100:.1f}% slippage): {min_sol_output / LAMPORTS_PER_SOL:.8f} SOL"
             )
 
-            # Build sell instructions using platform-specific builder
-            instructions = await instruction_builder.build_sell_instruction(
-                token_info,
-                self.wallet.pubkey,
-                token_balance,  # amount_in (tokens)
-                min_sol_output,  # minimum_amount_out (SOL)
-                address_provider,
+            prepared = (
+                self.templates.get(token_info, "sell") if self.templates else None
             )
+            if prepared:
+                # Precompiled after the buy: only the amounts are patched in
+                instructions = prepared.template.bind(
+                    amount_in=token_balance, minimum_amount_out=min_sol_output
+                )
+                priority_accounts = prepared.priority_accounts
+            else:
+                # Build sell instructions using platform-specific builder
+                instructions = await instruction_builder.build_sell_instruction(
+                    token_info,
+                    self.wallet.pubkey,
+                    token_balance,  # amount_in (tokens)
+                    min_sol_output,  # minimum_amount_out (SOL)
+                    address_provider,
+                )
 
-            # Get accounts for priority fee calculation
-            priority_accounts = instruction_builder.get_required_accounts_for_sell(
-                token_info, self.wallet.pubkey, address_provider
-            )
+                # Get accounts for priority fee calculation
+                priority_accounts = instruction_builder.get_required_accounts_for_sell(
+                    token_info, self.wallet.pubkey, address_provider
+                )
 
             # Send transaction
-            tx_signature = await self.client.build_and_send_transaction(
+            tx_signature, success = await _send_and_confirm(
+                self.client,
                 instructions,
-                self.wallet.keypair,
-                skip_preflight=True,
-                max_retries=self.max_retries,
+                self.wallet,
+                self.max_retries,
+                self.rebroadcast_interval,
                 priority_fee=await self.priority_fee_manager.calculate_priority_fee(
                     priority_accounts
                 ),
@@ -268,8 +345,6 @@ class PlatformAwareSeller(Trader):
                 ),
             )
 
-            success = await self.client.confirm_transaction(tx_signature)
-
             if success:
                 logger.info(f"Sell transaction confirmed: {tx_signature}")
                 return TradeResult(
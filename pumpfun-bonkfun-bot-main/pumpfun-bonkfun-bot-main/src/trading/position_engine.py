@@ -0,0 +1,226 @@
+"""
+Bounded concurrent engine for independent token lifecycles.
+
+Each accepted token runs its own buy → monitor → sell → cleanup lifecycle as a
+separate task. The engine caps the number of open positions, the total SOL
+committed to them, and how many lifecycles may be inside each stage at once,
+so throughput scales with capital and RPC budget without overrunning either.
+
+The monitor limit is enforced at admission instead: a token is only bought
+when a monitor slot is free, so every held position is monitored from the
+moment it is bought.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from interfaces.core import TokenInfo
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LIFECYCLE_STAGES = ("buy", "monitor", "sell", "cleanup")
+
+
+class PositionEngine:
+    """Runs token lifecycles concurrently within position, capital and stage limits."""
+
+    def __init__(
+        self,
+        lifecycle: Callable[[TokenInfo], Awaitable[bool]],
+        max_positions: int,
+        position_cost_sol: float,
+        max_sol_at_risk: float | None = None,
+        stage_limits: dict[str, int] | None = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            lifecycle: Coroutine running one token's full lifecycle. It returns
+                True once the capital is back in the wallet (sold or buy failed)
+                and False if the position is still held (marry/manual exits).
+            max_positions: Maximum number of lifecycles running at once
+            position_cost_sol: Worst-case SOL committed per position
+            max_sol_at_risk: Maximum SOL committed across held positions
+                (None for no limit beyond max_positions)
+            stage_limits: Optional per-stage concurrency limits keyed by stage
+                name ("buy", "monitor", "sell", "cleanup"). The monitor limit
+                caps positions bought and not yet exited; tokens arriving
+                while it is reached are rejected.
+        """
+        self._lifecycle = lifecycle
+        self.max_positions = max(1, max_positions)
+        self.position_cost_sol = position_cost_sol
+        self.max_sol_at_risk = max_sol_at_risk
+
+        self._stage_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.max_monitored: int | None = None
+        for stage, limit in (stage_limits or {}).items():
+            if stage not in LIFECYCLE_STAGES:
+                raise ValueError(
+                    f"Unknown lifecycle stage '{stage}'. Expected one of {LIFECYCLE_STAGES}"
+                )
+            if not limit:
+                continue
+            if stage == "monitor":
+                self.max_monitored = limit
+            else:
+                self._stage_semaphores[stage] = asyncio.Semaphore(limit)
+
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._sol_at_risk = 0.0
+        # Tokens holding a capital reservation / a monitor slot
+        self._capital_reserved: set[str] = set()
+        self._monitor_slots: set[str] = set()
+
+        # Counters
+        self.accepted = 0
+        self.rejected_capacity = 0
+        self.rejected_risk = 0
+        self.rejected_monitor = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def active_positions(self) -> int:
+        """Number of lifecycles currently running."""
+        return len(self._tasks)
+
+    @property
+    def sol_at_risk(self) -> float:
+        """SOL currently committed to running or held positions."""
+        return self._sol_at_risk
+
+    def submit(self, token_info: TokenInfo) -> bool:
+        """Start a lifecycle for a token if limits allow it.
+
+        Tokens that do not fit are rejected rather than queued, since they
+        would be stale by the time a slot frees up.
+
+        Args:
+            token_info: Newly detected token
+
+        Returns:
+            True if the lifecycle was started
+        """
+        token_key = str(token_info.mint)
+        if token_key in self._tasks:
+            return False
+
+        if len(self._tasks) >= self.max_positions:
+            self.rejected_capacity += 1
+            logger.info(
+                f"Skipping {token_info.symbol}: {len(self._tasks)}/{self.max_positions} positions open"
+            )
+            return False
+
+        if (
+            self.max_sol_at_risk is not None
+            and self._sol_at_risk + self.position_cost_sol > self.max_sol_at_risk
+        ):
+            self.rejected_risk += 1
+            logger.info(
+                f"Skipping {token_info.symbol}: {self._sol_at_risk:.6f} SOL at risk, "
+                f"limit {self.max_sol_at_risk:.6f} SOL"
+            )
+            return False
+
+        if (
+            self.max_monitored is not None
+            and len(self._monitor_slots) >= self.max_monitored
+        ):
+            self.rejected_monitor += 1
+            logger.info(
+                f"Skipping {token_info.symbol}: {len(self._monitor_slots)}/"
+                f"{self.max_monitored} monitor slots taken"
+            )
+            return False
+
+        # Reserve synchronously so concurrent submits cannot overshoot
+        self._sol_at_risk += self.position_cost_sol
+        self._capital_reserved.add(token_key)
+        if self.max_monitored is not None:
+            self._monitor_slots.add(token_key)
+        self.accepted += 1
+
+        task = asyncio.create_task(self._run(token_info))
+        self._tasks[token_key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(token_key, None))
+
+        logger.info(
+            f"Started lifecycle for {token_info.symbol} "
+            f"({len(self._tasks)}/{self.max_positions} positions, "
+            f"{self._sol_at_risk:.6f} SOL at risk)"
+        )
+        return True
+
+    async def _run(self, token_info: TokenInfo) -> None:
+        capital_returned = True
+        try:
+            capital_returned = await self._lifecycle(token_info)
+            self.completed += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.failed += 1
+            logger.exception(f"Lifecycle for {token_info.symbol} failed")
+        finally:
+            self.release_monitor_slot(token_info)
+            if capital_returned:
+                self.release_capital(token_info)
+
+    def release_monitor_slot(self, token_info: TokenInfo) -> None:
+        """Free the monitor slot of a position that is no longer monitored.
+
+        Args:
+            token_info: Token whose lifecycle held the slot
+        """
+        self._monitor_slots.discard(str(token_info.mint))
+
+    def release_capital(self, token_info: TokenInfo) -> None:
+        """Return a position's capital reservation once it is back in the wallet.
+
+        Releasing twice has no effect, so lifecycles can release as soon as a
+        sell lands and the engine still releases failed buys on exit.
+
+        Args:
+            token_info: Token whose lifecycle reserved the capital
+        """
+        token_key = str(token_info.mint)
+        if token_key in self._capital_reserved:
+            self._capital_reserved.discard(token_key)
+            self._sol_at_risk = max(0.0, self._sol_at_risk - self.position_cost_sol)
+
+    @asynccontextmanager
+    async def stage(self, name: str) -> AsyncIterator[None]:
+        """Hold a slot in a lifecycle stage for the duration of the block.
+
+        The monitor stage has no semaphore; its slots are taken at admission
+        (see submit) and freed with release_monitor_slot.
+
+        Args:
+            name: Stage name
+        """
+        semaphore = self._stage_semaphores.get(name)
+        if semaphore is None:
+            yield
+            return
+        async with semaphore:
+            yield
+
+    async def shutdown(self) -> None:
+        """Cancel running lifecycles and wait for them to finish."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(
+            f"Position engine stats: accepted={self.accepted}, completed={self.completed}, "
+            f"failed={self.failed}, rejected (capacity)={self.rejected_capacity}, "
+            f"rejected (risk)={self.rejected_risk}, "
+            f"rejected (monitor)={self.rejected_monitor}, "
+            f"SOL still at risk={self._sol_at_risk:.6f}"
+        )
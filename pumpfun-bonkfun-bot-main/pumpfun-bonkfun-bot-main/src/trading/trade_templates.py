@@ -0,0 +1,204 @@
+"""
+Precompiled buy and sell transactions per token.
+
+Buy templates are compiled when a token is detected and sell templates once
+it is bought, off the decision path, so executing a trade only patches the
+amounts, priority fee and blockhash into the compiled message before
+signing. Platforms whose builders do not support templates keep building
+their instructions per trade, as do tokens whose instructions fail template
+verification (see core.tx_template). A platform side is only switched off
+after several tokens in a row fail verification.
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+
+from solders.pubkey import Pubkey
+
+from core.client import SolanaClient
+from core.tx_template import TemplateError, TransactionTemplate
+from core.wallet import Wallet
+from interfaces.core import Platform, TokenInfo
+from platforms import get_platform_implementations
+from utils.dedup import BoundedDedupSet
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Values a trade patches into its template, encoded as u64 by the builders
+TRADE_FIELDS = {"amount_in": "<Q", "minimum_amount_out": "<Q"}
+# Tokens in a row failing verification before a platform side is switched off
+MAX_CONSECUTIVE_FAILURES = 5
+
+
+@dataclass(frozen=True)
+class TradeTemplate:
+    """A compiled trade transaction and its priority fee accounts."""
+
+    template: TransactionTemplate
+    priority_accounts: list[Pubkey]
+
+
+class TradeTemplateCache:
+    """Compiles and keeps trade templates per (platform, mint, wallet, side)."""
+
+    def __init__(self, client: SolanaClient, wallet: Wallet, max_size: int = 256):
+        """Initialize the cache.
+
+        Args:
+            client: Solana client the platform implementations are bound to
+            wallet: Wallet signing the trades
+            max_size: Maximum number of templates kept
+        """
+        self.client = client
+        self.wallet = wallet
+        self.max_size = max_size
+        self._templates: OrderedDict[tuple, TradeTemplate] = OrderedDict()
+        self._unsupported: set[tuple[Platform, str]] = set()
+        # Tokens whose template failed verification, and failures in a row
+        # per (platform, side)
+        self._failed = BoundedDedupSet(max_size)
+        self._consecutive_failures: dict[tuple[Platform, str], int] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        # Instrumentation
+        self.compiled = 0
+        self.hits = 0
+        self.misses = 0
+
+    def schedule(self, token_info: TokenInfo, side: str) -> None:
+        """Compile a template in the background.
+
+        Args:
+            token_info: Token to trade
+            side: "buy" or "sell"
+        """
+        if (token_info.platform, side) in self._unsupported:
+            return
+        key = self._key(token_info, side)
+        if key in self._templates or key in self._failed:
+            return
+        task = asyncio.create_task(self.prepare(token_info, side))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def prepare(self, token_info: TokenInfo, side: str) -> TradeTemplate | None:
+        """Compile the template of a trade.
+
+        Args:
+            token_info: Token to trade
+            side: "buy" or "sell"
+
+        Returns:
+            Compiled template, or None if the platform cannot use templates
+        """
+        key = self._key(token_info, side)
+        if key in self._templates:
+            return self._templates[key]
+        if (token_info.platform, side) in self._unsupported or key in self._failed:
+            return None
+
+        implementations = get_platform_implementations(
+            token_info.platform, self.client
+        )
+        address_provider = implementations.address_provider
+        instruction_builder = implementations.instruction_builder
+        user = self.wallet.pubkey
+
+        if not instruction_builder.supports_templates:
+            self._unsupported.update(
+                {(token_info.platform, "buy"), (token_info.platform, "sell")}
+            )
+            logger.info(
+                f"{token_info.platform.value} transactions are built per trade, "
+                f"its instruction builder does not support templates"
+            )
+            return None
+
+        if side == "buy":
+            build = instruction_builder.build_buy_instruction
+            priority_accounts = instruction_builder.get_required_accounts_for_buy(
+                token_info, user, address_provider
+            )
+        else:
+            build = instruction_builder.build_sell_instruction
+            priority_accounts = instruction_builder.get_required_accounts_for_sell(
+                token_info, user, address_provider
+            )
+
+        try:
+            template = await TransactionTemplate.compile(
+                user,
+                partial(build, token_info, user, address_provider=address_provider),
+                TRADE_FIELDS,
+            )
+        except TemplateError as e:
+            self._record_failure(token_info, side, e)
+            return None
+        except Exception:
+            logger.exception(f"Failed to precompile {side} of {token_info.mint}")
+            return None
+
+        self._consecutive_failures.pop((token_info.platform, side), None)
+        trade_template = TradeTemplate(template, priority_accounts)
+        self._templates[key] = trade_template
+        if len(self._templates) > self.max_size:
+            self._templates.popitem(last=False)
+        self.compiled += 1
+        return trade_template
+
+    def get(self, token_info: TokenInfo, side: str) -> TradeTemplate | None:
+        """Get a compiled template if it is ready.
+
+        Args:
+            token_info: Token to trade
+            side: "buy" or "sell"
+
+        Returns:
+            Template, or None to build the trade's instructions instead
+        """
+        trade_template = self._templates.get(self._key(token_info, side))
+        if trade_template is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return trade_template
+
+    async def close(self) -> None:
+        """Cancel compilations still running."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def log_stats(self) -> None:
+        """Log how many trades were served from templates."""
+        logger.info(
+            f"Trade templates: {self.compiled} compiled, {self.hits} trades "
+            f"precompiled, {self.misses} built per trade"
+        )
+
+    def _record_failure(
+        self, token_info: TokenInfo, side: str, error: TemplateError
+    ) -> None:
+        """Build one token's trades per call; switch off a side failing repeatedly."""
+        self._failed.add(self._key(token_info, side))
+        platform_side = (token_info.platform, side)
+        failures = self._consecutive_failures.get(platform_side, 0) + 1
+        self._consecutive_failures[platform_side] = failures
+        logger.info(
+            f"{side} of {token_info.mint} is built per trade, templates not "
+            f"applicable: {error}"
+        )
+        if failures >= MAX_CONSECUTIVE_FAILURES:
+            self._unsupported.add(platform_side)
+            logger.warning(
+                f"{token_info.platform.value} {side} templates disabled after "
+                f"{failures} tokens in a row failed verification; "
+                f"transactions are built per trade"
+            )
+
+    def _key(self, token_info: TokenInfo, side: str) -> tuple:
+        return (token_info.platform, token_info.mint, self.wallet.pubkey, side)
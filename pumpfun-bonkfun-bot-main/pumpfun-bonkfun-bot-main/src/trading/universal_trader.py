@@ -4,9 +4,7 @@ Cleaned up to remove all platform-specific hardcoding.
 """
 
 import asyncio
-import json
-from datetime import datetime
-from pathlib import Path
+from contextlib import AbstractAsyncContextManager, nullcontext
 from time import monotonic
 
 import uvloop
@@ -17,15 +15,27 @@ from cleanup.modes import (
     handle_cleanup_after_sell,
     handle_cleanup_post_session,
 )
+from core.broadcaster import TransactionBroadcaster
 from core.client import SolanaClient
+from core.curve_state import CurveState, CurveStateStore
+from core.pda_cache import pda_cache
+from core.priority_fee.fee_oracle import PriorityFeeOracle
 from core.priority_fee.manager import PriorityFeeManager
 from core.wallet import Wallet
+from core.ws_multiplexer import get_multiplexer
 from interfaces.core import Platform, TokenInfo
+from monitoring.base_listener import BaseTokenListener
+from monitoring.gap_backfill import GapBackfiller
 from monitoring.listener_factory import ListenerFactory
+from monitoring.price_feed.factory import PriceFeedFactory
+from monitoring.traffic_recorder import TrafficRecorder
 from platforms import get_platform_implementations
 from trading.base import TradeResult
+from trading.journal import TradeJournal
 from trading.platform_aware import PlatformAwareBuyer, PlatformAwareSeller
-from trading.position import Position
+from trading.position import ExitReason, Position
+from trading.position_engine import PositionEngine
+from trading.trade_templates import TradeTemplateCache
 from utils.logger import get_logger
 
 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -48,6 +58,9 @@ class UniversalTrader:
         platform: Platform | str = Platform.PUMP_FUN,
         # Listener configuration
         listener_type: str = "logs",
+        listener_sources: list[str] | None = None,
+        backfill_gap_slots: int = 0,
+        shared_websocket: bool = False,
         geyser_endpoint: str | None = None,
         geyser_api_token: str | None = None,
         geyser_auth_type: str = "x-token",
@@ -55,20 +68,32 @@ class UniversalTrader:
         # Trading configuration
         extreme_fast_mode: bool = False,
         extreme_fast_token_amount: int = 30,
+        transaction_templates: bool = False,
         # Exit strategy configuration
         exit_strategy: str = "time_based",
         take_profit_percentage: float | None = None,
         stop_loss_percentage: float | None = None,
         max_hold_time: int | None = None,
         price_check_interval: int = 10,
+        price_feed: str = "poll",
+        curve_state_max_age: float = 0.0,
+        price_feed_max_age: float | None = None,
         # Priority fee configuration
         enable_dynamic_priority_fee: bool = False,
         enable_fixed_priority_fee: bool = True,
         fixed_priority_fee: int = 200_000,
         extra_priority_fee: float = 0.0,
+        dynamic_fee_percentile: int = 70,
+        dynamic_fee_poll_interval: float = 2.0,
+        dynamic_fee_max_staleness: float = 10.0,
         hard_cap_prior_fee: int = 200_000,
         # Retry and timeout settings
         max_retries: int = 3,
+        slot_driven_blockhash: bool = False,
+        signature_subscribe: bool = False,
+        rebroadcast_interval: float = 0.0,
+        broadcast_endpoints: list[str] | None = None,
+        broadcast_fanout: int = 0,
         wait_time_after_creation: int = 15,
         wait_time_after_buy: int = 15,
         wait_time_before_new_token: int = 15,
@@ -83,12 +108,34 @@ class UniversalTrader:
         bro_address: str | None = None,
         marry_mode: bool = False,
         yolo_mode: bool = False,
+        # Concurrency configuration (yolo mode)
+        max_concurrent_positions: int = 1,
+        max_sol_at_risk: float | None = None,
+        stage_concurrency: dict | None = None,
         # Compute unit configuration
         compute_units: dict | None = None,
+        # Trade journal configuration
+        journal_config: dict | None = None,
+        bot_name: str | None = None,
+        # Traffic capture and replay
+        record_traffic_path: str | None = None,
+        token_listener: BaseTokenListener | None = None,
+        solana_client: SolanaClient | None = None,
+        fee_oracle: PriorityFeeOracle | None = None,
     ):
-        """Initialize the universal trader."""
+        """Initialize the universal trader.
+
+        ``token_listener``, ``solana_client`` and ``fee_oracle`` replace the
+        configured listener, RPC client and dynamic fee sampler. The shared
+        runner uses them to host several bots on one set of connections, and
+        the replay harness to drive the trader from a recording against a
+        simulated node. Injected clients and oracles are not closed by the
+        trader. ``bot_name`` is stored in every journal record, so bots
+        sharing a journal directory can be told apart.
+        """
         # Core components
-        self.solana_client = SolanaClient(rpc_endpoint)
+        self._owns_solana_client = solana_client is None
+        self.solana_client = solana_client or SolanaClient(rpc_endpoint)
         self.wallet = Wallet(private_key)
         self.priority_fee_manager = PriorityFeeManager(
             client=self.solana_client,
@@ -97,6 +144,10 @@ class UniversalTrader:
             fixed_fee=fixed_priority_fee,
             extra_fee=extra_priority_fee,
             hard_cap=hard_cap_prior_fee,
+            percentile=dynamic_fee_percentile,
+            poll_interval=dynamic_fee_poll_interval,
+            max_staleness=dynamic_fee_max_staleness,
+            fee_oracle=fee_oracle,
         )
 
         # Platform setup
@@ -122,9 +173,29 @@ class UniversalTrader:
             self.platform, self.solana_client
         )
 
+        # Derive wallet-specific PDAs now rather than on the first buy
+        self.platform_implementations.address_provider.precompute_user_addresses(
+            self.wallet.pubkey
+        )
+
+        # Sample priority fees for the platform's contended accounts
+        for name, accounts in (
+            self.platform_implementations.address_provider.get_priority_fee_accounts().items()
+        ):
+            self.priority_fee_manager.track_accounts(
+                f"{self.platform.value}.{name}", accounts
+            )
+
         # Store compute unit configuration
         self.compute_units = compute_units or {}
 
+        # Precompile trade transactions as tokens are detected and bought
+        self.trade_templates = (
+            TradeTemplateCache(self.solana_client, self.wallet)
+            if transaction_templates
+            else None
+        )
+
         # Create platform-aware traders
         self.buyer = PlatformAwareBuyer(
             self.solana_client,
@@ -136,6 +207,8 @@ class UniversalTrader:
             extreme_fast_token_amount,
             extreme_fast_mode,
             compute_units=self.compute_units,
+            rebroadcast_interval=rebroadcast_interval,
+            templates=self.trade_templates,
         )
 
         self.seller = PlatformAwareSeller(
@@ -145,10 +218,12 @@ class UniversalTrader:
             sell_slippage,
             max_retries,
             compute_units=self.compute_units,
+            rebroadcast_interval=rebroadcast_interval,
+            templates=self.trade_templates,
         )
 
         # Initialize the appropriate listener with platform filtering
-        self.token_listener = ListenerFactory.create_listener(
+        self.token_listener = token_listener or ListenerFactory.create_listener(
             listener_type=listener_type,
             wss_endpoint=wss_endpoint,
             geyser_endpoint=geyser_endpoint,
@@ -156,13 +231,80 @@ class UniversalTrader:
             geyser_auth_type=geyser_auth_type,
             pumpportal_url=pumpportal_url,
             platforms=[self.platform],  # Only listen for our platform
+            listener_sources=listener_sources,
+            shared_websocket=shared_websocket,
+        )
+
+        # Some parsers read accounts the detection source does not carry
+        self.token_listener.attach_rpc_client(self.solana_client)
+
+        # Recover creations missed while the listener reconnects
+        if backfill_gap_slots:
+            self.token_listener.attach_gap_backfiller(
+                GapBackfiller(self.solana_client, max_gap_slots=backfill_gap_slots)
+            )
+
+        # Optional capture of raw listener traffic for replay
+        self.traffic_recorder: TrafficRecorder | None = None
+        if record_traffic_path:
+            self.traffic_recorder = TrafficRecorder(record_traffic_path)
+            self.token_listener.attach_recorder(self.traffic_recorder)
+
+        # Trade and token records are written in the background
+        journal_config = journal_config or {}
+        self.journal = TradeJournal(
+            directory=journal_config.get("directory", "trades"),
+            max_file_size=int(journal_config.get("max_file_size_mb", 64) * 1024 * 1024),
+            rotate_interval=journal_config.get("rotate_interval", 86_400),
+            fsync=journal_config.get("fsync", "rotate"),
+            bot_name=bot_name,
+        )
+
+        # Pushed curve state for open positions (None means RPC polling)
+        self.curve_state_store = CurveStateStore(max_pools=10_000)
+        self.price_feed = PriceFeedFactory.create_price_feed(
+            feed_type=price_feed,
+            store=self.curve_state_store,
+            curve_manager=self.platform_implementations.curve_manager,
+            wss_endpoint=wss_endpoint,
+            geyser_endpoint=geyser_endpoint,
+            geyser_api_token=geyser_api_token,
+            geyser_auth_type=geyser_auth_type,
+            pumpportal_url=pumpportal_url,
         )
+        # Pushed state older than this is polled over RPC instead (defaults
+        # to one price check interval, i.e. the first missed update)
+        self.price_feed_max_age = (
+            price_check_interval if price_feed_max_age is None else price_feed_max_age
+        )
+        # Pools whose feed went quiet, logged once until it pushes again
+        self._stale_feed_pools: set[Pubkey] = set()
+
+        # Trade events seen by the listener keep the state of every traded
+        # curve; price reads use it while fresher than curve_state_max_age
+        self.curve_state_max_age = curve_state_max_age
+        if curve_state_max_age:
+            self.token_listener.attach_curve_state_store(self.curve_state_store)
+            self.platform_implementations.curve_manager.attach_state_store(
+                self.curve_state_store, curve_state_max_age
+            )
 
         # Trading parameters
         self.buy_amount = buy_amount
         self.buy_slippage = buy_slippage
         self.sell_slippage = sell_slippage
         self.max_retries = max_retries
+        # Submit through several endpoints; a shared client keeps the first one
+        if broadcast_endpoints and self.solana_client.broadcaster is None:
+            self.solana_client.attach_broadcaster(
+                TransactionBroadcaster(broadcast_endpoints, fanout=broadcast_fanout)
+            )
+
+        # Refresh the client's blockhashes on slot notifications instead of a timer
+        self.wss_endpoint = wss_endpoint
+        self.slot_driven_blockhash = slot_driven_blockhash
+        # Push confirmations through signatureSubscribe on top of batched polls
+        self.signature_subscribe = signature_subscribe
         self.extreme_fast_mode = extreme_fast_mode
         self.extreme_fast_token_amount = extreme_fast_token_amount
 
@@ -191,6 +333,17 @@ class UniversalTrader:
         self.marry_mode = marry_mode
         self.yolo_mode = yolo_mode
 
+        # Concurrent lifecycles in yolo mode; None keeps strictly serial processing
+        self.position_engine: PositionEngine | None = None
+        if yolo_mode and max_concurrent_positions > 1:
+            self.position_engine = PositionEngine(
+                lifecycle=self._handle_token,
+                max_positions=max_concurrent_positions,
+                position_cost_sol=buy_amount * (1 + buy_slippage),
+                max_sol_at_risk=max_sol_at_risk,
+                stage_limits=stage_concurrency,
+            )
+
         # State tracking
         self.traded_mints: set[Pubkey] = set()
         self.token_queue: asyncio.Queue = asyncio.Queue()
@@ -209,6 +362,11 @@ class UniversalTrader:
         )
         logger.info(f"Marry mode: {self.marry_mode}")
         logger.info(f"YOLO mode: {self.yolo_mode}")
+        if self.position_engine:
+            logger.info(
+                f"Concurrent positions: up to {self.position_engine.max_positions}, "
+                f"max SOL at risk: {self.position_engine.max_sol_at_risk or 'unlimited'}"
+            )
         logger.info(f"Exit strategy: {self.exit_strategy}")
 
         if self.exit_strategy == "tp_sl":
@@ -221,6 +379,9 @@ class UniversalTrader:
             logger.info(
                 f"Max hold time: {self.max_hold_time if self.max_hold_time else 'None'} seconds"
             )
+            logger.info(
+                f"Price feed: {self.price_feed.name if self.price_feed else 'poll'}"
+            )
 
         logger.info(f"Max token age: {self.max_token_age} seconds")
 
@@ -230,6 +391,24 @@ class UniversalTrader:
         except Exception as e:
             logger.warning(f"RPC warm-up failed: {e!s}")
 
+        await self.priority_fee_manager.start()
+        self.journal.start()
+
+        if self.slot_driven_blockhash:
+            await self.solana_client.blockhash_service.follow_slots(
+                get_multiplexer(self.wss_endpoint)
+            )
+        if self.signature_subscribe:
+            await self.solana_client.confirmations.follow_signatures(
+                get_multiplexer(self.wss_endpoint)
+            )
+
+        if self.price_feed:
+            await self.price_feed.start()
+
+        if self.traffic_recorder:
+            self.traffic_recorder.start()
+
         try:
             # Choose operating mode based on yolo_mode
             if not self.yolo_mode:
@@ -288,6 +467,7 @@ class UniversalTrader:
             if token_key not in self.processed_tokens:
                 # Record when the token was discovered
                 self.token_timestamps[token_key] = monotonic()
+                self._prepare_trade_template(token, "buy")
                 found_token = token
                 self.processed_tokens.add(token_key)
                 token_found.set()
@@ -322,6 +502,9 @@ class UniversalTrader:
 
     async def _cleanup_resources(self) -> None:
         """Perform cleanup operations before shutting down."""
+        if self.position_engine:
+            await self.position_engine.shutdown()
+
         if self.traded_mints:
             try:
                 logger.info(f"Cleaning up {len(self.traded_mints)} traded token(s)...")
@@ -341,7 +524,24 @@ class UniversalTrader:
         for key in old_keys:
             self.token_timestamps.pop(key, None)
 
-        await self.solana_client.close()
+        if self.price_feed:
+            await self.price_feed.stop()
+
+        await self.priority_fee_manager.stop()
+
+        if self.traffic_recorder:
+            await self.traffic_recorder.close()
+
+        await self.journal.close()
+
+        pda_cache.log_stats()
+
+        if self.trade_templates:
+            await self.trade_templates.close()
+            self.trade_templates.log_stats()
+
+        if self._owns_solana_client:
+            await self.solana_client.close()
 
     async def _queue_token(self, token_info: TokenInfo) -> None:
         """Queue a token for processing if not already processed."""
@@ -353,17 +553,28 @@ class UniversalTrader:
 
         # Record timestamp when token was discovered
         self.token_timestamps[token_key] = monotonic()
+        self._prepare_trade_template(token_info, "buy")
 
         await self.token_queue.put(token_info)
         logger.info(
             f"Queued new token: {token_info.symbol} ({token_info.mint}) on {token_info.platform.value}"
         )
 
+    def _prepare_trade_template(self, token_info: TokenInfo, side: str) -> None:
+        """Start compiling a trade's transaction template, if enabled."""
+        if self.trade_templates and token_info.platform == self.platform:
+            self.trade_templates.schedule(token_info, side)
+
     async def _process_token_queue(self) -> None:
         """Continuously process tokens from the queue, only if they're fresh."""
         while True:
             try:
                 token_info = await self.token_queue.get()
+            except asyncio.CancelledError:
+                logger.info("Token queue processor was cancelled")
+                break
+
+            try:
                 token_key = str(token_info.mint)
 
                 # Check if token is still "fresh"
@@ -383,7 +594,10 @@ class UniversalTrader:
                 logger.info(
                     f"Processing fresh token: {token_info.symbol} (age: {token_age:.1f}s)"
                 )
-                await self._handle_token(token_info)
+                if self.position_engine:
+                    self.position_engine.submit(token_info)
+                else:
+                    await self._handle_token(token_info)
 
             except asyncio.CancelledError:
                 logger.info("Token queue processor was cancelled")
@@ -393,19 +607,40 @@ class UniversalTrader:
             finally:
                 self.token_queue.task_done()
 
-    async def _handle_token(self, token_info: TokenInfo) -> None:
-        """Handle a new token creation event."""
+    def _stage(self, name: str) -> AbstractAsyncContextManager:
+        """Get the concurrency guard for a lifecycle stage."""
+        if self.position_engine:
+            return self.position_engine.stage(name)
+        return nullcontext()
+
+    def _release_monitor_slot(self, token_info: TokenInfo) -> None:
+        """Free the engine's monitor slot once a position is no longer monitored."""
+        if self.position_engine:
+            self.position_engine.release_monitor_slot(token_info)
+
+    def _release_capital(self, token_info: TokenInfo) -> None:
+        """Return the engine's capital reservation once a sell has landed."""
+        if self.position_engine:
+            self.position_engine.release_capital(token_info)
+
+    async def _handle_token(self, token_info: TokenInfo) -> bool:
+        """Handle a new token creation event.
+
+        Returns:
+            True if no tokens are held afterwards (sold, or never bought)
+        """
+        bought = False
         try:
             # Validate that token is for our platform
             if token_info.platform != self.platform:
                 logger.warning(
                     f"Token platform mismatch: expected {self.platform.value}, got {token_info.platform.value}"
                 )
-                return
+                return True
 
             # Wait for pool/curve to stabilize (unless in extreme fast mode)
             if not self.extreme_fast_mode:
-                await self._save_token_info(token_info)
+                self._save_token_info(token_info)
                 logger.info(
                     f"Waiting for {self.wait_time_after_creation} seconds for the pool/curve to stabilize..."
                 )
@@ -415,27 +650,37 @@ class UniversalTrader:
             logger.info(
                 f"Buying {self.buy_amount:.6f} SOL worth of {token_info.symbol} on {token_info.platform.value}..."
             )
-            buy_result: TradeResult = await self.buyer.execute(token_info)
+            async with self._stage("buy"):
+                buy_result: TradeResult = await self.buyer.execute(token_info)
 
             if buy_result.success:
-                await self._handle_successful_buy(token_info, buy_result)
+                bought = True
+                closed = await self._handle_successful_buy(token_info, buy_result)
             else:
                 await self._handle_failed_buy(token_info, buy_result)
+                closed = True
 
-            # Only wait for next token in yolo mode
-            if self.yolo_mode:
+            # Only wait for next token in serial yolo mode
+            if self.yolo_mode and not self.position_engine:
                 logger.info(
                     f"YOLO mode enabled. Waiting {self.wait_time_before_new_token} seconds before looking for next token..."
                 )
                 await asyncio.sleep(self.wait_time_before_new_token)
 
+            return closed
+
         except Exception:
             logger.exception(f"Error handling token {token_info.symbol}")
+            return not bought
 
     async def _handle_successful_buy(
         self, token_info: TokenInfo, buy_result: TradeResult
-    ) -> None:
-        """Handle successful token purchase."""
+    ) -> bool:
+        """Handle successful token purchase.
+
+        Returns:
+            True if the position was sold
+        """
         logger.info(
             f"Successfully bought {token_info.symbol} on {token_info.platform.value}"
         )
@@ -447,38 +692,48 @@ class UniversalTrader:
             buy_result.tx_signature,
         )
         self.traded_mints.add(token_info.mint)
+        self._prepare_trade_template(token_info, "sell")
 
         # Choose exit strategy
         if not self.marry_mode:
             if self.exit_strategy == "tp_sl":
-                await self._handle_tp_sl_exit(token_info, buy_result)
+                return await self._handle_tp_sl_exit(token_info, buy_result)
             elif self.exit_strategy == "time_based":
-                await self._handle_time_based_exit(token_info)
+                return await self._handle_time_based_exit(token_info)
             elif self.exit_strategy == "manual":
                 logger.info("Manual exit strategy - position will remain open")
         else:
             logger.info("Marry mode enabled. Skipping sell operation.")
+        self._release_monitor_slot(token_info)
+        return False
 
     async def _handle_failed_buy(
         self, token_info: TokenInfo, buy_result: TradeResult
     ) -> None:
         """Handle failed token purchase."""
         logger.error(f"Failed to buy {token_info.symbol}: {buy_result.error_message}")
+        self._release_monitor_slot(token_info)
+        self._release_capital(token_info)
         # Close ATA if enabled
-        await handle_cleanup_after_failure(
-            self.solana_client,
-            self.wallet,
-            token_info.mint,
-            self.priority_fee_manager,
-            self.cleanup_mode,
-            self.cleanup_with_priority_fee,
-            self.cleanup_force_close_with_burn,
-        )
+        async with self._stage("cleanup"):
+            await handle_cleanup_after_failure(
+                self.solana_client,
+                self.wallet,
+                token_info.mint,
+                self.priority_fee_manager,
+                self.cleanup_mode,
+                self.cleanup_with_priority_fee,
+                self.cleanup_force_close_with_burn,
+            )
 
     async def _handle_tp_sl_exit(
         self, token_info: TokenInfo, buy_result: TradeResult
-    ) -> None:
-        """Handle take profit/stop loss exit strategy."""
+    ) -> bool:
+        """Handle take profit/stop loss exit strategy.
+
+        Returns:
+            True if the position was closed
+        """
         # Create position
         position = Position.create_from_buy_result(
             mint=token_info.mint,
@@ -497,17 +752,65 @@ class UniversalTrader:
             logger.info(f"Stop loss target: {position.stop_loss_price:.8f} SOL")
 
         # Monitor position until exit condition is met
-        await self._monitor_position_until_exit(token_info, position)
+        exit_reason = await self._monitor_position_until_exit(token_info, position)
+        # Sell and cleanup run outside the monitor slot
+        self._release_monitor_slot(token_info)
+
+        async with self._stage("sell"):
+            sell_result = await self.seller.execute(token_info)
+
+        if not sell_result.success:
+            logger.error(f"Failed to exit position: {sell_result.error_message}")
+            return False
+
+        # Close position with actual exit price
+        position.close_position(sell_result.price, exit_reason)
+        self._release_capital(token_info)
+
+        logger.info(f"Successfully exited position: {exit_reason.value}")
+        self._log_trade(
+            "sell",
+            token_info,
+            sell_result.price,
+            sell_result.amount,
+            sell_result.tx_signature,
+        )
+
+        # Log final PnL
+        final_pnl = position.get_pnl()
+        logger.info(
+            f"Final PnL: {final_pnl['price_change_pct']:.2f}% ({final_pnl['unrealized_pnl_sol']:.6f} SOL)"
+        )
+
+        # Close ATA if enabled
+        async with self._stage("cleanup"):
+            await handle_cleanup_after_sell(
+                self.solana_client,
+                self.wallet,
+                token_info.mint,
+                self.priority_fee_manager,
+                self.cleanup_mode,
+                self.cleanup_with_priority_fee,
+                self.cleanup_force_close_with_burn,
+            )
+        return True
+
+    async def _handle_time_based_exit(self, token_info: TokenInfo) -> bool:
+        """Handle legacy time-based exit strategy.
 
-    async def _handle_time_based_exit(self, token_info: TokenInfo) -> None:
-        """Handle legacy time-based exit strategy."""
+        Returns:
+            True if the position was sold
+        """
         logger.info(f"Waiting for {self.wait_time_after_buy} seconds before selling...")
         await asyncio.sleep(self.wait_time_after_buy)
+        self._release_monitor_slot(token_info)
 
         logger.info(f"Selling {token_info.symbol}...")
-        sell_result: TradeResult = await self.seller.execute(token_info)
+        async with self._stage("sell"):
+            sell_result: TradeResult = await self.seller.execute(token_info)
 
         if sell_result.success:
+            self._release_capital(token_info)
             logger.info(f"Successfully sold {token_info.symbol}")
             self._log_trade(
                 "sell",
@@ -517,106 +820,148 @@ class UniversalTrader:
                 sell_result.tx_signature,
             )
             # Close ATA if enabled
-            await handle_cleanup_after_sell(
-                self.solana_client,
-                self.wallet,
-                token_info.mint,
-                self.priority_fee_manager,
-                self.cleanup_mode,
-                self.cleanup_with_priority_fee,
-                self.cleanup_force_close_with_burn,
-            )
-        else:
-            logger.error(
-                f"Failed to sell {token_info.symbol}: {sell_result.error_message}"
-            )
+            async with self._stage("cleanup"):
+                await handle_cleanup_after_sell(
+                    self.solana_client,
+                    self.wallet,
+                    token_info.mint,
+                    self.priority_fee_manager,
+                    self.cleanup_mode,
+                    self.cleanup_with_priority_fee,
+                    self.cleanup_force_close_with_burn,
+                )
+            return True
+
+        logger.error(f"Failed to sell {token_info.symbol}: {sell_result.error_message}")
+        return False
 
     async def _monitor_position_until_exit(
         self, token_info: TokenInfo, position: Position
-    ) -> None:
-        """Monitor a position until exit conditions are met."""
-        logger.info(
-            f"Starting position monitoring (check interval: {self.price_check_interval}s)"
-        )
+    ) -> ExitReason:
+        """Monitor a position until an exit condition is met.
+
+        Returns:
+            Exit condition that was met; selling is left to the caller
+        """
+        if self.price_feed:
+            logger.info(
+                f"Starting position monitoring ({self.price_feed.name} price feed, "
+                f"fallback interval: {self.price_check_interval}s)"
+            )
+        else:
+            logger.info(
+                f"Starting position monitoring (check interval: {self.price_check_interval}s)"
+            )
 
         # Get pool address for price monitoring using platform-agnostic method
         pool_address = self._get_pool_address(token_info)
-        curve_manager = self.platform_implementations.curve_manager
 
-        while position.is_active:
-            try:
-                # Get current price from pool/curve
-                current_price = await curve_manager.calculate_price(pool_address)
-
-                # Check if position should be exited
-                should_exit, exit_reason = position.should_exit(current_price)
+        if self.price_feed:
+            await self.price_feed.track(token_info, pool_address)
 
-                if should_exit and exit_reason:
-                    logger.info(f"Exit condition met: {exit_reason.value}")
-                    logger.info(f"Current price: {current_price:.8f} SOL")
+        state_version = 0
+        first_check = True
 
-                    # Log PnL before exit
-                    pnl = position.get_pnl(current_price)
-                    logger.info(
-                        f"Position PnL: {pnl['price_change_pct']:.2f}% ({pnl['unrealized_pnl_sol']:.6f} SOL)"
+        try:
+            while True:
+                try:
+                    # Get current price from pushed state or the pool/curve account
+                    curve_state = await self._wait_for_price_update(
+                        pool_address, state_version, first_check
                     )
+                    first_check = False
+                    state_version = curve_state.version
+                    current_price = curve_state.price
 
-                    # Execute sell
-                    sell_result = await self.seller.execute(token_info)
-
-                    if sell_result.success:
-                        # Close position with actual exit price
-                        position.close_position(sell_result.price, exit_reason)
+                    # Check if position should be exited
+                    should_exit, exit_reason = position.should_exit(current_price)
 
+                    if should_exit and exit_reason:
+                        logger.info(f"Exit condition met: {exit_reason.value}")
                         logger.info(
-                            f"Successfully exited position: {exit_reason.value}"
-                        )
-                        self._log_trade(
-                            "sell",
-                            token_info,
-                            sell_result.price,
-                            sell_result.amount,
-                            sell_result.tx_signature,
+                            f"Current price: {current_price:.8f} SOL ({curve_state.source})"
                         )
 
-                        # Log final PnL
-                        final_pnl = position.get_pnl()
+                        # Log PnL before exit
+                        pnl = position.get_pnl(current_price)
                         logger.info(
-                            f"Final PnL: {final_pnl['price_change_pct']:.2f}% ({final_pnl['unrealized_pnl_sol']:.6f} SOL)"
+                            f"Position PnL: {pnl['price_change_pct']:.2f}% ({pnl['unrealized_pnl_sol']:.6f} SOL)"
                         )
 
-                        # Close ATA if enabled
-                        await handle_cleanup_after_sell(
-                            self.solana_client,
-                            self.wallet,
-                            token_info.mint,
-                            self.priority_fee_manager,
-                            self.cleanup_mode,
-                            self.cleanup_with_priority_fee,
-                            self.cleanup_force_close_with_burn,
-                        )
-                    else:
-                        logger.error(
-                            f"Failed to exit position: {sell_result.error_message}"
-                        )
-                        # Keep monitoring in case sell can be retried
+                        return exit_reason
 
-                    break
-                else:
                     # Log current status
                     pnl = position.get_pnl(current_price)
                     logger.debug(
                         f"Position status: {current_price:.8f} SOL ({pnl['price_change_pct']:+.2f}%)"
                     )
 
-                # Wait before next price check
-                await asyncio.sleep(self.price_check_interval)
+                except Exception:
+                    logger.exception("Error monitoring position")
+                    await asyncio.sleep(
+                        self.price_check_interval
+                    )  # Continue monitoring despite errors
+        finally:
+            if self.price_feed:
+                self._stale_feed_pools.discard(pool_address)
+                await self.price_feed.untrack(pool_address)
+
+    async def _wait_for_price_update(
+        self, pool_address: Pubkey, seen_version: int, first_check: bool
+    ) -> CurveState:
+        """Wait for the next curve state of a held pool.
+
+        With a price feed this returns as soon as an update is pushed. If no
+        update arrives within the check interval, the last known state is
+        returned so time-based exits are still evaluated, as long as it is
+        no older than ``price_feed_max_age`` (one check interval by default).
+        Without a feed, before the feed has delivered anything, or while the
+        feed is stale, the curve is polled over RPC.
+
+        Args:
+            pool_address: Address of the pool/curve
+            seen_version: Version of the last state the caller evaluated
+            first_check: Whether this is the first check for the position
+
+        Returns:
+            Curve state to evaluate
+        """
+        store = self.curve_state_store
+
+        if self.price_feed:
+            if first_check:
+                state = store.get(pool_address)
+            else:
+                state = await store.wait_for_update(
+                    pool_address, seen_version, timeout=self.price_check_interval
+                ) or store.get(pool_address)
+            if state is not None and state.age <= self.price_feed_max_age:
+                if pool_address in self._stale_feed_pools and state.source != "rpc":
+                    self._stale_feed_pools.discard(pool_address)
+                    logger.info(f"Price feed for {pool_address} resumed")
+                return state
+            if (
+                state is not None
+                and not first_check
+                and pool_address not in self._stale_feed_pools
+            ):
+                self._stale_feed_pools.add(pool_address)
+                logger.warning(
+                    f"Price feed for {pool_address} is stale (no update for "
+                    f"{state.age:.1f}s), polling the curve over RPC"
+                )
+        elif not first_check:
+            await asyncio.sleep(self.price_check_interval)
 
-            except Exception:
-                logger.exception("Error monitoring position")
-                await asyncio.sleep(
-                    self.price_check_interval
-                )  # Continue monitoring despite errors
+        # With a feed, the stored state was just found too old to reuse
+        if self.curve_state_max_age and not self.price_feed:
+            state = store.get(pool_address)
+            if state is not None and state.age <= self.curve_state_max_age:
+                return state
+
+        curve_manager = self.platform_implementations.curve_manager
+        price = await curve_manager.calculate_price(pool_address)
+        return store.update(pool_address, price, "rpc")
 
     def _get_pool_address(self, token_info: TokenInfo) -> Pubkey:
         """Get the pool/curve address for price monitoring using platform-agnostic method."""
@@ -631,44 +976,36 @@ class UniversalTrader:
             # Fallback to deriving the address using platform provider
             return address_provider.derive_pool_address(token_info.mint)
 
-    async def _save_token_info(self, token_info: TokenInfo) -> None:
-        """Save token information to a file."""
-        try:
-            trades_dir = Path("trades")
-            trades_dir.mkdir(exist_ok=True)
-            file_path = trades_dir / f"{token_info.mint}.txt"
-
-            # Convert to dictionary for saving - platform-agnostic
-            token_dict = {
-                "name": token_info.name,
-                "symbol": token_info.symbol,
-                "uri": token_info.uri,
-                "mint": str(token_info.mint),
-                "platform": token_info.platform.value,
-                "user": str(token_info.user) if token_info.user else None,
-                "creator": str(token_info.creator) if token_info.creator else None,
-                "creation_timestamp": token_info.creation_timestamp,
-            }
-
-            # Add platform-specific fields only if they exist
-            platform_fields = {
-                "bonding_curve": token_info.bonding_curve,
-                "associated_bonding_curve": token_info.associated_bonding_curve,
-                "creator_vault": token_info.creator_vault,
-                "pool_state": token_info.pool_state,
-                "base_vault": token_info.base_vault,
-                "quote_vault": token_info.quote_vault,
-            }
-
-            for field_name, field_value in platform_fields.items():
-                if field_value is not None:
-                    token_dict[field_name] = str(field_value)
-
-            file_path.write_text(json.dumps(token_dict, indent=2))
-
-            logger.info(f"Token information saved to {file_path}")
-        except OSError:
-            logger.exception("Failed to save token information")
+    def _save_token_info(self, token_info: TokenInfo) -> None:
+        """Record token information in the trade journal."""
+        # Convert to dictionary for saving - platform-agnostic
+        token_dict = {
+            "name": token_info.name,
+            "symbol": token_info.symbol,
+            "uri": token_info.uri,
+            "mint": str(token_info.mint),
+            "platform": token_info.platform.value,
+            "user": str(token_info.user) if token_info.user else None,
+            "creator": str(token_info.creator) if token_info.creator else None,
+            "creation_timestamp": token_info.creation_timestamp,
+        }
+
+        # Add platform-specific fields only if they exist
+        platform_fields = {
+            "bonding_curve": token_info.bonding_curve,
+            "associated_bonding_curve": token_info.associated_bonding_curve,
+            "creator_vault": token_info.creator_vault,
+            "pool_state": token_info.pool_state,
+            "base_vault": token_info.base_vault,
+            "quote_vault": token_info.quote_vault,
+        }
+
+        for field_name, field_value in platform_fields.items():
+            if field_value is not None:
+                token_dict[field_name] = str(field_value)
+
+        self.journal.record("token", token_dict)
+        logger.debug(f"Token information for {token_info.symbol} queued for the journal")
 
     def _log_trade(
         self,
@@ -678,13 +1015,10 @@ class UniversalTrader:
         amount: float,
         tx_hash: str | None,
     ) -> None:
-        """Log trade information."""
-        try:
-            trades_dir = Path("trades")
-            trades_dir.mkdir(exist_ok=True)
-
-            log_entry = {
-                "timestamp": datetime.utcnow().isoformat(),
+        """Record trade information in the trade journal."""
+        self.journal.record(
+            "trade",
+            {
                 "action": action,
                 "platform": token_info.platform.value,
                 "token_address": str(token_info.mint),
@@ -692,13 +1026,8 @@ class UniversalTrader:
                 "price": price,
                 "amount": amount,
                 "tx_hash": str(tx_hash) if tx_hash else None,
-            }
-
-            log_file_path = trades_dir / "trades.log"
-            with log_file_path.open("a", encoding="utf-8") as log_file:
-                log_file.write(json.dumps(log_entry) + "\n")
-        except OSError:
-            logger.exception("Failed to log trade information")
+            },
+        )
 
 
 # Backward compatibility alias
@@ -0,0 +1,53 @@
+"""
+Bounded deduplication for keys seen across multiple event sources.
+"""
+
+from collections import OrderedDict
+from typing import Any
+
+
+class BoundedDedupSet:
+    """Remembers the most recently seen keys, evicting the oldest past a size limit.
+
+    Each key can carry a value (e.g. who delivered it first and when), so
+    later duplicates can be compared against the first sighting.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        """Initialize the dedup set.
+
+        Args:
+            max_size: Maximum number of keys remembered
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    def add(self, key: str, value: Any = None) -> bool:
+        """Record a key if it has not been seen yet.
+
+        Args:
+            key: Key to record (e.g. mint address or transaction signature)
+            value: Optional value stored with the first sighting
+
+        Returns:
+            True if the key is new, False if it is a duplicate
+        """
+        if key in self._entries:
+            return False
+
+        self._entries[key] = value
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the value stored with a key's first sighting."""
+        return self._entries.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
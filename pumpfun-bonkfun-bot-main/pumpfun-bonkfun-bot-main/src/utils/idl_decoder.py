@@ -0,0 +1,420 @@
+"""
+Compiled decoders for Anchor IDL types.
+
+The IDL interpreter in ``utils.idl_parser`` walks the type tree for every field
+of every message. This module compiles each type once into a decode plan:
+consecutive fixed-size fields are merged into a single ``struct.Struct`` and
+only strings, vectors, options and data-carrying enums are handled
+field-by-field. Decoded values are identical to the interpreter's output
+(pubkeys as base58 strings, enums as ``{"variant": ..., "data": ...}``).
+"""
+
+import struct
+from collections.abc import Callable
+from typing import Any
+
+from solders.pubkey import Pubkey
+
+DISCRIMINATOR_SIZE = 8
+PUBLIC_KEY_SIZE = 32
+STRING_LENGTH_PREFIX_SIZE = 4
+VEC_LENGTH_PREFIX_SIZE = 4
+ENUM_DISCRIMINATOR_SIZE = 1
+OPTION_TAG_SIZE = 1
+
+# Primitive struct format characters (without byte-order prefix)
+_PRIMITIVE_FORMATS = {
+    "u8": "B",
+    "u16": "H",
+    "u32": "I",
+    "u64": "Q",
+    "u128": "16s",
+    "i8": "b",
+    "i16": "h",
+    "i32": "i",
+    "i64": "q",
+    "i128": "16s",
+    "bool": "?",
+    "pubkey": "32s",
+}
+
+_LENGTH_PREFIX = struct.Struct("<I")
+_TAG = struct.Struct("<B")
+
+# Builders consume values from an iterator over a struct.unpack_from result
+Builder = Callable[[Any], Any]
+# Dynamic decoders take (data, offset) and return (value, new_offset)
+DynamicDecoder = Callable[[bytes, int], tuple[Any, int]]
+
+
+def _take(values: Any) -> Any:
+    return next(values)
+
+
+def _take_pubkey(values: Any) -> str:
+    # solders encodes base58 natively, far faster than the pure-Python codec
+    return str(Pubkey.from_bytes(next(values)))
+
+
+def _take_u128(values: Any) -> int:
+    return int.from_bytes(next(values), "little")
+
+
+def _take_i128(values: Any) -> int:
+    return int.from_bytes(next(values), "little", signed=True)
+
+
+_PRIMITIVE_BUILDERS: dict[str, Builder] = {
+    "pubkey": _take_pubkey,
+    "u128": _take_u128,
+    "i128": _take_i128,
+}
+
+
+class _FixedPlan:
+    """Compiled plan for a type whose encoded size never varies."""
+
+    __slots__ = ("build", "fmt", "size")
+
+    def __init__(self, fmt: str, build: Builder):
+        self.fmt = fmt
+        self.build = build
+        self.size = struct.calcsize("<" + fmt)
+
+
+class _DynamicPlan:
+    """Compiled plan for a type containing variable-length parts."""
+
+    __slots__ = ("decode", "min_size")
+
+    def __init__(self, decode: DynamicDecoder, min_size: int):
+        self.decode = decode
+        self.min_size = min_size
+
+
+def _fixed_decoder(plan: _FixedPlan) -> DynamicDecoder:
+    """Wrap a fixed plan so it can be used as a standalone decoder."""
+    layout = struct.Struct("<" + plan.fmt)
+    build = plan.build
+    size = layout.size
+
+    def decode(data: bytes, offset: int) -> tuple[Any, int]:
+        return build(iter(layout.unpack_from(data, offset))), offset + size
+
+    return decode
+
+
+def _as_decoder(plan: "_FixedPlan | _DynamicPlan") -> DynamicDecoder:
+    if isinstance(plan, _FixedPlan):
+        return _fixed_decoder(plan)
+    return plan.decode
+
+
+def _min_size(plan: "_FixedPlan | _DynamicPlan") -> int:
+    return plan.size if isinstance(plan, _FixedPlan) else plan.min_size
+
+
+class IDLTypeCompiler:
+    """Compiles IDL type definitions into decode plans."""
+
+    def __init__(self, types: dict[str, dict[str, Any]]):
+        """Initialize the compiler.
+
+        Args:
+            types: IDL ``types`` section keyed by type name
+        """
+        self.types = types
+        self._plans: dict[str, _FixedPlan | _DynamicPlan] = {}
+
+    def compile_fields(
+        self, fields: list[dict[str, Any]]
+    ) -> "_FixedPlan | _DynamicPlan":
+        """Compile a list of named fields into a struct plan.
+
+        Args:
+            fields: IDL field definitions with ``name`` and ``type`` keys
+
+        Returns:
+            Plan decoding the fields into a dictionary
+        """
+        names = [field["name"] for field in fields]
+        plans = [self.compile_type(field["type"]) for field in fields]
+
+        if all(isinstance(plan, _FixedPlan) for plan in plans):
+            builders = [plan.build for plan in plans]
+            named = list(zip(names, builders))
+
+            def build_struct(values: Any) -> dict[str, Any]:
+                return {name: build(values) for name, build in named}
+
+            return _FixedPlan("".join(plan.fmt for plan in plans), build_struct)
+
+        # Merge runs of fixed fields into one Struct between dynamic fields
+        segments: list[tuple[Any, ...]] = []
+        run: list[tuple[str, _FixedPlan]] = []
+
+        def close_run() -> None:
+            if run:
+                layout = struct.Struct("<" + "".join(plan.fmt for _, plan in run))
+                segments.append(
+                    ("fixed", layout, [(name, plan.build) for name, plan in run])
+                )
+                run.clear()
+
+        for name, plan in zip(names, plans):
+            if isinstance(plan, _FixedPlan):
+                run.append((name, plan))
+            else:
+                close_run()
+                segments.append(("dynamic", name, plan.decode))
+        close_run()
+
+        def decode_struct(data: bytes, offset: int) -> tuple[dict[str, Any], int]:
+            result: dict[str, Any] = {}
+            for segment in segments:
+                if segment[0] == "fixed":
+                    _, layout, builders = segment
+                    values = iter(layout.unpack_from(data, offset))
+                    for name, build in builders:
+                        result[name] = build(values)
+                    offset += layout.size
+                else:
+                    _, name, decode = segment
+                    result[name], offset = decode(data, offset)
+            return result, offset
+
+        return _DynamicPlan(decode_struct, sum(_min_size(plan) for plan in plans))
+
+    def compile_type(self, type_def: str | dict) -> "_FixedPlan | _DynamicPlan":
+        """Compile a single IDL type definition.
+
+        Args:
+            type_def: Primitive type name or composite type dictionary
+
+        Returns:
+            Compiled plan for the type
+
+        Raises:
+            ValueError: If the type is unknown or unsupported
+        """
+        if isinstance(type_def, str):
+            if type_def == "string":
+                return _DynamicPlan(_decode_string, STRING_LENGTH_PREFIX_SIZE)
+            if type_def == "bytes":
+                return _DynamicPlan(_decode_bytes, VEC_LENGTH_PREFIX_SIZE)
+            fmt = _PRIMITIVE_FORMATS.get(type_def)
+            if fmt is None:
+                raise ValueError(f"Unknown primitive type: {type_def}")
+            return _FixedPlan(fmt, _PRIMITIVE_BUILDERS.get(type_def, _take))
+
+        if isinstance(type_def, dict):
+            if "defined" in type_def:
+                defined = type_def["defined"]
+                name = defined["name"] if isinstance(defined, dict) else defined
+                return self.compile_defined(name)
+            if "array" in type_def:
+                element_type, length = type_def["array"]
+                return self._compile_array(self.compile_type(element_type), length)
+            if "vec" in type_def:
+                return self._compile_vec(self.compile_type(type_def["vec"]))
+            if "option" in type_def:
+                return self._compile_option(self.compile_type(type_def["option"]))
+
+        raise ValueError(f"Invalid or unknown type definition for decoding: {type_def}")
+
+    def compile_defined(self, type_name: str) -> "_FixedPlan | _DynamicPlan":
+        """Compile (or fetch the cached plan of) a user-defined type.
+
+        Args:
+            type_name: Name of the type in the IDL ``types`` section
+
+        Returns:
+            Compiled plan for the type
+        """
+        if type_name in self._plans:
+            return self._plans[type_name]
+
+        if type_name not in self.types:
+            raise ValueError(f"Unknown defined type: {type_name}")
+
+        type_def = self.types[type_name]["type"]
+        if type_def["kind"] == "struct":
+            plan = self.compile_fields(type_def.get("fields", []))
+        elif type_def["kind"] == "enum":
+            plan = self._compile_enum(type_name, type_def["variants"])
+        else:
+            raise ValueError(f"Unsupported type kind for decoding: {type_def['kind']}")
+
+        self._plans[type_name] = plan
+        return plan
+
+    def _compile_array(
+        self, element: "_FixedPlan | _DynamicPlan", length: int
+    ) -> "_FixedPlan | _DynamicPlan":
+        if isinstance(element, _FixedPlan):
+            build_element = element.build
+
+            def build_array(values: Any) -> list[Any]:
+                return [build_element(values) for _ in range(length)]
+
+            return _FixedPlan(element.fmt * length, build_array)
+
+        decode_element = element.decode
+
+        def decode_array(data: bytes, offset: int) -> tuple[list[Any], int]:
+            items = []
+            for _ in range(length):
+                value, offset = decode_element(data, offset)
+                items.append(value)
+            return items, offset
+
+        return _DynamicPlan(decode_array, element.min_size * length)
+
+    def _compile_vec(self, element: "_FixedPlan | _DynamicPlan") -> _DynamicPlan:
+        if isinstance(element, _FixedPlan):
+            element_fmt = element.fmt
+            build_element = element.build
+            element_size = element.size
+
+            def decode_vec(data: bytes, offset: int) -> tuple[list[Any], int]:
+                count = _LENGTH_PREFIX.unpack_from(data, offset)[0]
+                offset += VEC_LENGTH_PREFIX_SIZE
+                if offset + element_size * count > len(data):
+                    raise struct.error(f"vec of {count} elements exceeds buffer")
+                values = iter(struct.unpack_from("<" + element_fmt * count, data, offset))
+                items = [build_element(values) for _ in range(count)]
+                return items, offset + element_size * count
+
+            return _DynamicPlan(decode_vec, VEC_LENGTH_PREFIX_SIZE)
+
+        decode_element = element.decode
+
+        def decode_dynamic_vec(data: bytes, offset: int) -> tuple[list[Any], int]:
+            count = _LENGTH_PREFIX.unpack_from(data, offset)[0]
+            offset += VEC_LENGTH_PREFIX_SIZE
+            items = []
+            for _ in range(count):
+                value, offset = decode_element(data, offset)
+                items.append(value)
+            return items, offset
+
+        return _DynamicPlan(decode_dynamic_vec, VEC_LENGTH_PREFIX_SIZE)
+
+    def _compile_option(self, inner: "_FixedPlan | _DynamicPlan") -> _DynamicPlan:
+        decode_inner = _as_decoder(inner)
+
+        def decode_option(data: bytes, offset: int) -> tuple[Any, int]:
+            tag = _TAG.unpack_from(data, offset)[0]
+            offset += OPTION_TAG_SIZE
+            if tag == 0:
+                return None, offset
+            return decode_inner(data, offset)
+
+        return _DynamicPlan(decode_option, OPTION_TAG_SIZE)
+
+    def _compile_enum(
+        self, type_name: str, variants: list[dict[str, Any]]
+    ) -> "_FixedPlan | _DynamicPlan":
+        names = [variant["name"] for variant in variants]
+
+        def invalid_variant(index: int) -> ValueError:
+            return ValueError(
+                f"Invalid enum variant index {index} for type {type_name}"
+            )
+
+        # Unit-only enums are a single fixed byte
+        if not any(variant.get("fields") for variant in variants):
+
+            def build_unit_enum(values: Any) -> dict[str, Any]:
+                index = next(values)
+                if index >= len(names):
+                    raise invalid_variant(index)
+                return {"variant": names[index]}
+
+            return _FixedPlan("B", build_unit_enum)
+
+        variant_decoders: list[DynamicDecoder | None] = []
+        largest = 0
+        for variant in variants:
+            fields = variant.get("fields", [])
+            if not fields:
+                variant_decoders.append(None)
+                continue
+            if isinstance(fields[0], dict):
+                plan = self.compile_fields(fields)
+            else:
+                plan = self._compile_tuple(fields)
+            variant_decoders.append(_as_decoder(plan))
+            largest = max(largest, _min_size(plan))
+
+        def decode_enum(data: bytes, offset: int) -> tuple[dict[str, Any], int]:
+            index = _TAG.unpack_from(data, offset)[0]
+            offset += ENUM_DISCRIMINATOR_SIZE
+            if index >= len(names):
+                raise invalid_variant(index)
+            result: dict[str, Any] = {"variant": names[index]}
+            decode_variant = variant_decoders[index]
+            if decode_variant is not None:
+                result["data"], offset = decode_variant(data, offset)
+            return result, offset
+
+        return _DynamicPlan(decode_enum, ENUM_DISCRIMINATOR_SIZE + largest)
+
+    def _compile_tuple(self, field_types: list[Any]) -> "_FixedPlan | _DynamicPlan":
+        plans = [self.compile_type(field_type) for field_type in field_types]
+        decoders = [_as_decoder(plan) for plan in plans]
+
+        def decode_tuple(data: bytes, offset: int) -> tuple[list[Any], int]:
+            items = []
+            for decode in decoders:
+                value, offset = decode(data, offset)
+                items.append(value)
+            return items, offset
+
+        return _DynamicPlan(decode_tuple, sum(_min_size(plan) for plan in plans))
+
+
+def _decode_string(data: bytes, offset: int) -> tuple[str, int]:
+    length = _LENGTH_PREFIX.unpack_from(data, offset)[0]
+    offset += STRING_LENGTH_PREFIX_SIZE
+    return data[offset : offset + length].decode("utf-8"), offset + length
+
+
+def _decode_bytes(data: bytes, offset: int) -> tuple[bytes, int]:
+    length = _LENGTH_PREFIX.unpack_from(data, offset)[0]
+    offset += VEC_LENGTH_PREFIX_SIZE
+    return bytes(data[offset : offset + length]), offset + length
+
+
+class CompiledDecoder:
+    """Decoder for one IDL account, event or instruction-argument layout."""
+
+    __slots__ = ("_decode", "min_size", "name")
+
+    def __init__(self, name: str, plan: "_FixedPlan | _DynamicPlan"):
+        """Initialize the decoder.
+
+        Args:
+            name: Name of the decoded type (used for diagnostics)
+            plan: Compiled plan returned by ``IDLTypeCompiler``
+        """
+        self.name = name
+        self.min_size = _min_size(plan)
+        self._decode = _as_decoder(plan)
+
+    def decode(self, data: bytes, offset: int = 0) -> dict[str, Any]:
+        """Decode a value starting at ``offset``.
+
+        Args:
+            data: Raw bytes (without the Anchor discriminator)
+            offset: Byte offset where the value starts
+
+        Returns:
+            Decoded value
+
+        Raises:
+            struct.error: If the data is too short for the layout
+            ValueError: If the data contains an invalid enum variant
+            UnicodeDecodeError: If a string field is not valid UTF-8
+        """
+        return self._decode(data, offset)[0]
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from interfaces.core import Platform
+from utils.idl_decoder import CompiledDecoder
 from utils.idl_parser import IDLParser
 from utils.logger import get_logger
 
@@ -74,12 +75,31 @@ class IDLManager:
 
         instruction_count = len(parser.get_instruction_names())
         event_count = len(parser.get_event_names())
+        decoder_count = parser.compile_decoders()
         logger.info(
-            f"IDL parser loaded for {platform.value} with {instruction_count} instructions and {event_count} events"
+            f"IDL parser loaded for {platform.value} with {instruction_count} instructions, "
+            f"{event_count} events and {decoder_count} compiled decoders"
         )
 
         return parser
 
+    def get_decoder(
+        self, platform: Platform, type_name: str
+    ) -> CompiledDecoder | None:
+        """Get the compiled decoder for an IDL type on a platform.
+
+        Decoders are compiled once when the platform's parser is loaded and
+        cached alongside it.
+
+        Args:
+            platform: Platform whose IDL defines the type
+            type_name: Account, event or defined type name
+
+        Returns:
+            Compiled decoder, or None if the type could not be compiled
+        """
+        return self.get_parser(platform).get_type_decoder(type_name)
+
     def has_idl_support(self, platform: Platform) -> bool:
         """Check if a platform has IDL support configured.
 
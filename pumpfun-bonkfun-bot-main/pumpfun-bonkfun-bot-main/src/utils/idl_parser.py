@@ -9,12 +9,17 @@ import struct
 from typing import Any
 
 import base58
+from solders.pubkey import Pubkey
+
+from utils.idl_decoder import CompiledDecoder, IDLTypeCompiler
 
 # Constants for Anchor data layout
 DISCRIMINATOR_SIZE = 8
 PUBLIC_KEY_SIZE = 32
 STRING_LENGTH_PREFIX_SIZE = 4
+VEC_LENGTH_PREFIX_SIZE = 4
 ENUM_DISCRIMINATOR_SIZE = 1
+OPTION_TAG_SIZE = 1
 
 
 class IDLParser:
@@ -33,7 +38,10 @@ class IDLParser:
         "i32": ("<i", 4),
         "i64": ("<q", 8),
         "bool": ("<?", 1),
+        "u128": (None, 16),
+        "i128": (None, 16),
         "pubkey": (None, PUBLIC_KEY_SIZE),
+        "bytes": (None, VEC_LENGTH_PREFIX_SIZE),
         "string": (
             None,
             STRING_LENGTH_PREFIX_SIZE,
@@ -60,6 +68,64 @@ class IDLParser:
         self._build_type_map()
         self._calculate_instruction_sizes()
 
+        # Compiled decode plans, filled by compile_decoders()
+        self._type_decoders: dict[str, CompiledDecoder] = {}
+        self._instruction_decoders: dict[bytes, CompiledDecoder] = {}
+        self._compiled = False
+
+    # --------------------------------------------------------------------------
+    # Public Methods (External API) - Compiled decoders
+    # --------------------------------------------------------------------------
+
+    def compile_decoders(self) -> int:
+        """Compile decode plans for every IDL type and instruction.
+
+        Types that cannot be compiled keep using the recursive interpreter.
+
+        Returns:
+            Number of compiled decoders
+        """
+        if self._compiled:
+            return len(self._type_decoders) + len(self._instruction_decoders)
+
+        compiler = IDLTypeCompiler(self.types)
+        for type_name in self.types:
+            try:
+                self._type_decoders[type_name] = CompiledDecoder(
+                    type_name, compiler.compile_defined(type_name)
+                )
+            except Exception as e:
+                if self.verbose:
+                    print(f"⚠️  Could not compile decoder for type {type_name}: {e}")
+
+        for discriminator, instruction in self.instructions.items():
+            try:
+                self._instruction_decoders[discriminator] = CompiledDecoder(
+                    instruction["name"],
+                    compiler.compile_fields(instruction.get("args", [])),
+                )
+            except Exception as e:
+                if self.verbose:
+                    print(
+                        f"⚠️  Could not compile decoder for instruction {instruction['name']}: {e}"
+                    )
+
+        self._compiled = True
+        return len(self._type_decoders) + len(self._instruction_decoders)
+
+    def get_type_decoder(self, type_name: str) -> CompiledDecoder | None:
+        """Get the compiled decoder for an IDL type.
+
+        Args:
+            type_name: Name of the account, event or defined type
+
+        Returns:
+            Compiled decoder, or None if the type could not be compiled
+        """
+        if not self._compiled:
+            self.compile_decoders()
+        return self._type_decoders.get(type_name)
+
     # --------------------------------------------------------------------------
     # Public Methods (External API) - Instructions
     # --------------------------------------------------------------------------
@@ -110,18 +176,13 @@ class IDLParser:
         instruction = self.instructions[discriminator]
         data_args = ix_data[DISCRIMINATOR_SIZE:]
 
-        # Decode instruction arguments
-        args = {}
-        decode_offset = 0
-        for arg in instruction.get("args", []):
-            try:
-                value, decode_offset = self._decode_type(
-                    data_args, decode_offset, arg["type"]
-                )
-                args[arg["name"]] = value
-            except Exception as e:
-                if self.verbose:
-                    print(f"❌ Decode error in argument '{arg['name']}': {e}")
+        # Decode instruction arguments, preferring the compiled plan
+        args = self._decode_compiled(
+            self._instruction_decoders.get(discriminator), data_args
+        )
+        if args is None:
+            args = self._decode_instruction_args(instruction, data_args)
+            if args is None:
                 return None
 
         # Helper to safely retrieve account public keys
@@ -129,7 +190,10 @@ class IDLParser:
             if index < len(accounts):
                 account_index = accounts[index]
                 if account_index < len(keys):
-                    return base58.b58encode(keys[account_index]).decode("utf-8")
+                    key = keys[account_index]
+                    if len(key) == PUBLIC_KEY_SIZE:
+                        return str(Pubkey.from_bytes(key))
+                    return base58.b58encode(key).decode("utf-8")
             return None  # Return None for invalid indices
 
         # Build account info based on instruction definition
@@ -200,6 +264,14 @@ class IDLParser:
         type_def = self.types[event_name_actual]
         event_type = type_def.get("type", {})
 
+        # Fast path: compiled plan. Truncated or legacy payloads fall through to
+        # the interpreter, which decodes field-by-field and skips failures.
+        event_fields = self._decode_compiled(
+            self._type_decoders.get(event_name_actual), event_data[DISCRIMINATOR_SIZE:]
+        )
+        if event_fields is not None and event_type.get("kind") == "struct":
+            return {"event_name": event_name_actual, "fields": event_fields}
+
         # Decode event fields
         try:
             event_fields = {}
@@ -322,7 +394,11 @@ class IDLParser:
                     return None
                 data = account_data[DISCRIMINATOR_SIZE:]
 
-            decoded_data, _ = self._decode_defined_type(data, 0, account_type_name)
+            decoded_data = self._decode_compiled(
+                self._type_decoders.get(account_type_name), data
+            )
+            if decoded_data is None:
+                decoded_data, _ = self._decode_defined_type(data, 0, account_type_name)
             return decoded_data
 
         except Exception as e:
@@ -334,6 +410,35 @@ class IDLParser:
     # Internal Helper Methods
     # --------------------------------------------------------------------------
 
+    def _decode_compiled(
+        self, decoder: CompiledDecoder | None, data: bytes
+    ) -> dict[str, Any] | None:
+        """Decode with a compiled plan, returning None if it cannot be used."""
+        if decoder is None or len(data) < decoder.min_size:
+            return None
+        try:
+            return decoder.decode(data)
+        except Exception:
+            return None
+
+    def _decode_instruction_args(
+        self, instruction: dict[str, Any], data_args: bytes
+    ) -> dict[str, Any] | None:
+        """Decode instruction arguments with the recursive interpreter."""
+        args = {}
+        decode_offset = 0
+        for arg in instruction.get("args", []):
+            try:
+                value, decode_offset = self._decode_type(
+                    data_args, decode_offset, arg["type"]
+                )
+                args[arg["name"]] = value
+            except Exception as e:
+                if self.verbose:
+                    print(f"❌ Decode error in argument '{arg['name']}': {e}")
+                return None
+        return args
+
     def _build_instruction_map(self):
         """Build a map of discriminators to instruction definitions."""
         for instruction in self.idl.get("instructions", []):
@@ -385,6 +490,10 @@ class IDLParser:
                 element_type, array_length = type_def["array"]
                 element_size = self._calculate_type_min_size(element_type)
                 return element_size * array_length
+            if "vec" in type_def:
+                return VEC_LENGTH_PREFIX_SIZE
+            if "option" in type_def:
+                return OPTION_TAG_SIZE
 
         raise ValueError(
             f"Invalid or unknown type definition for size calculation: {type_def}"
@@ -447,6 +556,14 @@ class IDLParser:
                 return self._decode_defined_type(data, offset, type_name)
             if "array" in type_def:
                 return self._decode_array(data, offset, type_def["array"])
+            if "vec" in type_def:
+                return self._decode_vec(data, offset, type_def["vec"])
+            if "option" in type_def:
+                tag = struct.unpack_from("<B", data, offset)[0]
+                offset += OPTION_TAG_SIZE
+                if tag == 0:
+                    return None, offset
+                return self._decode_type(data, offset, type_def["option"])
 
         raise ValueError(f"Invalid or unknown type definition for decoding: {type_def}")
 
@@ -461,6 +578,18 @@ class IDLParser:
             array_data.append(value)
         return array_data, offset
 
+    def _decode_vec(
+        self, data: bytes, offset: int, element_type: str | dict
+    ) -> tuple[list[Any], int]:
+        """Decode length-prefixed vector types."""
+        length = struct.unpack_from("<I", data, offset)[0]
+        offset += VEC_LENGTH_PREFIX_SIZE
+        vec_data = []
+        for _ in range(length):
+            value, offset = self._decode_type(data, offset, element_type)
+            vec_data.append(value)
+        return vec_data, offset
+
     def _decode_primitive(
         self, data: bytes, offset: int, type_name: str
     ) -> tuple[Any, int]:
@@ -474,6 +603,20 @@ class IDLParser:
             value = data[offset : offset + length].decode("utf-8")
             return value, offset + length
 
+        if type_name == "bytes":
+            length = struct.unpack_from("<I", data, offset)[0]
+            offset += VEC_LENGTH_PREFIX_SIZE
+            return bytes(data[offset : offset + length]), offset + length
+
+        if type_name in ("u128", "i128"):
+            end = offset + 16
+            if end > len(data):
+                raise struct.error(f"{type_name} requires 16 bytes at offset {offset}")
+            value = int.from_bytes(
+                data[offset:end], "little", signed=type_name == "i128"
+            )
+            return value, end
+
         if type_name == "pubkey":
             end = offset + PUBLIC_KEY_SIZE
             value = base58.b58encode(data[offset:end]).decode("utf-8")
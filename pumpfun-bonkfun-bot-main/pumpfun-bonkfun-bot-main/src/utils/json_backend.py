@@ -0,0 +1,76 @@
+"""
+Pluggable JSON decoding for hot-path WebSocket frames.
+
+``orjson`` is used when installed (the ``fast-json`` extra) and the
+standard library otherwise. Both backends accept ``str`` and
+``bytes`` and return the same objects, so callers never branch on the
+backend.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+BACKENDS = ("auto", "orjson", "stdlib")
+
+_loads: Callable[[str | bytes], Any] = json.loads
+_backend = "stdlib"
+
+
+def set_backend(name: str = "auto") -> str:
+    """Select the JSON decoder.
+
+    Args:
+        name: "auto" (orjson if installed), "orjson" or "stdlib"
+
+    Returns:
+        Name of the backend in use
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global _loads, _backend
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}', expected one of {BACKENDS}")
+    if name == "orjson" and orjson is None:
+        raise ValueError("JSON backend 'orjson' requested but orjson is not installed")
+
+    if name != "stdlib" and orjson is not None:
+        _loads, _backend = orjson.loads, "orjson"
+    else:
+        _loads, _backend = json.loads, "stdlib"
+    return _backend
+
+
+def get_backend() -> str:
+    """Get the name of the JSON decoder in use."""
+    return _backend
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document with the selected backend.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Decoded object
+
+    Raises:
+        ValueError: If the document is not valid JSON (both backends raise
+            subclasses of ``ValueError``)
+    """
+    return _loads(data)
+
+
+set_backend("auto")
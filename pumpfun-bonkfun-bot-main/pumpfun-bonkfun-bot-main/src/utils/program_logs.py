@@ -0,0 +1,42 @@
+"""
+Attribution of ``Program data:`` log lines to the program that emitted them.
+
+Anchor event discriminators only hash the event name, so programs with an
+event of the same name (pump.fun and Raydium LaunchLab both emit
+``TradeEvent``) produce identical payload prefixes. The runtime brackets
+every invocation with ``Program <id> invoke [n]`` and ``Program <id>
+success``/``failed`` lines, so the emitting program is the innermost open
+invocation.
+"""
+
+from collections.abc import Iterator
+
+PROGRAM_DATA_PREFIX = "Program data: "
+_PROGRAM_PREFIX = "Program "
+_INVOKE = " invoke ["
+
+
+def program_data_lines(logs: list[str], program_id: str) -> Iterator[tuple[int, str]]:
+    """Yield the ``Program data:`` lines emitted by one program.
+
+    Args:
+        logs: List of log strings from transaction
+        program_id: Base58 address of the emitting program
+
+    Yields:
+        (log index, log line) pairs in log order
+    """
+    stack: list[str] = []
+    for index, log in enumerate(logs):
+        if log.startswith(PROGRAM_DATA_PREFIX):
+            if stack and stack[-1] == program_id:
+                yield index, log
+        elif log.startswith(_PROGRAM_PREFIX):
+            if log.endswith("]") and _INVOKE in log:
+                program = log[len(_PROGRAM_PREFIX) : log.index(_INVOKE)]
+                if " " not in program:
+                    stack.append(program)
+            elif stack and log.startswith(stack[-1], len(_PROGRAM_PREFIX)):
+                status = log[len(_PROGRAM_PREFIX) + len(stack[-1]) :]
+                if status == " success" or status.startswith(" failed"):
+                    stack.pop()